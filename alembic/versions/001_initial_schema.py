@@ -0,0 +1,25 @@
+"""initial schema
+
+Revision ID: 001
+Revises: 
+Create Date: 2025-09-17 00:00:00.000000
+
+초기 스키마 - 테이블은 app.db.database.create_tables()(Base.metadata.create_all)가 생성
+(리비전 체인을 잇기 위한 빈 리비전, 기존 데이터베이스는 app/db/migrate.py가 LEGACY_BASELINE_REVISION으로 stamp)
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,25 @@
+"""legacy placeholder
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-10-01 00:00:00.000000
+
+원본 파일이 저장소에 없는 리비전 - 스키마 변경은 create_tables()와 database.py의 보정 함수가 대신 적용
+(리비전 체인을 잇기 위한 빈 리비전, 기존 데이터베이스는 app/db/migrate.py가 LEGACY_BASELINE_REVISION으로 stamp)
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,66 @@
+"""add audit_events table
+
+Revision ID: 20261018_audit_events
+Revises: 20251201_add_product_name
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_audit_events'
+down_revision = '20251201_add_product_name'
+branch_labels = None
+depends_on = None
+
+
+AUDIT_EVENT_INDEXES = [
+    ("idx_audit_events_timestamp", "timestamp"),
+    ("idx_audit_events_user_email_timestamp", "user_email, timestamp"),
+    ("idx_audit_events_event_type_timestamp", "event_type, timestamp"),
+    ("idx_audit_events_severity_timestamp", "severity, timestamp"),
+]
+
+
+def upgrade() -> None:
+    """
+    감사 이벤트 영구 저장 테이블 (create_all로 이미 생성된 경우 건너뜀)
+    """
+    # asyncpg는 prepared statement 하나에 여러 명령을 허용하지 않으므로 문장마다 실행
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS audit_events (
+            id BIGSERIAL PRIMARY KEY,
+            event_id VARCHAR(36) NOT NULL UNIQUE,
+            event_type VARCHAR(50) NOT NULL,
+            severity VARCHAR(20) NOT NULL,
+            user_id INTEGER,
+            user_email VARCHAR(255),
+            user_role VARCHAR(50),
+            user_ip VARCHAR(64),
+            user_agent TEXT,
+            resource_type VARCHAR(100),
+            resource_id VARCHAR(100),
+            resource_name VARCHAR(255),
+            action VARCHAR(100),
+            details JSON,
+            old_values JSON,
+            new_values JSON,
+            request_id VARCHAR(100),
+            session_id VARCHAR(100),
+            endpoint TEXT,
+            http_method VARCHAR(10),
+            response_status INTEGER,
+            timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL
+        )
+    """)
+    for name, columns in AUDIT_EVENT_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON audit_events ({columns})")
+
+
+def downgrade() -> None:
+    """
+    audit_events 테이블 제거
+    """
+    op.drop_table('audit_events')
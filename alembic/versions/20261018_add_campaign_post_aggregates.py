@@ -0,0 +1,51 @@
+"""add denormalized active post aggregates to campaigns
+
+Revision ID: 20261018_campaign_post_aggregates
+Revises: 20261018_hot_path_indexes
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_campaign_post_aggregates'
+down_revision = '20261018_hot_path_indexes'
+branch_labels = None
+depends_on = None
+
+
+AGGREGATE_COLUMNS = ("active_post_count", "invoiced_post_count", "paid_post_count")
+
+
+def upgrade() -> None:
+    """
+    campaigns에 활성 포스트 수/계산서 발행 수/입금 완료 수 컬럼 추가 후 posts에서 한 번 계산해 채움
+    (budget은 기존 update_campaign_budget과 같이 활성 포스트가 있는 캠페인만 합계로 맞춤)
+    """
+    for column in AGGREGATE_COLUMNS:
+        op.execute(f"ALTER TABLE campaigns ADD COLUMN IF NOT EXISTS {column} INTEGER NOT NULL DEFAULT 0")
+
+    op.execute("""
+        UPDATE campaigns c
+        SET active_post_count = s.post_count,
+            invoiced_post_count = s.invoiced_count,
+            paid_post_count = s.paid_count,
+            budget = s.budget_sum
+        FROM (
+            SELECT campaign_id,
+                   count(*) AS post_count,
+                   count(*) FILTER (WHERE invoice_issued) AS invoiced_count,
+                   count(*) FILTER (WHERE payment_completed) AS paid_count,
+                   coalesce(sum(budget), 0) AS budget_sum
+            FROM posts
+            WHERE is_active = true
+            GROUP BY campaign_id
+        ) s
+        WHERE c.id = s.campaign_id
+    """)
+
+
+def downgrade() -> None:
+    for column in reversed(AGGREGATE_COLUMNS):
+        op.execute(f"ALTER TABLE campaigns DROP COLUMN IF EXISTS {column}")
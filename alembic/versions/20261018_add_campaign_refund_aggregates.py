@@ -0,0 +1,55 @@
+"""add denormalized cancellation/refund aggregates to campaigns
+
+Revision ID: 20261018_campaign_refund_aggregates
+Revises: 20261018_campaign_post_aggregates
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_campaign_refund_aggregates'
+down_revision = '20261018_campaign_post_aggregates'
+branch_labels = None
+depends_on = None
+
+
+AGGREGATE_COLUMNS = ("cancelled_post_count", "campaign_refund_count", "post_refund_count")
+
+
+def upgrade() -> None:
+    """
+    campaigns에 취소 포스트 수/캠페인 환불 건수/포스트 환불 건수 컬럼 추가 후 한 번 계산해 채움
+    """
+    for column in AGGREGATE_COLUMNS:
+        op.execute(f"ALTER TABLE campaigns ADD COLUMN IF NOT EXISTS {column} INTEGER NOT NULL DEFAULT 0")
+
+    op.execute("""
+        UPDATE campaigns c
+        SET cancelled_post_count = s.cancelled_count
+        FROM (
+            SELECT campaign_id, count(*) FILTER (WHERE is_cancelled) AS cancelled_count
+            FROM posts
+            WHERE is_active = true
+            GROUP BY campaign_id
+        ) s
+        WHERE c.id = s.campaign_id
+    """)
+    op.execute("""
+        UPDATE campaigns c
+        SET campaign_refund_count = s.refund_count
+        FROM (SELECT campaign_id, count(*) AS refund_count FROM campaign_refunds GROUP BY campaign_id) s
+        WHERE c.id = s.campaign_id
+    """)
+    op.execute("""
+        UPDATE campaigns c
+        SET post_refund_count = s.refund_count
+        FROM (SELECT campaign_id, count(*) AS refund_count FROM post_refunds GROUP BY campaign_id) s
+        WHERE c.id = s.campaign_id
+    """)
+
+
+def downgrade() -> None:
+    for column in reversed(AGGREGATE_COLUMNS):
+        op.execute(f"ALTER TABLE campaigns DROP COLUMN IF EXISTS {column}")
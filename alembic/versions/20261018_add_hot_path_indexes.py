@@ -0,0 +1,67 @@
+"""add composite / partial indexes for hot query paths
+
+Revision ID: 20261018_hot_path_indexes
+Revises: 20261018_token_state
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_hot_path_indexes'
+down_revision = '20261018_token_state'
+branch_labels = None
+depends_on = None
+
+
+# (인덱스 이름, 테이블, 컬럼/조건) - scripts/verify_indexes.py가 같은 이름으로 실행 계획을 검증
+HOT_PATH_INDEXES = [
+    # 캠페인별 포스트 목록 (campaign_id + is_active)
+    ("ix_posts_campaign_id_is_active", "posts", "(campaign_id, is_active)"),
+    # 담당자별 포스트 (담당자가 지정된 포스트만)
+    ("ix_posts_assigned_user_id", "posts", "(assigned_user_id) WHERE assigned_user_id IS NOT NULL"),
+    # 회사별 활성 발주요청 최신순
+    ("ix_order_requests_company_created_active", "order_requests", "(company, created_at DESC) WHERE is_active = true"),
+    # 요청자별 발주요청
+    ("ix_order_requests_user_id", "order_requests", "(user_id)"),
+    # 회사별 캠페인 최신순
+    ("ix_campaigns_company_created", "campaigns", "(company, created_at DESC)"),
+    # 담당 직원 / 클라이언트 사용자별 캠페인
+    ("ix_campaigns_staff_id", "campaigns", "(staff_id) WHERE staff_id IS NOT NULL"),
+    ("ix_campaigns_client_user_id", "campaigns", "(client_user_id) WHERE client_user_id IS NOT NULL"),
+    # 게시판 목록 (공지 우선, 최신순) - 삭제되지 않은 글만
+    ("ix_board_posts_company_notice_created", "board_posts", "(company, is_notice DESC, created_at DESC) WHERE is_deleted = false"),
+    # 텔레그램 중복 알림 확인 / 포스트 삭제 시 로그 정리
+    ("ix_telegram_notification_logs_user_post_created", "telegram_notification_logs", "(user_id, post_id, created_at)"),
+    ("ix_telegram_notification_logs_post_id", "telegram_notification_logs", "(post_id)"),
+    # 캠페인별 포스트 환불 내역 최신순
+    ("ix_post_refunds_campaign_created", "post_refunds", "(campaign_id, created_at DESC)"),
+]
+
+
+def upgrade() -> None:
+    """
+    운영 중 테이블 잠금을 피하기 위해 CREATE INDEX CONCURRENTLY 사용 (트랜잭션 밖에서 실행)
+    """
+    with op.get_context().autocommit_block():
+        for name, table, definition in HOT_PATH_INDEXES:
+            # 이전에 실패한 CONCURRENTLY 빌드는 INVALID 인덱스로 남으므로 먼저 정리
+            op.execute(f"""
+                DO $$
+                BEGIN
+                    IF EXISTS (
+                        SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                        WHERE c.relname = '{name}' AND NOT i.indisvalid
+                    ) THEN
+                        EXECUTE 'DROP INDEX {name}';
+                    END IF;
+                END $$;
+            """)
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(HOT_PATH_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,60 @@
+"""add revoked_tokens and refresh_tokens tables
+
+Revision ID: 20261018_token_state
+Revises: 20261018_audit_events
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_token_state'
+down_revision = '20261018_audit_events'
+branch_labels = None
+depends_on = None
+
+
+TOKEN_STATE_INDEXES = [
+    ("idx_revoked_tokens_revoked_at", "revoked_tokens", "revoked_at"),
+    ("idx_revoked_tokens_expires_at", "revoked_tokens", "expires_at"),
+    ("ix_refresh_tokens_id", "refresh_tokens", "id"),
+    ("ix_refresh_tokens_user_id", "refresh_tokens", "user_id"),
+    ("ix_refresh_tokens_expires_at", "refresh_tokens", "expires_at"),
+]
+
+
+def upgrade() -> None:
+    """
+    액세스 토큰 폐기 목록 / 리프레시 토큰 테이블 (create_all로 이미 생성된 경우 건너뜀)
+    """
+    # asyncpg는 prepared statement 하나에 여러 명령을 허용하지 않으므로 문장마다 실행
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS revoked_tokens (
+            jti VARCHAR(64) PRIMARY KEY,
+            expires_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            revoked_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+        )
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS refresh_tokens (
+            id SERIAL PRIMARY KEY,
+            token_hash VARCHAR(64) NOT NULL UNIQUE,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            jti VARCHAR(64) NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            expires_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            revoked_at TIMESTAMP WITHOUT TIME ZONE
+        )
+    """)
+    for name, table, columns in TOKEN_STATE_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade() -> None:
+    """
+    토큰 상태 테이블 제거
+    """
+    op.drop_table('refresh_tokens')
+    op.drop_table('revoked_tokens')
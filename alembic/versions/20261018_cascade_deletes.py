@@ -0,0 +1,114 @@
+"""ON DELETE CASCADE for campaign/post children and soft-delete purge indexes
+
+Revision ID: 20261018_cascade_deletes
+Revises: 20261018_campaign_refund_aggregates
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_cascade_deletes'
+down_revision = '20261018_campaign_refund_aggregates'
+branch_labels = None
+depends_on = None
+
+
+# (테이블, 컬럼, 참조 테이블) - 부모 삭제 시 DB가 자식 행을 함께 삭제
+CASCADE_FOREIGN_KEYS = [
+    ("posts", "campaign_id", "campaigns"),
+    ("order_requests", "post_id", "posts"),
+    ("order_requests", "campaign_id", "campaigns"),
+    ("telegram_notification_logs", "post_id", "posts"),
+    ("telegram_notification_logs", "campaign_id", "campaigns"),
+    ("purchase_requests", "campaign_id", "campaigns"),
+]
+
+# CASCADE 조회용 외래키 인덱스 + 소프트 삭제 정리(app/services/soft_delete_purge.py) 대상 부분 인덱스
+CASCADE_INDEXES = [
+    ("ix_order_requests_post_id", "order_requests", "(post_id)"),
+    ("ix_order_requests_campaign_id", "order_requests", "(campaign_id)"),
+    ("ix_telegram_notification_logs_campaign_id", "telegram_notification_logs", "(campaign_id) WHERE campaign_id IS NOT NULL"),
+    ("ix_purchase_requests_campaign_id", "purchase_requests", "(campaign_id) WHERE campaign_id IS NOT NULL"),
+    ("ix_campaign_contracts_campaign_id", "campaign_contracts", "(campaign_id)"),
+    ("ix_posts_soft_deleted", "posts", "(updated_at) WHERE is_active = false"),
+    ("ix_order_requests_soft_deleted", "order_requests", "(updated_at) WHERE is_active = false"),
+    ("ix_board_posts_soft_deleted", "board_posts", "(deleted_at) WHERE is_deleted = true"),
+]
+
+
+# pg_constraint.confdeltype 코드
+ON_DELETE_CODES = {"CASCADE": "c", "NO ACTION": "a"}
+
+
+def _replace_foreign_key(table: str, column: str, referred: str, on_delete: str) -> None:
+    """
+    컬럼의 외래키를 지정한 ON DELETE 동작으로 교체 (autocommit_block 안에서 호출, 다시 실행해도 안전)
+    - 이미 같은 동작의 외래키가 있으면 교체하지 않음
+    - 기존 외래키(이름 무관) 삭제와 NOT VALID 추가는 DO 블록 하나(트랜잭션 하나)로 실행해 외래키가 없는 순간이 없음.
+      NOT VALID 추가는 기존 행을 검사하지 않으므로 테이블 잠금은 짧게 끝남
+    - VALIDATE는 별도 트랜잭션: 기존 행 검사 동안 SHARE UPDATE EXCLUSIVE 잠금만 잡아 쓰기를 막지 않음
+    """
+    name = f"{table}_{column}_fkey"
+    column_fkeys = f"""
+        SELECT con.conname, con.confdeltype, con.convalidated FROM pg_constraint con
+        JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = ANY(con.conkey)
+        WHERE con.contype = 'f' AND con.conrelid = '{table}'::regclass AND a.attname = '{column}'
+    """
+    op.execute(f"""
+        DO $$
+        DECLARE r record;
+        BEGIN
+            IF EXISTS (SELECT 1 FROM ({column_fkeys}) fk WHERE fk.confdeltype = '{ON_DELETE_CODES[on_delete]}') THEN
+                RETURN;
+            END IF;
+            FOR r IN {column_fkeys} LOOP
+                EXECUTE format('ALTER TABLE {table} DROP CONSTRAINT %I', r.conname);
+            END LOOP;
+            ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({column})
+                REFERENCES {referred}(id) ON DELETE {on_delete} NOT VALID;
+        END $$;
+    """)
+    # 위 DO 블록이 커밋된 뒤 검증 (중단 후 재실행 시 남아 있는 NOT VALID 외래키도 검증)
+    op.execute(f"""
+        DO $$
+        DECLARE r record;
+        BEGIN
+            FOR r IN SELECT * FROM ({column_fkeys}) fk WHERE NOT fk.convalidated LOOP
+                EXECUTE format('ALTER TABLE {table} VALIDATE CONSTRAINT %I', r.conname);
+            END LOOP;
+        END $$;
+    """)
+
+
+def upgrade() -> None:
+    # 인덱스 먼저 (CASCADE가 자식 테이블을 순차 스캔하지 않도록) - 운영 중 잠금 방지를 위해 CONCURRENTLY
+    with op.get_context().autocommit_block():
+        for name, table, definition in CASCADE_INDEXES:
+            op.execute(f"""
+                DO $$
+                BEGIN
+                    IF EXISTS (
+                        SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                        WHERE c.relname = '{name}' AND NOT i.indisvalid
+                    ) THEN
+                        EXECUTE 'DROP INDEX {name}';
+                    END IF;
+                END $$;
+            """)
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+
+    # 외래키별로 교체와 검증을 각각 커밋 (긴 VALIDATE가 ACCESS EXCLUSIVE 잠금과 같은 트랜잭션에 묶이지 않도록)
+    with op.get_context().autocommit_block():
+        for table, column, referred in CASCADE_FOREIGN_KEYS:
+            _replace_foreign_key(table, column, referred, "CASCADE")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column, referred in reversed(CASCADE_FOREIGN_KEYS):
+            _replace_foreign_key(table, column, referred, "NO ACTION")
+
+        for name, _, _ in reversed(CASCADE_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
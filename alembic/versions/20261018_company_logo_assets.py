@@ -0,0 +1,33 @@
+"""add content hash and resized variants to company_logos
+
+Revision ID: 20261018_company_logo_assets
+Revises: 20261018_cascade_deletes
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_company_logo_assets'
+down_revision = '20261018_cascade_deletes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    company_logos에 콘텐츠 해시/확장자/리사이즈 너비 컬럼 추가
+    - 기존 행은 NULL로 남고 logo_url을 그대로 사용 (다음 업로드부터 버전 URL)
+    """
+    op.execute("ALTER TABLE company_logos ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)")
+    op.execute("ALTER TABLE company_logos ADD COLUMN IF NOT EXISTS asset_ext VARCHAR(10)")
+    op.execute("ALTER TABLE company_logos ADD COLUMN IF NOT EXISTS variant_widths JSON")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_company_logos_company_id ON company_logos (company_id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_company_logos_company_id")
+    op.execute("ALTER TABLE company_logos DROP COLUMN IF EXISTS variant_widths")
+    op.execute("ALTER TABLE company_logos DROP COLUMN IF EXISTS asset_ext")
+    op.execute("ALTER TABLE company_logos DROP COLUMN IF EXISTS content_hash")
@@ -1,13 +1,16 @@
 """
 관리자 전용 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_async_db
 from app.db.cleanup_data import cleanup_dummy_data, reset_database_to_production
 from app.api.deps import get_current_active_user
 from app.models.user import User, UserRole
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -243,6 +246,89 @@ async def get_schema_status(
         )
 
 
+@router.get("/index-advisor")
+async def get_index_advisor_report(
+    min_table_rows: int = Query(1000, ge=0, description="이 행 수 미만 테이블은 후보에서 제외"),
+    statement_limit: int = Query(50, ge=1, le=500, description="분석할 상위 문장 수"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """인덱스 추천 / 미사용 인덱스 리포트 (슈퍼 어드민 전용)"""
+    
+    # 슈퍼 어드민 권한 확인
+    if current_user.role != UserRole.SUPER_ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="슈퍼 어드민만 인덱스 분석을 조회할 수 있습니다."
+        )
+    
+    try:
+        from app.db.index_advisor import IndexAdvisor
+        
+        advisor = IndexAdvisor(min_table_rows=min_table_rows, statement_limit=statement_limit)
+        return await advisor.analyze(db)
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"인덱스 분석 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/campaign-aggregates/drift")
+async def get_campaign_aggregate_drift(
+    fix: bool = Query(False, description="드리프트가 있으면 posts 기준으로 보정"),
+    current_user: User = Depends(get_current_active_user)
+):
+    """캠페인 포스트 집계(budget/포스트 수) 드리프트 점검 (슈퍼 어드민 전용)"""
+    
+    # 슈퍼 어드민 권한 확인
+    if current_user.role != UserRole.SUPER_ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="슈퍼 어드민만 캠페인 집계를 점검할 수 있습니다."
+        )
+    
+    try:
+        from app.services.campaign_aggregates import campaign_aggregate_reconciler
+        
+        return await campaign_aggregate_reconciler.run_once(fix=fix)
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"캠페인 집계 점검 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/soft-delete-purge")
+async def get_soft_delete_purge_status(
+    run: bool = Query(False, description="지금 한 번 실행"),
+    current_user: User = Depends(get_current_active_user)
+):
+    """소프트 삭제 행 배치 정리 상태(실행별/누적 삭제 건수) 조회 (슈퍼 어드민 전용)"""
+    
+    # 슈퍼 어드민 권한 확인
+    if current_user.role != UserRole.SUPER_ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail="슈퍼 어드민만 소프트 삭제 정리 상태를 조회할 수 있습니다."
+        )
+    
+    try:
+        from app.services.soft_delete_purge import soft_delete_purger
+        
+        if run:
+            await soft_delete_purger.run_once()
+        return soft_delete_purger.stats()
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"소프트 삭제 정리 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
 @router.post("/smart-migration")
 async def smart_migration_endpoint(
     dry_run: bool = True,
@@ -478,7 +564,7 @@ async def update_null_campaign_dates_endpoint(
         from sqlalchemy import text
         from datetime import datetime, timedelta
         
-        print("Updating NULL campaign dates with default values...")
+        logger.debug("Updating NULL campaign dates with default values...")
         
         # NULL인 start_date와 end_date를 가진 캠페인 수 확인
         result = await db.execute(text("""
@@ -489,7 +575,7 @@ async def update_null_campaign_dates_endpoint(
         null_count = result.scalar()
         
         if null_count > 0:
-            print(f"Found {null_count} campaigns with NULL dates")
+            logger.debug("Found %s campaigns with NULL dates", null_count)
             
             # NULL인 날짜 필드들을 현재 시간과 30일 후로 설정
             current_time = datetime.now()
@@ -507,9 +593,9 @@ async def update_null_campaign_dates_endpoint(
             
             await db.commit()
             
-            print(f"Updated {null_count} campaigns with default dates")
-            print(f"Default start_date: {current_time}")
-            print(f"Default end_date: {end_time}")
+            logger.debug("Updated %s campaigns with default dates", null_count)
+            logger.debug("Default start_date: %s", current_time)
+            logger.debug("Default end_date: %s", end_time)
             
             return {
                 "success": True,
@@ -527,7 +613,7 @@ async def update_null_campaign_dates_endpoint(
             
     except Exception as e:
         await db.rollback()
-        print(f"Failed to update NULL campaign dates: {e}")
+        logger.error("Failed to update NULL campaign dates: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to update campaign dates: {str(e)}"
@@ -6,7 +6,7 @@ from datetime import timedelta
 from app.db.database import get_async_db
 from app.schemas.user import UserLogin, Token, UserResponse
 from app.services.user_service import UserService
-from app.core.security import create_access_token, verify_password, create_refresh_token, blacklist_token
+from app.core.security import create_access_token, verify_password_async, create_refresh_token, rotate_refresh_token, blacklist_token
 from app.core.config import settings
 from app.core.logging import security_logger
 
@@ -42,7 +42,11 @@ async def login(
     service = UserService(db)
     user = await service.get_user_by_email(form_data.username)
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    password_valid, upgraded_hash = (False, None)
+    if user:
+        password_valid, upgraded_hash = await verify_password_async(form_data.password, user.hashed_password)
+
+    if not password_valid:
         security_logger.log_login_attempt(
             email=form_data.username,
             success=False,
@@ -67,6 +71,11 @@ async def login(
             detail="비활성화된 계정입니다."
         )
     
+    # BCRYPT_ROUNDS 변경 시 기존 해시를 새 비용으로 교체
+    if upgraded_hash:
+        user.hashed_password = upgraded_hash
+        await db.commit()
+
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         subject=str(user.id), expires_delta=access_token_expires
@@ -82,7 +91,8 @@ async def login(
     return Token(
         access_token=access_token,
         token_type="bearer",
-        user=UserResponse.from_orm(user)
+        user=UserResponse.from_orm(user),
+        refresh_token=await create_refresh_token(db, user.id)
     )
 
 
@@ -99,7 +109,11 @@ async def login_json(
     service = UserService(db)
     user = await service.get_user_by_email(login_data.email)
     
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    password_valid, upgraded_hash = (False, None)
+    if user:
+        password_valid, upgraded_hash = await verify_password_async(login_data.password, user.hashed_password)
+
+    if not password_valid:
         security_logger.log_login_attempt(
             email=login_data.email,
             success=False,
@@ -123,6 +137,11 @@ async def login_json(
             detail="비활성화된 계정입니다."
         )
     
+    # BCRYPT_ROUNDS 변경 시 기존 해시를 새 비용으로 교체
+    if upgraded_hash:
+        user.hashed_password = upgraded_hash
+        await db.commit()
+
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         subject=str(user.id), expires_delta=access_token_expires
@@ -138,7 +157,8 @@ async def login_json(
     return Token(
         access_token=access_token,
         token_type="bearer",
-        user=UserResponse.from_orm(user)
+        user=UserResponse.from_orm(user),
+        refresh_token=await create_refresh_token(db, user.id)
     )
 
 
@@ -155,7 +175,7 @@ async def logout(
         )
     
     try:
-        blacklist_token(token)
+        await blacklist_token(token)
         return {"message": "로그아웃되었습니다."}
     except Exception as e:
         raise HTTPException(
@@ -167,18 +187,33 @@ async def logout(
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
     request: Request,
-    refresh_token: str = Depends(lambda request: request.headers.get("X-Refresh-Token", ""))
+    refresh_token: str = Depends(lambda request: request.headers.get("X-Refresh-Token", "")),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """리프레시 토큰을 사용한 액세스 토큰 갱신"""
+    """리프레시 토큰을 사용한 액세스 토큰 갱신 (리프레시 토큰은 1회용, 새 토큰 발급)"""
     if not refresh_token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="리프레시 토큰이 필요합니다."
         )
     
-    # TODO: 리프레시 토큰 검증 로직 구현 필요
-    # 현재는 기본 응답만 반환
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="리프레시 토큰 기능은 구현 예정입니다."
-    )
\ No newline at end of file
+    user_id = await rotate_refresh_token(db, refresh_token)
+    user = await UserService(db).get_user_by_id(int(user_id)) if user_id else None
+    if not user or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 리프레시 토큰입니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        subject=str(user.id), expires_delta=access_token_expires
+    )
+    
+    return Token(
+        access_token=access_token,
+        token_type="bearer",
+        user=UserResponse.from_orm(user),
+        refresh_token=await create_refresh_token(db, user.id)
+    )
@@ -14,6 +14,7 @@ from pathlib import Path
 from app.db.database import get_async_db
 from app.models import User, BoardPost, PostType, UserRole, BoardPostAttachment
 from app.api.deps import get_current_active_user
+from app.services.view_counter import view_counter
 
 router = APIRouter(prefix="/api/board", tags=["board"])
 
@@ -151,7 +152,7 @@ async def get_board_posts(
                     }
                     for att in post.attachments
                 ],
-                "viewCount": post.view_count,
+                "viewCount": post.view_count + view_counter.pending(post.id),
                 "authorId": post.author_id,
                 "authorName": post.author.name if post.author else None,
                 "createdAt": post.created_at.isoformat(),
@@ -196,9 +197,8 @@ async def get_board_post(
     if not post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
 
-    # 조회수 증가
-    post.view_count += 1
-    await db.commit()
+    # 조회수 증가 (워커 메모리에 모아 주기적으로 한 번에 반영)
+    view_counter.increment(post.id)
 
     return {
         "success": True,
@@ -224,7 +224,7 @@ async def get_board_post(
                 }
                 for att in post.attachments
             ],
-            "viewCount": post.view_count,
+            "viewCount": post.view_count + view_counter.pending(post.id),
             "authorId": post.author_id,
             "authorName": post.author.name if post.author else None,
             "createdAt": post.created_at.isoformat(),
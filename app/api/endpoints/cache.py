@@ -4,6 +4,8 @@ Cache management API endpoints
 
 from fastapi import APIRouter
 from app.core.cache import app_cache, invalidate_user_cache, invalidate_global_cache
+from app.services.company_logo import company_logo_cache
+from app.services.company_settings import company_settings_cache
 
 router = APIRouter()
 
@@ -15,7 +17,9 @@ async def get_cache_stats():
     return {
         "cache_stats": stats,
         "cache_type": "in_memory",
-        "default_ttl_seconds": app_cache.default_ttl
+        "default_ttl_seconds": app_cache.default_ttl,
+        "company_settings": company_settings_cache.stats(),
+        "company_logo": company_logo_cache.stats()
     }
 
 
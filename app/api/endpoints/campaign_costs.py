@@ -11,6 +11,9 @@ from app.models.user import User, UserRole
 from app.models.campaign import Campaign
 from app.models.campaign_cost import CampaignCost
 from pydantic import BaseModel
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -83,7 +86,7 @@ async def create_campaign_cost(
     await db.commit()
     await db.refresh(new_cost)
 
-    print(f"[CAMPAIGN-COST] Created cost {new_cost.id} for campaign {cost_data.campaign_id} by user {current_user.name}")
+    logger.debug("[CAMPAIGN-COST] Created cost %s for campaign %s by user %s", new_cost.id, cost_data.campaign_id, current_user.name)
 
     return new_cost
 
@@ -153,7 +156,7 @@ async def approve_campaign_cost(
     # 캠페인 원가 업데이트
     await _update_campaign_cost(db, cost.campaign_id)
 
-    print(f"[CAMPAIGN-COST] Cost {cost_id} approved by {current_user.name}")
+    logger.debug("[CAMPAIGN-COST] Cost %s approved by %s", cost_id, current_user.name)
 
     return {"message": "Cost approved successfully", "cost_id": cost_id}
 
@@ -191,7 +194,7 @@ async def delete_campaign_cost(
     # 캠페인 원가 업데이트
     await _update_campaign_cost(db, campaign_id)
 
-    print(f"[CAMPAIGN-COST] Cost {cost_id} deleted by {current_user.name}")
+    logger.debug("[CAMPAIGN-COST] Cost %s deleted by %s", cost_id, current_user.name)
 
     return {"message": "Cost deleted successfully", "cost_id": cost_id}
 
@@ -233,4 +236,4 @@ async def _update_campaign_cost(db: AsyncSession, campaign_id: int):
 
     await db.commit()
 
-    print(f"[CAMPAIGN-COST] Updated campaign {campaign_id} cost={total_cost}, margin={campaign.margin}")
+    logger.debug("[CAMPAIGN-COST] Updated campaign %s cost=%s, margin=%s", campaign_id, total_cost, campaign.margin)
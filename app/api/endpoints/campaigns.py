@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, File, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_, and_, extract
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import aliased, joinedload, load_only, noload, selectinload
 from typing import List, Optional
 from urllib.parse import unquote
 from datetime import datetime, timezone
@@ -11,20 +11,64 @@ import logging
 logger = logging.getLogger(__name__)
 
 from app.db.database import get_async_db
-from app.schemas.campaign import CampaignCreate, CampaignUpdate, CampaignResponse, CampaignDuplicateRequest, CampaignDuplicateResponse
-from app.schemas.post import PostCreate, PostResponse
+from app.schemas.campaign import (
+    CampaignCreate, CampaignUpdate, CampaignResponse, CampaignDuplicateRequest, CampaignDuplicateResponse,
+    CampaignBulkCloneRequest, CampaignBulkCloneResponse, CampaignCloneResult,
+)
+from app.schemas.post import PostBatchRequest, PostCreate, PostResponse
 from app.schemas.order_request import OrderRequestCreate, OrderRequestResponse
 from app.api.deps import get_current_active_user
 from app.models.user import User, UserRole
 from app.models.campaign import Campaign, CampaignStatus
+from app.models.campaign_contract import CampaignContract
 from app.models.post import Post
 from app.models.order_request import OrderRequest
 from app.models.product import Product
 from app.core.websocket import manager
+from app.services.campaign_aggregates import apply_post_delta, delete_post_refunds, post_contribution
+from app.core.serialization import FastJSONResponse, source_attributes
+from app.schemas.serializers import (
+    CAMPAIGN_LIST_FIELDS, CAMPAIGN_LIST_INCLUDES, campaign_list_view, serialize_campaign_list_post,
+    serialize_campaign_detail, serialize_campaign_post, serialize_campaign_post_compat, serialize_order_request_row
+)
 
 router = APIRouter()
 
 
+def _load_columns(model, fields, extra=()):
+    """직렬화 스펙이 읽는 속성 중 실제 컬럼만 (load_only 인자)"""
+    column_attrs = model.__mapper__.column_attrs
+    names = dict.fromkeys(name for name in (*source_attributes(fields), *extra) if name in column_attrs)
+    return [getattr(model, name) for name in names]
+
+
+def _campaign_list_load_options(view):
+    """캠페인 목록 응답에 필요한 컬럼과 관계만 로드하는 옵션"""
+    campaign_fields = [CAMPAIGN_LIST_FIELDS[key] for key in view.fields]
+    # 관계 로딩에 필요한 FK는 항상 포함
+    options = [load_only(*_load_columns(Campaign, campaign_fields, ("creator_id", "staff_id", "client_user_id")))]
+    includes = set(view.includes)
+    for key, relationship in (("creator", Campaign.creator), ("staff_user", Campaign.staff_user), ("client_user", Campaign.client_user)):
+        if key in includes:
+            serializer = CAMPAIGN_LIST_INCLUDES[key].serializer
+            options.append(joinedload(relationship).load_only(*_load_columns(User, serializer.fields)))
+        else:
+            # client_user/staff_user는 모델 기본값이 selectin - 요청하지 않았으면 로드하지 않음
+            options.append(noload(relationship))
+    # 컬렉션은 selectinload (LIMIT 페이지에 행 곱 없이, 활성 항목만)
+    if "posts" in includes:
+        options.append(
+            selectinload(Campaign.posts.and_(Post.is_active == True))
+            .load_only(*_load_columns(Post, serialize_campaign_list_post.fields))
+        )
+    if "contracts" in includes:
+        options.append(
+            selectinload(Campaign.contracts.and_(CampaignContract.is_active == True))
+            .load_only(*_load_columns(CampaignContract, CAMPAIGN_LIST_INCLUDES["contracts"].serializer.fields, ("is_active",)))
+        )
+    return options
+
+
 @router.get("/")
 async def get_campaigns(
     request: Request,
@@ -34,12 +78,26 @@ async def get_campaigns(
     # 월별 필터링 파라미터
     year: Optional[int] = Query(None, description="연도 필터"),
     month: Optional[int] = Query(None, ge=1, le=12, description="월 필터 (1-12)"),
+    # 응답 필드 선택 파라미터
+    fields: Optional[str] = Query(
+        None,
+        description="캠페인 필드 (쉼표 구분, *=전체). 미지정 시 요약 필드 + post_count/posts_budget (활성 포스트 집계)"
+    ),
+    include: Optional[str] = Query(
+        None,
+        description="포함할 관계 (creator,staff_user,client_user,posts,contracts, *=전체). 미지정 시 creator,staff_user"
+    ),
     # JWT 인증된 사용자
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_async_db)
 ):
     """캠페인 목록 조회 (JWT 인증 기반 권한별 필터링)"""
-    print(f"[CAMPAIGNS-LIST] JWT User: {current_user.name}, Role: {current_user.role.value}, Company: {current_user.company}")
+    try:
+        view = campaign_list_view(fields, include)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    logger.debug("[CAMPAIGNS-LIST] JWT User: %s, Role: %s, Company: %s", current_user.name, current_user.role.value, current_user.company)
     
     user_id = current_user.id
     user_role = current_user.role.value
@@ -49,13 +107,13 @@ async def get_campaigns(
     page_size = size
     offset = (page - 1) * size
     
-    print(f"[CAMPAIGNS-LIST] Pagination - page={current_page}, size={page_size}, offset={offset}")
+    logger.debug("[CAMPAIGNS-LIST] Pagination - page=%s, size=%s, offset=%s", current_page, page_size, offset)
     
     # JWT 기반 권한별 필터링 (UserRole enum 값 사용)
     # 기존 client_company 필드 기반 필터링 (데이터베이스 구조에 맞춰)
     if user_role == UserRole.SUPER_ADMIN.value:
         # 슈퍼 어드민은 모든 캠페인 조회 가능
-        query = select(Campaign).options(joinedload(Campaign.creator), joinedload(Campaign.client_user), joinedload(Campaign.staff_user), joinedload(Campaign.posts), joinedload(Campaign.contracts))
+        query = select(Campaign)
         count_query = select(func.count(Campaign.id))
     elif user_role == UserRole.AGENCY_ADMIN.value:
         # AGENCY_ADMIN은 다음 조건의 캠페인 조회 가능:
@@ -64,7 +122,7 @@ async def get_campaigns(
 
         if current_user.company is None or current_user.company == '':
             # company가 없는 사용자는 캠페인 조회 불가 (보안 강화)
-            query = select(Campaign).options(joinedload(Campaign.creator), joinedload(Campaign.client_user), joinedload(Campaign.staff_user), joinedload(Campaign.posts), joinedload(Campaign.contracts)).where(False)
+            query = select(Campaign).where(False)
             count_query = select(func.count(Campaign.id)).where(False)
         else:
             # Campaign.company 컬럼을 직접 사용한 간단한 쿼리 (성능 개선)
@@ -80,7 +138,7 @@ async def get_campaigns(
             column_result = await db.execute(check_column_query)
             company_column_exists = column_result.fetchone() is not None
 
-            print(f"[CAMPAIGNS-LIST] campaigns.company 컬럼 존재 여부: {company_column_exists}")
+            logger.debug("[CAMPAIGNS-LIST] campaigns.company 컬럼 존재 여부: %s", company_column_exists)
 
             if company_column_exists:
                 # campaigns.company 컬럼이 있는 경우 - 직접 필터링 (성능 최적화)
@@ -88,13 +146,7 @@ async def get_campaigns(
                 # 1. 같은 company의 캠페인
                 # 2. 본인이 생성한 캠페인 (다른 company여도 가능)
                 # 3. 본인이 staff로 배정된 캠페인 (다른 company여도 가능)
-                query = select(Campaign).options(
-                    joinedload(Campaign.creator),
-                    joinedload(Campaign.client_user),
-                    joinedload(Campaign.staff_user),
-                    joinedload(Campaign.posts),
-                    joinedload(Campaign.contracts)
-                ).where(
+                query = select(Campaign).where(
                     or_(
                         Campaign.company == current_user.company,
                         Campaign.creator_id == user_id,
@@ -110,7 +162,7 @@ async def get_campaigns(
                 )
             else:
                 # campaigns.company 컬럼이 없는 경우 - 서브쿼리 방식으로 안전하게 처리 (Fallback)
-                print(f"[CAMPAIGNS-LIST] Fallback 로직 사용 - 서브쿼리 방식")
+                logger.debug("[CAMPAIGNS-LIST] Fallback 로직 사용 - 서브쿼리 방식")
 
                 # AGENCY_ADMIN은 다음 중 하나만 만족하면 조회 가능 (OR 조건):
                 # 1. creator가 같은 company의 사용자
@@ -118,13 +170,7 @@ async def get_campaigns(
                 # 3. 본인이 staff로 배정된 캠페인
                 creator_subquery = select(User.id).where(User.company == current_user.company)
 
-                query = select(Campaign).options(
-                    joinedload(Campaign.creator),
-                    joinedload(Campaign.client_user),
-                    joinedload(Campaign.staff_user),
-                    joinedload(Campaign.posts),
-                    joinedload(Campaign.contracts)
-                ).where(
+                query = select(Campaign).where(
                     or_(
                         Campaign.creator_id.in_(creator_subquery),
                         Campaign.creator_id == user_id,
@@ -140,13 +186,7 @@ async def get_campaigns(
                 )
     elif user_role == UserRole.CLIENT.value:
         # 클라이언트는 자신을 대상으로 한 캠페인만 조회 가능 (client_user_id 외래키 관계 사용)
-        query = select(Campaign).options(
-            joinedload(Campaign.creator),
-            joinedload(Campaign.client_user),
-            joinedload(Campaign.staff_user),
-            joinedload(Campaign.posts),
-            joinedload(Campaign.contracts)
-        ).where(Campaign.client_user_id == user_id)
+        query = select(Campaign).where(Campaign.client_user_id == user_id)
         count_query = select(func.count(Campaign.id)).where(Campaign.client_user_id == user_id)
     elif user_role == UserRole.TEAM_LEADER.value:
         # TEAM_LEADER는 다음 조건의 캠페인 조회 가능:
@@ -163,13 +203,7 @@ async def get_campaigns(
             )
         )
 
-        query = select(Campaign).options(
-            joinedload(Campaign.creator),
-            joinedload(Campaign.client_user),
-            joinedload(Campaign.staff_user),
-            joinedload(Campaign.posts),
-            joinedload(Campaign.contracts)
-        ).where(
+        query = select(Campaign).where(
             or_(
                 Campaign.creator_id == user_id,  # 본인이 생성
                 Campaign.staff_id == user_id,  # 본인이 담당
@@ -187,7 +221,7 @@ async def get_campaigns(
         )
     elif user_role == UserRole.STAFF.value:
         # 직원은 자신이 생성한 캠페인 또는 자신이 담당하는 캠페인 조회 가능 (creator_id 또는 staff_id 기준)
-        query = select(Campaign).options(joinedload(Campaign.creator), joinedload(Campaign.client_user), joinedload(Campaign.staff_user), joinedload(Campaign.posts), joinedload(Campaign.contracts)).where(
+        query = select(Campaign).where(
             or_(Campaign.creator_id == user_id, Campaign.staff_id == user_id)
         )
         count_query = select(func.count(Campaign.id)).where(
@@ -195,7 +229,7 @@ async def get_campaigns(
         )
     else:
         # 기본적으로는 같은 회사 기준 필터링 (creator의 company 기준)
-        query = select(Campaign).options(joinedload(Campaign.creator), joinedload(Campaign.client_user), joinedload(Campaign.staff_user), joinedload(Campaign.posts), joinedload(Campaign.contracts)).join(User, Campaign.creator_id == User.id).where(
+        query = select(Campaign).join(User, Campaign.creator_id == User.id).where(
             User.company == current_user.company
         )
         count_query = select(func.count(Campaign.id)).join(User, Campaign.creator_id == User.id).where(
@@ -204,7 +238,7 @@ async def get_campaigns(
 
     # 월별 필터링 적용 (year, month 파라미터가 있는 경우)
     if year is not None and month is not None:
-        print(f"[CAMPAIGNS-LIST] 월별 필터링 적용: {year}년 {month}월")
+        logger.debug("[CAMPAIGNS-LIST] 월별 필터링 적용: %s년 %s월", year, month)
         date_filter = and_(
             extract('year', Campaign.start_date) == year,
             extract('month', Campaign.start_date) == month
@@ -230,14 +264,14 @@ async def get_campaigns(
             query = query.where(date_filter)
             count_query = count_query.where(date_filter)
     else:
-        print(f"[CAMPAIGNS-LIST] 월별 필터링 없음 - 전체 기간 조회")
+        logger.debug("[CAMPAIGNS-LIST] 월별 필터링 없음 - 전체 기간 조회")
 
     # 전체 개수 조회
     total_count_result = await db.execute(count_query)
     total_count = total_count_result.scalar()
     
-    # 페이지네이션 적용된 쿼리 실행
-    paginated_query = query.offset(offset).limit(page_size).order_by(Campaign.created_at.desc())
+    # 페이지네이션 적용된 쿼리 실행 (요청한 필드/관계만 로드)
+    paginated_query = query.options(*_campaign_list_load_options(view)).offset(offset).limit(page_size).order_by(Campaign.created_at.desc())
     result = await db.execute(paginated_query)
     campaigns = result.unique().scalars().all()
     
@@ -246,105 +280,12 @@ async def get_campaigns(
     has_next = current_page < total_pages
     has_prev = current_page > 1
     
-    print(f"[CAMPAIGNS-LIST-JWT] Found {len(campaigns)} campaigns (page {current_page}/{total_pages}, total: {total_count})")
-    
-    # Campaign 모델을 CampaignResponse 스키마로 직렬화 (기존 구조 유지)
-    serialized_campaigns = []
-    for campaign in campaigns:
-        campaign_data = {
-            "id": campaign.id,
-            "name": campaign.name,
-            "description": campaign.description,
-            "status": campaign.status.value if campaign.status else None,
-            "client_company": campaign.client_company,
-            "budget": campaign.budget,  # budget 필드 추가
-            "start_date": campaign.start_date.isoformat() if campaign.start_date else None,
-            "end_date": campaign.end_date.isoformat() if campaign.end_date else None,
-            "invoiceIssued": getattr(campaign, 'invoice_issued', False) if hasattr(campaign, 'invoice_issued') else False,  # 계산서 발행 완료
-            "paymentCompleted": getattr(campaign, 'payment_completed', False) if hasattr(campaign, 'payment_completed') else False,  # 입금 완료
-            "creator_id": campaign.creator_id,
-            "staff_id": campaign.staff_id,  # 캠페인 담당 직원 ID 추가
-            "created_at": campaign.created_at.isoformat() if campaign.created_at else None,
-            "updated_at": campaign.updated_at.isoformat() if campaign.updated_at else None,
-            "User": {
-                "id": campaign.creator.id,
-                "name": campaign.creator.name,
-                "role": campaign.creator.role.value,
-                "company": campaign.creator.company
-            } if campaign.creator else None,
-            "staff_user": {
-                "id": campaign.staff_user.id,
-                "name": campaign.staff_user.name,
-                "role": campaign.staff_user.role.value,
-                "company": campaign.staff_user.company
-            } if campaign.staff_user else None,
-            "client_user": {
-                "id": campaign.client_user.id,
-                "name": campaign.client_user.name,
-                "email": campaign.client_user.email,
-                "company": campaign.client_user.company,
-                "business_number": getattr(campaign.client_user, 'business_number', None),
-                "contact": campaign.client_user.contact,
-                # 클라이언트 실제 회사 정보 추가
-                "client_company_name": getattr(campaign.client_user, 'client_company_name', None),
-                "client_business_number": getattr(campaign.client_user, 'client_business_number', None),
-                "client_ceo_name": getattr(campaign.client_user, 'client_ceo_name', None),
-                "client_company_address": getattr(campaign.client_user, 'client_company_address', None),
-                "client_business_type": getattr(campaign.client_user, 'client_business_type', None),
-                "client_business_item": getattr(campaign.client_user, 'client_business_item', None)
-            } if campaign.client_user else None,
-            "posts": [
-                {
-                    "id": post.id,
-                    "title": post.title,
-                    "work_type": post.work_type,
-                    "workType": post.work_type,  # 프론트엔드 호환성
-                    "topicStatus": post.topic_status,
-                    "outline": post.outline,
-                    "outlineStatus": post.outline_status,  # 세부사항 승인 상태 추가
-                    "rejectReason": post.reject_reason,  # 반려 사유
-                    "images": post.images or [],
-                    "published_url": post.published_url,
-                    "publishedUrl": post.published_url,  # 프론트엔드 호환성
-                    "orderRequestStatus": post.order_request_status,
-                    "orderRequestId": post.order_request_id,
-                    "startDate": post.start_date,      # 기존 호환성
-                    "dueDate": post.due_date,          # 기존 호환성
-                    # "startDatetime": post.start_datetime.isoformat() if post.start_datetime else None,
-                    # "dueDatetime": post.due_datetime.isoformat() if post.due_datetime else None,
-                    "productId": post.product_id,
-                    "product_name": post.product_name,  # 상품명 추가
-                    "productName": post.product_name,  # 프론트엔드 호환성
-                    "quantity": post.quantity,
-                    "budget": post.budget or 0.0,  # 견적 금액
-                    # 재무 관련 필드
-                    "invoiceIssued": post.invoice_issued or False,
-                    "paymentCompleted": post.payment_completed or False,
-                    "invoiceDueDate": post.invoice_due_date.isoformat() if post.invoice_due_date else None,
-                    "paymentDueDate": post.payment_due_date.isoformat() if post.payment_due_date else None,
-                    "is_active": post.is_active,
-                    "createdAt": post.created_at.isoformat() if post.created_at else None,
-                    "updatedAt": post.updated_at.isoformat() if post.updated_at else None
-                } for post in (campaign.posts or []) if post.is_active
-            ],
-            "contracts": [
-                {
-                    "id": contract.id,
-                    "file_url": contract.file_url,
-                    "file_name": contract.file_name,
-                    "file_size": contract.file_size,
-                    "uploaded_at": contract.uploaded_at.isoformat() if contract.uploaded_at else None
-                } for contract in (campaign.contracts or []) if contract.is_active
-            ],
-            # 취소/환불 관련 필드
-            "cancelled_at": campaign.cancelled_at.isoformat() if getattr(campaign, 'cancelled_at', None) else None,
-            "cancellation_reason": getattr(campaign, 'cancellation_reason', None),
-            "refund_amount": float(campaign.refund_amount) if getattr(campaign, 'refund_amount', None) else 0,
-            "is_refunded": getattr(campaign, 'is_refunded', False)
-        }
-        serialized_campaigns.append(campaign_data)
+    logger.debug("[CAMPAIGNS-LIST-JWT] Found %s campaigns (page %s/%s, total: %s)", len(campaigns), current_page, total_pages, total_count)
     
-    return {
+    # fields/include 조합별로 생성한 직렬화 함수로 변환
+    serialized_campaigns = [view.serializer(campaign) for campaign in campaigns]
+
+    return FastJSONResponse({
         "data": serialized_campaigns,
         "pagination": {
             "page": current_page,
@@ -355,7 +296,7 @@ async def get_campaigns(
             "has_prev": has_prev,
             "offset": offset
         }
-    }
+    })
 
 
 @router.post("/", response_model=CampaignResponse)
@@ -370,12 +311,12 @@ async def create_campaign(
     user_id = current_user.id
     user_role = current_user.role.value
     
-    print(f"[CAMPAIGN-CREATE-JWT] Campaign creation request - User ID: {user_id}, Role: {user_role}")
-    print(f"[CAMPAIGN-CREATE-JWT] Campaign data: {campaign_data}")
+    logger.debug("[CAMPAIGN-CREATE-JWT] Campaign creation request - User ID: %s, Role: %s", user_id, user_role)
+    logger.debug("[CAMPAIGN-CREATE-JWT] Campaign data: %s", campaign_data)
     
     # 권한 확인 - 관리자, 팀 리더, 직원은 캠페인 생성 가능
     if user_role not in [UserRole.SUPER_ADMIN.value, UserRole.AGENCY_ADMIN.value, UserRole.TEAM_LEADER.value, UserRole.STAFF.value]:
-        print(f"[CAMPAIGN-CREATE-JWT] ERROR: Insufficient permissions - user_role={user_role}")
+        logger.error("[CAMPAIGN-CREATE-JWT] ERROR: Insufficient permissions - user_role=%s", user_role)
         raise HTTPException(status_code=403, detail="권한이 없습니다. 관리자, 팀 리더, 직원만 캠페인을 생성할 수 있습니다.")
     
     # 새 캠페인 생성 - 안전한 기본값 처리
@@ -395,7 +336,7 @@ async def create_campaign(
                     parsed = datetime.fromisoformat(date_input.replace('Z', '+00:00'))
                     return parsed.replace(tzinfo=None)
                 except ValueError:
-                    print(f"[CAMPAIGN-CREATE-JWT] WARNING: Failed to parse date string: {date_input}")
+                    logger.error("[CAMPAIGN-CREATE-JWT] WARNING: Failed to parse date string: %s", date_input)
                     return current_time
             return current_time
         
@@ -410,9 +351,9 @@ async def create_campaign(
                 match = re.search(r'\(ID: (\d+)\)', client_company)
                 if match:
                     client_user_id = int(match.group(1))
-                    print(f"[CAMPAIGN-CREATE-JWT] Extracted client_user_id: {client_user_id}")
+                    logger.debug("[CAMPAIGN-CREATE-JWT] Extracted client_user_id: %s", client_user_id)
             except (ValueError, AttributeError) as e:
-                print(f"[CAMPAIGN-CREATE-JWT] Failed to extract client_user_id: {e}")
+                logger.error("[CAMPAIGN-CREATE-JWT] Failed to extract client_user_id: %s", e)
 
         # 캠페인 생성 - client_user_id와 staff_id 처리
         campaign_kwargs = {
@@ -428,31 +369,31 @@ async def create_campaign(
             "status": CampaignStatus.ACTIVE
         }
 
-        print(f"[CAMPAIGN-CREATE-JWT] Setting campaign company to: {current_user.company}")
+        logger.debug("[CAMPAIGN-CREATE-JWT] Setting campaign company to: %s", current_user.company)
         
         # client_user_id 필드가 존재하는지 확인 후 설정 (스키마 동기화 대응)
         try:
             # Campaign 모델에 client_user_id 속성이 있는지 확인
             if hasattr(Campaign, 'client_user_id'):
                 campaign_kwargs["client_user_id"] = client_user_id
-                print(f"[CAMPAIGN-CREATE-JWT] client_user_id field available, set to: {client_user_id}")
+                logger.debug("[CAMPAIGN-CREATE-JWT] client_user_id field available, set to: %s", client_user_id)
             else:
-                print("[CAMPAIGN-CREATE-JWT] client_user_id field not available, skipping")
+                logger.debug("[CAMPAIGN-CREATE-JWT] client_user_id field not available, skipping")
         except Exception as e:
-            print(f"[CAMPAIGN-CREATE-JWT] Warning: Could not set client_user_id: {e}")
+            logger.warning("[CAMPAIGN-CREATE-JWT] Warning: Could not set client_user_id: %s", e)
 
         new_campaign = Campaign(**campaign_kwargs)
         
-        print(f"[CAMPAIGN-CREATE-JWT] SUCCESS: Creating campaign with data: name='{new_campaign.name}', budget={new_campaign.budget}")
+        logger.debug("[CAMPAIGN-CREATE-JWT] SUCCESS: Creating campaign with data: name='%s', budget=%s", new_campaign.name, new_campaign.budget)
         db.add(new_campaign)
         await db.commit()
         await db.refresh(new_campaign)
-        print(f"[CAMPAIGN-CREATE-JWT] SUCCESS: Campaign created with ID {new_campaign.id}")
+        logger.debug("[CAMPAIGN-CREATE-JWT] SUCCESS: Campaign created with ID %s", new_campaign.id)
     except Exception as e:
         await db.rollback()
-        print(f"[CAMPAIGN-CREATE-JWT] ERROR: Database operation failed: {e}")
-        print(f"[CAMPAIGN-CREATE-JWT] ERROR: Exception type: {type(e).__name__}")
-        print(f"[CAMPAIGN-CREATE-JWT] ERROR: Campaign data that failed: name='{campaign_data.name}', budget={campaign_data.budget}, client_company='{campaign_data.client_company}'")
+        logger.error("[CAMPAIGN-CREATE-JWT] ERROR: Database operation failed: %s", e)
+        logger.error("[CAMPAIGN-CREATE-JWT] ERROR: Exception type: %s", type(e).__name__)
+        logger.error("[CAMPAIGN-CREATE-JWT] ERROR: Campaign data that failed: name='%s', budget=%s, client_company='%s'", campaign_data.name, campaign_data.budget, campaign_data.client_company)
         raise HTTPException(status_code=500, detail=f"캠페인 생성 중 오류가 발생했습니다: {str(e)}")
     
     # WebSocket 알림 전송 (일시적으로 비활성화)
@@ -468,7 +409,7 @@ async def create_campaign(
         )
     except Exception as e:
         # WebSocket 에러는 무시하고 계속 진행
-        print(f"WebSocket notification failed: {e}")
+        logger.error("WebSocket notification failed: %s", e)
 
     # 명시적 dict 변환으로 직렬화 문제 해결
     response_data = {
@@ -490,7 +431,7 @@ async def create_campaign(
         "client_user": None
     }
 
-    print(f"[CAMPAIGN-CREATE-JWT] Returning response: {response_data}")
+    logger.debug("[CAMPAIGN-CREATE-JWT] Returning response: %s", response_data)
     return response_data
 
 
@@ -505,15 +446,15 @@ async def get_staff_members(
     user_id = current_user.id
     user_role = current_user.role.value
     
-    print(f"[STAFF-MEMBERS-JWT] Request from user_id={user_id}, user_role={user_role}")
+    logger.debug("[STAFF-MEMBERS-JWT] Request from user_id=%s, user_role=%s", user_id, user_role)
     
     # 대행사 어드민과 슈퍼 어드민만 직원 목록 조회 가능
     if user_role not in [UserRole.AGENCY_ADMIN.value, UserRole.SUPER_ADMIN.value]:
-        print(f"[STAFF-MEMBERS-JWT] ERROR: Insufficient permissions - user_role={user_role}")
+        logger.error("[STAFF-MEMBERS-JWT] ERROR: Insufficient permissions - user_role=%s", user_role)
         raise HTTPException(status_code=403, detail="직원 목록 조회 권한이 없습니다. 대행사 어드민 또는 슈퍼 어드민만 접근 가능합니다.")
     
     try:
-        print(f"[STAFF-MEMBERS-JWT] Found user: {current_user.name}, company={current_user.company}")
+        logger.debug("[STAFF-MEMBERS-JWT] Found user: %s, company=%s", current_user.name, current_user.company)
         
         # 직원들 조회 (권한별 필터링)
         if user_role == UserRole.SUPER_ADMIN.value:
@@ -532,7 +473,7 @@ async def get_staff_members(
         result = await db.execute(staff_query)
         staff_members = result.scalars().all()
         
-        print(f"[STAFF-MEMBERS-JWT] Found {len(staff_members)} staff members")
+        logger.debug("[STAFF-MEMBERS-JWT] Found %s staff members", len(staff_members))
         
         # 직원 정보를 딕셔너리로 변환
         staff_list = [
@@ -550,7 +491,7 @@ async def get_staff_members(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[STAFF-MEMBERS-JWT] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[STAFF-MEMBERS-JWT] Unexpected error: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"직원 목록 조회 중 오류: {str(e)}")
 
 
@@ -570,11 +511,11 @@ async def get_client_members(
     user_id = current_user.id
     user_role = current_user.role.value
     
-    print(f"[CLIENT-MEMBERS-JWT] Request from user_id={user_id}, user_role={user_role}")
-    print(f"[CLIENT-MEMBERS-JWT] Campaign ID: {campaign_id}")
+    logger.debug("[CLIENT-MEMBERS-JWT] Request from user_id=%s, user_role=%s", user_id, user_role)
+    logger.debug("[CLIENT-MEMBERS-JWT] Campaign ID: %s", campaign_id)
     
     try:
-        print(f"[CLIENT-MEMBERS-JWT] Found user: {current_user.name}, company={current_user.company}")
+        logger.debug("[CLIENT-MEMBERS-JWT] Found user: %s, company=%s", current_user.name, current_user.company)
         
         target_company = None
         
@@ -587,7 +528,7 @@ async def get_client_members(
             if not campaign:
                 raise HTTPException(status_code=404, detail="Campaign not found")
             
-            print(f"[CLIENT-MEMBERS-JWT] Campaign found: {campaign.name}, client_user_id: {campaign.client_user_id}")
+            logger.debug("[CLIENT-MEMBERS-JWT] Campaign found: %s, client_user_id: %s", campaign.name, campaign.client_user_id)
             
             if campaign.client_user_id:
                 # 캠페인의 클라이언트 사용자 조회
@@ -597,16 +538,16 @@ async def get_client_members(
                 
                 if client_user:
                     target_company = client_user.company
-                    print(f"[CLIENT-MEMBERS-JWT] Using campaign client's company: {target_company}")
+                    logger.debug("[CLIENT-MEMBERS-JWT] Using campaign client's company: %s", target_company)
                 else:
-                    print(f"[CLIENT-MEMBERS-JWT] Campaign client user not found, using current user's company")
+                    logger.debug("[CLIENT-MEMBERS-JWT] Campaign client user not found, using current user's company")
                     target_company = current_user.company
             else:
-                print(f"[CLIENT-MEMBERS-JWT] Campaign has no client_user_id, using current user's company")
+                logger.debug("[CLIENT-MEMBERS-JWT] Campaign has no client_user_id, using current user's company")
                 target_company = current_user.company
         else:
             target_company = current_user.company
-            print(f"[CLIENT-MEMBERS-JWT] No campaign_id provided, using current user's company: {target_company}")
+            logger.debug("[CLIENT-MEMBERS-JWT] No campaign_id provided, using current user's company: %s", target_company)
         
         # 대상 회사의 클라이언트들 조회 (클라이언트 역할만)
         client_query = select(User).where(
@@ -617,7 +558,7 @@ async def get_client_members(
         result = await db.execute(client_query)
         client_members = result.scalars().all()
         
-        print(f"[CLIENT-MEMBERS-JWT] Found {len(client_members)} client members in company: {target_company}")
+        logger.debug("[CLIENT-MEMBERS-JWT] Found %s client members in company: %s", len(client_members), target_company)
         
         # 클라이언트 정보를 딕셔너리로 변환
         client_list = [
@@ -635,7 +576,7 @@ async def get_client_members(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CLIENT-MEMBERS-JWT] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[CLIENT-MEMBERS-JWT] Unexpected error: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"클라이언트 목록 조회 중 오류: {str(e)}")
 
 
@@ -665,7 +606,7 @@ async def check_order_requests_table(
         count = result.scalar()
         return {"status": "ok", "table_exists": True, "count": count}
     except Exception as e:
-        print(f"[ORDER-REQUEST-HEALTH] Table check failed: {e}")
+        logger.error("[ORDER-REQUEST-HEALTH] Table check failed: %s", e)
         return {"status": "error", "table_exists": False, "error": str(e)}
 
 @router.get("/order-requests")
@@ -679,7 +620,7 @@ async def get_all_order_requests(
     user_role = current_user.role.value
     user_company = current_user.company
 
-    print(f"[ORDER-REQUESTS-LIST] Getting order requests for user_id={current_user.id}, role={user_role}, company={user_company}, month={month}")
+    logger.debug("[ORDER-REQUESTS-LIST] Getting order requests for user_id=%s, role=%s, company=%s, month=%s", current_user.id, user_role, user_company, month)
 
     try:
         # 발주요청 조회 (회사별 필터링 적용)
@@ -712,15 +653,15 @@ async def get_all_order_requests(
         # 권한별 필터링 (계층적 구조) - denormalized 필드 사용으로 성능 최적화
         if user_role == UserRole.SUPER_ADMIN:
             # 슈퍼 어드민: 모든 발주요청 조회 가능
-            print("[ORDER-REQUESTS-LIST] SUPER_ADMIN: showing all order requests")
+            logger.debug("[ORDER-REQUESTS-LIST] SUPER_ADMIN: showing all order requests")
             query = base_query
         elif user_role == UserRole.AGENCY_ADMIN:
             # 에이전시 어드민: 본인 회사의 모든 발주요청 조회 가능
-            print(f"[ORDER-REQUESTS-LIST] AGENCY_ADMIN: filtering by company '{user_company}'")
+            logger.debug("[ORDER-REQUESTS-LIST] AGENCY_ADMIN: filtering by company '%s'", user_company)
             query = base_query.where(OrderRequest.company == user_company)
         elif user_role == UserRole.TEAM_LEADER:
             # 팀 리더: 본인 회사의 STAFF + 본인의 발주요청만 조회 가능
-            print(f"[ORDER-REQUESTS-LIST] TEAM_LEADER: filtering by company '{user_company}' and staff only")
+            logger.debug("[ORDER-REQUESTS-LIST] TEAM_LEADER: filtering by company '%s' and staff only", user_company)
             query = base_query.where(
                 OrderRequest.company == user_company,
                 or_(
@@ -730,11 +671,11 @@ async def get_all_order_requests(
             )
         elif user_role == UserRole.STAFF:
             # 직원: 본인이 작성한 발주요청만 조회 가능
-            print(f"[ORDER-REQUESTS-LIST] STAFF: filtering by user_id={current_user.id}")
+            logger.debug("[ORDER-REQUESTS-LIST] STAFF: filtering by user_id=%s", current_user.id)
             query = base_query.where(OrderRequest.user_id == current_user.id)
         else:
             # CLIENT나 기타 역할은 발주요청 조회 불가
-            print(f"[ORDER-REQUESTS-LIST] Unauthorized role: {user_role}")
+            logger.debug("[ORDER-REQUESTS-LIST] Unauthorized role: %s", user_role)
             raise HTTPException(status_code=403, detail="발주요청 조회 권한이 없습니다")
 
         # 월간 필터 적용
@@ -748,9 +689,9 @@ async def get_all_order_requests(
                 start_date = datetime(year, month_num, 1)
                 end_date = datetime(year, month_num, last_day, 23, 59, 59)
                 query = query.where((OrderRequest.created_at >= start_date) & (OrderRequest.created_at <= end_date))
-                print(f"[ORDER-REQUESTS-LIST] Month filter applied: {start_date.isoformat()} to {end_date.isoformat()}")
+                logger.debug("[ORDER-REQUESTS-LIST] Month filter applied: %s to %s", start_date.isoformat(), end_date.isoformat())
             except (ValueError, AttributeError) as e:
-                print(f"[ORDER-REQUESTS-LIST] Invalid month format: {month}, error: {e}")
+                logger.error("[ORDER-REQUESTS-LIST] Invalid month format: %s, error: %s", month, e)
                 raise HTTPException(status_code=400, detail="Invalid month format. Use YYYY-MM format.")
 
         query = query.order_by(OrderRequest.created_at.desc())
@@ -758,44 +699,22 @@ async def get_all_order_requests(
         result = await db.execute(query)
         order_requests_with_details = result.all()
 
-        print(f"[ORDER-REQUESTS-LIST] Found {len(order_requests_with_details)} order requests")
+        logger.debug("[ORDER-REQUESTS-LIST] Found %s order requests", len(order_requests_with_details))
 
         # 응답 데이터 구성
-        order_requests_data = []
-        for order_request, post, campaign, product, requester_name in order_requests_with_details:
-            print(f"[ORDER-REQUEST-DATA] ID: {order_request.id}, post_id: {post.id}, product_id: {post.product_id}")
-            print(f"[ORDER-REQUEST-DATA] Product: {product.name if product else 'None'}, cost: {product.cost if product else 'None'}, quantity: {post.quantity}")
-            order_requests_data.append({
-                "id": order_request.id,
-                "title": order_request.title,
-                "description": order_request.description,
-                "status": order_request.status,
-                "cost_price": order_request.cost_price,
-                "resource_type": order_request.resource_type,
-                "post_id": order_request.post_id,
-                "user_id": order_request.user_id,
-                "campaign_id": order_request.campaign_id,
-                "created_at": order_request.created_at.isoformat(),
-                "updated_at": order_request.updated_at.isoformat(),
-                # 추가 정보
-                "post_title": post.title,
-                "campaign_name": campaign.name,
-                "product_name": post.product_name or (product.name if product else None),
-                "product_cost": product.cost if product else 0,  # products 테이블 원가
-                "quantity": post.quantity or 1,  # 수량
-                "total_cost": order_request.cost_price or 0,  # order_requests 테이블 원장 값
-                "requester_name": requester_name,
-                "work_type": post.work_type
-            })
+        order_requests_data = [
+            serialize_order_request_row(order_request, post, campaign, product, requester_name)
+            for order_request, post, campaign, product, requester_name in order_requests_with_details
+        ]
 
-        return order_requests_data
+        return FastJSONResponse(order_requests_data)
 
     except Exception as e:
-        print(f"[ORDER-REQUESTS-LIST] Error getting order requests: {e}")
-        print(f"[ORDER-REQUESTS-LIST] Error type: {type(e).__name__}")
-        print(f"[ORDER-REQUESTS-LIST] Error args: {e.args}")
+        logger.error("[ORDER-REQUESTS-LIST] Error getting order requests: %s", e)
+        logger.error("[ORDER-REQUESTS-LIST] Error type: %s", type(e).__name__)
+        logger.error("[ORDER-REQUESTS-LIST] Error args: %s", e.args)
         import traceback
-        print(f"[ORDER-REQUESTS-LIST] Traceback: {traceback.format_exc()}")
+        logger.debug("[ORDER-REQUESTS-LIST] Traceback: %s", traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"발주요청 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
 @router.put("/order-requests/{order_request_id}/status")
@@ -807,8 +726,8 @@ async def update_order_request_status(
 ):
     """발주요청 상태 업데이트 (승인/거절)"""
 
-    print(f"[ORDER-REQUEST-UPDATE] Updating order_request_id={order_request_id}, user_id={current_user.id}, user_role={current_user.role.value}")
-    print(f"[ORDER-REQUEST-UPDATE] Status data: {status_data}")
+    logger.debug("[ORDER-REQUEST-UPDATE] Updating order_request_id=%s, user_id=%s, user_role=%s", order_request_id, current_user.id, current_user.role.value)
+    logger.debug("[ORDER-REQUEST-UPDATE] Status data: %s", status_data)
 
     try:
         # 발주요청 조회
@@ -823,11 +742,11 @@ async def update_order_request_status(
         user_role = current_user.role.value
         user_company = current_user.company
 
-        print(f"[ORDER-REQUEST-UPDATE] User info - Role: '{user_role}', Company: '{user_company}'")
+        logger.debug("[ORDER-REQUEST-UPDATE] User info - Role: '%s', Company: '%s'", user_role, user_company)
 
         # 슈퍼 어드민은 모든 발주요청 관리 가능
         if user_role == UserRole.SUPER_ADMIN:
-            print(f"[ORDER-REQUEST-UPDATE] Super admin access granted")
+            logger.debug("[ORDER-REQUEST-UPDATE] Super admin access granted")
         else:
             # 일반 어드민은 본인 회사의 발주요청만 관리 가능
             if user_role != UserRole.AGENCY_ADMIN:
@@ -845,7 +764,7 @@ async def update_order_request_status(
                 raise HTTPException(status_code=404, detail="발주요청 생성자를 찾을 수 없습니다.")
 
             requester_company = requester.company
-            print(f"[ORDER-REQUEST-UPDATE] Company check - User: '{user_company}', Requester: '{requester_company}'")
+            logger.debug("[ORDER-REQUEST-UPDATE] Company check - User: '%s', Requester: '%s'", user_company, requester_company)
 
             if user_company != requester_company:
                 raise HTTPException(
@@ -877,7 +796,7 @@ async def update_order_request_status(
         await db.commit()
         await db.refresh(order_request)
 
-        print(f"[ORDER-REQUEST-UPDATE] Successfully updated order request {order_request_id} to status: {new_status}")
+        logger.debug("[ORDER-REQUEST-UPDATE] Successfully updated order request %s to status: %s", order_request_id, new_status)
 
         return {
             "message": f"발주요청이 {new_status}되었습니다.",
@@ -892,7 +811,7 @@ async def update_order_request_status(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[ORDER-REQUEST-UPDATE] Error updating order request: {e}")
+        logger.error("[ORDER-REQUEST-UPDATE] Error updating order request: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"발주요청 상태 업데이트 중 오류가 발생했습니다: {str(e)}")
 
@@ -954,7 +873,7 @@ async def test_auth(
     current_user: User = Depends(get_current_active_user)
 ):
     """인증 테스트 엔드포인트"""
-    print(f"[TEST-AUTH] 사용자 정보: {current_user.id}, {current_user.role}, {current_user.company}")
+    logger.debug("[TEST-AUTH] 사용자 정보: %s, %s, %s", current_user.id, current_user.role, current_user.company)
     return {
         "user_id": current_user.id,
         "role": current_user.role.value if hasattr(current_user.role, 'value') else str(current_user.role),
@@ -970,24 +889,24 @@ async def get_approved_posts_expense(
     db: AsyncSession = Depends(get_async_db)
 ):
     """발주 승인된 posts의 원가*수량 총 지출 계산"""
-    print(f"[APPROVED-POSTS-EXPENSE] ===== API 호출 시작 =====")
+    logger.debug("[APPROVED-POSTS-EXPENSE] ===== API 호출 시작 =====")
 
     try:
         # 사용자 정보 검증
         if not current_user:
-            print(f"[APPROVED-POSTS-EXPENSE] ERROR: current_user is None")
+            logger.error("[APPROVED-POSTS-EXPENSE] ERROR: current_user is None")
             raise HTTPException(status_code=401, detail="인증되지 않은 사용자입니다")
 
-        print(f"[APPROVED-POSTS-EXPENSE] 사용자 검증 완료: {current_user.id}")
+        logger.debug("[APPROVED-POSTS-EXPENSE] 사용자 검증 완료: %s", current_user.id)
 
         # 회사별 권한 확인
         user_role = current_user.role
         user_company = current_user.company
 
-        print(f"[APPROVED-POSTS-EXPENSE] User: {current_user.id}")
-        print(f"[APPROVED-POSTS-EXPENSE] Role: {user_role} (type: {type(user_role)})")
-        print(f"[APPROVED-POSTS-EXPENSE] Role.value: {user_role.value if hasattr(user_role, 'value') else 'No value attr'}")
-        print(f"[APPROVED-POSTS-EXPENSE] Company: {user_company}")
+        logger.debug("[APPROVED-POSTS-EXPENSE] User: %s", current_user.id)
+        logger.debug("[APPROVED-POSTS-EXPENSE] Role: %s (type: %s)", user_role, type(user_role))
+        logger.debug("[APPROVED-POSTS-EXPENSE] Role.value: %s", user_role.value if hasattr(user_role, 'value') else 'No value attr')
+        logger.debug("[APPROVED-POSTS-EXPENSE] Company: %s", user_company)
 
         # 먼저 간단한 승인된 OrderRequest 조회
         simple_query = select(OrderRequest).where(
@@ -996,18 +915,18 @@ async def get_approved_posts_expense(
         )
 
         if user_role != UserRole.SUPER_ADMIN:
-            print(f"[APPROVED-POSTS-EXPENSE] Adding company filter for {user_company}")
+            logger.debug("[APPROVED-POSTS-EXPENSE] Adding company filter for %s", user_company)
             from sqlalchemy.orm import aliased
             UserAlias = aliased(User)
             simple_query = simple_query.join(
                 UserAlias, OrderRequest.user_id == UserAlias.id
             ).where(UserAlias.company == user_company)
 
-        print(f"[APPROVED-POSTS-EXPENSE] Executing simple query...")
+        logger.debug("[APPROVED-POSTS-EXPENSE] Executing simple query...")
         result = await db.execute(simple_query)
         approved_orders = result.scalars().all()
 
-        print(f"[APPROVED-POSTS-EXPENSE] Found {len(approved_orders)} approved orders")
+        logger.debug("[APPROVED-POSTS-EXPENSE] Found %s approved orders", len(approved_orders))
 
         # 임시로 간단한 응답 반환
         return {
@@ -1018,13 +937,13 @@ async def get_approved_posts_expense(
         }
 
     except HTTPException as he:
-        print(f"[APPROVED-POSTS-EXPENSE] HTTPException: {he.status_code} - {he.detail}")
+        logger.error("[APPROVED-POSTS-EXPENSE] HTTPException: %s - %s", he.status_code, he.detail)
         raise he
     except Exception as e:
         import traceback
-        print(f"[APPROVED-POSTS-EXPENSE] Unexpected Error: {e}")
-        print(f"[APPROVED-POSTS-EXPENSE] Error type: {type(e).__name__}")
-        print(f"[APPROVED-POSTS-EXPENSE] Traceback: {traceback.format_exc()}")
+        logger.error("[APPROVED-POSTS-EXPENSE] Unexpected Error: %s", e)
+        logger.error("[APPROVED-POSTS-EXPENSE] Error type: %s", type(e).__name__)
+        logger.debug("[APPROVED-POSTS-EXPENSE] Traceback: %s", traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"발주 승인 지출 계산 중 오류가 발생했습니다: {str(e)}")
 
 
@@ -1034,7 +953,7 @@ async def get_order_status_list(
 ):
     """발주요청 상태 목록 조회 (단순 버전)"""
     try:
-        print(f"[ORDER-STATUS-LIST] Simple version for user: {current_user.id}")
+        logger.debug("[ORDER-STATUS-LIST] Simple version for user: %s", current_user.id)
 
         # DB 쿼리 없이 단순 반환
         status_list = [
@@ -1043,7 +962,7 @@ async def get_order_status_list(
             {"value": "거부", "label": "거부", "color": "red"}
         ]
 
-        print(f"[ORDER-STATUS-LIST] Returning: {status_list}")
+        logger.debug("[ORDER-STATUS-LIST] Returning: %s", status_list)
 
         return {
             "status_list": status_list,
@@ -1051,7 +970,7 @@ async def get_order_status_list(
         }
 
     except Exception as e:
-        print(f"[ORDER-STATUS-LIST] Exception: {e}")
+        logger.error("[ORDER-STATUS-LIST] Exception: %s", e)
         return {
             "status_list": [],
             "success": False,
@@ -1065,7 +984,7 @@ async def get_order_requesters(
 ):
     """발주요청자 목록 조회 (단순 버전)"""
     try:
-        print(f"[ORDER-REQUESTERS] Simple version for user: {current_user.id}")
+        logger.debug("[ORDER-REQUESTERS] Simple version for user: %s", current_user.id)
 
         # DB 쿼리 없이 빈 목록 반환 (프론트엔드 fallback 활용)
         return {
@@ -1074,7 +993,7 @@ async def get_order_requesters(
         }
 
     except Exception as e:
-        print(f"[ORDER-REQUESTERS] Exception: {e}")
+        logger.error("[ORDER-REQUESTERS] Exception: %s", e)
         return {
             "requester_list": [],
             "success": False,
@@ -1093,9 +1012,7 @@ async def get_monthly_campaign_stats(
     user_role = current_user.role.value
     user_company = current_user.company
 
-    logger.warning(f"{'='*80}")
-    logger.warning(f"[MONTHLY-STATS] Getting monthly stats for user_id={current_user.id}, role={user_role}, company={user_company}, month={month}")
-    logger.warning(f"{'='*80}")
+    logger.debug("[MONTHLY-STATS] Getting monthly stats for user_id=%s, role=%s, company=%s, month=%s", current_user.id, user_role, user_company, month)
 
     try:
         # 기본 쿼리 - posts를 eager load하여 lazy loading 방지
@@ -1139,9 +1056,9 @@ async def get_monthly_campaign_stats(
                 _, last_day = monthrange(year, month_num)
                 filter_start_date = datetime(year, month_num, 1)
                 filter_end_date = datetime(year, month_num, last_day, 23, 59, 59)
-                logger.warning(f"[MONTHLY-STATS] Month filter will be applied to posts: {filter_start_date.isoformat()} to {filter_end_date.isoformat()}")
+                logger.debug("[MONTHLY-STATS] Month filter will be applied to posts: %s to %s", filter_start_date.isoformat(), filter_end_date.isoformat())
             except (ValueError, AttributeError) as e:
-                print(f"[MONTHLY-STATS] Invalid month format: {month}, error: {e}")
+                logger.error("[MONTHLY-STATS] Invalid month format: %s, error: %s", month, e)
                 raise HTTPException(status_code=400, detail="Invalid month format. Use YYYY-MM format.")
 
         # Post 필터링 함수 (월간 필터 적용)
@@ -1154,24 +1071,24 @@ async def get_monthly_campaign_stats(
             post_date = None
             if post.start_datetime:
                 post_date = post.start_datetime
-                logger.warning(f"[POST-FILTER] Post {post.id} using start_datetime: {post_date}")
+                logger.debug("[POST-FILTER] Post %s using start_datetime: %s", post.id, post_date)
             elif post.start_date:
                 try:
                     # start_date가 문자열 형태일 경우 (YYYY-MM-DD)
                     post_date = datetime.strptime(post.start_date, '%Y-%m-%d')
-                    logger.warning(f"[POST-FILTER] Post {post.id} using start_date: {post.start_date} -> {post_date}")
+                    logger.debug("[POST-FILTER] Post %s using start_date: %s -> %s", post.id, post.start_date, post_date)
                 except (ValueError, TypeError) as e:
-                    logger.warning(f"[POST-FILTER] Post {post.id} date parse error: {post.start_date}, error: {e}")
+                    logger.debug("[POST-FILTER] Post %s date parse error: %s, error: %s", post.id, post.start_date, e)
                     return False
             else:
-                logger.warning(f"[POST-FILTER] Post {post.id} has no start_date or start_datetime")
+                logger.debug("[POST-FILTER] Post %s has no start_date or start_datetime", post.id)
 
             if not post_date:
-                logger.warning(f"[POST-FILTER] Post {post.id} excluded - no valid date")
+                logger.debug("[POST-FILTER] Post %s excluded - no valid date", post.id)
                 return False
 
             in_month = filter_start_date <= post_date <= filter_end_date
-            logger.warning(f"[POST-FILTER] Post {post.id} date={post_date}, filter={filter_start_date} to {filter_end_date}, included={in_month}, budget={post.budget}")
+            logger.debug("[POST-FILTER] Post %s date=%s, filter=%s to %s, included=%s, budget=%s", post.id, post_date, filter_start_date, filter_end_date, in_month, post.budget)
             return in_month
 
         # 취소되지 않은 캠페인만 필터링
@@ -1223,14 +1140,14 @@ async def get_monthly_campaign_stats(
             "pendingPayments": pending_payments
         }
 
-        print(f"[MONTHLY-STATS] Stats calculated: {stats}")
+        logger.debug("[MONTHLY-STATS] Stats calculated: %s", stats)
 
         return stats
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[MONTHLY-STATS] Error: {e}")
+        logger.error("[MONTHLY-STATS] Error: %s", e)
         raise HTTPException(status_code=500, detail=f"월간 통계 조회 중 오류가 발생했습니다: {str(e)}")
 
 
@@ -1244,7 +1161,7 @@ async def get_receivables_status(
     user_role = current_user.role.value
     user_company = current_user.company
 
-    print(f"[RECEIVABLES-STATUS] Getting receivables status for user_id={current_user.id}, role={user_role}, company={user_company}")
+    logger.debug("[RECEIVABLES-STATUS] Getting receivables status for user_id=%s, role=%s, company=%s", current_user.id, user_role, user_company)
 
     try:
         # 기본 쿼리 - posts를 eager load하여 lazy loading 방지
@@ -1327,15 +1244,30 @@ async def get_receivables_status(
             }
         }
 
-        print(f"[RECEIVABLES-STATUS] Result: {len(pending_invoices)} invoices, {len(pending_payments)} payments")
+        logger.debug("[RECEIVABLES-STATUS] Result: %s invoices, %s payments", len(pending_invoices), len(pending_payments))
 
         return result
 
     except Exception as e:
-        print(f"[RECEIVABLES-STATUS] Error: {e}")
+        logger.error("[RECEIVABLES-STATUS] Error: %s", e)
         raise HTTPException(status_code=500, detail=f"미수금 현황 조회 중 오류가 발생했습니다: {str(e)}")
 
 
+def _ensure_can_duplicate(original: Campaign, current_user: User) -> None:
+    """캠페인 복사 권한 확인 (단건/다중 복사 공통)"""
+    user_role = current_user.role.value
+    if user_role == "SUPER_ADMIN":
+        pass  # 모든 캠페인 복사 가능
+    elif user_role == "AGENCY_ADMIN":
+        if original.company != current_user.company:
+            raise HTTPException(status_code=403, detail="다른 회사의 캠페인은 복사할 수 없습니다.")
+    elif user_role == "STAFF":
+        if original.creator_id != current_user.id and original.staff_id != current_user.id:
+            raise HTTPException(status_code=403, detail="본인이 담당하지 않은 캠페인은 복사할 수 없습니다.")
+    else:
+        raise HTTPException(status_code=403, detail="캠페인을 복사할 권한이 없습니다.")
+
+
 @router.post("/{campaign_id}/duplicate", response_model=CampaignDuplicateResponse)
 async def duplicate_campaign(
     campaign_id: int,
@@ -1343,16 +1275,14 @@ async def duplicate_campaign(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_async_db)
 ):
-    """캠페인 기본 정보 복사 (콘텐츠/카톡 정보 제외)"""
-
-    user_role = current_user.role.value
-    user_company = current_user.company
+    """캠페인 기본 정보 복사 (콘텐츠/카톡 정보 제외, include_posts/include_contracts로 업무/계약서 함께 복사)"""
+    from app.services.campaign_clone import CloneSpec, clone_campaigns
 
-    print(f"[CAMPAIGN-DUPLICATE] User {current_user.id} attempting to duplicate campaign {campaign_id}")
+    logger.debug("[CAMPAIGN-DUPLICATE] User %s attempting to duplicate campaign %s", current_user.id, campaign_id)
 
     try:
         # 1. 원본 캠페인 조회
-        query = select(Campaign).where(Campaign.id == campaign_id)
+        query = select(Campaign).options(noload("*")).where(Campaign.id == campaign_id)
         result = await db.execute(query)
         original = result.scalar_one_or_none()
 
@@ -1360,60 +1290,38 @@ async def duplicate_campaign(
             raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다.")
 
         # 2. 권한 확인
-        if user_role == "SUPER_ADMIN":
-            pass  # 모든 캠페인 복사 가능
-        elif user_role == "AGENCY_ADMIN":
-            if original.company != user_company:
-                raise HTTPException(status_code=403, detail="다른 회사의 캠페인은 복사할 수 없습니다.")
-        elif user_role == "STAFF":
-            if original.creator_id != current_user.id and original.staff_id != current_user.id:
-                raise HTTPException(status_code=403, detail="본인이 담당하지 않은 캠페인은 복사할 수 없습니다.")
-        else:
-            raise HTTPException(status_code=403, detail="캠페인을 복사할 권한이 없습니다.")
+        _ensure_can_duplicate(original, current_user)
 
         # 3. 날짜 유효성 검사
         if duplicate_data.end_date <= duplicate_data.start_date:
             raise HTTPException(status_code=400, detail="종료일은 시작일 이후여야 합니다.")
 
-        # 4. 날짜 타임존 제거 (DB는 timezone-naive datetime 사용)
-        start_date_naive = duplicate_data.start_date.replace(tzinfo=None) if duplicate_data.start_date.tzinfo else duplicate_data.start_date
-        end_date_naive = duplicate_data.end_date.replace(tzinfo=None) if duplicate_data.end_date.tzinfo else duplicate_data.end_date
-
-        # 5. 새 캠페인 생성 (기본 정보만)
-        new_campaign = Campaign(
-            # 기본 정보 복사
-            name=duplicate_data.new_name,
-            description=original.description,
-            budget=duplicate_data.budget,
-            start_date=start_date_naive,
-            end_date=end_date_naive,
-
-            # 클라이언트 정보 복사
-            company=original.company,
-            client_company=original.client_company,
-
-            # 새로 설정
-            status=CampaignStatus.ACTIVE,  # ACTIVE로 생성
+        # 4. 새 캠페인 생성 + 업무/계약서 INSERT ... SELECT (한 트랜잭션)
+        clone = await clone_campaigns(
+            db,
+            [CloneSpec(
+                source=original,
+                name=duplicate_data.new_name,
+                start_date=duplicate_data.start_date,
+                end_date=duplicate_data.end_date,
+                budget=duplicate_data.budget,
+                staff_id=duplicate_data.staff_id,
+            )],
             creator_id=current_user.id,
-            staff_id=duplicate_data.staff_id or current_user.id,
-            client_user_id=original.client_user_id,
-
-            # 재무 상태는 Post 레벨로 이동 (더 이상 Campaign에 없음)
-            # invoice_issued=False,
-            # payment_completed=False,
-
-            # 카톡 정보 제외 (None)
-            chat_content=None,
-            chat_summary=None,
-            chat_attachments=None,
-            chat_images=None
+            include_posts=duplicate_data.include_posts,
+            include_contracts=duplicate_data.include_contracts,
         )
-
-        db.add(new_campaign)
         await db.commit()
-        await db.refresh(new_campaign)
 
-        print(f"[CAMPAIGN-DUPLICATE] Campaign {original.id} '{original.name}' duplicated to {new_campaign.id} '{new_campaign.name}' by user {current_user.id}")
+        new_campaign = (await db.execute(
+            select(Campaign).options(noload("*")).where(Campaign.id == clone.campaign_ids[0])
+        )).scalar_one()
+
+        logger.debug(
+            "[CAMPAIGN-DUPLICATE] Campaign %s '%s' duplicated to %s '%s' by user %s (posts=%s, contracts=%s)",
+            original.id, original.name, new_campaign.id, new_campaign.name, current_user.id,
+            clone.copied_posts, clone.copied_contracts
+        )
 
         # 5. 응답 데이터 구성
         campaign_response = CampaignResponse(
@@ -1428,9 +1336,6 @@ async def duplicate_campaign(
             creator_id=new_campaign.creator_id,
             client_user_id=new_campaign.client_user_id,
             staff_id=new_campaign.staff_id,
-            # 재무 필드는 Post 레벨로 이동
-            # invoice_issued=new_campaign.invoice_issued,
-            # payment_completed=new_campaign.payment_completed,
             created_at=new_campaign.created_at,
             updated_at=new_campaign.updated_at
         )
@@ -1438,13 +1343,94 @@ async def duplicate_campaign(
         return CampaignDuplicateResponse(
             success=True,
             message="캠페인이 성공적으로 복사되었습니다.",
-            campaign=campaign_response
+            campaign=campaign_response,
+            copied_posts=clone.copied_posts,
+            copied_contracts=clone.copied_contracts
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CAMPAIGN-DUPLICATE] Error: {e}")
+        logger.error("[CAMPAIGN-DUPLICATE] Error: %s", e)
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"캠페인 복사 중 오류가 발생했습니다: {str(e)}")
+
+
+@router.post("/clone", response_model=CampaignBulkCloneResponse)
+async def clone_campaigns_bulk(
+    clone_data: CampaignBulkCloneRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    여러 캠페인 한 번에 복사 (월 단위 반복 계약 - 매월 초 일괄 생성)
+    - 원본 조회 1회, 캠페인/업무/계약서는 집합 단위 INSERT로 한 트랜잭션에 복사 (하나라도 실패하면 전체 취소)
+    """
+    from app.core.config import settings
+    from app.services.campaign_clone import CloneSpec, clone_campaigns
+
+    items = clone_data.campaigns
+    if len(items) > settings.CAMPAIGN_CLONE_MAX_CAMPAIGNS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.CAMPAIGN_CLONE_MAX_CAMPAIGNS}개 캠페인까지 복사할 수 있습니다."
+        )
+    for item in items:
+        if item.end_date <= item.start_date:
+            raise HTTPException(status_code=400, detail=f"종료일은 시작일 이후여야 합니다. (캠페인 {item.source_campaign_id})")
+    source_ids = [item.source_campaign_id for item in items]
+    if len(set(source_ids)) != len(source_ids):
+        raise HTTPException(status_code=400, detail="같은 원본 캠페인을 한 요청에서 여러 번 복사할 수 없습니다.")
+
+    try:
+        result = await db.execute(select(Campaign).options(noload("*")).where(Campaign.id.in_(source_ids)))
+        originals = {campaign.id: campaign for campaign in result.scalars()}
+        missing = [campaign_id for campaign_id in source_ids if campaign_id not in originals]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"캠페인을 찾을 수 없습니다: {', '.join(map(str, missing))}")
+        for campaign in originals.values():
+            _ensure_can_duplicate(campaign, current_user)
+
+        specs = [
+            CloneSpec(
+                source=originals[item.source_campaign_id],
+                name=item.new_name or originals[item.source_campaign_id].name,
+                start_date=item.start_date,
+                end_date=item.end_date,
+                budget=item.budget,
+                staff_id=item.staff_id or originals[item.source_campaign_id].staff_id,
+            )
+            for item in items
+        ]
+        clone = await clone_campaigns(
+            db,
+            specs,
+            creator_id=current_user.id,
+            include_posts=clone_data.include_posts,
+            include_contracts=clone_data.include_contracts,
+        )
+        await db.commit()
+
+        logger.debug(
+            "[CAMPAIGN-CLONE] User %s cloned %s campaigns (posts=%s, contracts=%s)",
+            current_user.id, len(specs), clone.copied_posts, clone.copied_contracts
+        )
+
+        return CampaignBulkCloneResponse(
+            success=True,
+            message=f"캠페인 {len(specs)}개가 복사되었습니다.",
+            campaigns=[
+                CampaignCloneResult(source_campaign_id=spec.source.id, campaign_id=new_id, name=spec.name)
+                for spec, new_id in zip(specs, clone.campaign_ids)
+            ],
+            copied_posts=clone.copied_posts,
+            copied_contracts=clone.copied_contracts
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("[CAMPAIGN-CLONE] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"캠페인 복사 중 오류가 발생했습니다: {str(e)}")
 
@@ -1461,7 +1447,7 @@ async def get_campaign_detail(
     user_id = current_user.id
     user_role = current_user.role.value
     
-    print(f"[CAMPAIGN-DETAIL-JWT] Request for campaign_id={campaign_id}, user_id={user_id}, user_role={user_role}")
+    logger.debug("[CAMPAIGN-DETAIL-JWT] Request for campaign_id=%s, user_id=%s, user_role=%s", campaign_id, user_id, user_role)
     
     try:
         # 캠페인 찾기 (creator, client_user, staff_user 관계 포함)
@@ -1474,23 +1460,23 @@ async def get_campaign_detail(
         campaign = result.scalar_one_or_none()
         
         if not campaign:
-            print(f"[CAMPAIGN-DETAIL-JWT] Campaign {campaign_id} not found")
+            logger.debug("[CAMPAIGN-DETAIL-JWT] Campaign %s not found", campaign_id)
             raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다")
         
-        print(f"[CAMPAIGN-DETAIL-JWT] Found campaign: {campaign.name}")
-        print(f"[CAMPAIGN-DETAIL-JWT] Campaign client_user_id: {campaign.client_user_id}")
-        print(f"[CAMPAIGN-DETAIL-JWT] Campaign client_user: {campaign.client_user}")
+        logger.debug("[CAMPAIGN-DETAIL-JWT] Found campaign: %s", campaign.name)
+        logger.debug("[CAMPAIGN-DETAIL-JWT] Campaign client_user_id: %s", campaign.client_user_id)
+        logger.debug("[CAMPAIGN-DETAIL-JWT] Campaign client_user: %s", campaign.client_user)
         if campaign.client_user:
-            print(f"[CAMPAIGN-DETAIL-JWT] Client user details: id={campaign.client_user.id}, name={campaign.client_user.name}")
-            print(f"[CAMPAIGN-DETAIL-JWT] Client company info:")
-            print(f"  - client_company_name: {getattr(campaign.client_user, 'client_company_name', None)}")
-            print(f"  - client_business_number: {getattr(campaign.client_user, 'client_business_number', None)}")
-            print(f"  - client_ceo_name: {getattr(campaign.client_user, 'client_ceo_name', None)}")
-            print(f"  - client_company_address: {getattr(campaign.client_user, 'client_company_address', None)}")
-            print(f"  - client_business_type: {getattr(campaign.client_user, 'client_business_type', None)}")
-            print(f"  - client_business_item: {getattr(campaign.client_user, 'client_business_item', None)}")
+            logger.debug("[CAMPAIGN-DETAIL-JWT] Client user details: id=%s, name=%s", campaign.client_user.id, campaign.client_user.name)
+            logger.debug("[CAMPAIGN-DETAIL-JWT] Client company info:")
+            logger.debug("  - client_company_name: %s", getattr(campaign.client_user, 'client_company_name', None))
+            logger.debug("  - client_business_number: %s", getattr(campaign.client_user, 'client_business_number', None))
+            logger.debug("  - client_ceo_name: %s", getattr(campaign.client_user, 'client_ceo_name', None))
+            logger.debug("  - client_company_address: %s", getattr(campaign.client_user, 'client_company_address', None))
+            logger.debug("  - client_business_type: %s", getattr(campaign.client_user, 'client_business_type', None))
+            logger.debug("  - client_business_item: %s", getattr(campaign.client_user, 'client_business_item', None))
         else:
-            print(f"[CAMPAIGN-DETAIL-JWT] WARNING: client_user is None!")
+            logger.warning("[CAMPAIGN-DETAIL-JWT] WARNING: client_user is None!")
 
         # JWT 기반 권한 확인
         if user_role == UserRole.SUPER_ADMIN.value:
@@ -1499,7 +1485,7 @@ async def get_campaign_detail(
         elif user_role == UserRole.CLIENT.value:
             # 클라이언트는 자신을 대상으로 한 캠페인만 조회 가능 (client_user_id 외래키 관계 사용)
             if campaign.client_user_id != user_id:
-                print(f"[CAMPAIGN-DETAIL-JWT] CLIENT permission denied: client_user_id={campaign.client_user_id}, user_id={user_id}")
+                logger.debug("[CAMPAIGN-DETAIL-JWT] CLIENT permission denied: client_user_id=%s, user_id=%s", campaign.client_user_id, user_id)
                 raise HTTPException(status_code=403, detail="이 캠페인에 접근할 권한이 없습니다.")
         elif user_role == UserRole.AGENCY_ADMIN.value:
             # 대행사 어드민은 같은 회사 캠페인만 조회 가능 (리스트 API와 동일한 로직)
@@ -1513,77 +1499,23 @@ async def get_campaign_detail(
             if not (creator_company_match or staff_match):
                 creator_company = campaign.creator.company if campaign.creator else "None"
                 staff_company = campaign.staff_user.company if campaign.staff_user else "None"
-                print(f"[CAMPAIGN-DETAIL-JWT] AGENCY_ADMIN permission denied: creator.company={creator_company}, staff.company={staff_company}, user.company={current_user.company}, staff_id={campaign.staff_id}, user_id={user_id}")
+                logger.debug("[CAMPAIGN-DETAIL-JWT] AGENCY_ADMIN permission denied: creator.company=%s, staff.company=%s, user.company=%s, staff_id=%s, user_id=%s", creator_company, staff_company, current_user.company, campaign.staff_id, user_id)
                 raise HTTPException(status_code=403, detail="이 캠페인에 접근할 권한이 없습니다.")
         elif user_role == UserRole.STAFF.value:
             # 직원은 자신이 생성한 캠페인 또는 자신이 담당하는 캠페인 조회 가능
             if campaign.creator_id != user_id and campaign.staff_id != user_id:
-                print(f"[CAMPAIGN-DETAIL-JWT] STAFF permission denied: campaign.creator_id={campaign.creator_id}, campaign.staff_id={campaign.staff_id}, user_id={user_id}")
+                logger.debug("[CAMPAIGN-DETAIL-JWT] STAFF permission denied: campaign.creator_id=%s, campaign.staff_id=%s, user_id=%s", campaign.creator_id, campaign.staff_id, user_id)
                 raise HTTPException(status_code=403, detail="자신이 생성하거나 담당하는 캠페인만 접근할 수 있습니다.")
         
         
-        # 총 매출 계산 (취소되지 않은 활성 posts의 budget 합계)
-        from sqlalchemy import func
-        posts_budget_query = select(func.sum(Post.budget)).where(
-            Post.campaign_id == campaign_id,
-            Post.is_active == True,
-            or_(Post.is_cancelled == False, Post.is_cancelled == None)
-        )
-        posts_budget_result = await db.execute(posts_budget_query)
-        total_revenue = float(posts_budget_result.scalar() or 0.0)
-        print(f"[CAMPAIGN-DETAIL-JWT] SUCCESS: Returning campaign {campaign.id} to user {user_id}")
-        # 직렬화된 응답 반환 (executionStatus 매핑 포함)
-        response_data = {
-            "id": campaign.id,
-            "name": campaign.name,
-            "description": campaign.description,
-            "status": campaign.status.value if campaign.status else None,
-            "client_company": campaign.client_company,
-            "budget": campaign.budget,
-            "total_revenue": total_revenue,  # 모든 posts의 budget 합계
-            "start_date": campaign.start_date.isoformat() if campaign.start_date else None,
-            "end_date": campaign.end_date.isoformat() if campaign.end_date else None,
-            "invoiceIssued": getattr(campaign, 'invoice_issued', False) if hasattr(campaign, 'invoice_issued') else False,  # 계산서 발행 완료
-            "paymentCompleted": getattr(campaign, 'payment_completed', False) if hasattr(campaign, 'payment_completed') else False,  # 입금 완료
-            "creator_id": campaign.creator_id,
-            "staff_id": campaign.staff_id,  # 캠페인 담당 직원 ID 추가
-            "created_at": campaign.created_at.isoformat() if campaign.created_at else None,
-            "updated_at": campaign.updated_at.isoformat() if campaign.updated_at else None,
-            "creator_name": campaign.creator.name if campaign.creator else None,
-            "staff_user": {
-                "id": campaign.staff_user.id,
-                "name": campaign.staff_user.name,
-                "role": campaign.staff_user.role.value,
-                "company": campaign.staff_user.company
-            } if campaign.staff_user else None,
-            "client_name": campaign.client_company,
-            "client_user": {
-                "id": campaign.client_user.id,
-                "name": campaign.client_user.name,
-                "email": campaign.client_user.email,
-                "company": campaign.client_user.company,
-                "business_number": getattr(campaign.client_user, 'business_number', None),
-                "contact": campaign.client_user.contact,
-                # 클라이언트 실제 회사 정보 추가
-                "client_company_name": getattr(campaign.client_user, 'client_company_name', None),
-                "client_business_number": getattr(campaign.client_user, 'client_business_number', None),
-                "client_ceo_name": getattr(campaign.client_user, 'client_ceo_name', None),
-                "client_company_address": getattr(campaign.client_user, 'client_company_address', None),
-                "client_business_type": getattr(campaign.client_user, 'client_business_type', None),
-                "client_business_item": getattr(campaign.client_user, 'client_business_item', None)
-            } if campaign.client_user else None,
-            # 취소/환불 관련 필드
-            "cancelled_at": campaign.cancelled_at.isoformat() if getattr(campaign, 'cancelled_at', None) else None,
-            "cancellation_reason": getattr(campaign, 'cancellation_reason', None),
-            "refund_amount": float(campaign.refund_amount) if getattr(campaign, 'refund_amount', None) else 0,
-            "is_refunded": getattr(campaign, 'is_refunded', False)
-        }
-        return response_data
+        logger.debug("[CAMPAIGN-DETAIL-JWT] SUCCESS: Returning campaign %s to user %s", campaign.id, user_id)
+        # CampaignResponse와 같은 키로 직렬화 (response_model 검증/jsonable_encoder 생략)
+        return FastJSONResponse(serialize_campaign_detail(campaign))
         
     except HTTPException:
         raise  # HTTPException은 그대로 전달
     except Exception as e:
-        print(f"[CAMPAIGN-DETAIL-JWT] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[CAMPAIGN-DETAIL-JWT] Unexpected error: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"캠페인 조회 중 오류: {str(e)}")
 
 
@@ -1601,7 +1533,7 @@ async def update_campaign(
     db: AsyncSession = Depends(get_async_db)
 ):
     """캠페인 수정"""
-    print(f"[CAMPAIGN-UPDATE] Update request for campaign_id={campaign_id}, viewerId={viewerId}, viewerRole={viewerRole}")
+    logger.debug("[CAMPAIGN-UPDATE] Update request for campaign_id=%s, viewerId=%s, viewerRole=%s", campaign_id, viewerId, viewerRole)
     
     # Node.js API 호환 모드인지 확인
     if viewerId is not None or adminId is not None:
@@ -1611,40 +1543,40 @@ async def update_campaign(
             user_role = viewerRole or adminRole
             
             if not user_id or not user_role:
-                print(f"[CAMPAIGN-UPDATE] ERROR: Missing params - user_id={user_id}, user_role={user_role}")
+                logger.error("[CAMPAIGN-UPDATE] ERROR: Missing params - user_id=%s, user_role=%s", user_id, user_role)
                 raise HTTPException(status_code=400, detail="viewerId와 viewerRole이 필요합니다")
             
             # URL 디코딩
             user_role = unquote(user_role).strip()
-            print(f"[CAMPAIGN-UPDATE] Processing with user_id={user_id}, user_role='{user_role}'")
+            logger.debug("[CAMPAIGN-UPDATE] Processing with user_id=%s, user_role='%s'", user_id, user_role)
             
             # 캠페인 찾기 (creator 관계 포함)
-            print(f"[CAMPAIGN-UPDATE] Searching for campaign with ID: {campaign_id}")
+            logger.debug("[CAMPAIGN-UPDATE] Searching for campaign with ID: %s", campaign_id)
             campaign_query = select(Campaign).options(joinedload(Campaign.creator)).where(Campaign.id == campaign_id)
             result = await db.execute(campaign_query)
             campaign = result.unique().scalar_one_or_none()
             
             if not campaign:
-                print(f"[CAMPAIGN-UPDATE] Campaign not found: {campaign_id}")
+                logger.debug("[CAMPAIGN-UPDATE] Campaign not found: %s", campaign_id)
                 raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다.")
             
-            print(f"[CAMPAIGN-UPDATE] Found campaign: {campaign.name}, creator_id={campaign.creator_id}")
+            logger.debug("[CAMPAIGN-UPDATE] Found campaign: %s, creator_id=%s", campaign.name, campaign.creator_id)
             
             # 권한 확인
-            print(f"[CAMPAIGN-UPDATE] Checking user permissions for user_id: {user_id}")
+            logger.debug("[CAMPAIGN-UPDATE] Checking user permissions for user_id: %s", user_id)
             viewer_query = select(User).where(User.id == user_id)
             viewer_result = await db.execute(viewer_query)
             viewer = viewer_result.scalar_one_or_none()
             
             if not viewer:
-                print(f"[CAMPAIGN-UPDATE] User not found: {user_id}")
+                logger.debug("[CAMPAIGN-UPDATE] User not found: %s", user_id)
                 raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
             
-            print(f"[CAMPAIGN-UPDATE] Found user: {viewer.name}, role={user_role}, company={viewer.company}")
+            logger.debug("[CAMPAIGN-UPDATE] Found user: %s, role=%s, company=%s", viewer.name, user_role, viewer.company)
             
             if user_role == UserRole.SUPER_ADMIN.value:
                 # 슈퍼 어드민은 모든 캠페인 수정 가능
-                print(f"[CAMPAIGN-UPDATE] Super admin can edit any campaign")
+                logger.debug("[CAMPAIGN-UPDATE] Super admin can edit any campaign")
                 pass
             elif user_role == UserRole.CLIENT.value:
                 # 클라이언트는 다음 캠페인을 수정 가능:
@@ -1654,10 +1586,10 @@ async def update_campaign(
                 
                 if campaign.creator_id == user_id:
                     can_edit = True
-                    print(f"[CAMPAIGN-UPDATE] CLIENT can edit: own created campaign")
+                    logger.debug("[CAMPAIGN-UPDATE] CLIENT can edit: own created campaign")
                 elif campaign.client_user_id == user_id:
                     can_edit = True
-                    print(f"[CAMPAIGN-UPDATE] CLIENT can edit: campaign created for them")
+                    logger.debug("[CAMPAIGN-UPDATE] CLIENT can edit: campaign created for them")
                 
                 if not can_edit:
                     raise HTTPException(status_code=403, detail="이 캠페인을 수정할 권한이 없습니다.")
@@ -1675,7 +1607,7 @@ async def update_campaign(
 
                 if creator and creator.company == viewer.company:
                     can_edit = True
-                    print(f"[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: same company creator")
+                    logger.debug("[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: same company creator")
 
                 # 2) 자신이 담당 스태프로 지정되었고 같은 회사인지 확인
                 if not can_edit and campaign.staff_id == user_id:
@@ -1685,7 +1617,7 @@ async def update_campaign(
 
                     if staff_user and staff_user.company == viewer.company:
                         can_edit = True
-                        print(f"[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: assigned as staff with same company")
+                        logger.debug("[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: assigned as staff with same company")
 
                 # 3) 클라이언트 사용자가 있고, 그 클라이언트의 캠페인을 대행사에서 관리하는지 확인
                 if not can_edit and campaign.client_user_id:
@@ -1697,7 +1629,7 @@ async def update_campaign(
                     # 현재는 단순히 client_user_id가 있으면 편집 가능하게 설정
                     if client_user:
                         can_edit = True
-                        print(f"[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: client campaign for user_id={campaign.client_user_id}")
+                        logger.debug("[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: client campaign for user_id=%s", campaign.client_user_id)
 
                 if not can_edit:
                     raise HTTPException(status_code=403, detail="이 캠페인을 수정할 권한이 없습니다.")
@@ -1712,11 +1644,11 @@ async def update_campaign(
                 # 1) 본인이 생성
                 if campaign.creator_id == user_id:
                     can_edit = True
-                    print(f"[CAMPAIGN-UPDATE] TEAM_LEADER can edit: own created campaign")
+                    logger.debug("[CAMPAIGN-UPDATE] TEAM_LEADER can edit: own created campaign")
                 # 2) 본인이 담당
                 elif campaign.staff_id == user_id:
                     can_edit = True
-                    print(f"[CAMPAIGN-UPDATE] TEAM_LEADER can edit: own assigned campaign")
+                    logger.debug("[CAMPAIGN-UPDATE] TEAM_LEADER can edit: own assigned campaign")
                 else:
                     # 3,4) 팀원이 생성하거나 담당하는 캠페인인지 확인
                     team_members_subquery = select(User.id).where(
@@ -1730,10 +1662,10 @@ async def update_campaign(
 
                     if campaign.creator_id in team_member_ids:
                         can_edit = True
-                        print(f"[CAMPAIGN-UPDATE] TEAM_LEADER can edit: team member created campaign")
+                        logger.debug("[CAMPAIGN-UPDATE] TEAM_LEADER can edit: team member created campaign")
                     elif campaign.staff_id in team_member_ids:
                         can_edit = True
-                        print(f"[CAMPAIGN-UPDATE] TEAM_LEADER can edit: team member assigned campaign")
+                        logger.debug("[CAMPAIGN-UPDATE] TEAM_LEADER can edit: team member assigned campaign")
 
                 if not can_edit:
                     raise HTTPException(status_code=403, detail="이 캠페인을 수정할 권한이 없습니다.")
@@ -1744,7 +1676,7 @@ async def update_campaign(
             
             # 캠페인 정보 업데이트
             update_data = campaign_data.model_dump(exclude_unset=True)
-            print(f"[CAMPAIGN-UPDATE] Update data received: {update_data}")
+            logger.debug("[CAMPAIGN-UPDATE] Update data received: %s", update_data)
             
             for field, value in update_data.items():
                 if field == 'user_id':
@@ -1756,20 +1688,20 @@ async def update_campaign(
                         # 기존 값 유지하거나 최소 예산 설정
                         if campaign.budget is None:
                             setattr(campaign, field, 1000000.0)  # 기본 예산 100만원
-                            print(f"[CAMPAIGN-UPDATE] Set default budget: 1000000.0")
+                            logger.debug("[CAMPAIGN-UPDATE] Set default budget: 1000000.0")
                         else:
-                            print(f"[CAMPAIGN-UPDATE] Keeping existing budget: {campaign.budget}")
+                            logger.debug("[CAMPAIGN-UPDATE] Keeping existing budget: %s", campaign.budget)
                     else:
                         try:
                             budget_value = float(value)
                             setattr(campaign, field, budget_value)
-                            print(f"[CAMPAIGN-UPDATE] Updated budget: {budget_value}")
+                            logger.debug("[CAMPAIGN-UPDATE] Updated budget: %s", budget_value)
                         except (ValueError, TypeError) as e:
-                            print(f"[CAMPAIGN-UPDATE] Invalid budget value: {value}, keeping existing: {campaign.budget}")
+                            logger.debug("[CAMPAIGN-UPDATE] Invalid budget value: %s, keeping existing: %s", value, campaign.budget)
                 elif field == 'creator_id' and value:
                     # 담당 직원 변경 (대행사 어드민만 가능) - UserRole enum 값 사용
                     if user_role != UserRole.AGENCY_ADMIN.value and not ('agency' in user_role.lower() and 'admin' in user_role.lower()):
-                        print(f"[CAMPAIGN-UPDATE] Permission denied: user_role={user_role} cannot change creator_id")
+                        logger.debug("[CAMPAIGN-UPDATE] Permission denied: user_role=%s cannot change creator_id", user_role)
                         continue
                     
                     # 새로운 담당 직원이 같은 회사인지 확인
@@ -1778,28 +1710,28 @@ async def update_campaign(
                     new_staff = new_staff_result.scalar_one_or_none()
                     
                     if not new_staff:
-                        print(f"[CAMPAIGN-UPDATE] New staff not found: {value}")
+                        logger.debug("[CAMPAIGN-UPDATE] New staff not found: %s", value)
                         continue
                         
                     if new_staff.company != viewer.company:
-                        print(f"[CAMPAIGN-UPDATE] New staff not in same company: {new_staff.company} != {viewer.company}")
+                        logger.debug("[CAMPAIGN-UPDATE] New staff not in same company: %s != %s", new_staff.company, viewer.company)
                         continue
                         
                     setattr(campaign, field, value)
-                    print(f"[CAMPAIGN-UPDATE] Changed creator_id from {campaign.creator_id} to {value} ({new_staff.name})")
+                    logger.debug("[CAMPAIGN-UPDATE] Changed creator_id from %s to %s (%s)", campaign.creator_id, value, new_staff.name)
                 elif field == 'staff_id':
                     # 캠페인 담당자 변경 (대행사 어드민과 슈퍼 어드민 가능)
                     if (user_role != UserRole.AGENCY_ADMIN.value and
                         user_role != UserRole.SUPER_ADMIN.value and
                         not ('agency' in user_role.lower() and 'admin' in user_role.lower())):
-                        print(f"[CAMPAIGN-UPDATE] Permission denied: user_role={user_role} cannot change staff_id")
+                        logger.debug("[CAMPAIGN-UPDATE] Permission denied: user_role=%s cannot change staff_id", user_role)
                         continue
 
                     # null 값인 경우 (담당자 할당 해제)
                     if value is None:
                         old_staff_id = getattr(campaign, 'staff_id', 'None')
                         setattr(campaign, field, None)
-                        print(f"[CAMPAIGN-UPDATE] Removed staff assignment from {old_staff_id} to None")
+                        logger.debug("[CAMPAIGN-UPDATE] Removed staff assignment from %s to None", old_staff_id)
                     else:
                         # 새로운 담당 직원이 같은 회사인지 확인
                         new_staff_query = select(User).where(User.id == value)
@@ -1807,17 +1739,17 @@ async def update_campaign(
                         new_staff = new_staff_result.scalar_one_or_none()
 
                         if not new_staff:
-                            print(f"[CAMPAIGN-UPDATE] New staff not found: {value}")
+                            logger.debug("[CAMPAIGN-UPDATE] New staff not found: %s", value)
                             continue
 
                         # SUPER_ADMIN은 회사 제약 없이 모든 직원 할당 가능
                         if user_role != UserRole.SUPER_ADMIN.value and new_staff.company != viewer.company:
-                            print(f"[CAMPAIGN-UPDATE] New staff not in same company: {new_staff.company} != {viewer.company}")
+                            logger.debug("[CAMPAIGN-UPDATE] New staff not in same company: %s != %s", new_staff.company, viewer.company)
                             continue
 
                         old_staff_id = getattr(campaign, 'staff_id', 'None')
                         setattr(campaign, field, value)
-                        print(f"[CAMPAIGN-UPDATE] Changed staff_id from {old_staff_id} to {value} ({new_staff.name})")
+                        logger.debug("[CAMPAIGN-UPDATE] Changed staff_id from %s to %s (%s)", old_staff_id, value, new_staff.name)
                 elif field in ['start_date', 'end_date']:
                     # 날짜 필드는 안전하게 파싱 - 빈 값도 허용
                     def safe_datetime_parse(date_input):
@@ -1832,16 +1764,16 @@ async def update_campaign(
                                 parsed = datetime.fromisoformat(date_input.replace('Z', '+00:00'))
                                 return parsed.replace(tzinfo=None)
                             except ValueError:
-                                print(f"[CAMPAIGN-UPDATE] WARNING: Failed to parse date string: {date_input}")
+                                logger.error("[CAMPAIGN-UPDATE] WARNING: Failed to parse date string: %s", date_input)
                                 return None
                         return None
                     
                     try:
                         parsed_date = safe_datetime_parse(value)
                         setattr(campaign, field, parsed_date)
-                        print(f"[CAMPAIGN-UPDATE] Updated {field}: {value} -> {parsed_date}")
+                        logger.debug("[CAMPAIGN-UPDATE] Updated %s: %s -> %s", field, value, parsed_date)
                     except Exception as e:
-                        print(f"[CAMPAIGN-UPDATE] Date parsing error for {field}: {e}")
+                        logger.error("[CAMPAIGN-UPDATE] Date parsing error for %s: %s", field, e)
                         # 날짜 파싱 실패 시 None 설정
                         setattr(campaign, field, None)
                 elif field == 'client_company' and value:
@@ -1856,31 +1788,31 @@ async def update_campaign(
                             match = re.search(r'\(ID: (\d+)\)', value)
                             if match:
                                 client_user_id = int(match.group(1))
-                                print(f"[CAMPAIGN-UPDATE] Updated client_company: {value}")
-                                print(f"[CAMPAIGN-UPDATE] Extracted client_user_id: {client_user_id}")
+                                logger.debug("[CAMPAIGN-UPDATE] Updated client_company: %s", value)
+                                logger.debug("[CAMPAIGN-UPDATE] Extracted client_user_id: %s", client_user_id)
                             else:
-                                print(f"[CAMPAIGN-UPDATE] Updated client_company: {value}")
-                                print(f"[CAMPAIGN-UPDATE] No ID pattern found, client_user_id will be None")
+                                logger.debug("[CAMPAIGN-UPDATE] Updated client_company: %s", value)
+                                logger.debug("[CAMPAIGN-UPDATE] No ID pattern found, client_user_id will be None")
                         except (ValueError, AttributeError) as e:
-                            print(f"[CAMPAIGN-UPDATE] Failed to extract client_user_id: {e}")
+                            logger.error("[CAMPAIGN-UPDATE] Failed to extract client_user_id: %s", e)
                     else:
                         # client_company가 None이거나 빈 문자열인 경우
-                        print(f"[CAMPAIGN-UPDATE] Updated client_company: {value}")
-                        print(f"[CAMPAIGN-UPDATE] Set client_user_id to None (no value or pattern)")
+                        logger.debug("[CAMPAIGN-UPDATE] Updated client_company: %s", value)
+                        logger.debug("[CAMPAIGN-UPDATE] Set client_user_id to None (no value or pattern)")
                     
                     # client_user_id 필드가 존재하는지 확인 후 설정 (스키마 동기화 대응)
                     try:
                         if hasattr(campaign, 'client_user_id'):
                             setattr(campaign, 'client_user_id', client_user_id)
-                            print(f"[CAMPAIGN-UPDATE] client_user_id field available, updated to: {client_user_id}")
+                            logger.debug("[CAMPAIGN-UPDATE] client_user_id field available, updated to: %s", client_user_id)
                         else:
-                            print("[CAMPAIGN-UPDATE] client_user_id field not available, skipping")
+                            logger.debug("[CAMPAIGN-UPDATE] client_user_id field not available, skipping")
                     except Exception as e:
-                        print(f"[CAMPAIGN-UPDATE] Warning: Could not update client_user_id: {e}")
+                        logger.warning("[CAMPAIGN-UPDATE] Warning: Could not update client_user_id: %s", e)
                 elif field == 'staff_id' and value:
                     # 캠페인 담당자 변경 (대행사 어드민만 가능)
                     if user_role != UserRole.AGENCY_ADMIN.value and not ('agency' in user_role.lower() and 'admin' in user_role.lower()) and user_role != UserRole.SUPER_ADMIN.value:
-                        print(f"[CAMPAIGN-UPDATE] Permission denied: user_role={user_role} cannot change staff_id")
+                        logger.debug("[CAMPAIGN-UPDATE] Permission denied: user_role=%s cannot change staff_id", user_role)
                         continue
 
                     # 새로운 담당 직원이 같은 회사인지 확인
@@ -1889,31 +1821,31 @@ async def update_campaign(
                     new_staff = new_staff_result.scalar_one_or_none()
 
                     if not new_staff:
-                        print(f"[CAMPAIGN-UPDATE] New staff not found: {value}")
+                        logger.debug("[CAMPAIGN-UPDATE] New staff not found: %s", value)
                         continue
 
                     # 대행사 어드민의 경우 같은 회사 직원만 배정 가능
                     if user_role == UserRole.AGENCY_ADMIN.value and hasattr(viewer, 'company') and new_staff.company != viewer.company:
-                        print(f"[CAMPAIGN-UPDATE] New staff not in same company: {new_staff.company} != {viewer.company}")
+                        logger.debug("[CAMPAIGN-UPDATE] New staff not in same company: %s != %s", new_staff.company, viewer.company)
                         continue
 
                     setattr(campaign, field, value)
-                    print(f"[CAMPAIGN-UPDATE] Changed staff_id from {getattr(campaign, 'staff_id', 'None')} to {value} ({new_staff.name})")
+                    logger.debug("[CAMPAIGN-UPDATE] Changed staff_id from %s to %s (%s)", getattr(campaign, 'staff_id', 'None'), value, new_staff.name)
                 elif field in ['invoice_issued', 'payment_completed']:
                     # 재무 상태 필드 처리
                     try:
                         bool_value = bool(value) if value is not None else False
                         setattr(campaign, field, bool_value)
-                        print(f"[CAMPAIGN-UPDATE] Updated financial field {field}: {value} -> {bool_value}")
+                        logger.debug("[CAMPAIGN-UPDATE] Updated financial field %s: %s -> %s", field, value, bool_value)
                     except Exception as e:
-                        print(f"[CAMPAIGN-UPDATE] Warning: Could not update {field}: {e}")
+                        logger.warning("[CAMPAIGN-UPDATE] Warning: Could not update %s: %s", field, e)
                 elif hasattr(campaign, field):
                     setattr(campaign, field, value)
-                    print(f"[CAMPAIGN-UPDATE] Updated {field}: {value}")
+                    logger.debug("[CAMPAIGN-UPDATE] Updated %s: %s", field, value)
                     # executionStatus 업데이트 특별 로깅
                     if field == 'executionStatus':
-                        print(f"[CAMPAIGN-UPDATE] ExecutionStatus successfully updated to: {value}")
-                        print(f"[CAMPAIGN-UPDATE] Campaign.executionStatus value: {getattr(campaign, 'executionStatus', 'NOT_FOUND')}")
+                        logger.debug("[CAMPAIGN-UPDATE] ExecutionStatus successfully updated to: %s", value)
+                        logger.debug("[CAMPAIGN-UPDATE] Campaign.executionStatus value: %s", getattr(campaign, 'executionStatus', 'NOT_FOUND'))
         
             # 업데이트 시간과 업데이트한 사용자 정보 추가
             campaign.updated_at = datetime.utcnow()
@@ -1921,7 +1853,7 @@ async def update_campaign(
             await db.commit()
             await db.refresh(campaign)
             
-            print(f"[CAMPAIGN-UPDATE] SUCCESS: Campaign {campaign_id} updated by user {user_id}")
+            logger.debug("[CAMPAIGN-UPDATE] SUCCESS: Campaign %s updated by user %s", campaign_id, user_id)
 
             # 직렬화된 응답 반환 (executionStatus 매핑 포함)
             response_data = {
@@ -1946,18 +1878,18 @@ async def update_campaign(
         except HTTPException:
             raise  # HTTPException은 그대로 전달
         except Exception as e:
-            print(f"[CAMPAIGN-UPDATE] Unexpected error: {type(e).__name__}: {e}")
+            logger.error("[CAMPAIGN-UPDATE] Unexpected error: %s: %s", type(e).__name__, e)
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"캠페인 수정 중 오류: {str(e)}")
     else:
         # JWT 토큰 기반 API 모드
-        print(f"[CAMPAIGN-UPDATE] JWT 토큰 기반 수정 요청: campaign_id={campaign_id}")
+        logger.debug("[CAMPAIGN-UPDATE] JWT 토큰 기반 수정 요청: campaign_id=%s", campaign_id)
         
         # JWT 토큰에서 사용자 정보 추출
         user_id = jwt_user.id
         user_role = jwt_user.role
         
-        print(f"[CAMPAIGN-UPDATE] JWT User: id={user_id}, role={user_role}")
+        logger.debug("[CAMPAIGN-UPDATE] JWT User: id=%s, role=%s", user_id, user_role)
         
         # 동일한 수정 로직 사용 (Query parameter 방식과 동일)
         try:
@@ -1967,23 +1899,23 @@ async def update_campaign(
             campaign = result.unique().scalar_one_or_none()
             
             if not campaign:
-                print(f"[CAMPAIGN-UPDATE] Campaign not found: {campaign_id}")
+                logger.debug("[CAMPAIGN-UPDATE] Campaign not found: %s", campaign_id)
                 raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다.")
             
-            print(f"[CAMPAIGN-UPDATE] Found campaign: {campaign.name}, creator_id={campaign.creator_id}")
+            logger.debug("[CAMPAIGN-UPDATE] Found campaign: %s, creator_id=%s", campaign.name, campaign.creator_id)
             
             # 권한 확인 (Query parameter 방식과 동일한 로직)
             if user_role == UserRole.SUPER_ADMIN.value:
-                print(f"[CAMPAIGN-UPDATE] Super admin can edit any campaign")
+                logger.debug("[CAMPAIGN-UPDATE] Super admin can edit any campaign")
                 pass
             elif user_role == UserRole.CLIENT.value:
                 can_edit = False
                 if campaign.creator_id == user_id:
                     can_edit = True
-                    print(f"[CAMPAIGN-UPDATE] CLIENT can edit: own created campaign")
+                    logger.debug("[CAMPAIGN-UPDATE] CLIENT can edit: own created campaign")
                 elif campaign.client_user_id == user_id:
                     can_edit = True
-                    print(f"[CAMPAIGN-UPDATE] CLIENT can edit: campaign created for them")
+                    logger.debug("[CAMPAIGN-UPDATE] CLIENT can edit: campaign created for them")
                 
                 if not can_edit:
                     raise HTTPException(status_code=403, detail="이 캠페인을 수정할 권한이 없습니다.")
@@ -1997,7 +1929,7 @@ async def update_campaign(
 
                 if creator and creator.company == jwt_user.company:
                     can_edit = True
-                    print(f"[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: same company campaign")
+                    logger.debug("[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: same company campaign")
 
                 # 2) 자신이 담당 스태프로 지정되었고 같은 회사인지 확인
                 if not can_edit and campaign.staff_id == user_id:
@@ -2007,7 +1939,7 @@ async def update_campaign(
 
                     if staff_user and staff_user.company == jwt_user.company:
                         can_edit = True
-                        print(f"[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: assigned as staff with same company")
+                        logger.debug("[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: assigned as staff with same company")
 
                 # 3) 클라이언트 사용자가 있고 같은 회사인지 확인
                 if not can_edit and campaign.client_user_id:
@@ -2016,7 +1948,7 @@ async def update_campaign(
                     client = client_result.scalar_one_or_none()
                     if client and client.company == jwt_user.company:
                         can_edit = True
-                        print(f"[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: client from same company")
+                        logger.debug("[CAMPAIGN-UPDATE] AGENCY_ADMIN can edit: client from same company")
 
                 if not can_edit:
                     raise HTTPException(status_code=403, detail="이 캠페인을 수정할 권한이 없습니다.")
@@ -2025,31 +1957,31 @@ async def update_campaign(
             
             # 캠페인 데이터 업데이트 (Query parameter 방식과 동일한 로직)
             update_data = campaign_data.dict(exclude_unset=True)
-            print(f"[CAMPAIGN-UPDATE] Update data: {update_data}")
+            logger.debug("[CAMPAIGN-UPDATE] Update data: %s", update_data)
             
             for field, value in update_data.items():
                 if field == 'budget':
                     if value is None or value == '' or value == 0:
                         if campaign.budget is None:
                             setattr(campaign, field, 1000000.0)
-                            print(f"[CAMPAIGN-UPDATE] Set default budget: 1000000.0")
+                            logger.debug("[CAMPAIGN-UPDATE] Set default budget: 1000000.0")
                         else:
-                            print(f"[CAMPAIGN-UPDATE] Keeping existing budget: {campaign.budget}")
+                            logger.debug("[CAMPAIGN-UPDATE] Keeping existing budget: %s", campaign.budget)
                     else:
                         try:
                             budget_value = float(value)
                             setattr(campaign, field, budget_value)
-                            print(f"[CAMPAIGN-UPDATE] Updated budget: {budget_value}")
+                            logger.debug("[CAMPAIGN-UPDATE] Updated budget: %s", budget_value)
                         except (ValueError, TypeError) as e:
-                            print(f"[CAMPAIGN-UPDATE] Invalid budget value: {value}, keeping existing: {campaign.budget}")
+                            logger.debug("[CAMPAIGN-UPDATE] Invalid budget value: %s, keeping existing: %s", value, campaign.budget)
                 elif field in ['start_date', 'end_date']:
                     if value is None or value == '':
                         if getattr(campaign, field) is None:
                             default_date = datetime.now()
                             setattr(campaign, field, default_date)
-                            print(f"[CAMPAIGN-UPDATE] Set default {field}: {default_date}")
+                            logger.debug("[CAMPAIGN-UPDATE] Set default %s: %s", field, default_date)
                         else:
-                            print(f"[CAMPAIGN-UPDATE] Keeping existing {field}: {getattr(campaign, field)}")
+                            logger.debug("[CAMPAIGN-UPDATE] Keeping existing %s: %s", field, getattr(campaign, field))
                     else:
                         try:
                             if isinstance(value, str):
@@ -2057,9 +1989,9 @@ async def update_campaign(
                             else:
                                 parsed_date = value
                             setattr(campaign, field, parsed_date)
-                            print(f"[CAMPAIGN-UPDATE] Updated {field}: {value} -> {parsed_date}")
+                            logger.debug("[CAMPAIGN-UPDATE] Updated %s: %s -> %s", field, value, parsed_date)
                         except Exception as e:
-                            print(f"[CAMPAIGN-UPDATE] Date parsing error for {field}: {e}, keeping existing value")
+                            logger.error("[CAMPAIGN-UPDATE] Date parsing error for %s: %s, keeping existing value", field, e)
                             # 파싱 오류 시 기존 값을 유지 (NULL 값 설정하지 않음)
                             pass
                 elif field == 'client_company' and value:
@@ -2071,23 +2003,23 @@ async def update_campaign(
                             match = re.search(r'\(ID: (\d+)\)', value)
                             if match:
                                 client_user_id = int(match.group(1))
-                                print(f"[CAMPAIGN-UPDATE] Updated client_company: {value}")
-                                print(f"[CAMPAIGN-UPDATE] Extracted client_user_id: {client_user_id}")
+                                logger.debug("[CAMPAIGN-UPDATE] Updated client_company: %s", value)
+                                logger.debug("[CAMPAIGN-UPDATE] Extracted client_user_id: %s", client_user_id)
                         except (ValueError, AttributeError) as e:
-                            print(f"[CAMPAIGN-UPDATE] Failed to extract client_user_id: {e}")
+                            logger.error("[CAMPAIGN-UPDATE] Failed to extract client_user_id: %s", e)
                     
                     try:
                         if hasattr(campaign, 'client_user_id'):
                             setattr(campaign, 'client_user_id', client_user_id)
-                            print(f"[CAMPAIGN-UPDATE] client_user_id field available, updated to: {client_user_id}")
+                            logger.debug("[CAMPAIGN-UPDATE] client_user_id field available, updated to: %s", client_user_id)
                         else:
-                            print("[CAMPAIGN-UPDATE] client_user_id field not available, skipping")
+                            logger.debug("[CAMPAIGN-UPDATE] client_user_id field not available, skipping")
                     except Exception as e:
-                        print(f"[CAMPAIGN-UPDATE] Warning: Could not update client_user_id: {e}")
+                        logger.warning("[CAMPAIGN-UPDATE] Warning: Could not update client_user_id: %s", e)
                 elif field == 'staff_id' and value:
                     # 캠페인 담당자 변경 (대행사 어드민만 가능)
                     if user_role != UserRole.AGENCY_ADMIN.value and not ('agency' in user_role.lower() and 'admin' in user_role.lower()) and user_role != UserRole.SUPER_ADMIN.value:
-                        print(f"[CAMPAIGN-UPDATE] Permission denied: user_role={user_role} cannot change staff_id")
+                        logger.debug("[CAMPAIGN-UPDATE] Permission denied: user_role=%s cannot change staff_id", user_role)
                         continue
 
                     # 새로운 담당 직원이 같은 회사인지 확인
@@ -2096,31 +2028,31 @@ async def update_campaign(
                     new_staff = new_staff_result.scalar_one_or_none()
 
                     if not new_staff:
-                        print(f"[CAMPAIGN-UPDATE] New staff not found: {value}")
+                        logger.debug("[CAMPAIGN-UPDATE] New staff not found: %s", value)
                         continue
 
                     # 대행사 어드민의 경우 같은 회사 직원만 배정 가능
                     if user_role == UserRole.AGENCY_ADMIN.value and hasattr(viewer, 'company') and new_staff.company != viewer.company:
-                        print(f"[CAMPAIGN-UPDATE] New staff not in same company: {new_staff.company} != {viewer.company}")
+                        logger.debug("[CAMPAIGN-UPDATE] New staff not in same company: %s != %s", new_staff.company, viewer.company)
                         continue
 
                     setattr(campaign, field, value)
-                    print(f"[CAMPAIGN-UPDATE] Changed staff_id from {getattr(campaign, 'staff_id', 'None')} to {value} ({new_staff.name})")
+                    logger.debug("[CAMPAIGN-UPDATE] Changed staff_id from %s to %s (%s)", getattr(campaign, 'staff_id', 'None'), value, new_staff.name)
                 elif field in ['invoice_issued', 'payment_completed']:
                     # 재무 상태 필드 처리
                     try:
                         bool_value = bool(value) if value is not None else False
                         setattr(campaign, field, bool_value)
-                        print(f"[CAMPAIGN-UPDATE] Updated financial field {field}: {value} -> {bool_value}")
+                        logger.debug("[CAMPAIGN-UPDATE] Updated financial field %s: %s -> %s", field, value, bool_value)
                     except Exception as e:
-                        print(f"[CAMPAIGN-UPDATE] Warning: Could not update {field}: {e}")
+                        logger.warning("[CAMPAIGN-UPDATE] Warning: Could not update %s: %s", field, e)
                 elif hasattr(campaign, field):
                     setattr(campaign, field, value)
-                    print(f"[CAMPAIGN-UPDATE] Updated {field}: {value}")
+                    logger.debug("[CAMPAIGN-UPDATE] Updated %s: %s", field, value)
                     # executionStatus 업데이트 특별 로깅
                     if field == 'executionStatus':
-                        print(f"[CAMPAIGN-UPDATE] ExecutionStatus successfully updated to: {value}")
-                        print(f"[CAMPAIGN-UPDATE] Campaign.executionStatus value: {getattr(campaign, 'executionStatus', 'NOT_FOUND')}")
+                        logger.debug("[CAMPAIGN-UPDATE] ExecutionStatus successfully updated to: %s", value)
+                        logger.debug("[CAMPAIGN-UPDATE] Campaign.executionStatus value: %s", getattr(campaign, 'executionStatus', 'NOT_FOUND'))
             
             # 업데이트 시간 설정
             campaign.updated_at = datetime.utcnow()
@@ -2128,7 +2060,7 @@ async def update_campaign(
             await db.commit()
             await db.refresh(campaign)
             
-            print(f"[CAMPAIGN-UPDATE] SUCCESS: Campaign {campaign_id} updated by JWT user {user_id}")
+            logger.debug("[CAMPAIGN-UPDATE] SUCCESS: Campaign %s updated by JWT user %s", campaign_id, user_id)
 
             # 직렬화된 응답 반환 (executionStatus 매핑 포함)
             response_data = {
@@ -2153,7 +2085,7 @@ async def update_campaign(
         except HTTPException:
             raise  # HTTPException은 그대로 전달
         except Exception as e:
-            print(f"[CAMPAIGN-UPDATE] Unexpected error in JWT mode: {type(e).__name__}: {e}")
+            logger.error("[CAMPAIGN-UPDATE] Unexpected error in JWT mode: %s: %s", type(e).__name__, e)
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"캠페인 수정 중 오류: {str(e)}")
 
@@ -2300,30 +2232,9 @@ async def get_campaign_posts(
         posts_with_products = posts_result.all()
 
         # PostResponse 형태로 직렬화 (product name 포함)
-        posts_data = []
-        for post, product in posts_with_products:
-            posts_data.append({
-                "id": post.id,
-                "title": post.title,
-                "workType": post.work_type,
-                "topicStatus": post.topic_status,
-                "outline": post.outline,
-                "outlineStatus": post.outline_status,
-                "images": post.images or [],
-                "publishedUrl": post.published_url,
-                "orderRequestStatus": post.order_request_status,
-                "orderRequestId": post.order_request_id,
-                "startDate": post.start_date,
-                "dueDate": post.due_date,
-                "productId": post.product_id,
-                "productName": product.name if product else None,  # 제품명 추가
-                "productCost": product.cost if product else None,  # 제품 원가 추가
-                "quantity": post.quantity,
-                "campaignId": post.campaign_id,
-                "createdAt": post.created_at.isoformat() if post.created_at else None
-            })
+        posts_data = [serialize_campaign_post_compat(post, product) for post, product in posts_with_products]
 
-        return posts_data
+        return FastJSONResponse(posts_data)
     else:
         # JWT 기반 API 호출은 별도 엔드포인트 사용 요구
         raise HTTPException(
@@ -2341,7 +2252,7 @@ async def get_campaign_posts_jwt(
 ):
     """JWT 인증 기반 캠페인 게시물 목록 조회"""
 
-    print(f"[CAMPAIGN-POSTS-JWT] Request for campaign_id={campaign_id}, user_id={current_user.id}, user_role={current_user.role.value}")
+    logger.debug("[CAMPAIGN-POSTS-JWT] Request for campaign_id=%s, user_id=%s, user_role=%s", campaign_id, current_user.id, current_user.role.value)
 
     # 캠페인 존재 여부 확인
     campaign_query = select(Campaign).where(Campaign.id == campaign_id)
@@ -2349,7 +2260,7 @@ async def get_campaign_posts_jwt(
     campaign = result.scalar_one_or_none()
 
     if not campaign:
-        print(f"[CAMPAIGN-POSTS-JWT] Campaign {campaign_id} not found")
+        logger.debug("[CAMPAIGN-POSTS-JWT] Campaign %s not found", campaign_id)
         raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다")
 
     # 캠페인의 모든 포스트 조회 (Product 조인)
@@ -2361,68 +2272,13 @@ async def get_campaign_posts_jwt(
     posts_result = await db.execute(posts_query)
     posts_with_products = posts_result.all()
 
-    print(f"[CAMPAIGN-POSTS-JWT] Found {len(posts_with_products)} posts for campaign {campaign_id}")
+    logger.debug("[CAMPAIGN-POSTS-JWT] Found %s posts for campaign %s", len(posts_with_products), campaign_id)
 
     # PostResponse 형태로 직렬화 (product name 포함)
-    posts_data = []
-    for post, product in posts_with_products:
-        posts_data.append({
-            "id": post.id,
-            "title": post.title,
-            "workType": post.work_type,
-            "topicStatus": post.topic_status,
-            "outline": post.outline,
-            "outlineStatus": post.outline_status,
-            "rejectReason": post.reject_reason,  # 반려 사유
-            "images": post.images or [],
-            "publishedUrl": post.published_url,
-            "orderRequestStatus": post.order_request_status,
-            "orderRequestId": post.order_request_id,
-            "startDate": post.start_date,  # 기존 호환성
-            "dueDate": post.due_date,      # 기존 호환성
-            # "startDatetime": post.start_datetime.isoformat() if post.start_datetime else None,  # 새로운 DateTime
-            # "dueDatetime": post.due_datetime.isoformat() if post.due_datetime else None,        # 새로운 DateTime
-            "productId": post.product_id,
-            "productName": post.product_name or (product.name if product else None),  # 제품명: post.product_name 우선, 없으면 product.name
-            "quantity": post.quantity,
-            "cost": post.cost,  # 포스트별 작업 단가
-            "productCost": post.product_cost or (product.cost if product else None),  # 제품 원가: post 우선, 없으면 product DB
-            "budget": post.budget or 0.0,  # 포스트별 매출 예산
-            # 재무 관련 필드
-            "invoiceIssued": post.invoice_issued or False,
-            "paymentCompleted": post.payment_completed or False,
-            "invoiceDueDate": post.invoice_due_date.isoformat() if post.invoice_due_date else None,
-            "paymentDueDate": post.payment_due_date.isoformat() if post.payment_due_date else None,
-            "campaignId": post.campaign_id,
-            "createdAt": post.created_at.isoformat() if post.created_at else None
-        })
-
-    return posts_data
+    posts_data = [serialize_campaign_post(post, product) for post, product in posts_with_products]
 
+    return FastJSONResponse(posts_data)
 
-# Campaign budget 자동 업데이트 헬퍼 함수
-async def update_campaign_budget(campaign_id: int, db: AsyncSession):
-    """캠페인의 모든 활성 posts의 budget 합계로 campaign.budget 업데이트"""
-    from sqlalchemy import func
-    
-    # 모든 활성 posts의 budget 합계 계산
-    posts_budget_query = select(func.sum(Post.budget)).where(
-        Post.campaign_id == campaign_id,
-        Post.is_active == True
-    )
-    result = await db.execute(posts_budget_query)
-    total_budget = float(result.scalar() or 0.0)
-    
-    # Campaign budget 업데이트
-    campaign_query = select(Campaign).where(Campaign.id == campaign_id)
-    campaign_result = await db.execute(campaign_query)
-    campaign = campaign_result.scalar_one_or_none()
-    
-    if campaign:
-        campaign.budget = total_budget
-        print(f"[UPDATE-CAMPAIGN-BUDGET] Campaign {campaign_id} budget updated: {total_budget}")
-    
-    return total_budget
 
 @router.post("/{campaign_id}/posts/", response_model=PostResponse)
 async def create_campaign_post(
@@ -2432,7 +2288,7 @@ async def create_campaign_post(
     db: AsyncSession = Depends(get_async_db)
 ):
     """캠페인에 새 업무(포스트) 생성 (JWT 기반)"""
-    print(f"[CREATE-POST] JWT User: {current_user.name}, Campaign: {campaign_id}, Data: {post_data.dict()}")
+    logger.debug("[CREATE-POST] JWT User: %s, Campaign: %s, Data: %s", current_user.name, campaign_id, post_data.dict())
 
     try:
         # 캠페인 존재 여부 및 권한 확인
@@ -2495,12 +2351,12 @@ async def create_campaign_post(
         )
 
         db.add(new_post)
+        # 캠페인 budget/포스트 집계 증분 반영 (같은 트랜잭션)
+        await apply_post_delta(db, campaign_id, after=post_contribution(new_post))
         await db.commit()
         await db.refresh(new_post)
-        # Campaign budget 자동 업데이트
-        await update_campaign_budget(campaign_id, db)
 
-        print(f"[CREATE-POST] SUCCESS: Created post {new_post.id} for campaign {campaign_id} with product_cost: {product_cost}")
+        logger.debug("[CREATE-POST] SUCCESS: Created post %s for campaign %s with product_cost: %s", new_post.id, campaign_id, product_cost)
 
         # 수동으로 직렬화해서 productName과 product_cost 포함
         return {
@@ -2539,7 +2395,7 @@ async def create_campaign_post(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CREATE-POST] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[CREATE-POST] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"업무 생성 중 오류: {str(e)}")
 
@@ -2553,7 +2409,7 @@ async def update_campaign_post(
     db: AsyncSession = Depends(get_async_db)
 ):
     """캠페인의 업무(포스트) 수정 (JWT 기반)"""
-    print(f"[UPDATE-POST] JWT User: {current_user.name}, Campaign: {campaign_id}, Post: {post_id}, Data: {post_data}")
+    logger.debug("[UPDATE-POST] JWT User: %s, Campaign: %s, Post: %s, Data: %s", current_user.name, campaign_id, post_id, post_data)
 
     try:
         # 캠페인 및 포스트 존재 여부 확인
@@ -2564,7 +2420,13 @@ async def update_campaign_post(
         if not campaign:
             raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다")
 
-        post_query = select(Post).where(Post.id == post_id, Post.campaign_id == campaign_id, Post.is_active == True)
+        # 포스트 행 잠금 (같은 포스트 동시 수정 시 변경 전 기여분을 최신 값으로 계산하도록 직렬화)
+        post_query = (
+            select(Post)
+            .where(Post.id == post_id, Post.campaign_id == campaign_id, Post.is_active == True)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
         post_result = await db.execute(post_query)
         post = post_result.scalar_one_or_none()
 
@@ -2599,22 +2461,25 @@ async def update_campaign_post(
         else:
             raise HTTPException(status_code=403, detail="이 업무를 수정할 권한이 없습니다")
 
+        # 캠페인 집계 증분 계산용 변경 전 상태
+        contribution_before = post_contribution(post)
+
         # 업데이트할 필드들 처리
         if 'title' in post_data:
             post.title = post_data['title']
         if 'workType' in post_data:
             post.work_type = post_data['workType']
         if 'topicStatus' in post_data:
-            print(f"[UPDATE-POST] Updating topic_status: {post.topic_status} -> {post_data['topicStatus']}")
+            logger.debug("[UPDATE-POST] Updating topic_status: %s -> %s", post.topic_status, post_data['topicStatus'])
             post.topic_status = post_data['topicStatus']
         if 'outline' in post_data:
-            print(f"[UPDATE-POST] Updating outline: {len(post.outline or '')} chars -> {len(post_data['outline'] or '')} chars")
+            logger.debug("[UPDATE-POST] Updating outline: %s chars -> %s chars", len(post.outline or ''), len(post_data['outline'] or ''))
             post.outline = post_data['outline']
         if 'outlineStatus' in post_data:
-            print(f"[UPDATE-POST] Updating outline_status: {post.outline_status} -> {post_data['outlineStatus']}")
+            logger.debug("[UPDATE-POST] Updating outline_status: %s -> %s", post.outline_status, post_data['outlineStatus'])
             post.outline_status = post_data['outlineStatus']
         if 'rejectReason' in post_data:
-            print(f"[UPDATE-POST] Updating reject_reason: {post_data['rejectReason']}")
+            logger.debug("[UPDATE-POST] Updating reject_reason: %s", post_data['rejectReason'])
             post.reject_reason = post_data['rejectReason']
         if 'images' in post_data:
             post.images = post_data['images']
@@ -2633,7 +2498,7 @@ async def update_campaign_post(
                     if product:
                         post.product_cost = product.cost  # 상품 원가 자동 연동
                         post.product_name = product.name  # 상품명 자동 연동
-                        print(f"[UPDATE-POST] Auto-updated product_cost: {product.cost}, product_name: {product.name}")
+                        logger.debug("[UPDATE-POST] Auto-updated product_cost: %s, product_name: %s", product.cost, product.name)
                     else:
                         post.product_cost = None
                         post.product_name = None
@@ -2641,25 +2506,25 @@ async def update_campaign_post(
                     post.product_cost = None
                     post.product_name = None
 
-                print(f"[UPDATE-POST] Updated product_id: {post.product_id}")
+                logger.debug("[UPDATE-POST] Updated product_id: %s", post.product_id)
             except (ValueError, TypeError) as e:
-                print(f"[UPDATE-POST] Invalid productId: {post_data['productId']}, error: {e}")
+                logger.error("[UPDATE-POST] Invalid productId: %s, error: %s", post_data['productId'], e)
                 raise HTTPException(status_code=400, detail=f"잘못된 상품 ID 형식: {post_data['productId']}")
         if 'quantity' in post_data:
             # quantity를 정수로 변환
             try:
                 post.quantity = int(post_data['quantity']) if post_data['quantity'] else 1
-                print(f"[UPDATE-POST] Updated quantity: {post.quantity}")
+                logger.debug("[UPDATE-POST] Updated quantity: %s", post.quantity)
             except (ValueError, TypeError) as e:
-                print(f"[UPDATE-POST] Invalid quantity: {post_data['quantity']}, error: {e}")
+                logger.error("[UPDATE-POST] Invalid quantity: %s, error: %s", post_data['quantity'], e)
                 raise HTTPException(status_code=400, detail=f"잘못된 수량 형식: {post_data['quantity']}")
         if 'budget' in post_data:
             # budget을 float로 변환
             try:
                 post.budget = float(post_data['budget']) if post_data['budget'] else 0.0
-                print(f"[UPDATE-POST] Updated budget: {post.budget}")
+                logger.debug("[UPDATE-POST] Updated budget: %s", post.budget)
             except (ValueError, TypeError) as e:
-                print(f"[UPDATE-POST] Invalid budget: {post_data['budget']}, error: {e}")
+                logger.error("[UPDATE-POST] Invalid budget: %s, error: %s", post_data['budget'], e)
                 raise HTTPException(status_code=400, detail=f"잘못된 매출 형식: {post_data['budget']}")
         if 'startDate' in post_data:
             post.start_date = post_data['startDate']
@@ -2667,15 +2532,15 @@ async def update_campaign_post(
             post.due_date = post_data['dueDate']
         if 'published_url' in post_data:
             post.published_url = post_data['published_url']
-            print(f"[UPDATE-POST] Updated published_url: {post_data['published_url']}")
+            logger.debug("[UPDATE-POST] Updated published_url: %s", post_data['published_url'])
 
         # 재무 관련 필드 업데이트
         if 'invoice_issued' in post_data:
             post.invoice_issued = bool(post_data['invoice_issued'])
-            print(f"[UPDATE-POST] Updated invoice_issued: {post.invoice_issued}")
+            logger.debug("[UPDATE-POST] Updated invoice_issued: %s", post.invoice_issued)
         if 'payment_completed' in post_data:
             post.payment_completed = bool(post_data['payment_completed'])
-            print(f"[UPDATE-POST] Updated payment_completed: {post.payment_completed}")
+            logger.debug("[UPDATE-POST] Updated payment_completed: %s", post.payment_completed)
         if 'invoice_due_date' in post_data:
             from datetime import datetime
             if post_data['invoice_due_date']:
@@ -2685,9 +2550,9 @@ async def update_campaign_post(
                         post.invoice_due_date = datetime.fromisoformat(post_data['invoice_due_date'].replace('Z', '+00:00'))
                     else:
                         post.invoice_due_date = post_data['invoice_due_date']
-                    print(f"[UPDATE-POST] Updated invoice_due_date: {post.invoice_due_date}")
+                    logger.debug("[UPDATE-POST] Updated invoice_due_date: %s", post.invoice_due_date)
                 except (ValueError, TypeError) as e:
-                    print(f"[UPDATE-POST] Invalid invoice_due_date: {post_data['invoice_due_date']}, error: {e}")
+                    logger.error("[UPDATE-POST] Invalid invoice_due_date: %s, error: %s", post_data['invoice_due_date'], e)
             else:
                 post.invoice_due_date = None
         if 'payment_due_date' in post_data:
@@ -2699,28 +2564,27 @@ async def update_campaign_post(
                         post.payment_due_date = datetime.fromisoformat(post_data['payment_due_date'].replace('Z', '+00:00'))
                     else:
                         post.payment_due_date = post_data['payment_due_date']
-                    print(f"[UPDATE-POST] Updated payment_due_date: {post.payment_due_date}")
+                    logger.debug("[UPDATE-POST] Updated payment_due_date: %s", post.payment_due_date)
                 except (ValueError, TypeError) as e:
-                    print(f"[UPDATE-POST] Invalid payment_due_date: {post_data['payment_due_date']}, error: {e}")
+                    logger.error("[UPDATE-POST] Invalid payment_due_date: %s, error: %s", post_data['payment_due_date'], e)
             else:
                 post.payment_due_date = None
 
         # 업무 수정 시 발주 요청 상태 초기화
-        print(f"[UPDATE-POST] 업무 수정으로 인한 발주 요청 상태 초기화: Post {post.id}")
-        print(f"[UPDATE-POST] 이전 발주 상태: orderRequestStatus={post.order_request_status}, orderRequestId={post.order_request_id}")
+        logger.debug("[UPDATE-POST] 업무 수정으로 인한 발주 요청 상태 초기화: Post %s", post.id)
+        logger.debug("[UPDATE-POST] 이전 발주 상태: orderRequestStatus=%s, orderRequestId=%s", post.order_request_status, post.order_request_id)
 
         post.order_request_status = None
         post.order_request_id = None
 
-        print(f"[UPDATE-POST] 발주 요청 상태 초기화 완료")
+        logger.debug("[UPDATE-POST] 발주 요청 상태 초기화 완료")
 
+        # 캠페인 budget/포스트 집계 증분 반영 (같은 트랜잭션)
+        await apply_post_delta(db, campaign_id, contribution_before, post_contribution(post))
         await db.commit()
         await db.refresh(post)
-        # Campaign budget 자동 업데이트
-        await update_campaign_budget(campaign_id, db)
-        await db.commit()
 
-        print(f"[UPDATE-POST] SUCCESS: Updated post {post.id} for campaign {campaign_id} with product_cost: {post.product_cost}")
+        logger.debug("[UPDATE-POST] SUCCESS: Updated post %s for campaign %s with product_cost: %s", post.id, campaign_id, post.product_cost)
 
         # 수정된 포스트 반환 (camelCase로 통일)
         return {
@@ -2755,7 +2619,7 @@ async def update_campaign_post(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[UPDATE-POST] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[UPDATE-POST] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"업무 수정 중 오류: {str(e)}")
 
@@ -2768,7 +2632,7 @@ async def delete_campaign_post(
     db: AsyncSession = Depends(get_async_db)
 ):
     """캠페인의 업무(포스트) 삭제 (JWT 기반 - Hard Delete)"""
-    print(f"[DELETE-POST] JWT User: {current_user.name}, Campaign: {campaign_id}, Post: {post_id}")
+    logger.debug("[DELETE-POST] JWT User: %s, Campaign: %s, Post: %s", current_user.name, campaign_id, post_id)
 
     try:
         # 캠페인 존재 여부 확인
@@ -2779,8 +2643,13 @@ async def delete_campaign_post(
         if not campaign:
             raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다")
 
-        # 포스트 존재 여부 확인
-        post_query = select(Post).where(Post.id == post_id, Post.campaign_id == campaign_id, Post.is_active == True)
+        # 포스트 존재 여부 확인 (행 잠금 - 동시 수정과 직렬화해 삭제 시 차감할 기여분을 최신 값으로 계산)
+        post_query = (
+            select(Post)
+            .where(Post.id == post_id, Post.campaign_id == campaign_id, Post.is_active == True)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
         post_result = await db.execute(post_query)
         post = post_result.scalar_one_or_none()
 
@@ -2807,25 +2676,332 @@ async def delete_campaign_post(
         order_request_stmt = sql_delete(OrderRequest).where(OrderRequest.post_id == post_id)
         await db.execute(order_request_stmt)
 
-        # 3. Post 삭제
+        # 3. 환불 기록 삭제 (캠페인 환불 건수 차감)
+        await delete_post_refunds(db, campaign_id, [post_id])
+
+        # 4. Post 삭제
         delete_post_stmt = sql_delete(Post).where(Post.id == post_id)
         await db.execute(delete_post_stmt)
 
-        # Campaign budget 자동 업데이트
-        await update_campaign_budget(campaign_id, db)
+        # 캠페인 budget/포스트 집계 증분 반영 (같은 트랜잭션)
+        await apply_post_delta(db, campaign_id, before=post_contribution(post))
         await db.commit()
 
-        print(f"[DELETE-POST] SUCCESS: Hard deleted post {post_id} from campaign {campaign_id}")
+        logger.debug("[DELETE-POST] SUCCESS: Hard deleted post %s from campaign %s", post_id, campaign_id)
         return None  # 204 No Content
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[DELETE-POST] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[DELETE-POST] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"업무 삭제 중 오류: {str(e)}")
 
 
+# 단건 수정 API(update_campaign_post)의 키 -> 컬럼 (그대로 대입하는 필드)
+POST_UPDATE_COLUMNS = {
+    'title': 'title',
+    'workType': 'work_type',
+    'topicStatus': 'topic_status',
+    'outline': 'outline',
+    'outlineStatus': 'outline_status',
+    'rejectReason': 'reject_reason',
+    'images': 'images',
+    'startDate': 'start_date',
+    'dueDate': 'due_date',
+    'published_url': 'published_url',
+}
+
+# CLIENT가 수정할 수 있는 필드 (승인 상태만)
+CLIENT_POST_UPDATE_FIELDS = {'topicStatus', 'outlineStatus', 'rejectReason'}
+
+
+def _parse_post_due_date(value):
+    """재무 마감일 값 변환 (ISO 문자열 -> datetime, 빈 값 -> None)"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value
+
+
+def _post_update_values(post_data: dict) -> dict:
+    """
+    단건 수정 API와 같은 규칙으로 UPDATE 컬럼 값 계산 (잘못된 값은 ValueError)
+    - productId 변경 시 product_cost/product_name은 호출자가 상품 조회 후 채움
+    - 업무 수정 시 발주 요청 상태 초기화
+    """
+    values = {column: post_data[key] for key, column in POST_UPDATE_COLUMNS.items() if key in post_data}
+
+    if 'productId' in post_data:
+        try:
+            values['product_id'] = int(post_data['productId']) if post_data['productId'] else None
+        except (ValueError, TypeError):
+            raise ValueError(f"잘못된 상품 ID 형식: {post_data['productId']}")
+    if 'quantity' in post_data:
+        try:
+            values['quantity'] = int(post_data['quantity']) if post_data['quantity'] else 1
+        except (ValueError, TypeError):
+            raise ValueError(f"잘못된 수량 형식: {post_data['quantity']}")
+    if 'budget' in post_data:
+        try:
+            values['budget'] = float(post_data['budget']) if post_data['budget'] else 0.0
+        except (ValueError, TypeError):
+            raise ValueError(f"잘못된 매출 형식: {post_data['budget']}")
+
+    # 재무 관련 필드
+    if 'invoice_issued' in post_data:
+        values['invoice_issued'] = bool(post_data['invoice_issued'])
+    if 'payment_completed' in post_data:
+        values['payment_completed'] = bool(post_data['payment_completed'])
+    for key in ('invoice_due_date', 'payment_due_date'):
+        if key in post_data:
+            try:
+                values[key] = _parse_post_due_date(post_data[key])
+            except (ValueError, TypeError):
+                raise ValueError(f"잘못된 날짜 형식 ({key}): {post_data[key]}")
+
+    values['order_request_status'] = None
+    values['order_request_id'] = None
+    return values
+
+
+def _batch_error(result: dict, status_code: int, detail: str) -> dict:
+    result.update(status="error", statusCode=status_code, detail=detail)
+    return result
+
+
+@router.post("/{campaign_id}/posts:batch")
+async def batch_campaign_posts(
+    campaign_id: int,
+    batch: PostBatchRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    캠페인 업무(포스트) 일괄 생성/수정/삭제 (JWT 기반)
+    - 캠페인 조회/권한 확인 1회, 권한 규칙은 단건 생성/수정/삭제 API와 동일
+    - 검증에 실패한 항목만 제외하고 나머지는 insert()/update()/delete() 일괄 문장으로 한 트랜잭션에 반영
+    - 캠페인 집계 UPDATE 1회, WebSocket 이벤트 1회, 응답은 요청 순서대로 항목별 결과
+    """
+    from pydantic import ValidationError
+    from sqlalchemy import delete as sql_delete, insert, update
+    from app.core.config import settings
+    from app.models.user_telegram_setting import TelegramNotificationLog
+    from app.services.campaign_aggregates import total_contribution, values_contribution
+
+    operations = batch.operations
+    if len(operations) > settings.POST_BATCH_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.POST_BATCH_MAX_OPERATIONS}개 작업까지 처리할 수 있습니다"
+        )
+
+    campaign_result = await db.execute(
+        select(Campaign).options(noload("*")).where(Campaign.id == campaign_id)
+    )
+    campaign = campaign_result.scalar_one_or_none()
+    if not campaign:
+        raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다")
+
+    # 권한 확인 (요청당 1회)
+    user_role = current_user.role.value
+    is_admin = user_role in [UserRole.SUPER_ADMIN.value, UserRole.AGENCY_ADMIN.value, UserRole.TEAM_LEADER.value]
+    is_owner = campaign.creator_id == current_user.id or campaign.staff_id == current_user.id
+    is_client = not is_admin and user_role == UserRole.CLIENT.value
+    can_manage = is_admin or is_owner  # 생성/삭제
+    can_update = (
+        is_admin
+        or (user_role == UserRole.STAFF.value and is_owner)
+        or (is_client and campaign.client_user_id == current_user.id)
+    )
+    if not can_manage and not can_update:
+        raise HTTPException(status_code=403, detail="이 캠페인의 업무를 수정할 권한이 없습니다")
+
+    # 수정/삭제 대상 포스트 현재 상태 (쿼리 1회, 집계 증분 계산용)
+    target_ids = {op.post_id for op in operations if op.op != "create" and op.post_id is not None}
+    current_rows = {}
+    if target_ids:
+        rows = await db.execute(
+            select(Post.id, Post.budget, Post.is_active, Post.invoice_issued, Post.payment_completed, Post.is_cancelled)
+            .where(Post.id.in_(target_ids), Post.campaign_id == campaign_id, Post.is_active == True)
+        )
+        current_rows = {row.id: row for row in rows}
+
+    results = []
+    creates = []  # (result, PostCreate)
+    updates = []  # (result, values)
+    deletes = []  # result
+    seen_post_ids = set()
+
+    for index, op in enumerate(operations):
+        result = {"index": index, "op": op.op, "postId": op.post_id, "status": "ok"}
+        results.append(result)
+
+        if op.op == "create":
+            if not can_manage:
+                _batch_error(result, 403, "이 캠페인에 업무를 생성할 권한이 없습니다")
+                continue
+            try:
+                creates.append((result, PostCreate.model_validate(op.data)))
+            except ValidationError as e:
+                detail = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+                _batch_error(result, 422, f"잘못된 업무 데이터: {detail}")
+            continue
+
+        if op.post_id is None:
+            _batch_error(result, 422, "postId가 필요합니다")
+            continue
+        if op.post_id in seen_post_ids:
+            _batch_error(result, 409, "같은 업무에 대한 작업이 중복되었습니다")
+            continue
+        seen_post_ids.add(op.post_id)
+        if op.post_id not in current_rows:
+            _batch_error(result, 404, "업무를 찾을 수 없습니다")
+            continue
+
+        if op.op == "delete":
+            if not can_manage:
+                _batch_error(result, 403, "이 업무를 삭제할 권한이 없습니다")
+                continue
+            deletes.append(result)
+            continue
+
+        if not can_update:
+            _batch_error(result, 403, "이 업무를 수정할 권한이 없습니다")
+            continue
+        if is_client:
+            forbidden_fields = set(op.data) - CLIENT_POST_UPDATE_FIELDS
+            if forbidden_fields:
+                _batch_error(
+                    result, 403,
+                    f"CLIENT는 승인 상태만 변경할 수 있습니다. 허용되지 않은 필드: {', '.join(sorted(forbidden_fields))}"
+                )
+                continue
+        try:
+            updates.append((result, _post_update_values(op.data)))
+        except ValueError as e:
+            _batch_error(result, 400, str(e))
+
+    # 상품 원가/상품명 자동 연동 (쿼리 1회)
+    product_ids = {post_data.product_id for _, post_data in creates if post_data.product_id}
+    product_ids |= {values['product_id'] for _, values in updates if values.get('product_id')}
+    products = {}
+    if product_ids:
+        product_rows = await db.execute(
+            select(Product.id, Product.cost, Product.name).where(Product.id.in_(product_ids))
+        )
+        products = {row.id: row for row in product_rows}
+
+    for _, values in updates:
+        if 'product_id' in values:
+            product = products.get(values['product_id'])
+            values['product_cost'] = product.cost if product else None
+            values['product_name'] = product.name if product else None
+
+    create_rows = []
+    for _, post_data in creates:
+        product = products.get(post_data.product_id) if post_data.product_id else None
+        create_rows.append({
+            "title": post_data.title,
+            "work_type": post_data.work_type,
+            "topic_status": post_data.topic_status,
+            "outline": post_data.outline,
+            "outline_status": post_data.outline_status,
+            "images": post_data.images or [],
+            "published_url": post_data.published_url,
+            "order_request_status": post_data.order_request_status,
+            "order_request_id": post_data.order_request_id,
+            "start_date": post_data.start_date,
+            "due_date": post_data.due_date,
+            "start_datetime": post_data.start_datetime,
+            "due_datetime": post_data.due_datetime,
+            "product_id": post_data.product_id,
+            "product_cost": product.cost if product else None,
+            "product_name": post_data.product_name or (product.name if product else None),
+            "quantity": post_data.quantity or 1,
+            "cost": post_data.cost,
+            "budget": post_data.budget or 0.0,
+            "assigned_user_id": post_data.assigned_user_id,
+            "invoice_issued": False,
+            "payment_completed": False,
+            "campaign_id": campaign_id,
+        })
+
+    # 캠페인 집계 증분 (변경 전/후 합계로 apply_post_delta 1회)
+    before = total_contribution(
+        [values_contribution(current_rows[result["postId"]]._mapping) for result, _ in updates]
+        + [values_contribution(current_rows[result["postId"]]._mapping) for result in deletes]
+    )
+    after = total_contribution(
+        [values_contribution(row) for row in create_rows]
+        + [values_contribution({**current_rows[result["postId"]]._mapping, **values}) for result, values in updates]
+    )
+
+    try:
+        if create_rows:
+            inserted = await db.execute(
+                insert(Post).returning(Post.id, sort_by_parameter_order=True), create_rows
+            )
+            for (result, _), post_id in zip(creates, inserted.scalars().all()):
+                result["postId"] = post_id
+
+        # 같은 변경 값끼리 묶어 UPDATE ... WHERE id IN (...) (예: 계산서 발행 플래그 일괄 변경은 문장 1개)
+        update_groups = {}
+        for result, values in updates:
+            signature = repr(sorted(values.items()))
+            update_groups.setdefault(signature, (values, []))[1].append(result["postId"])
+        for values, post_ids in update_groups.values():
+            await db.execute(
+                update(Post)
+                .where(Post.id.in_(post_ids))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+
+        if deletes:
+            delete_ids = [result["postId"] for result in deletes]
+            # Hard Delete: 관련 데이터 먼저 삭제 후 post 삭제 (단건 삭제 API와 동일)
+            await db.execute(sql_delete(TelegramNotificationLog).where(TelegramNotificationLog.post_id.in_(delete_ids)))
+            await db.execute(sql_delete(OrderRequest).where(OrderRequest.post_id.in_(delete_ids)))
+            await delete_post_refunds(db, campaign_id, delete_ids)
+            await db.execute(
+                sql_delete(Post).where(Post.id.in_(delete_ids)).execution_options(synchronize_session=False)
+            )
+
+        await apply_post_delta(db, campaign_id, before, after)
+        await db.commit()
+    except Exception as e:
+        logger.error("[BATCH-POSTS] Unexpected error: %s: %s", type(e).__name__, e)
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"업무 일괄 처리 중 오류: {str(e)}")
+
+    summary = {
+        "created": len(creates),
+        "updated": len(updates),
+        "deleted": len(deletes),
+        "failed": sum(1 for result in results if result["status"] == "error"),
+    }
+    logger.debug("[BATCH-POSTS] User: %s, Campaign: %s, Summary: %s", current_user.name, campaign_id, summary)
+
+    if creates or updates or deletes:
+        try:
+            await manager.notify_campaign_update(
+                campaign_id=campaign_id,
+                update_type="업무 일괄 처리",
+                data={
+                    "created": [result["postId"] for result, _ in creates],
+                    "updated": [result["postId"] for result, _ in updates],
+                    "deleted": [result["postId"] for result in deletes],
+                }
+            )
+        except Exception as e:
+            # WebSocket 에러는 무시하고 계속 진행
+            logger.error("WebSocket notification failed: %s", e)
+
+    return FastJSONResponse({"results": results, "summary": summary})
+
+
 # 프론트엔드 호환: campaign_id 없이 post_id만으로 삭제
 @router.delete("/posts/{post_id}", status_code=204)
 async def delete_post_by_id(
@@ -2834,18 +3010,24 @@ async def delete_post_by_id(
     db: AsyncSession = Depends(get_async_db)
 ):
     """업무(포스트) 삭제 - campaign_id 없이 post_id만으로 삭제 (Hard Delete)"""
-    print(f"[DELETE-POST-SIMPLE] JWT User: {current_user.name}, Post: {post_id}")
+    logger.debug("[DELETE-POST-SIMPLE] JWT User: %s, Post: %s", current_user.name, post_id)
 
     try:
-        # 포스트 존재 여부 확인 (campaign join)
-        post_query = select(Post).options(selectinload(Post.Campaign)).where(Post.id == post_id, Post.is_active == True)
+        # 포스트 존재 여부 확인 (campaign join, 포스트 행 잠금 - 동시 수정과 직렬화)
+        post_query = (
+            select(Post)
+            .options(selectinload(Post.campaign))
+            .where(Post.id == post_id, Post.is_active == True)
+            .with_for_update(of=Post)
+            .execution_options(populate_existing=True)
+        )
         post_result = await db.execute(post_query)
         post = post_result.scalar_one_or_none()
 
         if not post:
             raise HTTPException(status_code=404, detail="업무를 찾을 수 없습니다")
 
-        campaign = post.Campaign
+        campaign = post.campaign
         if not campaign:
             raise HTTPException(status_code=404, detail="연결된 캠페인을 찾을 수 없습니다")
 
@@ -2869,25 +3051,80 @@ async def delete_post_by_id(
         order_request_stmt = sql_delete(OrderRequest).where(OrderRequest.post_id == post_id)
         await db.execute(order_request_stmt)
 
-        # 3. Post 삭제
+        # 3. 환불 기록 삭제 (캠페인 환불 건수 차감)
+        await delete_post_refunds(db, campaign.id, [post_id])
+
+        # 4. Post 삭제
         delete_post_stmt = sql_delete(Post).where(Post.id == post_id)
         await db.execute(delete_post_stmt)
 
+        # 캠페인 budget/포스트 집계 증분 반영 (같은 트랜잭션)
+        await apply_post_delta(db, campaign.id, before=post_contribution(post))
         await db.commit()
-        # Campaign budget 자동 업데이트
-        await update_campaign_budget(post.campaign_id, db)
 
-        print(f"[DELETE-POST-SIMPLE] SUCCESS: Hard deleted post {post_id}")
+        logger.debug("[DELETE-POST-SIMPLE] SUCCESS: Hard deleted post %s", post_id)
         return None  # 204 No Content
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[DELETE-POST-SIMPLE] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[DELETE-POST-SIMPLE] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"업무 삭제 중 오류: {str(e)}")
 
 
+def _compat_user_role(role: str) -> Optional[UserRole]:
+    """Node.js 호환 모드의 역할 문자열 -> UserRole ('super admin', 'agency_admin' 같은 표기 허용)"""
+    role = unquote(role).strip()
+    lowered = role.lower()
+    if 'super' in lowered:
+        return UserRole.SUPER_ADMIN
+    if 'agency' in lowered and 'admin' in lowered:
+        return UserRole.AGENCY_ADMIN
+    try:
+        return UserRole(role)
+    except ValueError:
+        return None
+
+
+async def _can_delete_campaign(
+    db: AsyncSession,
+    campaign,
+    creator_company: Optional[str],
+    user_id: int,
+    role: Optional[UserRole],
+    company: Optional[str],
+) -> bool:
+    """캠페인 삭제 권한 (JWT/Node.js 호환 모드 공통)"""
+    if role == UserRole.SUPER_ADMIN:
+        # 슈퍼 어드민은 모든 캠페인 삭제 가능
+        return True
+    if role == UserRole.AGENCY_ADMIN:
+        # 같은 회사 직원이 생성한 캠페인 또는 자신이 담당 스태프로 지정된 캠페인
+        # (회사가 없는 생성자/사용자끼리 None == None으로 통과하지 않도록 회사 존재 확인)
+        same_company = creator_company is not None and creator_company == company
+        return same_company or campaign.staff_id == user_id
+    if role == UserRole.CLIENT:
+        # 자신의 회사와 연결된 캠페인만 (제한적)
+        return creator_company is not None and creator_company == company
+    if role in (UserRole.TEAM_LEADER, UserRole.STAFF):
+        # 본인이 생성하거나 담당하는 캠페인
+        if user_id in (campaign.creator_id, campaign.staff_id):
+            return True
+        if role == UserRole.STAFF:
+            return False
+        # 팀 리더: 자기 팀 STAFF가 생성하거나 담당하는 캠페인
+        team_member = await db.execute(
+            select(User.id).where(
+                User.id.in_([campaign.creator_id, campaign.staff_id]),
+                User.company == company,
+                User.team_leader_id == user_id,
+            ).limit(1)
+        )
+        return team_member.scalar_one_or_none() is not None
+    return False
+
+
 @router.delete("/{campaign_id}", status_code=204)
 async def delete_campaign(
     campaign_id: int,
@@ -2900,375 +3137,104 @@ async def delete_campaign(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_async_db)
 ):
-    """캠페인 삭제 (권한별 제한)"""
-    from datetime import datetime
-    import uuid
+    """
+    캠페인 삭제 (권한별 제한)
+    - 자식 행(텔레그램 로그/발주요청/환불 기록/구매요청/포스트/계약서/비용)은 캠페인과 같은 트랜잭션에서 집합 DELETE로 먼저 삭제.
+      20261018_cascade_deletes 마이그레이션이 적용되지 않은 스키마(외래키 NO ACTION)에서도 외래키 위반 없이 삭제되도록
+      CASCADE 적용이 보장될 때까지 명시적 삭제를 유지
+    """
+    from sqlalchemy import delete as sql_delete
+    from app.models.campaign_cost import CampaignCost
+    from app.models.campaign_refund import CampaignRefund
+    from app.models.post_refund import PostRefund
+    from app.models.purchase_request import PurchaseRequest
+    from app.models.user_telegram_setting import TelegramNotificationLog
 
-    request_id = str(uuid.uuid4())[:8]
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    logger.debug("[CAMPAIGN-DELETE] Request for campaign_id=%s, viewerId=%s, viewerRole=%s", campaign_id, viewerId, viewerRole)
 
-    print(f"[CAMPAIGN-DELETE] 🟢 START Request {request_id} at {timestamp}")
-    print(f"[CAMPAIGN-DELETE] Request for campaign_id={campaign_id}, viewerId={viewerId}, viewerRole={viewerRole}")
-    
-    # Node.js API 호환 모드인지 확인
-    if viewerId is not None or adminId is not None:
-        try:
+    try:
+        if viewerId is not None or adminId is not None:
             # Node.js API 호환 모드
             user_id = viewerId or adminId
             user_role = viewerRole or adminRole
-            
             if not user_id or not user_role:
-                print(f"[CAMPAIGN-DELETE] ERROR: Missing params - user_id={user_id}, user_role={user_role}")
                 raise HTTPException(status_code=400, detail="viewerId와 viewerRole이 필요합니다")
-            
-            # URL 디코딩
-            user_role = unquote(user_role).strip()
-            print(f"[CAMPAIGN-DELETE] Processing with user_id={user_id}, user_role='{user_role}'")
-            
-            # 캠페인 찾기 (creator 관계 포함)
-            campaign_query = select(Campaign).options(joinedload(Campaign.creator)).where(Campaign.id == campaign_id)
-            result = await db.execute(campaign_query)
-            campaign = result.unique().scalar_one_or_none()
-            
-            if not campaign:
-                print(f"[CAMPAIGN-DELETE] Campaign not found: {campaign_id}")
-                raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다.")
-            
-            print(f"[CAMPAIGN-DELETE] Found campaign: {campaign.name}, creator_id={campaign.creator_id}")
-            
-            # 사용자 권한 확인
-            viewer_query = select(User).where(User.id == user_id)
-            viewer_result = await db.execute(viewer_query)
-            viewer = viewer_result.scalar_one_or_none()
-            
+
+            viewer_result = await db.execute(
+                select(User.name, User.company).where(User.id == user_id)
+            )
+            viewer = viewer_result.one_or_none()
             if not viewer:
-                print(f"[CAMPAIGN-DELETE] User not found: {user_id}")
                 raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-            
-            print(f"[CAMPAIGN-DELETE] Viewer info: {viewer.name}, role={user_role}, company={viewer.company}")
-            
-            # 권한 검사 (UserRole enum 값 사용)
-            can_delete = False
-            
-            if user_role == UserRole.SUPER_ADMIN.value or 'super' in user_role.lower():
-                # 슈퍼 어드민은 모든 캠페인 삭제 가능
-                can_delete = True
-                print(f"[CAMPAIGN-DELETE] Super admin can delete any campaign")
-            elif user_role == UserRole.AGENCY_ADMIN.value or ('agency' in user_role.lower() and 'admin' in user_role.lower()):
-                # 대행사 어드민은 같은 회사의 모든 캠페인 삭제 가능
-                if campaign.creator and campaign.creator.company == viewer.company:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE] Agency admin can delete campaign from same company")
-                else:
-                    print(f"[CAMPAIGN-DELETE] Agency admin cannot delete - different company")
-            elif user_role == UserRole.TEAM_LEADER.value:
-                # 팀 리더는 다음 캠페인을 삭제 가능:
-                # 1) 본인이 생성한 캠페인
-                # 2) 본인이 담당하는 캠페인 (staff_id)
-                # 3) 자기 팀 STAFF가 생성한 캠페인
-                # 4) 자기 팀 STAFF가 담당하는 캠페인
-
-                # 1) 본인이 생성
-                if campaign.creator_id == user_id:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE] TEAM_LEADER can delete: own created campaign")
-                # 2) 본인이 담당
-                elif campaign.staff_id == user_id:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE] TEAM_LEADER can delete: own assigned campaign")
-                else:
-                    # 3,4) 팀원이 생성하거나 담당하는 캠페인인지 확인
-                    team_members_subquery = select(User.id).where(
-                        and_(
-                            User.company == viewer.company,
-                            User.team_leader_id == user_id
-                        )
-                    )
-                    team_members_result = await db.execute(team_members_subquery)
-                    team_member_ids = [row[0] for row in team_members_result.fetchall()]
-
-                    if campaign.creator_id in team_member_ids:
-                        can_delete = True
-                        print(f"[CAMPAIGN-DELETE] TEAM_LEADER can delete: team member created campaign")
-                    elif campaign.staff_id in team_member_ids:
-                        can_delete = True
-                        print(f"[CAMPAIGN-DELETE] TEAM_LEADER can delete: team member assigned campaign")
-                    else:
-                        print(f"[CAMPAIGN-DELETE] TEAM_LEADER cannot delete - not own or team campaign")
-            elif user_role == UserRole.STAFF.value:
-                # 직원은 자신이 생성한 캠페인 또는 자신이 담당하는 캠페인 삭제 가능
-                if campaign.creator_id == user_id:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE] Staff can delete own created campaign")
-                elif campaign.staff_id == user_id:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE] Staff can delete assigned campaign")
-                else:
-                    print(f"[CAMPAIGN-DELETE] Staff cannot delete - not creator or assigned staff")
-            elif user_role == UserRole.CLIENT.value:
-                # 클라이언트는 자신의 회사와 연결된 캠페인만 삭제 가능 (제한적)
-                if campaign.creator and campaign.creator.company == viewer.company:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE] Client can delete campaign from same company")
-                else:
-                    print(f"[CAMPAIGN-DELETE] Client cannot delete - different company")
-            
-            if not can_delete:
-                print(f"[CAMPAIGN-DELETE] Permission denied for user_role={user_role}, creator_id={campaign.creator_id}")
-                raise HTTPException(status_code=403, detail="이 캠페인을 삭제할 권한이 없습니다.")
-            
-            # 관련 데이터 먼저 삭제 (순서 중요: 외래키 제약조건)
-            from app.models.purchase_request import PurchaseRequest
-            from app.models.post import Post
-            from app.models.order_request import OrderRequest
-            from app.models.user_telegram_setting import TelegramNotificationLog
-            from sqlalchemy import delete as sql_delete
-
-            # 1. 텔레그램 알림 로그 삭제
-            telegram_log_stmt = sql_delete(TelegramNotificationLog).where(TelegramNotificationLog.campaign_id == campaign_id)
-            await db.execute(telegram_log_stmt)
-
-            # 2. 주문 요청 삭제
-            order_request_stmt = sql_delete(OrderRequest).where(OrderRequest.campaign_id == campaign_id)
-            await db.execute(order_request_stmt)
-
-            # 3. 구매요청 삭제
-            purchase_count_query = select(func.count()).select_from(PurchaseRequest).where(PurchaseRequest.campaign_id == campaign_id)
-            purchase_count_result = await db.execute(purchase_count_query)
-            purchase_count = purchase_count_result.scalar()
-
-            if purchase_count > 0:
-                print(f"[CAMPAIGN-DELETE] Found {purchase_count} related purchase requests, deleting them first")
-                delete_purchase_stmt = sql_delete(PurchaseRequest).where(PurchaseRequest.campaign_id == campaign_id)
-                await db.execute(delete_purchase_stmt)
-
-            # 4. Posts 삭제
-            posts_count_query = select(func.count()).select_from(Post).where(Post.campaign_id == campaign_id)
-            posts_count_result = await db.execute(posts_count_query)
-            posts_count = posts_count_result.scalar()
-
-            if posts_count > 0:
-                print(f"[CAMPAIGN-DELETE] Found {posts_count} related posts, deleting them first")
-                delete_posts_stmt = sql_delete(Post).where(Post.campaign_id == campaign_id)
-                await db.execute(delete_posts_stmt)
-
-            # 5. 캠페인 삭제
-            delete_campaign_stmt = sql_delete(Campaign).where(Campaign.id == campaign_id)
-            await db.execute(delete_campaign_stmt)
-            await db.commit()
-            
-            print(f"[CAMPAIGN-DELETE] SUCCESS: Campaign {campaign_id} deleted by user {user_id}")
-            
-            # WebSocket 알림 전송 (선택적)
-            try:
-                await manager.notify_campaign_update(
-                    action="deleted",
-                    campaign_id=campaign_id,
-                    campaign_name=campaign.name,
-                    user_id=user_id,
-                    user_name=viewer.name
-                )
-                print(f"[CAMPAIGN-DELETE] WebSocket notification sent")
-            except Exception as ws_error:
-                print(f"[CAMPAIGN-DELETE] WebSocket notification failed: {ws_error}")
-                # WebSocket 실패는 삭제 작업에 영향 없음
-            
-            print(f"[CAMPAIGN-DELETE] 🔴 END Request {request_id} - SUCCESS at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
-            return  # 204 No Content
-
-        except HTTPException:
-            print(f"[CAMPAIGN-DELETE] 🔴 END Request {request_id} - HTTP ERROR at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
-            raise
-        except Exception as e:
-            print(f"[CAMPAIGN-DELETE] 🔴 END Request {request_id} - EXCEPTION at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
-            print(f"[CAMPAIGN-DELETE] Unexpected error: {type(e).__name__}: {e}")
-            await db.rollback()
-            raise HTTPException(status_code=500, detail=f"캠페인 삭제 중 오류: {str(e)}")
-    else:
-        # 기존 API 모드 (JWT 토큰 기반)
-        try:
-            print(f"[CAMPAIGN-DELETE-JWT] 🟢 START JWT Request {request_id} at {timestamp}")
-            print(f"[CAMPAIGN-DELETE-JWT] Request from user: {current_user.name}, role: {current_user.role.value}")
-            print(f"[CAMPAIGN-DELETE-JWT] User details - ID: {current_user.id}, Company: {current_user.company}")
-
-            # 캠페인 찾기 (creator 관계 포함)
-            campaign_query = select(Campaign).options(joinedload(Campaign.creator)).where(Campaign.id == campaign_id)
-            result = await db.execute(campaign_query)
-            campaign = result.unique().scalar_one_or_none()
-
-            if not campaign:
-                print(f"[CAMPAIGN-DELETE-JWT] Campaign not found: {campaign_id}")
-                raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다.")
-
-            print(f"[CAMPAIGN-DELETE-JWT] Found campaign: {campaign.name}, creator_id={campaign.creator_id}")
-            print(f"[CAMPAIGN-DELETE-JWT] Campaign creator info: {campaign.creator.name if campaign.creator else 'None'}, company: {campaign.creator.company if campaign.creator else 'None'}")
-
-            # 권한 검사
-            can_delete = False
-
-            print(f"[CAMPAIGN-DELETE-JWT] Permission check starting...")
-            print(f"[CAMPAIGN-DELETE-JWT] Current user role: {current_user.role} (enum: {current_user.role.value})")
-            print(f"[CAMPAIGN-DELETE-JWT] Available roles: SUPER_ADMIN={UserRole.SUPER_ADMIN.value}, AGENCY_ADMIN={UserRole.AGENCY_ADMIN.value}, STAFF={UserRole.STAFF.value}, CLIENT={UserRole.CLIENT.value}")
-
-            if current_user.role == UserRole.SUPER_ADMIN:
-                # 슈퍼 어드민은 모든 캠페인 삭제 가능
-                can_delete = True
-                print(f"[CAMPAIGN-DELETE-JWT] ✅ Super admin can delete any campaign")
-            elif current_user.role == UserRole.AGENCY_ADMIN:
-                # 대행사 어드민은 다음 캠페인 삭제 가능:
-                # 1) 같은 회사 직원이 생성한 캠페인
-                # 2) 자신이 담당 스태프로 지정된 캠페인 (같은 회사)
-                print(f"[CAMPAIGN-DELETE-JWT] Agency admin check - User company: '{current_user.company}', Campaign creator company: '{campaign.creator.company if campaign.creator else 'None'}'")
-
-                # 1) 캠페인 생성자가 같은 회사인지 확인
-                if campaign.creator and campaign.creator.company == current_user.company:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE-JWT] ✅ Agency admin can delete: same company creator")
-
-                # 2) 자신이 담당 스태프로 지정되었고 같은 회사인지 확인
-                if not can_delete and campaign.staff_id == current_user.id:
-                    # staff 사용자 정보 조회
-                    staff_query = select(User).where(User.id == campaign.staff_id)
-                    staff_result = await db.execute(staff_query)
-                    staff_user = staff_result.scalar_one_or_none()
-
-                    if staff_user and staff_user.company == current_user.company:
-                        can_delete = True
-                        print(f"[CAMPAIGN-DELETE-JWT] ✅ Agency admin can delete: assigned as staff with same company")
-
-                if not can_delete:
-                    print(f"[CAMPAIGN-DELETE-JWT] ❌ Agency admin cannot delete - no permission")
-            elif current_user.role == UserRole.TEAM_LEADER:
-                # 팀 리더는 다음 캠페인을 삭제 가능:
-                # 1) 본인이 생성한 캠페인
-                # 2) 본인이 담당하는 캠페인 (staff_id)
-                # 3) 자기 팀 STAFF가 생성한 캠페인
-                # 4) 자기 팀 STAFF가 담당하는 캠페인
-                print(f"[CAMPAIGN-DELETE-JWT] TEAM_LEADER check - User ID: {current_user.id}, Campaign creator ID: {campaign.creator_id}, Campaign staff ID: {campaign.staff_id}")
-
-                # 1) 본인이 생성
-                if campaign.creator_id == current_user.id:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE-JWT] ✅ TEAM_LEADER can delete: own created campaign")
-                # 2) 본인이 담당
-                elif campaign.staff_id == current_user.id:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE-JWT] ✅ TEAM_LEADER can delete: own assigned campaign")
-                else:
-                    # 3,4) 팀원이 생성하거나 담당하는 캠페인인지 확인
-                    team_members_subquery = select(User.id).where(
-                        and_(
-                            User.company == current_user.company,
-                            User.team_leader_id == current_user.id
-                        )
-                    )
-                    team_members_result = await db.execute(team_members_subquery)
-                    team_member_ids = [row[0] for row in team_members_result.fetchall()]
-                    print(f"[CAMPAIGN-DELETE-JWT] Team member IDs: {team_member_ids}")
-
-                    if campaign.creator_id in team_member_ids:
-                        can_delete = True
-                        print(f"[CAMPAIGN-DELETE-JWT] ✅ TEAM_LEADER can delete: team member created campaign")
-                    elif campaign.staff_id in team_member_ids:
-                        can_delete = True
-                        print(f"[CAMPAIGN-DELETE-JWT] ✅ TEAM_LEADER can delete: team member assigned campaign")
-                    else:
-                        print(f"[CAMPAIGN-DELETE-JWT] ❌ TEAM_LEADER cannot delete - not own or team campaign")
-            elif current_user.role == UserRole.STAFF:
-                # 직원은 자신이 생성한 캠페인 또는 자신이 담당하는 캠페인 삭제 가능
-                print(f"[CAMPAIGN-DELETE-JWT] Staff check - User ID: {current_user.id}, Campaign creator ID: {campaign.creator_id}, Campaign staff ID: {campaign.staff_id}")
-                if campaign.creator_id == current_user.id:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE-JWT] ✅ Staff can delete own created campaign")
-                elif campaign.staff_id == current_user.id:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE-JWT] ✅ Staff can delete assigned campaign")
-                else:
-                    print(f"[CAMPAIGN-DELETE-JWT] ❌ Staff cannot delete - not creator or assigned staff")
-            elif current_user.role == UserRole.CLIENT:
-                # 클라이언트는 자신의 회사와 연결된 캠페인만 삭제 가능 (제한적)
-                print(f"[CAMPAIGN-DELETE-JWT] Client check - User company: '{current_user.company}', Campaign creator company: '{campaign.creator.company if campaign.creator else 'None'}'")
-                if campaign.creator and campaign.creator.company == current_user.company:
-                    can_delete = True
-                    print(f"[CAMPAIGN-DELETE-JWT] ✅ Client can delete campaign from same company")
-                else:
-                    print(f"[CAMPAIGN-DELETE-JWT] ❌ Client cannot delete - different company")
-            else:
-                print(f"[CAMPAIGN-DELETE-JWT] ❌ Unknown role: {current_user.role}")
-
-            print(f"[CAMPAIGN-DELETE-JWT] Final permission result: can_delete = {can_delete}")
-
-            if not can_delete:
-                print(f"[CAMPAIGN-DELETE-JWT] Permission denied for user_role={current_user.role.value}, creator_id={campaign.creator_id}")
-                raise HTTPException(status_code=403, detail="이 캠페인을 삭제할 권한이 없습니다.")
-
-            # 관련 데이터 먼저 삭제 (순서 중요: 외래키 제약조건)
-            from app.models.purchase_request import PurchaseRequest
-            from app.models.post import Post
-            from app.models.order_request import OrderRequest
-            from app.models.user_telegram_setting import TelegramNotificationLog
-            from sqlalchemy import delete as sql_delete
-
-            # 1. 텔레그램 알림 로그 삭제
-            telegram_log_stmt = sql_delete(TelegramNotificationLog).where(TelegramNotificationLog.campaign_id == campaign_id)
-            await db.execute(telegram_log_stmt)
-
-            # 2. 주문 요청 삭제
-            order_request_stmt = sql_delete(OrderRequest).where(OrderRequest.campaign_id == campaign_id)
-            await db.execute(order_request_stmt)
-
-            # 3. 구매요청 삭제
-            purchase_count_query = select(func.count()).select_from(PurchaseRequest).where(PurchaseRequest.campaign_id == campaign_id)
-            purchase_count_result = await db.execute(purchase_count_query)
-            purchase_count = purchase_count_result.scalar()
-
-            if purchase_count > 0:
-                print(f"[CAMPAIGN-DELETE-JWT] Found {purchase_count} related purchase requests, deleting them first")
-                delete_purchase_stmt = sql_delete(PurchaseRequest).where(PurchaseRequest.campaign_id == campaign_id)
-                await db.execute(delete_purchase_stmt)
-
-            # 4. Posts 삭제
-            posts_count_query = select(func.count()).select_from(Post).where(Post.campaign_id == campaign_id)
-            posts_count_result = await db.execute(posts_count_query)
-            posts_count = posts_count_result.scalar()
-
-            if posts_count > 0:
-                print(f"[CAMPAIGN-DELETE-JWT] Found {posts_count} related posts, deleting them first")
-                delete_posts_stmt = sql_delete(Post).where(Post.campaign_id == campaign_id)
-                await db.execute(delete_posts_stmt)
-
-            # 5. 캠페인 삭제
-            delete_campaign_stmt = sql_delete(Campaign).where(Campaign.id == campaign_id)
-            await db.execute(delete_campaign_stmt)
-            await db.commit()
+            role = _compat_user_role(user_role)
+            user_name, company = viewer.name, viewer.company
+        else:
+            # JWT 토큰 기반
+            user_id = current_user.id
+            role = current_user.role
+            user_name, company = current_user.name, current_user.company
+
+        # 삭제 중 다른 요청이 포스트를 추가/수정하지 않도록 캠페인 행 잠금
+        creator = aliased(User)
+        campaign_result = await db.execute(
+            select(Campaign.id, Campaign.name, Campaign.creator_id, Campaign.staff_id, creator.company.label("creator_company"))
+            .outerjoin(creator, creator.id == Campaign.creator_id)
+            .where(Campaign.id == campaign_id)
+            .with_for_update(of=Campaign)
+        )
+        campaign = campaign_result.one_or_none()
+        if not campaign:
+            raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다.")
 
-            print(f"[CAMPAIGN-DELETE-JWT] SUCCESS: Campaign {campaign_id} deleted by user {current_user.id}")
+        if not await _can_delete_campaign(db, campaign, campaign.creator_company, user_id, role, company):
+            logger.debug("[CAMPAIGN-DELETE] Permission denied for role=%s, creator_id=%s", role, campaign.creator_id)
+            raise HTTPException(status_code=403, detail="이 캠페인을 삭제할 권한이 없습니다.")
+
+        # 자식 행 먼저 삭제 (순서 중요: 포스트를 참조하는 행 -> 포스트 -> 캠페인)
+        campaign_post_ids = select(Post.id).where(Post.campaign_id == campaign_id)
+        child_deletes = [
+            sql_delete(TelegramNotificationLog).where(or_(
+                TelegramNotificationLog.campaign_id == campaign_id,
+                TelegramNotificationLog.post_id.in_(campaign_post_ids),
+            )),
+            sql_delete(OrderRequest).where(or_(
+                OrderRequest.campaign_id == campaign_id,
+                OrderRequest.post_id.in_(campaign_post_ids),
+            )),
+            sql_delete(PostRefund).where(or_(
+                PostRefund.campaign_id == campaign_id,
+                PostRefund.post_id.in_(campaign_post_ids),
+            )),
+            sql_delete(CampaignRefund).where(CampaignRefund.campaign_id == campaign_id),
+            sql_delete(PurchaseRequest).where(PurchaseRequest.campaign_id == campaign_id),
+            sql_delete(Post).where(Post.campaign_id == campaign_id),
+            sql_delete(CampaignContract).where(CampaignContract.campaign_id == campaign_id),
+            sql_delete(CampaignCost).where(CampaignCost.campaign_id == campaign_id),
+        ]
+        for stmt in child_deletes:
+            await db.execute(stmt)
 
-            # WebSocket 알림 전송 (선택적)
-            try:
-                await manager.notify_campaign_update(
-                    action="deleted",
-                    campaign_id=campaign_id,
-                    campaign_name=campaign.name,
-                    user_id=current_user.id,
-                    user_name=current_user.name
-                )
-                print(f"[CAMPAIGN-DELETE-JWT] WebSocket notification sent")
-            except Exception as ws_error:
-                print(f"[CAMPAIGN-DELETE-JWT] WebSocket notification failed: {ws_error}")
-                # WebSocket 실패는 삭제 작업에 영향 없음
+        await db.execute(sql_delete(Campaign).where(Campaign.id == campaign_id))
+        await db.commit()
+        logger.debug("[CAMPAIGN-DELETE] SUCCESS: Campaign %s deleted by user %s", campaign_id, user_id)
 
-            print(f"[CAMPAIGN-DELETE-JWT] 🔴 END JWT Request {request_id} - SUCCESS at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
-            return  # 204 No Content
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("[CAMPAIGN-DELETE] Unexpected error: %s: %s", type(e).__name__, e)
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"캠페인 삭제 중 오류: {str(e)}")
 
-        except HTTPException:
-            print(f"[CAMPAIGN-DELETE-JWT] 🔴 END JWT Request {request_id} - HTTP ERROR at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
-            raise
-        except Exception as e:
-            print(f"[CAMPAIGN-DELETE-JWT] 🔴 END JWT Request {request_id} - EXCEPTION at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
-            print(f"[CAMPAIGN-DELETE-JWT] Unexpected error: {type(e).__name__}: {e}")
-            await db.rollback()
-            raise HTTPException(status_code=500, detail=f"캠페인 삭제 중 오류: {str(e)}")
+    # WebSocket 알림 전송 (실패해도 삭제 결과에 영향 없음)
+    try:
+        await manager.notify_campaign_update(
+            campaign_id=campaign_id,
+            update_type="삭제",
+            data={"campaign_name": campaign.name, "user_id": user_id, "user_name": user_name},
+        )
+    except Exception as ws_error:
+        logger.error("[CAMPAIGN-DELETE] WebSocket notification failed: %s", ws_error)
+    return  # 204 No Content
 
 
 # 발주요청 관련 엔드포인트
@@ -3282,7 +3248,7 @@ async def create_order_request(
 ):
     """JWT 기반 발주요청 생성"""
 
-    print(f"[ORDER-REQUEST] Creating order request for post_id={post_id}, user_id={current_user.id}")
+    logger.debug("[ORDER-REQUEST] Creating order request for post_id=%s, user_id=%s", post_id, current_user.id)
 
     try:
         # 포스트 존재 여부 및 권한 확인
@@ -3314,12 +3280,12 @@ async def create_order_request(
 
         # cost_price = products.cost × posts.quantity (DB 단일 출처, 원장 기준)
         calculated_cost_price = int(product.cost * post.quantity)
-        print(f"[ORDER-REQUEST] cost_price: {product.cost} × {post.quantity} = {calculated_cost_price}")
+        logger.debug("[ORDER-REQUEST] cost_price: %s × %s = %s", product.cost, post.quantity, calculated_cost_price)
 
         # 포스트에 product_cost가 없으면 자동 동기화
         if not post.product_cost:
             post.product_cost = product.cost
-            print(f"[ORDER-REQUEST] Synced post.product_cost = {product.cost}")
+            logger.debug("[ORDER-REQUEST] Synced post.product_cost = %s", product.cost)
 
         # 발주요청 생성
         new_order_request = OrderRequest(
@@ -3345,7 +3311,7 @@ async def create_order_request(
         post.order_request_status = "발주 대기"
         await db.commit()
 
-        print(f"[ORDER-REQUEST] Order request created successfully: {new_order_request.id}")
+        logger.debug("[ORDER-REQUEST] Order request created successfully: %s", new_order_request.id)
 
         # 응답 데이터 구성
         return {
@@ -3365,7 +3331,7 @@ async def create_order_request(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[ORDER-REQUEST] Error creating order request: {e}")
+        logger.error("[ORDER-REQUEST] Error creating order request: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"발주요청 생성 중 오류가 발생했습니다: {str(e)}")
 
@@ -3410,7 +3376,7 @@ async def get_order_request(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[ORDER-REQUEST] Error getting order request: {e}")
+        logger.error("[ORDER-REQUEST] Error getting order request: %s", e)
         raise HTTPException(status_code=500, detail=f"발주요청 조회 중 오류가 발생했습니다: {str(e)}")
 
 
@@ -3438,7 +3404,7 @@ async def update_order_cost_prices(
         result = await db.execute(update_query)
         await db.commit()
 
-        print(f"[UPDATE-COST-PRICES] Updated {result.rowcount} order_requests")
+        logger.debug("[UPDATE-COST-PRICES] Updated %s order_requests", result.rowcount)
 
         return {
             "message": "order_requests cost_price 업데이트 완료",
@@ -3446,7 +3412,7 @@ async def update_order_cost_prices(
         }
 
     except Exception as e:
-        print(f"[UPDATE-COST-PRICES] Error: {e}")
+        logger.error("[UPDATE-COST-PRICES] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"cost_price 업데이트 중 오류: {str(e)}")
 
@@ -3476,7 +3442,7 @@ async def migrate_order_request_companies(
         result = await db.execute(update_query)
         await db.commit()
 
-        print(f"[MIGRATE-COMPANY] Updated {result.rowcount} order_requests")
+        logger.debug("[MIGRATE-COMPANY] Updated %s order_requests", result.rowcount)
 
         return {
             "message": "order_requests company/requester_role/team_leader_id 업데이트 완료",
@@ -3484,7 +3450,7 @@ async def migrate_order_request_companies(
         }
 
     except Exception as e:
-        print(f"[MIGRATE-COMPANY] Error: {e}")
+        logger.error("[MIGRATE-COMPANY] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"company 필드 업데이트 중 오류: {str(e)}")
 
@@ -3624,7 +3590,7 @@ async def debug_amounts(
         }
 
     except Exception as e:
-        print(f"[DEBUG-AMOUNTS] Error: {e}")
+        logger.error("[DEBUG-AMOUNTS] Error: %s", e)
         raise HTTPException(status_code=500, detail=f"디버그 쿼리 실행 중 오류: {str(e)}")
 
 
@@ -3638,7 +3604,7 @@ async def reset_campaign_order_requests(
     캠페인 수정 시 해당 캠페인의 모든 posts의 발주 요청 상태를 초기화합니다.
     """
     try:
-        print(f"[RESET-ORDER-REQUESTS] Starting reset for campaign {campaign_id} by user {current_user.id}")
+        logger.debug("[RESET-ORDER-REQUESTS] Starting reset for campaign %s by user %s", campaign_id, current_user.id)
 
         # 캠페인 존재 확인
         campaign_query = select(Campaign).where(Campaign.id == campaign_id)
@@ -3655,7 +3621,7 @@ async def reset_campaign_order_requests(
         can_reset = False
         if user_role == UserRole.SUPER_ADMIN.value:
             can_reset = True
-            print(f"[RESET-ORDER-REQUESTS] SUPER_ADMIN access granted")
+            logger.debug("[RESET-ORDER-REQUESTS] SUPER_ADMIN access granted")
         elif user_role == UserRole.AGENCY_ADMIN.value:
             # creator를 직접 조회해서 확인
             creator_query = select(User).where(User.id == campaign.creator_id)
@@ -3664,18 +3630,18 @@ async def reset_campaign_order_requests(
 
             if creator and creator.company == current_user.company:
                 can_reset = True
-                print(f"[RESET-ORDER-REQUESTS] AGENCY_ADMIN access granted: same company")
+                logger.debug("[RESET-ORDER-REQUESTS] AGENCY_ADMIN access granted: same company")
             else:
-                print(f"[RESET-ORDER-REQUESTS] AGENCY_ADMIN access denied: different company or no creator")
+                logger.debug("[RESET-ORDER-REQUESTS] AGENCY_ADMIN access denied: different company or no creator")
         elif user_role == UserRole.STAFF.value:
             if campaign.creator_id == user_id:
                 can_reset = True
-                print(f"[RESET-ORDER-REQUESTS] STAFF access granted: campaign creator")
+                logger.debug("[RESET-ORDER-REQUESTS] STAFF access granted: campaign creator")
             else:
-                print(f"[RESET-ORDER-REQUESTS] STAFF access denied: not campaign creator")
+                logger.debug("[RESET-ORDER-REQUESTS] STAFF access denied: not campaign creator")
 
         if not can_reset:
-            print(f"[RESET-ORDER-REQUESTS] Access denied for user {user_id} with role {user_role}")
+            logger.debug("[RESET-ORDER-REQUESTS] Access denied for user %s with role %s", user_id, user_role)
             raise HTTPException(status_code=403, detail="이 캠페인의 발주 요청을 초기화할 권한이 없습니다.")
 
         # 해당 캠페인의 모든 posts의 발주 요청 상태 초기화
@@ -3686,9 +3652,9 @@ async def reset_campaign_order_requests(
         check_result = await db.execute(check_query)
         posts_before = check_result.scalars().all()
 
-        print(f"[RESET-ORDER-REQUESTS] Found {len(posts_before)} posts for campaign {campaign_id}")
+        logger.debug("[RESET-ORDER-REQUESTS] Found %s posts for campaign %s", len(posts_before), campaign_id)
         for post in posts_before:
-            print(f"[RESET-ORDER-REQUESTS] Post {post.id}: order_request_status={post.order_request_status}, order_request_id={post.order_request_id}")
+            logger.debug("[RESET-ORDER-REQUESTS] Post %s: order_request_status=%s, order_request_id=%s", post.id, post.order_request_status, post.order_request_id)
 
         update_query = (
             update(Post)
@@ -3703,16 +3669,16 @@ async def reset_campaign_order_requests(
         await db.commit()
 
         updated_count = result.rowcount
-        print(f"[RESET-ORDER-REQUESTS] Update query executed, affected rows: {updated_count}")
+        logger.debug("[RESET-ORDER-REQUESTS] Update query executed, affected rows: %s", updated_count)
 
         # 업데이트 후 상태 확인
         check_after_query = select(Post).where(Post.campaign_id == campaign_id)
         check_after_result = await db.execute(check_after_query)
         posts_after = check_after_result.scalars().all()
 
-        print(f"[RESET-ORDER-REQUESTS] After update:")
+        logger.debug("[RESET-ORDER-REQUESTS] After update:")
         for post in posts_after:
-            print(f"[RESET-ORDER-REQUESTS] Post {post.id}: order_request_status={post.order_request_status}, order_request_id={post.order_request_id}")
+            logger.debug("[RESET-ORDER-REQUESTS] Post %s: order_request_status=%s, order_request_id=%s", post.id, post.order_request_status, post.order_request_id)
 
         return {
             "success": True,
@@ -3721,10 +3687,10 @@ async def reset_campaign_order_requests(
         }
 
     except HTTPException as e:
-        print(f"[RESET-ORDER-REQUESTS] HTTP Error: {e.detail}")
+        logger.error("[RESET-ORDER-REQUESTS] HTTP Error: %s", e.detail)
         raise e
     except Exception as e:
-        print(f"[RESET-ORDER-REQUESTS] Error: {e}")
+        logger.error("[RESET-ORDER-REQUESTS] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"발주 요청 상태 초기화 중 오류가 발생했습니다: {str(e)}")
 
@@ -3753,29 +3719,29 @@ async def get_campaign_chat_content(
         user_role = current_user.role.value
         can_access = False
 
-        print(f"[CHAT-CONTENT-GET] Permission check:")
-        print(f"  - User ID: {current_user.id}, Role: {user_role}, Company: {current_user.company}")
-        print(f"  - Campaign ID: {campaign.id}, Creator ID: {campaign.creator_id}, Company: {campaign.company}")
+        logger.debug("[CHAT-CONTENT-GET] Permission check:")
+        logger.debug("  - User ID: %s, Role: %s, Company: %s", current_user.id, user_role, current_user.company)
+        logger.debug("  - Campaign ID: %s, Creator ID: %s, Company: %s", campaign.id, campaign.creator_id, campaign.company)
 
         if user_role == UserRole.SUPER_ADMIN.value:
             can_access = True
-            print(f"  - SUPER_ADMIN: Access granted")
+            logger.debug("  - SUPER_ADMIN: Access granted")
         elif user_role in [UserRole.AGENCY_ADMIN.value, UserRole.STAFF.value]:
             # 같은 회사 또는 캠페인 생성자
             is_creator = campaign.creator_id == current_user.id
             is_same_company = current_user.company == campaign.company
-            print(f"  - Is Creator: {is_creator} ({campaign.creator_id} == {current_user.id})")
-            print(f"  - Same Company: {is_same_company} ('{current_user.company}' == '{campaign.company}')")
+            logger.debug("  - Is Creator: %s (%s == %s)", is_creator, campaign.creator_id, current_user.id)
+            logger.debug("  - Same Company: %s ('%s' == '%s')", is_same_company, current_user.company, campaign.company)
 
             if is_creator or is_same_company:
                 can_access = True
-                print(f"  - AGENCY_ADMIN/STAFF: Access granted")
+                logger.debug("  - AGENCY_ADMIN/STAFF: Access granted")
             else:
-                print(f"  - AGENCY_ADMIN/STAFF: Access denied")
+                logger.debug("  - AGENCY_ADMIN/STAFF: Access denied")
         # CLIENT는 카톡 관리 조회 권한 없음
 
         if not can_access:
-            print(f"[CHAT-CONTENT-GET] Permission denied for user {current_user.id}")
+            logger.debug("[CHAT-CONTENT-GET] Permission denied for user %s", current_user.id)
             raise HTTPException(status_code=403, detail="카톡 내용을 조회할 권한이 없습니다.")
 
         return {
@@ -3788,7 +3754,7 @@ async def get_campaign_chat_content(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CHAT-CONTENT-GET] Error: {e}")
+        logger.error("[CHAT-CONTENT-GET] Error: %s", e)
         raise HTTPException(status_code=500, detail=f"카톡 내용 조회 중 오류가 발생했습니다: {str(e)}")
 
 
@@ -3815,28 +3781,28 @@ async def update_campaign_chat_content(
         user_role = current_user.role.value
         can_edit = False
 
-        print(f"[CHAT-CONTENT-UPDATE] Permission check:")
-        print(f"  - User ID: {current_user.id}, Role: {user_role}, Company: {current_user.company}")
-        print(f"  - Campaign ID: {campaign.id}, Creator ID: {campaign.creator_id}, Company: {campaign.company}")
+        logger.debug("[CHAT-CONTENT-UPDATE] Permission check:")
+        logger.debug("  - User ID: %s, Role: %s, Company: %s", current_user.id, user_role, current_user.company)
+        logger.debug("  - Campaign ID: %s, Creator ID: %s, Company: %s", campaign.id, campaign.creator_id, campaign.company)
 
         if user_role == UserRole.SUPER_ADMIN.value:
             can_edit = True
-            print(f"  - SUPER_ADMIN: Access granted")
+            logger.debug("  - SUPER_ADMIN: Access granted")
         elif user_role in [UserRole.AGENCY_ADMIN.value, UserRole.STAFF.value]:
             # 같은 회사 또는 캠페인 생성자
             is_creator = campaign.creator_id == current_user.id
             is_same_company = current_user.company == campaign.company
-            print(f"  - Is Creator: {is_creator} ({campaign.creator_id} == {current_user.id})")
-            print(f"  - Same Company: {is_same_company} ('{current_user.company}' == '{campaign.company}')")
+            logger.debug("  - Is Creator: %s (%s == %s)", is_creator, campaign.creator_id, current_user.id)
+            logger.debug("  - Same Company: %s ('%s' == '%s')", is_same_company, current_user.company, campaign.company)
 
             if is_creator or is_same_company:
                 can_edit = True
-                print(f"  - AGENCY_ADMIN/STAFF: Access granted")
+                logger.debug("  - AGENCY_ADMIN/STAFF: Access granted")
             else:
-                print(f"  - AGENCY_ADMIN/STAFF: Access denied")
+                logger.debug("  - AGENCY_ADMIN/STAFF: Access denied")
 
         if not can_edit:
-            print(f"[CHAT-CONTENT-UPDATE] Permission denied for user {current_user.id}")
+            logger.debug("[CHAT-CONTENT-UPDATE] Permission denied for user %s", current_user.id)
             raise HTTPException(status_code=403, detail="카톡 내용을 수정할 권한이 없습니다.")
 
         # 카톡 내용 업데이트
@@ -3851,7 +3817,7 @@ async def update_campaign_chat_content(
         await db.commit()
         await db.refresh(campaign)
 
-        print(f"[CHAT-CONTENT-UPDATE] Campaign {campaign_id} chat content updated by user {current_user.id}")
+        logger.debug("[CHAT-CONTENT-UPDATE] Campaign %s chat content updated by user %s", campaign_id, current_user.id)
 
         return {
             "success": True,
@@ -3865,7 +3831,7 @@ async def update_campaign_chat_content(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CHAT-CONTENT-UPDATE] Error: {e}")
+        logger.error("[CHAT-CONTENT-UPDATE] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"카톡 내용 저장 중 오류가 발생했습니다: {str(e)}")
 
@@ -3909,7 +3875,7 @@ async def upload_chat_images(
         for image in images:
             # 이미지 파일인지 확인
             if not image.content_type or not image.content_type.startswith('image/'):
-                print(f"[CHAT-IMAGE-UPLOAD] Skipping non-image file: {image.filename}")
+                logger.debug("[CHAT-IMAGE-UPLOAD] Skipping non-image file: %s", image.filename)
                 continue
 
             try:
@@ -3921,9 +3887,9 @@ async def upload_chat_images(
                     "filename": file_result["filename"],
                     "size": file_result["size"]
                 })
-                print(f"[CHAT-IMAGE-UPLOAD] Image saved: {file_result['filename']}")
+                logger.debug("[CHAT-IMAGE-UPLOAD] Image saved: %s", file_result['filename'])
             except Exception as e:
-                print(f"[CHAT-IMAGE-UPLOAD] Failed to save image {image.filename}: {e}")
+                logger.error("[CHAT-IMAGE-UPLOAD] Failed to save image %s: %s", image.filename, e)
                 continue
 
         if not uploaded_images:
@@ -3942,7 +3908,7 @@ async def upload_chat_images(
 
         await db.commit()
 
-        print(f"[CHAT-IMAGE-UPLOAD] Campaign {campaign_id} uploaded {len(uploaded_images)} images")
+        logger.debug("[CHAT-IMAGE-UPLOAD] Campaign %s uploaded %s images", campaign_id, len(uploaded_images))
 
         return {
             "success": True,
@@ -3953,7 +3919,7 @@ async def upload_chat_images(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CHAT-IMAGE-UPLOAD] Error: {e}")
+        logger.error("[CHAT-IMAGE-UPLOAD] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"이미지 업로드 중 오류가 발생했습니다: {str(e)}")
 
@@ -3981,7 +3947,7 @@ async def get_status_values(
             "total_posts": sum(topic_distribution.values())
         }
     except Exception as e:
-        print(f"[DEBUG-STATUS-VALUES] Error: {e}")
+        logger.error("[DEBUG-STATUS-VALUES] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -3992,7 +3958,7 @@ async def get_user_posts_debug(
 ):
     """현재 사용자의 캠페인 및 Post 데이터 확인 (디버그용)"""
     try:
-        logger.warning(f"[DEBUG-USER-POSTS] User: {current_user.name}, Role: {current_user.role.value}, Company: {current_user.company}")
+        logger.warning("[DEBUG-USER-POSTS] User: %s, Role: %s, Company: %s", current_user.name, current_user.role.value, current_user.company)
 
         # STAFF 사용자의 캠페인 조회
         query = select(Campaign).options(selectinload(Campaign.posts))
@@ -4014,7 +3980,7 @@ async def get_user_posts_debug(
         result = await db.execute(query)
         campaigns = result.scalars().all()
 
-        logger.warning(f"[DEBUG-USER-POSTS] Found {len(campaigns)} campaigns")
+        logger.warning("[DEBUG-USER-POSTS] Found %s campaigns", len(campaigns))
 
         # 캠페인 및 Post 데이터 정리
         campaign_data = []
@@ -4033,14 +3999,7 @@ async def get_user_posts_debug(
                 if post.start_datetime:
                     start_datetime_str = post.start_datetime.isoformat()
 
-                logger.warning(
-                    f"[DEBUG-POST] Post ID={post.id}, "
-                    f"start_date={start_date_str}, "
-                    f"start_datetime={start_datetime_str}, "
-                    f"budget={post.budget}, "
-                    f"is_active={post.is_active}, "
-                    f"payment_completed={post.payment_completed}"
-                )
+                logger.warning("[DEBUG-POST] Post ID=%s, start_date=%s, start_datetime=%s, budget=%s, is_active=%s, payment_completed=%s", post.id, start_date_str, start_datetime_str, post.budget, post.is_active, post.payment_completed)
 
                 posts_info.append({
                     "id": post.id,
@@ -4060,7 +4019,7 @@ async def get_user_posts_debug(
                 "posts": posts_info
             })
 
-        logger.warning(f"[DEBUG-USER-POSTS] Total posts: {total_posts}")
+        logger.warning("[DEBUG-USER-POSTS] Total posts: %s", total_posts)
 
         return {
             "user": {
@@ -4074,7 +4033,7 @@ async def get_user_posts_debug(
         }
 
     except Exception as e:
-        logger.error(f"[DEBUG-USER-POSTS] Error: {e}")
+        logger.error("[DEBUG-USER-POSTS] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -4148,7 +4107,7 @@ async def upload_campaign_contract(
         await db.commit()
         await db.refresh(contract)
 
-        print(f"[CONTRACT-UPLOAD] Campaign {campaign_id} uploaded contract: {file.filename}")
+        logger.debug("[CONTRACT-UPLOAD] Campaign %s uploaded contract: %s", campaign_id, file.filename)
 
         return {
             "id": contract.id,
@@ -4162,7 +4121,7 @@ async def upload_campaign_contract(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CONTRACT-UPLOAD] Error: {e}")
+        logger.error("[CONTRACT-UPLOAD] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"계약서 업로드 중 오류가 발생했습니다: {str(e)}")
 
@@ -4220,20 +4179,20 @@ async def delete_campaign_contract(
         file_path = Path(__file__).parent.parent.parent.parent / contract.file_url.lstrip('/')
         if file_path.exists():
             os.remove(file_path)
-            print(f"[CONTRACT-DELETE] Deleted file: {file_path}")
+            logger.debug("[CONTRACT-DELETE] Deleted file: %s", file_path)
 
         # DB에서 삭제
         await db.delete(contract)
         await db.commit()
 
-        print(f"[CONTRACT-DELETE] Campaign {campaign_id} deleted contract {contract_id}")
+        logger.debug("[CONTRACT-DELETE] Campaign %s deleted contract %s", campaign_id, contract_id)
 
         return {"success": True, "message": "계약서가 성공적으로 삭제되었습니다."}
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CONTRACT-DELETE] Error: {e}")
+        logger.error("[CONTRACT-DELETE] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"계약서 삭제 중 오류가 발생했습니다: {str(e)}")
 
@@ -4249,7 +4208,12 @@ async def cancel_campaign(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_async_db)
 ):
-    """캠페인 취소 + 환불 처리"""
+    """
+    캠페인 취소 + 환불 처리
+    - 포스트 취소는 UPDATE ... RETURNING 1회, 포스트 환불 기록은 일괄 INSERT (포스트를 ORM으로 읽지 않음)
+    - 총 예산은 DB SUM, 캠페인 환불액/환불 건수/취소 포스트 수는 캠페인 UPDATE 1회로 반영
+    """
+    from sqlalchemy import insert, update
     from app.models.campaign_refund import CampaignRefund, RefundType, RefundStatus
     from app.models.post_refund import PostRefund
 
@@ -4258,10 +4222,8 @@ async def cancel_campaign(
         if current_user.role not in [UserRole.SUPER_ADMIN, UserRole.AGENCY_ADMIN]:
             raise HTTPException(status_code=403, detail="캠페인 취소 권한이 없습니다. 관리자만 취소할 수 있습니다.")
 
-        # 캠페인 조회
-        query = select(Campaign).options(
-            selectinload(Campaign.posts)
-        ).where(Campaign.id == campaign_id)
+        # 캠페인 조회 (행 잠금 - 동시 취소/환불 직렬화, 커밋까지 유지)
+        query = select(Campaign).options(noload("*")).where(Campaign.id == campaign_id).with_for_update()
         result = await db.execute(query)
         campaign = result.scalar_one_or_none()
 
@@ -4282,10 +4244,11 @@ async def cancel_campaign(
         refund_amount_input = cancel_request.get("refund_amount")
         cancel_posts = cancel_request.get("cancel_posts", True)
 
-        # 캠페인 총 예산 계산 (활성 포스트 기준)
-        total_budget = sum(
-            (post.budget or 0) for post in campaign.posts if post.is_active
-        )
+        # 캠페인 총 예산 계산 (활성 포스트 기준, DB 합계)
+        total_budget = float((await db.execute(
+            select(func.coalesce(func.sum(Post.budget), 0.0))
+            .where(Post.campaign_id == campaign_id, Post.is_active == True)
+        )).scalar() or 0)
 
         # 환불 금액 결정
         if refund_type_str == "전액환불":
@@ -4299,16 +4262,46 @@ async def cancel_campaign(
             if actual_refund_amount > total_budget:
                 raise HTTPException(status_code=400, detail=f"환불 금액({actual_refund_amount:,.0f}원)이 총 예산({total_budget:,.0f}원)을 초과할 수 없습니다.")
 
-        # 1. 캠페인 상태 변경
-        campaign.status = CampaignStatus.CANCELLED
-        campaign.cancelled_at = datetime.now(timezone.utc)
-        campaign.cancelled_by = current_user.id
-        campaign.cancellation_reason = cancellation_reason
-        campaign.refund_amount = actual_refund_amount
-        campaign.is_refunded = True
+        now = datetime.now(timezone.utc)
 
-        # 2. 환불 기록 생성
-        campaign_refund = CampaignRefund(
+        # 1. 포스트 취소 처리 (취소되지 않은 활성 포스트 전체, 환불액 = 포스트 예산)
+        cancelled_posts = []
+        if cancel_posts:
+            cancelled_result = await db.execute(
+                update(Post)
+                .where(
+                    Post.campaign_id == campaign_id,
+                    Post.is_active == True,
+                    or_(Post.is_cancelled.is_(None), Post.is_cancelled == False),
+                )
+                .values(is_cancelled=True, refund_amount=func.coalesce(Post.budget, 0.0))
+                .returning(Post.id, Post.refund_amount)
+                .execution_options(synchronize_session=False)
+            )
+            cancelled_posts = cancelled_result.all()
+
+        # 2. 포스트별 환불 기록 (일괄 INSERT)
+        if cancelled_posts:
+            post_refund_reason = f"캠페인 취소: {cancellation_reason}" if cancellation_reason else "캠페인 취소"
+            await db.execute(insert(PostRefund), [
+                {
+                    "post_id": post_id,
+                    "campaign_id": campaign_id,
+                    "refund_type": RefundType.FULL,
+                    "refund_amount": amount,
+                    "original_budget": amount,
+                    "refund_reason": post_refund_reason,
+                    "status": RefundStatus.COMPLETED,
+                    "requested_by": current_user.id,
+                    "approved_by": current_user.id,
+                    "approved_at": now,
+                    "completed_at": now,
+                }
+                for post_id, amount in cancelled_posts
+            ])
+
+        # 3. 캠페인 환불 기록
+        db.add(CampaignRefund(
             campaign_id=campaign_id,
             refund_type=refund_type,
             refund_amount=actual_refund_amount,
@@ -4317,41 +4310,31 @@ async def cancel_campaign(
             status=RefundStatus.COMPLETED,
             requested_by=current_user.id,
             approved_by=current_user.id,
-            approved_at=datetime.now(timezone.utc),
-            completed_at=datetime.now(timezone.utc)
+            approved_at=now,
+            completed_at=now
+        ))
+
+        # 4. 캠페인 상태 + 환불/취소 집계 변경 (UPDATE 1회)
+        await db.execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id)
+            .values(
+                status=CampaignStatus.CANCELLED,
+                cancelled_at=now,
+                cancelled_by=current_user.id,
+                cancellation_reason=cancellation_reason,
+                refund_amount=actual_refund_amount,
+                is_refunded=True,
+                campaign_refund_count=Campaign.campaign_refund_count + 1,
+                post_refund_count=Campaign.post_refund_count + len(cancelled_posts),
+                cancelled_post_count=Campaign.cancelled_post_count + len(cancelled_posts),
+            )
+            .execution_options(synchronize_session=False)
         )
-        db.add(campaign_refund)
-
-        # 3. 포스트 취소 처리
-        cancelled_post_count = 0
-        if cancel_posts:
-            for post in campaign.posts:
-                if post.is_active and not getattr(post, 'is_cancelled', False):
-                    post.is_cancelled = True
-                    post.refund_amount = post.budget or 0
-                    cancelled_post_count += 1
-
-                    # 포스트별 환불 기록
-                    post_refund = PostRefund(
-                        post_id=post.id,
-                        campaign_id=campaign_id,
-                        refund_type=RefundType.FULL,
-                        refund_amount=post.budget or 0,
-                        original_budget=post.budget or 0,
-                        refund_reason=f"캠페인 취소: {cancellation_reason}" if cancellation_reason else "캠페인 취소",
-                        status=RefundStatus.COMPLETED,
-                        requested_by=current_user.id,
-                        approved_by=current_user.id,
-                        approved_at=datetime.now(timezone.utc),
-                        completed_at=datetime.now(timezone.utc)
-                    )
-                    db.add(post_refund)
 
         await db.commit()
 
-        print(f"[CAMPAIGN-CANCEL] Campaign {campaign_id} cancelled by user {current_user.id}. "
-              f"Refund: {actual_refund_amount:,.0f}원 ({refund_type_str}), "
-              f"Posts cancelled: {cancelled_post_count}")
+        logger.debug("[CAMPAIGN-CANCEL] Campaign %s cancelled by user %s. Refund: %s원 (%s), Posts cancelled: %s", campaign_id, current_user.id, format(actual_refund_amount, ',.0f'), refund_type_str, len(cancelled_posts))
 
         return {
             "success": True,
@@ -4360,14 +4343,14 @@ async def cancel_campaign(
             "refund_type": refund_type_str,
             "refund_amount": actual_refund_amount,
             "original_budget": total_budget,
-            "cancelled_posts": cancelled_post_count,
-            "cancelled_at": campaign.cancelled_at.isoformat()
+            "cancelled_posts": len(cancelled_posts),
+            "cancelled_at": now.isoformat()
         }
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CAMPAIGN-CANCEL] Error: {e}")
+        logger.error("[CAMPAIGN-CANCEL] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"캠페인 취소 중 오류가 발생했습니다: {str(e)}")
 
@@ -4380,7 +4363,8 @@ async def refund_post(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_async_db)
 ):
-    """개별 업무(Post) 환불 처리"""
+    """개별 업무(Post) 환불 처리 (포스트/캠페인 환불액과 환불 집계는 증분 UPDATE)"""
+    from sqlalchemy import update
     from app.models.post_refund import PostRefund
     from app.models.campaign_refund import RefundType, RefundStatus
 
@@ -4390,7 +4374,7 @@ async def refund_post(
             raise HTTPException(status_code=403, detail="환불 처리 권한이 없습니다.")
 
         # 캠페인 + 포스트 조회
-        campaign_query = select(Campaign).where(Campaign.id == campaign_id)
+        campaign_query = select(Campaign).options(noload("*")).where(Campaign.id == campaign_id)
         campaign_result = await db.execute(campaign_query)
         campaign = campaign_result.scalar_one_or_none()
         if not campaign:
@@ -4399,13 +4383,17 @@ async def refund_post(
         if current_user.role == UserRole.AGENCY_ADMIN and campaign.company != current_user.company:
             raise HTTPException(status_code=403, detail="다른 회사의 캠페인을 처리할 수 없습니다.")
 
-        post_query = select(Post).where(Post.id == post_id, Post.campaign_id == campaign_id)
-        post_result = await db.execute(post_query)
-        post = post_result.scalar_one_or_none()
+        # 포스트 행 잠금 (같은 포스트 동시 환불 직렬화)
+        post_query = (
+            select(Post.id, Post.budget, Post.is_active, Post.is_cancelled)
+            .where(Post.id == post_id, Post.campaign_id == campaign_id)
+            .with_for_update()
+        )
+        post = (await db.execute(post_query)).one_or_none()
         if not post:
             raise HTTPException(status_code=404, detail="업무를 찾을 수 없습니다.")
 
-        if getattr(post, 'is_cancelled', False):
+        if post.is_cancelled:
             raise HTTPException(status_code=400, detail="이미 취소된 업무입니다.")
 
         # 요청 데이터 파싱
@@ -4425,12 +4413,19 @@ async def refund_post(
             if actual_refund_amount > original_budget:
                 raise HTTPException(status_code=400, detail=f"환불 금액이 업무 예산({original_budget:,.0f}원)을 초과할 수 없습니다.")
 
+        is_full_refund = refund_type_str == "전액환불"
+
         # 1. 포스트 상태 업데이트
-        if refund_type_str == "전액환불":
-            post.is_cancelled = True
-        post.refund_amount = (post.refund_amount or 0) + actual_refund_amount
+        post_values = {"refund_amount": func.coalesce(Post.refund_amount, 0.0) + actual_refund_amount}
+        if is_full_refund:
+            post_values["is_cancelled"] = True
+        await db.execute(
+            update(Post).where(Post.id == post_id).values(**post_values)
+            .execution_options(synchronize_session=False)
+        )
 
         # 2. 환불 기록 생성
+        now = datetime.now(timezone.utc)
         post_refund = PostRefund(
             post_id=post_id,
             campaign_id=campaign_id,
@@ -4441,18 +4436,27 @@ async def refund_post(
             status=RefundStatus.COMPLETED,
             requested_by=current_user.id,
             approved_by=current_user.id,
-            approved_at=datetime.now(timezone.utc),
-            completed_at=datetime.now(timezone.utc)
+            approved_at=now,
+            completed_at=now
         )
         db.add(post_refund)
 
-        # 3. 캠페인의 총 환불액 업데이트 (비정규화)
-        campaign.refund_amount = float(campaign.refund_amount or 0) + actual_refund_amount
+        # 3. 캠페인의 총 환불액/환불 집계 업데이트 (비정규화, 증분)
+        cancelled_delta = 1 if is_full_refund and post.is_active is not False else 0
+        await db.execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id)
+            .values(
+                refund_amount=func.coalesce(Campaign.refund_amount, 0) + actual_refund_amount,
+                post_refund_count=Campaign.post_refund_count + 1,
+                cancelled_post_count=Campaign.cancelled_post_count + cancelled_delta,
+            )
+            .execution_options(synchronize_session=False)
+        )
 
         await db.commit()
 
-        print(f"[POST-REFUND] Post {post_id} in Campaign {campaign_id} refunded: "
-              f"{actual_refund_amount:,.0f}원 ({refund_type_str})")
+        logger.debug("[POST-REFUND] Post %s in Campaign %s refunded: %s원 (%s)", post_id, campaign_id, format(actual_refund_amount, ',.0f'), refund_type_str)
 
         return {
             "success": True,
@@ -4467,7 +4471,7 @@ async def refund_post(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[POST-REFUND] Error: {e}")
+        logger.error("[POST-REFUND] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"업무 환불 처리 중 오류가 발생했습니다: {str(e)}")
 
@@ -4529,7 +4533,7 @@ async def upload_cancel_invoice(
 
         await db.commit()
 
-        print(f"[CANCEL-INVOICE] Refund {refund_id} uploaded cancel invoice: {file.filename}")
+        logger.debug("[CANCEL-INVOICE] Refund %s uploaded cancel invoice: %s", refund_id, file.filename)
 
         return {
             "success": True,
@@ -4541,7 +4545,7 @@ async def upload_cancel_invoice(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CANCEL-INVOICE] Error: {e}")
+        logger.error("[CANCEL-INVOICE] Error: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"취소 계산서 업로드 중 오류가 발생했습니다: {str(e)}")
 
@@ -4558,7 +4562,7 @@ async def get_campaign_refunds(
 
     try:
         # 캠페인 존재 확인
-        campaign_query = select(Campaign).where(Campaign.id == campaign_id)
+        campaign_query = select(Campaign).options(noload("*")).where(Campaign.id == campaign_id)
         campaign_result = await db.execute(campaign_query)
         campaign = campaign_result.scalar_one_or_none()
         if not campaign:
@@ -4598,10 +4602,9 @@ async def get_campaign_refunds(
 
         user_names = {}
         if user_ids:
-            users_query = select(User).where(User.id.in_(list(user_ids)))
+            users_query = select(User.id, User.name).where(User.id.in_(list(user_ids)))
             users_result = await db.execute(users_query)
-            for u in users_result.scalars().all():
-                user_names[u.id] = u.name
+            user_names = dict(users_result.all())
 
         return {
             "campaign_refunds": [
@@ -4645,7 +4648,7 @@ async def get_campaign_refunds(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[CAMPAIGN-REFUNDS] Error: {e}")
+        logger.error("[CAMPAIGN-REFUNDS] Error: %s", e)
         raise HTTPException(status_code=500, detail=f"환불 내역 조회 중 오류가 발생했습니다: {str(e)}")
 
 
@@ -4655,15 +4658,10 @@ async def get_refund_summary(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_async_db)
 ):
-    """캠페인 환불 요약 조회"""
-    from app.models.campaign_refund import CampaignRefund
-    from app.models.post_refund import PostRefund
-
+    """캠페인 환불 요약 조회 (캠페인 행의 비정규화 집계만 사용 - 포스트/환불 기록 재집계 없음)"""
     try:
         # 캠페인 조회
-        query = select(Campaign).options(
-            selectinload(Campaign.posts)
-        ).where(Campaign.id == campaign_id)
+        query = select(Campaign).options(noload("*")).where(Campaign.id == campaign_id)
         result = await db.execute(query)
         campaign = result.scalar_one_or_none()
         if not campaign:
@@ -4673,8 +4671,8 @@ async def get_refund_summary(
         if current_user.role == UserRole.AGENCY_ADMIN and campaign.company != current_user.company:
             raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
 
-        # 총 예산
-        original_budget = sum((p.budget or 0) for p in campaign.posts if p.is_active)
+        # 총 예산 (활성 포스트 budget 합계 - 활성 포스트가 있으면 campaign.budget에 유지됨)
+        original_budget = float(campaign.budget or 0) if campaign.active_post_count else 0.0
 
         # 총 환불액
         total_refunded = float(campaign.refund_amount or 0)
@@ -4682,18 +4680,6 @@ async def get_refund_summary(
         # 잔액
         remaining_amount = original_budget - total_refunded
 
-        # 환불 건수
-        cr_count_query = select(func.count(CampaignRefund.id)).where(CampaignRefund.campaign_id == campaign_id)
-        cr_count_result = await db.execute(cr_count_query)
-        campaign_refund_count = cr_count_result.scalar() or 0
-
-        pr_count_query = select(func.count(PostRefund.id)).where(PostRefund.campaign_id == campaign_id)
-        pr_count_result = await db.execute(pr_count_query)
-        post_refund_count = pr_count_result.scalar() or 0
-
-        # 취소된 업무 수
-        cancelled_posts = sum(1 for p in campaign.posts if getattr(p, 'is_cancelled', False))
-
         return {
             "campaign_id": campaign_id,
             "campaign_name": campaign.name,
@@ -4703,11 +4689,11 @@ async def get_refund_summary(
             "total_refunded": total_refunded,
             "remaining_amount": max(remaining_amount, 0),
             "is_fully_refunded": getattr(campaign, 'is_refunded', False),
-            "campaign_refund_count": campaign_refund_count,
-            "post_refund_count": post_refund_count,
-            "total_posts": len(campaign.posts),
-            "cancelled_posts": cancelled_posts,
-            "active_posts": len(campaign.posts) - cancelled_posts,
+            "campaign_refund_count": campaign.campaign_refund_count,
+            "post_refund_count": campaign.post_refund_count,
+            "total_posts": campaign.active_post_count,
+            "cancelled_posts": campaign.cancelled_post_count,
+            "active_posts": campaign.active_post_count - campaign.cancelled_post_count,
             "cancellation_reason": campaign.cancellation_reason,
             "cancelled_at": campaign.cancelled_at.isoformat() if campaign.cancelled_at else None
         }
@@ -4715,5 +4701,5 @@ async def get_refund_summary(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[REFUND-SUMMARY] Error: {e}")
+        logger.error("[REFUND-SUMMARY] Error: %s", e)
         raise HTTPException(status_code=500, detail=f"환불 요약 조회 중 오류가 발생했습니다: {str(e)}")
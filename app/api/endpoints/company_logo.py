@@ -1,114 +1,80 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File, Form
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import Optional
+from typing import Optional, Tuple
 from urllib.parse import unquote
 from datetime import datetime
 
 from app.db.database import get_async_db
 from app.api.deps import get_current_active_user
+from app.core.config import settings
+from app.core.file_upload import FileUploadError
 from app.models.user import User
 from app.models.company_logo import CompanyLogo
-from app.core.file_upload import file_manager
+from app.services.company_logo import (
+    ASSET_NAME_PATTERN,
+    asset_path,
+    company_logo_cache,
+    logo_payload,
+    store_logo_file,
+)
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-@router.get("/logo")
-async def get_company_logo(
-    # Node.js API 호환성을 위한 쿼리 파라미터
-    viewerId: Optional[int] = Query(None, alias="viewerId"),
-    adminId: Optional[int] = Query(None, alias="adminId"),
-    viewerRole: Optional[str] = Query(None, alias="viewerRole"),
-    adminRole: Optional[str] = Query(None, alias="adminRole"),
-    db: AsyncSession = Depends(get_async_db),
-    jwt_user: User = Depends(get_current_active_user)
-):
-    """회사 로고 조회 (대행사별)"""
+async def _resolve_logo_user(
+    db: AsyncSession,
+    viewerId: Optional[int],
+    adminId: Optional[int],
+    viewerRole: Optional[str],
+    adminRole: Optional[str],
+    jwt_user: User,
+    admin_action: Optional[str] = None,
+) -> Tuple[int, str]:
+    """
+    (사용자 ID, 회사명) 확인 - Node.js API 호환 모드(viewerId/viewerRole)와 JWT 모드 공통
+    admin_action이 있으면 대행사 어드민 권한 확인 (예: "업로드", "제거")
+    """
     # Node.js API 호환 모드인지 확인
     if viewerId is not None or adminId is not None:
-        # Node.js API 호환 모드
         user_id = viewerId or adminId
         user_role = viewerRole or adminRole
-        
+
         if not user_id or not user_role:
             raise HTTPException(status_code=400, detail="viewerId와 viewerRole이 필요합니다")
-        
+
         # URL 디코딩
         user_role = unquote(user_role).strip()
-        
+
+        if admin_action:
+            is_agency_admin = (user_role == '대행사 어드민' or
+                             user_role == '대행사어드민' or
+                             ('대행사' in user_role and '어드민' in user_role))
+            if not is_agency_admin:
+                raise HTTPException(status_code=403, detail=f"권한이 없습니다. 대행사 어드민만 로고를 {admin_action}할 수 있습니다.")
+
         # 사용자의 회사 정보 찾기
-        user_query = select(User).where(User.id == user_id)
-        result = await db.execute(user_query)
-        user = result.scalar_one_or_none()
-        
+        result = await db.execute(select(User.id, User.company).where(User.id == user_id))
+        user = result.one_or_none()
+
         if not user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-        
-        company_name = user.company or 'default'
-        
-        # 해당 회사의 로고 데이터 조회
-        logo_query = select(CompanyLogo).where(CompanyLogo.company_id == company_name)
-        logo_result = await db.execute(logo_query)
-        logo_data = logo_result.scalar_one_or_none()
-        
-        if not logo_data:
-            # 로고가 없으면 기본 데이터 반환
-            return {
-                "id": 1,
-                "logoUrl": None,
-                "uploadedAt": None,
-                "companyId": company_name,
-                "updatedBy": user_id
-            }
-        
-        return {
-            "id": logo_data.id,
-            "logoUrl": logo_data.logo_url,
-            "uploadedAt": logo_data.updated_at.isoformat() if logo_data.updated_at else None,
-            "companyId": logo_data.company_id,
-            "updatedBy": logo_data.updated_by
-        }
-    else:
-        # 기존 API 모드 (JWT 토큰 기반)
-        current_user = jwt_user
-        print(f"[COMPANY-LOGO-GET-JWT] Request from user_id={current_user.id}, user_role={current_user.role}")
-
-        try:
-            company_name = current_user.company or 'default'
-
-            # 해당 회사의 로고 데이터 조회
-            logo_query = select(CompanyLogo).where(CompanyLogo.company_id == company_name)
-            logo_result = await db.execute(logo_query)
-            logo_data = logo_result.scalar_one_or_none()
-
-            if not logo_data:
-                # 로고가 없으면 기본 데이터 반환
-                return {
-                    "id": 1,
-                    "logoUrl": None,
-                    "uploadedAt": None,
-                    "companyId": company_name,
-                    "updatedBy": current_user.id
-                }
-
-            print(f"[COMPANY-LOGO-GET-JWT] SUCCESS: Found logo for company {company_name}")
-            return {
-                "id": logo_data.id,
-                "logoUrl": logo_data.logo_url,
-                "uploadedAt": logo_data.updated_at.isoformat() if logo_data.updated_at else None,
-                "companyId": logo_data.company_id,
-                "updatedBy": logo_data.updated_by
-            }
-            
-        except Exception as e:
-            print(f"[COMPANY-LOGO-GET-JWT] Unexpected error: {type(e).__name__}: {e}")
-            raise HTTPException(status_code=500, detail=f"로고 조회 중 오류: {str(e)}")
 
+        return user_id, user.company or 'default'
 
-@router.post("/logo")
-async def upload_company_logo(
-    logo: UploadFile = File(...),
+    # 기존 API 모드 (JWT 토큰 기반)
+    if admin_action and jwt_user.role.value not in ['AGENCY_ADMIN', 'SUPER_ADMIN']:
+        raise HTTPException(status_code=403, detail=f"권한이 없습니다. 대행사 어드민만 로고를 {admin_action}할 수 있습니다.")
+
+    return jwt_user.id, jwt_user.company or 'default'
+
+
+@router.get("/logo")
+async def get_company_logo(
     # Node.js API 호환성을 위한 쿼리 파라미터
     viewerId: Optional[int] = Query(None, alias="viewerId"),
     adminId: Optional[int] = Query(None, alias="adminId"),
@@ -117,147 +83,108 @@ async def upload_company_logo(
     db: AsyncSession = Depends(get_async_db),
     jwt_user: User = Depends(get_current_active_user)
 ):
-    """회사 로고 업로드 (파일 기반)"""
-    # Node.js API 호환 모드인지 확인
-    if viewerId is not None or adminId is not None:
-        # Node.js API 호환 모드
-        user_id = viewerId or adminId
-        user_role = viewerRole or adminRole
+    """회사 로고 조회 (대행사별, 회사별 메타데이터 캐시 - logoUrl은 내용 해시가 들어간 고정 URL)"""
+    user_id, company_name = await _resolve_logo_user(db, viewerId, adminId, viewerRole, adminRole, jwt_user)
 
-        if not user_id or not user_role:
-            raise HTTPException(status_code=400, detail="viewerId와 viewerRole이 필요합니다")
+    try:
+        payload = await company_logo_cache.get(db, company_name)
+    except Exception as e:
+        logger.error("[COMPANY-LOGO-GET] Unexpected error: %s: %s", type(e).__name__, e)
+        raise HTTPException(status_code=500, detail=f"로고 조회 중 오류: {str(e)}")
 
-        # URL 디코딩
-        user_role = unquote(user_role).strip()
+    if payload is None:
+        # 로고가 없으면 기본 데이터 반환
+        return {
+            "id": 1,
+            "logoUrl": None,
+            "uploadedAt": None,
+            "companyId": company_name,
+            "updatedBy": user_id,
+            "version": None,
+            "variants": {}
+        }
+    return payload
 
-        # 권한 확인: 대행사 어드민만 로고 업로드 가능
-        is_agency_admin = (user_role == '대행사 어드민' or
-                         user_role == '대행사어드민' or
-                         ('대행사' in user_role and '어드민' in user_role))
 
-        if not is_agency_admin:
-            raise HTTPException(status_code=403, detail="권한이 없습니다. 대행사 어드민만 로고를 업로드할 수 있습니다.")
+@router.get("/logo/assets/{asset}")
+async def get_company_logo_asset(asset: str, request: Request):
+    """
+    해시 이름의 로고 파일 서빙 (인증 없음 - <img>/CDN에서 직접 요청)
+    - 이름에 내용 해시가 들어 있어 변하지 않으므로 장기 캐시(immutable) + ETag/304
+    """
+    match = ASSET_NAME_PATTERN.match(asset)
+    if not match:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
 
-        # 사용자의 회사 정보 찾기
-        user_query = select(User).where(User.id == user_id)
-        result = await db.execute(user_query)
-        user = result.scalar_one_or_none()
+    etag = f'"{asset.rsplit(".", 1)[0]}"'
+    headers = {
+        "Cache-Control": f"public, max-age={settings.ASSET_CACHE_MAX_AGE_SECONDS}, immutable",
+        "ETag": etag,
+    }
 
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+
+    path = asset_path(asset)
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+
+    return FileResponse(path, headers=headers)
 
-        company_name = user.company or 'default'
 
-        # 파일 업로드
-        file_result = await file_manager.save_file(logo)
-        logo_url = file_result["url"]
+@router.post("/logo")
+async def upload_company_logo(
+    logo: UploadFile = File(...),
+    # Node.js API 호환성을 위한 쿼리 파라미터
+    viewerId: Optional[int] = Query(None, alias="viewerId"),
+    adminId: Optional[int] = Query(None, alias="adminId"),
+    viewerRole: Optional[str] = Query(None, alias="viewerRole"),
+    adminRole: Optional[str] = Query(None, alias="adminRole"),
+    db: AsyncSession = Depends(get_async_db),
+    jwt_user: User = Depends(get_current_active_user)
+):
+    """회사 로고 업로드 (내용 해시 이름으로 저장 + 리사이즈 변형 미리 생성)"""
+    user_id, company_name = await _resolve_logo_user(
+        db, viewerId, adminId, viewerRole, adminRole, jwt_user, admin_action="업로드"
+    )
+    logger.debug("[COMPANY-LOGO-UPLOAD] Request from user_id=%s, company=%s, file=%s", user_id, company_name, logo.filename)
+
+    try:
+        # 파일 저장
+        asset = await store_logo_file(logo)
 
         # 기존 로고 확인
-        existing_logo_query = select(CompanyLogo).where(CompanyLogo.company_id == company_name)
-        existing_result = await db.execute(existing_logo_query)
-        existing_logo = existing_result.scalar_one_or_none()
+        existing_result = await db.execute(
+            select(CompanyLogo).where(CompanyLogo.company_id == company_name).order_by(CompanyLogo.id.desc()).limit(1)
+        )
+        company_logo = existing_result.scalar_one_or_none()
 
-        if existing_logo:
+        if company_logo:
             # 기존 로고 업데이트
-            existing_logo.logo_url = logo_url
-            existing_logo.updated_by = user_id
-            await db.commit()
-            await db.refresh(existing_logo)
-
-            return {
-                "id": existing_logo.id,
-                "logoUrl": existing_logo.logo_url,
-                "uploadedAt": existing_logo.updated_at.isoformat() if existing_logo.updated_at else None,
-                "companyId": existing_logo.company_id,
-                "updatedBy": existing_logo.updated_by
-            }
+            for field, value in asset.items():
+                setattr(company_logo, field, value)
+            company_logo.updated_by = user_id
         else:
             # 새 로고 생성
-            new_logo = CompanyLogo(
-                logo_url=logo_url,
-                company_id=company_name,
-                updated_by=user_id
-            )
+            company_logo = CompanyLogo(company_id=company_name, updated_by=user_id, **asset)
+            db.add(company_logo)
 
-            db.add(new_logo)
-            await db.commit()
-            await db.refresh(new_logo)
-
-            return {
-                "id": new_logo.id,
-                "logoUrl": new_logo.logo_url,
-                "uploadedAt": new_logo.created_at.isoformat() if new_logo.created_at else None,
-                "companyId": new_logo.company_id,
-                "updatedBy": new_logo.updated_by
-            }
-    else:
-        # 기존 API 모드 (JWT 토큰 기반)
-        current_user = jwt_user
-        print(f"[COMPANY-LOGO-UPLOAD-JWT] Request from user_id={current_user.id}, user_role={current_user.role}")
-
-        try:
-            # 권한 확인: 대행사 어드민만 로고 업로드 가능
-            if current_user.role.value not in ['AGENCY_ADMIN', 'SUPER_ADMIN']:
-                raise HTTPException(status_code=403, detail="권한이 없습니다. 대행사 어드민만 로고를 업로드할 수 있습니다.")
-
-            company_name = current_user.company or 'default'
-
-            # 파일 업로드
-            print(f"[COMPANY-LOGO-UPLOAD-JWT] Uploading file: {logo.filename}, size: {logo.size if hasattr(logo, 'size') else 'unknown'}")
-            file_result = await file_manager.save_file(logo)
-            print(f"[COMPANY-LOGO-UPLOAD-JWT] File upload result: {file_result}")
-            logo_url = file_result["url"]
-            print(f"[COMPANY-LOGO-UPLOAD-JWT] Logo URL: {logo_url}")
-
-            # 기존 로고 확인
-            existing_logo_query = select(CompanyLogo).where(CompanyLogo.company_id == company_name)
-            existing_result = await db.execute(existing_logo_query)
-            existing_logo = existing_result.scalar_one_or_none()
-
-            if existing_logo:
-                # 기존 로고 업데이트
-                existing_logo.logo_url = logo_url
-                existing_logo.updated_by = current_user.id
-                await db.commit()
-                await db.refresh(existing_logo)
-
-                print(f"[COMPANY-LOGO-UPLOAD-JWT] SUCCESS: Updated logo for company {company_name}")
-
-                return {
-                    "id": existing_logo.id,
-                    "logoUrl": existing_logo.logo_url,
-                    "uploadedAt": existing_logo.updated_at.isoformat() if existing_logo.updated_at else None,
-                    "companyId": existing_logo.company_id,
-                    "updatedBy": existing_logo.updated_by
-                }
-            else:
-                # 새 로고 생성
-                new_logo = CompanyLogo(
-                    logo_url=logo_url,
-                    company_id=company_name,
-                    updated_by=current_user.id
-                )
-
-                db.add(new_logo)
-                await db.commit()
-                await db.refresh(new_logo)
-
-                print(f"[COMPANY-LOGO-UPLOAD-JWT] SUCCESS: Created new logo for company {company_name}")
-
-                return {
-                    "id": new_logo.id,
-                    "logoUrl": new_logo.logo_url,
-                    "uploadedAt": new_logo.created_at.isoformat() if new_logo.created_at else None,
-                    "companyId": new_logo.company_id,
-                    "updatedBy": new_logo.updated_by
-                }
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            print(f"[COMPANY-LOGO-UPLOAD-JWT] Unexpected error: {type(e).__name__}: {e}")
-            await db.rollback()
-            raise HTTPException(status_code=500, detail=f"로고 업로드 중 오류: {str(e)}")
+        await db.commit()
+        await db.refresh(company_logo)
+        company_logo_cache.invalidate(company_name)
+
+        logger.debug("[COMPANY-LOGO-UPLOAD] SUCCESS: Saved logo %s for company %s", company_logo.content_hash, company_name)
+        return logo_payload(company_logo)
+
+    except FileUploadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("[COMPANY-LOGO-UPLOAD] Unexpected error: %s: %s", type(e).__name__, e)
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"로고 업로드 중 오류: {str(e)}")
 
 
 @router.delete("/logo")
@@ -270,76 +197,26 @@ async def delete_company_logo(
     db: AsyncSession = Depends(get_async_db),
     jwt_user: User = Depends(get_current_active_user)
 ):
-    """회사 로고 제거 (대행사별)"""
-    # Node.js API 호환 모드인지 확인
-    if viewerId is not None or adminId is not None:
-        # Node.js API 호환 모드
-        user_id = viewerId or adminId
-        user_role = viewerRole or adminRole
-        
-        if not user_id or not user_role:
-            raise HTTPException(status_code=400, detail="viewerId와 viewerRole이 필요합니다")
-        
-        # URL 디코딩
-        user_role = unquote(user_role).strip()
-        
-        # 권한 확인: 대행사 어드민만 로고 제거 가능
-        is_agency_admin = (user_role == '대행사 어드민' or 
-                         user_role == '대행사어드민' or
-                         ('대행사' in user_role and '어드민' in user_role))
-        
-        if not is_agency_admin:
-            raise HTTPException(status_code=403, detail="권한이 없습니다. 대행사 어드민만 로고를 제거할 수 있습니다.")
-        
-        # 사용자의 회사 정보 찾기
-        user_query = select(User).where(User.id == user_id)
-        result = await db.execute(user_query)
-        user = result.scalar_one_or_none()
-        
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-        
-        company_name = user.company or 'default'
-        
+    """회사 로고 제거 (대행사별, 해시 이름의 파일은 다른 회사와 공유될 수 있어 남겨둠)"""
+    user_id, company_name = await _resolve_logo_user(
+        db, viewerId, adminId, viewerRole, adminRole, jwt_user, admin_action="제거"
+    )
+
+    try:
         # 해당 회사의 로고 제거
-        logo_query = select(CompanyLogo).where(CompanyLogo.company_id == company_name)
-        logo_result = await db.execute(logo_query)
-        logo = logo_result.scalar_one_or_none()
-        
-        if logo:
+        logo_result = await db.execute(select(CompanyLogo).where(CompanyLogo.company_id == company_name))
+        logos = logo_result.scalars().all()
+
+        for logo in logos:
             await db.delete(logo)
+        if logos:
             await db.commit()
-        
+            logger.debug("[COMPANY-LOGO-DELETE] SUCCESS: Deleted logo for company %s", company_name)
+        company_logo_cache.invalidate(company_name)
+
         return {"message": "로고가 제거되었습니다."}
-    else:
-        # 기존 API 모드 (JWT 토큰 기반)
-        current_user = jwt_user
-        print(f"[COMPANY-LOGO-DELETE-JWT] Request from user_id={current_user.id}, user_role={current_user.role}")
-        
-        try:
-            # 권한 확인: 대행사 어드민만 로고 제거 가능
-            if current_user.role.value not in ['AGENCY_ADMIN', 'SUPER_ADMIN']:
-                raise HTTPException(status_code=403, detail="권한이 없습니다. 대행사 어드민만 로고를 제거할 수 있습니다.")
-            
-            company_name = current_user.company or 'default'
-            
-            # 해당 회사의 로고 제거
-            logo_query = select(CompanyLogo).where(CompanyLogo.company_id == company_name)
-            logo_result = await db.execute(logo_query)
-            logo = logo_result.scalar_one_or_none()
-            
-            if logo:
-                await db.delete(logo)
-                await db.commit()
-                print(f"[COMPANY-LOGO-DELETE-JWT] SUCCESS: Deleted logo for company {company_name}")
-            else:
-                print(f"[COMPANY-LOGO-DELETE-JWT] No logo found for company {company_name}")
-            
-            return {"message": "로고가 제거되었습니다."}
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            print(f"[COMPANY-LOGO-DELETE-JWT] Unexpected error: {type(e).__name__}: {e}")
-            await db.rollback()
-            raise HTTPException(status_code=500, detail=f"로고 제거 중 오류: {str(e)}")
\ No newline at end of file
+
+    except Exception as e:
+        logger.error("[COMPANY-LOGO-DELETE] Unexpected error: %s: %s", type(e).__name__, e)
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"로고 제거 중 오류: {str(e)}")
@@ -1,77 +1,50 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict, Any
-from datetime import datetime
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.core.security import get_current_user
 from app.models.user import User, UserRole
-from app.models.company_settings import CompanySettings, CompanyInfo
-from app.models.system_setting import SettingCategory
+from app.models.company_settings import CompanyInfo
 from app.services.company_settings import (
     get_user_company,
+    get_company_settings as get_cached_company_settings,
+    get_company_setting_value,
+    get_company_setting_values,
+    set_company_settings,
+    delete_company_setting as delete_company_setting_value,
+    company_info_from_user,
     can_user_edit_company_settings
 )
+import logging
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
 
+router = APIRouter()
 
-@router.get("/")
-async def get_company_settings(
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
-):
-    """현재 사용자 회사의 설정 목록 조회"""
 
+def _settings_company(user: User) -> str:
+    """설정 대상 회사 (SUPER_ADMIN은 자신의 company 필드, 없으면 기본값)"""
     user_company = get_user_company(user)
 
-    print(f"[COMPANY-SETTINGS-INFO] user_id={user.id}, role={user.role.value}, user.company={user.company}")
-    print(f"[COMPANY-SETTINGS-INFO] get_user_company() result: {user_company}")
-
-    # SUPER_ADMIN의 경우 자신의 company 필드 사용, 없으면 기본값 설정
     if user_company is None and user.role == UserRole.SUPER_ADMIN:
         user_company = user.company or "SUPER_ADMIN_DEFAULT"
-        print(f"[COMPANY-SETTINGS-INFO] SUPER_ADMIN: using user.company = {user_company}")
 
     if user_company is None:
-        print(f"[COMPANY-SETTINGS-INFO] ERROR: user_company is still None")
+        logger.error("[COMPANY-SETTINGS-INFO] ERROR: user_company is None (user_id=%s)", user.id)
         raise HTTPException(status_code=400, detail="사용자에게 회사 정보가 없습니다")
 
-    # 회사별 설정 조회
-    settings = db.query(CompanySettings).filter(
-        CompanySettings.company == user_company
-    ).all()
-
-    print(f"[COMPANY-SETTINGS-INFO] Found {len(settings)} settings for company: {user_company}")
-
-    # 딕셔너리로 변환
-    settings_dict = {}
-
-    if settings:
-        # company_settings에 데이터가 있으면 사용
-        for setting in settings:
-            settings_dict[setting.setting_key] = setting.setting_value
-        print(f"[COMPANY-SETTINGS-INFO] Using company_settings data: {settings_dict}")
-    else:
-        # company_settings에 데이터가 없으면 users 테이블에서 가져오기
-        print(f"[COMPANY-SETTINGS-INFO] No company_settings found, reading from users table...")
-
-        # SUPER_ADMIN 또는 AGENCY_ADMIN의 client_* 필드에서 읽기
-        if user.role in [UserRole.SUPER_ADMIN, UserRole.AGENCY_ADMIN]:
-            if user.client_company_name:
-                settings_dict['company_name'] = user.client_company_name
-            if user.client_business_number:
-                settings_dict['business_number'] = user.client_business_number
-            if user.client_ceo_name:
-                settings_dict['ceo_name'] = user.client_ceo_name
-            if user.client_company_address:
-                settings_dict['company_address'] = user.client_company_address
-            if user.client_business_type:
-                settings_dict['business_type'] = user.client_business_type
-            if user.client_business_item:
-                settings_dict['business_item'] = user.client_business_item
-
-            print(f"[COMPANY-SETTINGS-INFO] Read from users table: {settings_dict}")
+    return user_company
+
+
+async def _company_info_response(db: AsyncSession, user: User) -> Dict[str, Any]:
+    """회사 정보 응답 (company_settings 스냅샷, 비어 있으면 users 테이블의 client_* 필드)"""
+    user_company = _settings_company(user)
+
+    settings_dict = await get_cached_company_settings(db, user_company)
+    if not settings_dict:
+        logger.debug("[COMPANY-SETTINGS-INFO] No company_settings found for %s, reading from users table", user_company)
+        settings_dict = company_info_from_user(user)
 
     # CompanyInfo 헬퍼 클래스 사용
     company_info = CompanyInfo(user_company, settings_dict)
@@ -83,59 +56,35 @@ async def get_company_settings(
     }
 
 
+@router.get("/")
+async def get_company_settings(
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user)
+):
+    """현재 사용자 회사의 설정 목록 조회"""
+    return await _company_info_response(db, user)
+
+
 @router.post("/bulk-update")
 async def bulk_update_company_settings(
     settings: Dict[str, str] = Body(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """현재 사용자 회사의 설정 일괄 업데이트"""
 
-    user_company = get_user_company(user)
-
-    # SUPER_ADMIN의 경우 자신의 company 필드 사용, 없으면 기본값 설정
-    if user_company is None and user.role == UserRole.SUPER_ADMIN:
-        user_company = user.company or "SUPER_ADMIN_DEFAULT"
-
-    if user_company is None:
-        raise HTTPException(status_code=400, detail="사용자에게 회사 정보가 없습니다")
+    user_company = _settings_company(user)
 
     if not can_user_edit_company_settings(user, user_company):
         raise HTTPException(status_code=403, detail="회사 설정을 수정할 권한이 없습니다")
 
-    updated_settings = []
     errors = []
-
-    for setting_key, new_value in settings.items():
-        try:
-            # 기존 설정 확인
-            existing_setting = db.query(CompanySettings).filter(
-                CompanySettings.company == user_company,
-                CompanySettings.setting_key == setting_key
-            ).first()
-
-            if existing_setting:
-                # 기존 설정 업데이트
-                existing_setting.setting_value = new_value
-                existing_setting.modified_by = user.id
-                existing_setting.updated_at = datetime.utcnow()
-            else:
-                # 새 설정 생성
-                new_setting = CompanySettings(
-                    company=user_company,
-                    setting_key=setting_key,
-                    setting_value=new_value,
-                    modified_by=user.id
-                )
-                db.add(new_setting)
-
-            updated_settings.append(setting_key)
-
-        except Exception as e:
-            errors.append(f"설정 '{setting_key}' 업데이트 중 오류: {str(e)}")
-
-    if updated_settings:
-        db.commit()
+    try:
+        updated_settings = await set_company_settings(db, user_company, settings, user)
+    except Exception as e:
+        await db.rollback()
+        updated_settings = []
+        errors.append(f"설정 업데이트 중 오류: {str(e)}")
 
     return {
         "success": True,
@@ -148,103 +97,45 @@ async def bulk_update_company_settings(
 
 @router.get("/info")
 async def get_company_info(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """현재 사용자 회사의 정보를 DocumentTemplateBuilder 형태로 반환"""
+    return await _company_info_response(db, user)
 
-    user_company = get_user_company(user)
-
-    print(f"[COMPANY-SETTINGS-INFO] /info endpoint - user_id={user.id}, role={user.role.value}, user.company={user.company}")
-    print(f"[COMPANY-SETTINGS-INFO] /info endpoint - get_user_company() result: {user_company}")
-
-    # SUPER_ADMIN의 경우 자신의 company 필드 사용, 없으면 기본값 설정
-    if user_company is None and user.role == UserRole.SUPER_ADMIN:
-        user_company = user.company or "SUPER_ADMIN_DEFAULT"
-        print(f"[COMPANY-SETTINGS-INFO] /info endpoint - SUPER_ADMIN: using user.company = {user_company}")
-
-    if user_company is None:
-        print(f"[COMPANY-SETTINGS-INFO] /info endpoint - ERROR: user_company is still None")
-        raise HTTPException(status_code=400, detail="사용자에게 회사 정보가 없습니다")
 
-    # 회사별 설정 조회
-    settings = db.query(CompanySettings).filter(
-        CompanySettings.company == user_company
-    ).all()
-
-    print(f"[COMPANY-SETTINGS-INFO] /info endpoint - Found {len(settings)} settings for company: {user_company}")
-
-    # 딕셔너리로 변환
-    settings_dict = {}
-
-    if settings:
-        # company_settings에 데이터가 있으면 사용
-        for setting in settings:
-            settings_dict[setting.setting_key] = setting.setting_value
-        print(f"[COMPANY-SETTINGS-INFO] /info endpoint - Using company_settings data: {settings_dict}")
-    else:
-        # company_settings에 데이터가 없으면 users 테이블에서 가져오기
-        print(f"[COMPANY-SETTINGS-INFO] /info endpoint - No company_settings found, reading from users table...")
-
-        # SUPER_ADMIN 또는 AGENCY_ADMIN의 client_* 필드에서 읽기
-        if user.role in [UserRole.SUPER_ADMIN, UserRole.AGENCY_ADMIN]:
-            if user.client_company_name:
-                settings_dict['company_name'] = user.client_company_name
-            if user.client_business_number:
-                settings_dict['business_number'] = user.client_business_number
-            if user.client_ceo_name:
-                settings_dict['ceo_name'] = user.client_ceo_name
-            if user.client_company_address:
-                settings_dict['company_address'] = user.client_company_address
-            if user.client_business_type:
-                settings_dict['business_type'] = user.client_business_type
-            if user.client_business_item:
-                settings_dict['business_item'] = user.client_business_item
-
-            print(f"[COMPANY-SETTINGS-INFO] /info endpoint - Read from users table: {settings_dict}")
+@router.get("/values")
+async def get_company_setting_values_endpoint(
+    keys: List[str] = Query(..., description="조회할 설정 키 (여러 개 지정 가능)"),
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user)
+):
+    """여러 회사 설정 값을 한 번에 조회"""
 
-    company_info = CompanyInfo(user_company, settings_dict)
+    user_company = _settings_company(user)
+    values = await get_company_setting_values(db, user_company, keys)
 
     return {
         "success": True,
         "company": user_company,
-        "info": company_info.to_dict()
+        "settings": values
     }
 
 
 @router.get("/{setting_key}")
 async def get_company_setting(
     setting_key: str = Path(..., description="설정 키"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """특정 회사 설정 조회"""
 
-    user_company = get_user_company(user)
-
-    # SUPER_ADMIN의 경우 자신의 company 필드 사용, 없으면 기본값 설정
-    if user_company is None and user.role == UserRole.SUPER_ADMIN:
-        user_company = user.company or "SUPER_ADMIN_DEFAULT"
-
-    if user_company is None:
-        raise HTTPException(status_code=400, detail="사용자에게 회사 정보가 없습니다")
-
-    setting = db.query(CompanySettings).filter(
-        CompanySettings.company == user_company,
-        CompanySettings.setting_key == setting_key
-    ).first()
-
-    if not setting:
-        return {
-            "success": True,
-            "setting_key": setting_key,
-            "setting_value": None
-        }
+    user_company = _settings_company(user)
 
     return {
         "success": True,
-        "setting_key": setting.setting_key,
-        "setting_value": setting.setting_value
+        "setting_key": setting_key,
+        "setting_value": await get_company_setting_value(db, user_company, setting_key)
     }
 
 
@@ -252,86 +143,42 @@ async def get_company_setting(
 async def update_company_setting(
     setting_key: str = Path(..., description="설정 키"),
     setting_value: str = Body(..., description="설정 값"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """특정 회사 설정 업데이트"""
 
-    user_company = get_user_company(user)
-
-    # SUPER_ADMIN의 경우 자신의 company 필드 사용, 없으면 기본값 설정
-    if user_company is None and user.role == UserRole.SUPER_ADMIN:
-        user_company = user.company or "SUPER_ADMIN_DEFAULT"
-
-    if user_company is None:
-        raise HTTPException(status_code=400, detail="사용자에게 회사 정보가 없습니다")
+    user_company = _settings_company(user)
 
     if not can_user_edit_company_settings(user, user_company):
         raise HTTPException(status_code=403, detail="회사 설정을 수정할 권한이 없습니다")
 
-    # 기존 설정 확인
-    setting = db.query(CompanySettings).filter(
-        CompanySettings.company == user_company,
-        CompanySettings.setting_key == setting_key
-    ).first()
-
-    if setting:
-        # 기존 설정 업데이트
-        setting.setting_value = setting_value
-        setting.modified_by = user.id
-        setting.updated_at = datetime.utcnow()
-    else:
-        # 새 설정 생성
-        setting = CompanySettings(
-            company=user_company,
-            setting_key=setting_key,
-            setting_value=setting_value,
-            modified_by=user.id
-        )
-        db.add(setting)
-
-    db.commit()
-    db.refresh(setting)
+    await set_company_settings(db, user_company, {setting_key: setting_value}, user)
 
     return {
         "success": True,
-        "setting_key": setting.setting_key,
-        "setting_value": setting.setting_value
+        "setting_key": setting_key,
+        "setting_value": setting_value
     }
 
 
 @router.delete("/{setting_key}")
 async def delete_company_setting(
     setting_key: str = Path(..., description="설정 키"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """특정 회사 설정 삭제"""
 
-    user_company = get_user_company(user)
-
-    # SUPER_ADMIN의 경우 자신의 company 필드 사용, 없으면 기본값 설정
-    if user_company is None and user.role == UserRole.SUPER_ADMIN:
-        user_company = user.company or "SUPER_ADMIN_DEFAULT"
-
-    if user_company is None:
-        raise HTTPException(status_code=400, detail="사용자에게 회사 정보가 없습니다")
+    user_company = _settings_company(user)
 
     if not can_user_edit_company_settings(user, user_company):
         raise HTTPException(status_code=403, detail="회사 설정을 수정할 권한이 없습니다")
 
-    setting = db.query(CompanySettings).filter(
-        CompanySettings.company == user_company,
-        CompanySettings.setting_key == setting_key
-    ).first()
-
-    if not setting:
+    if not await delete_company_setting_value(db, user_company, setting_key):
         raise HTTPException(status_code=404, detail="설정을 찾을 수 없습니다")
 
-    db.delete(setting)
-    db.commit()
-
     return {
         "success": True,
         "message": f"설정 '{setting_key}'가 삭제되었습니다"
-    }
\ No newline at end of file
+    }
@@ -1,15 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from typing import Optional
+from typing import Dict, Optional
+import asyncio
 from datetime import datetime, timedelta
 from urllib.parse import unquote
 
 from app.db.database import get_async_db
 from app.api.deps import get_current_active_user, _get_client_ip
 from app.models.user import User
-from app.models.campaign import Campaign
+from app.models.campaign import Campaign, CampaignStatus
 from app.models.purchase_request import PurchaseRequest
+from app.db.query_optimizer import query_optimizer
 from app.services.analytics_service import AnalyticsService
 from app.services.chart_service import ChartService
 from app.services.metrics_service import MetricsService
@@ -19,6 +21,29 @@ from app.core.logging import security_logger, log_api_call
 router = APIRouter()
 
 
+def _quick_stats(dashboard_data: Dict) -> Dict:
+    """QueryOptimizer 대시보드 데이터(상태별 집계)를 요약 통계로 변환"""
+    campaigns = dashboard_data["campaigns"]
+    purchase_requests = dashboard_data["purchase_requests"]
+    return {
+        "total_campaigns": sum(stats["count"] for stats in campaigns.values()),
+        "active_campaigns": campaigns.get(CampaignStatus.ACTIVE.value, {}).get("count", 0),
+        "total_expenses": (
+            sum(stats["total_budget"] for stats in campaigns.values())
+            + sum(stats["total_amount"] for stats in purchase_requests.values())
+        ),
+        "total_users": dashboard_data["users"]["total"]
+    }
+
+
+async def _load_dashboard_data(user: User) -> Dict:
+    """병렬 쿼리 실행기로 대시보드 데이터 조회 (제한 시간 초과 시 504)"""
+    try:
+        return await query_optimizer.get_dashboard_data_optimized(user)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="대시보드 데이터 조회 시간이 초과되었습니다")
+
+
 @router.get("/stats")
 async def get_dashboard_stats(
     # Node.js API 호환성을 위한 쿼리 파라미터
@@ -50,61 +75,11 @@ async def get_dashboard_stats(
         if not current_user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
         
-        # 권한별 통계 조회
-        if user_role in ['슈퍼 어드민', '슈퍼어드민'] or '슈퍼' in user_role:
-            # 슈퍼 어드민은 전체 통계
-            total_campaigns_result = await db.execute(select(func.count(Campaign.id)))
-            total_campaigns = total_campaigns_result.scalar() or 0
-            
-            active_campaigns_result = await db.execute(select(func.count(Campaign.id)).where(Campaign.status == 'active'))
-            active_campaigns = active_campaigns_result.scalar() or 0
-            
-            total_users_result = await db.execute(select(func.count(User.id)))
-            total_users = total_users_result.scalar() or 0
-            
-        elif user_role in ['대행사 어드민', '대행사어드민'] or ('대행사' in user_role and '어드민' in user_role):
-            # 대행사 어드민은 소속 회사 통계
-            company_campaigns_result = await db.execute(
-                select(func.count(Campaign.id))
-                .join(User, Campaign.user_id == User.id)
-                .where(User.company == current_user.company)
-            )
-            total_campaigns = company_campaigns_result.scalar() or 0
-            
-            company_active_campaigns_result = await db.execute(
-                select(func.count(Campaign.id))
-                .join(User, Campaign.user_id == User.id)
-                .where(User.company == current_user.company, Campaign.status == 'active')
-            )
-            active_campaigns = company_active_campaigns_result.scalar() or 0
-            
-            company_users_result = await db.execute(
-                select(func.count(User.id))
-                .where(User.company == current_user.company)
-            )
-            total_users = company_users_result.scalar() or 0
-            
-        elif user_role == '클라이언트':
-            # 클라이언트는 자신의 통계만
-            user_campaigns_result = await db.execute(
-                select(func.count(Campaign.id))
-                .where(Campaign.user_id == user_id)
-            )
-            total_campaigns = user_campaigns_result.scalar() or 0
-            
-            user_active_campaigns_result = await db.execute(
-                select(func.count(Campaign.id))
-                .where(Campaign.user_id == user_id, Campaign.status == 'active')
-            )
-            active_campaigns = user_active_campaigns_result.scalar() or 0
-            
-            total_users = 1  # 자기 자신만
-            
-        else:
-            # 직원은 회사 통계
-            total_campaigns = 0
-            active_campaigns = 0
-            total_users = 1
+        # 권한별 통계 조회 (권한 범위는 DB에 저장된 사용자 역할 기준)
+        quick_stats = _quick_stats(await _load_dashboard_data(current_user))
+        total_campaigns = quick_stats["total_campaigns"]
+        active_campaigns = quick_stats["active_campaigns"]
+        total_users = quick_stats["total_users"]
         
         return {
             "total_campaigns": total_campaigns,
@@ -179,11 +154,11 @@ async def get_advanced_analytics(
         if date_to:
             date_to_dt = datetime.fromisoformat(date_to)
             
-        # 임시 분석 데이터 (AnalyticsService 이슈 해결 후 복구)
+        quick_stats = _quick_stats(await _load_dashboard_data(current_user))
         analytics_data = {
-            "total_campaigns": 0,
-            "active_campaigns": 0,
-            "total_expenses": 0.0,
+            "total_campaigns": quick_stats["total_campaigns"],
+            "active_campaigns": quick_stats["active_campaigns"],
+            "total_expenses": quick_stats["total_expenses"],
             "user_role": current_user.role.value if current_user.role else "unknown"
         }
         
@@ -201,6 +176,8 @@ async def get_advanced_analytics(
             "request_timestamp": datetime.now().isoformat()
         }
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -328,27 +305,21 @@ async def get_dashboard_summary(
     """대시보드 요약 정보 조회 (빠른 로딩용)"""
     
     try:
-        # 기본 통계만 빠르게 조회 (임시 데이터)
+        # 기본 통계(별도 세션들)와 실시간 메트릭(요청 세션)을 동시에 조회
         metrics_service = MetricsService(db)
-        
-        # 병렬 처리로 성능 최적화
-        import asyncio
-        
-        # 임시 기본 통계 데이터
-        basic_stats = {
-            "total_campaigns": 0,
-            "active_campaigns": 0, 
-            "total_expenses": 0.0,
-            "user_role": current_user.role.value if current_user.role else "unknown"
-        }
-        realtime_metrics_task = metrics_service.get_real_time_metrics(current_user)
-        
-        # asyncio.gather 대신 직접 호출 (임시)
-        realtime_metrics = await realtime_metrics_task
+        basic_stats, realtime_metrics = await asyncio.gather(
+            _load_dashboard_data(current_user),
+            metrics_service.get_real_time_metrics(current_user),
+            return_exceptions=True
+        )
         
         # 에러 처리
+        if isinstance(basic_stats, HTTPException):
+            raise basic_stats
         if isinstance(basic_stats, Exception):
             basic_stats = {"error": "기본 통계를 조회할 수 없습니다"}
+        else:
+            basic_stats = _quick_stats(basic_stats)
         
         if isinstance(realtime_metrics, Exception):
             realtime_metrics = {"error": "실시간 메트릭을 조회할 수 없습니다"}
@@ -381,6 +352,8 @@ async def get_dashboard_summary(
             "summary": summary
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         security_logger.log_suspicious_activity(
             "dashboard_summary_error",
@@ -13,6 +13,9 @@ from app.core.file_upload import file_manager, FileUploadError
 from app.api.deps import get_current_active_user
 from app.models.user import User
 from app.core.websocket import manager
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -212,17 +215,17 @@ async def view_file(
 
         # URL 디코딩 처리 (한글 파일명 지원)
         decoded_filename = unquote(filename)
-        print(f"🔍 Original filename: {filename}")
-        print(f"🔍 Decoded filename: {decoded_filename}")
+        logger.debug("🔍 Original filename: %s", filename)
+        logger.debug("🔍 Decoded filename: %s", decoded_filename)
 
         file_path = f"{category}/{decoded_filename}"
         full_path = file_manager.upload_dir / file_path
 
-        print(f"🔍 Full path: {full_path}")
-        print(f"🔍 File exists: {full_path.exists()}")
+        logger.debug("🔍 Full path: %s", full_path)
+        logger.debug("🔍 File exists: %s", full_path.exists())
 
         if not full_path.exists():
-            print(f"❌ 파일이 존재하지 않음: {file_path}")
+            logger.debug("❌ 파일이 존재하지 않음: %s", file_path)
             raise HTTPException(status_code=404, detail=f"파일을 찾을 수 없습니다: {file_path}")
 
         # MIME 타입 직접 추정 (file_manager 의존성 제거)
@@ -235,7 +238,7 @@ async def view_file(
             else:
                 content_type = 'application/octet-stream'
 
-        print(f"🔍 Content-Type: {content_type}")
+        logger.debug("🔍 Content-Type: %s", content_type)
 
         return FileResponse(
             path=str(full_path),
@@ -246,7 +249,7 @@ async def view_file(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ 파일 조회 실패: {str(e)}")
+        logger.error("❌ 파일 조회 실패: %s", str(e))
         raise HTTPException(status_code=500, detail=f"파일 조회 실패: {str(e)}")
 
 @router.get("/thumbnail/{filename}")
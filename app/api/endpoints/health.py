@@ -1,6 +1,5 @@
 from fastapi import APIRouter
 from datetime import datetime
-import psutil
 import os
 from pathlib import Path
 from app.core.config import settings
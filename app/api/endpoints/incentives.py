@@ -10,6 +10,9 @@ from app.models.user import User, UserRole
 from app.models.incentive import Incentive, IncentiveStatus
 from app.models.incentive_rule import IncentiveRule
 from app.services.incentive_service import IncentiveService
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -33,7 +36,7 @@ async def get_my_incentive(
     if month is None:
         month = now.month
 
-    print(f"[INCENTIVE] User {current_user.name} requesting incentive for {year}-{month}")
+    logger.debug("[INCENTIVE] User %s requesting incentive for %s-%s", current_user.name, year, month)
 
     try:
         # 인센티브 계산 (없으면 생성, 있으면 재계산)
@@ -76,7 +79,7 @@ async def get_my_incentive(
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        print(f"[INCENTIVE-ERROR] {str(e)}")
+        logger.error("[INCENTIVE-ERROR] %s", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to calculate incentive: {str(e)}")
 
 
@@ -102,7 +105,7 @@ async def get_team_incentives(
     if month is None:
         month = now.month
 
-    print(f"[TEAM-INCENTIVE] Team Leader {current_user.name} requesting team incentives for {year}-{month}")
+    logger.debug("[TEAM-INCENTIVE] Team Leader %s requesting team incentives for %s-%s", current_user.name, year, month)
 
     try:
         # 팀원 조회 (같은 company + team_leader_id == 본인)
@@ -178,7 +181,7 @@ async def get_team_incentives(
             }
         }
     except Exception as e:
-        print(f"[TEAM-INCENTIVE-ERROR] {str(e)}")
+        logger.error("[TEAM-INCENTIVE-ERROR] %s", str(e))
         raise HTTPException(status_code=500, detail=f"Failed to get team incentives: {str(e)}")
 
 
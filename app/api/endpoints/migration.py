@@ -3,17 +3,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_async_db
 from app.core.security import get_current_user
 from app.models.user import UserRole
+import importlib.util
 import os
 import logging
 
-# Optional alembic import with graceful fallback
-try:
-    from alembic import command
-    from alembic.config import Config
-    from alembic.runtime.migration import MigrationContext
-    ALEMBIC_AVAILABLE = True
-except ImportError:
-    ALEMBIC_AVAILABLE = False
+# Optional alembic - 설치 여부만 확인하고 실제 import는 마이그레이션 실행 시점으로 미룸 (워커 부팅 시간 단축)
+ALEMBIC_AVAILABLE = importlib.util.find_spec("alembic") is not None
+if not ALEMBIC_AVAILABLE:
     logging.warning("Alembic not available - migration features will be limited")
 
 router = APIRouter()
@@ -50,6 +46,9 @@ async def run_migration(
                 detail="Alembic 설정 파일(alembic.ini)을 찾을 수 없습니다."
             )
 
+        from alembic import command
+        from alembic.config import Config
+
         alembic_cfg = Config(alembic_ini_path)
 
         # 현재 리비전 확인
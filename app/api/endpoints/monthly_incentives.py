@@ -48,7 +48,7 @@ async def calculate_monthly_incentives(
     if current_user.role not in [UserRole.SUPER_ADMIN, UserRole.AGENCY_ADMIN]:
         raise HTTPException(status_code=403, detail="권한이 없습니다")
 
-    logger.info(f"월간 인센티브 계산 시작: {request.year}년 {request.month}월")
+    logger.info("월간 인센티브 계산 시작: %s년 %s월", request.year, request.month)
 
     results = []
     summary = {"created": 0, "updated": 0, "skipped": 0, "error": 0}
@@ -68,7 +68,7 @@ async def calculate_monthly_incentives(
         users_result = await db.execute(user_query)
         target_users = users_result.scalars().all()
 
-        logger.info(f"대상 사용자 {len(target_users)}명 조회 완료")
+        logger.info("대상 사용자 %s명 조회 완료", len(target_users))
 
         for user in target_users:
             try:
@@ -96,24 +96,24 @@ async def calculate_monthly_incentives(
                     summary["skipped"] += 1
                     continue
 
-                print(f"[MONTHLY-INCENTIVE] 사용자 {user.name} (ID: {user.id}) 캠페인 조회 - 요청 년/월: {request.year}/{request.month}")
+                logger.debug("[MONTHLY-INCENTIVE] 사용자 %s (ID: %s) 캠페인 조회 - 요청 년/월: %s/%s", user.name, user.id, request.year, request.month)
 
                 # 모든 캠페인 먼저 확인 (디버깅용)
                 all_campaigns_query = select(Campaign).where(Campaign.staff_id == user.id)
                 all_campaigns_result = await db.execute(all_campaigns_query)
                 all_campaigns = all_campaigns_result.scalars().all()
 
-                print(f"[MONTHLY-INCENTIVE] 전체 캠페인 ({len(all_campaigns)}개):")
+                logger.debug("[MONTHLY-INCENTIVE] 전체 캠페인 (%s개):", len(all_campaigns))
                 for campaign in all_campaigns:
                     campaign_year = campaign.start_date.year if campaign.start_date else None
                     campaign_month = campaign.start_date.month if campaign.start_date else None
                     extract_year = campaign.start_date.year if campaign.start_date else None
                     extract_month = campaign.start_date.month if campaign.start_date else None
                     matches_filter = (extract_year == request.year and extract_month == request.month)
-                    print(f"  - 캠페인 {campaign.id}: {campaign.name}")
-                    print(f"    시작일: {campaign.start_date} (연도: {campaign_year}, 월: {campaign_month})")
-                    print(f"    요청 연도/월: {request.year}/{request.month}")
-                    print(f"    필터 매치: {matches_filter} (연도매치: {extract_year == request.year}, 월매치: {extract_month == request.month})")
+                    logger.debug("  - 캠페인 %s: %s", campaign.id, campaign.name)
+                    logger.debug("    시작일: %s (연도: %s, 월: %s)", campaign.start_date, campaign_year, campaign_month)
+                    logger.debug("    요청 연도/월: %s/%s", request.year, request.month)
+                    logger.debug("    필터 매치: %s (연도매치: %s, 월매치: %s)", matches_filter, extract_year == request.year, extract_month == request.month)
 
                 # 해당 사용자의 캠페인 데이터 조회 (campaign.start_date 기준, 취소 캠페인 제외)
                 campaign_query = select(Campaign).where(
@@ -130,9 +130,9 @@ async def calculate_monthly_incentives(
                 campaigns_result = await db.execute(campaign_query)
                 campaigns = campaigns_result.scalars().all()
 
-                print(f"[MONTHLY-INCENTIVE] SQL 필터링 결과: {len(campaigns)}개 캠페인 발견")
+                logger.debug("[MONTHLY-INCENTIVE] SQL 필터링 결과: %s개 캠페인 발견", len(campaigns))
                 for campaign in campaigns:
-                    print(f"  - 캠페인 {campaign.id}: {campaign.name}, 시작일: {campaign.start_date}")
+                    logger.debug("  - 캠페인 %s: %s, 시작일: %s", campaign.id, campaign.name, campaign.start_date)
 
                 # 매출/이익 계산
                 total_revenue = 0.0
@@ -223,7 +223,7 @@ async def calculate_monthly_incentives(
                     summary["created"] += 1
 
             except Exception as e:
-                logger.error(f"사용자 {user.name}({user.id}) 인센티브 계산 실패: {str(e)}")
+                logger.error("사용자 %s(%s) 인센티브 계산 실패: %s", user.name, user.id, str(e))
                 results.append(IncentiveCalculationResult(
                     user_id=user.id,
                     user_name=user.name,
@@ -237,7 +237,7 @@ async def calculate_monthly_incentives(
         # 데이터베이스 커밋
         await db.commit()
 
-        logger.info(f"인센티브 계산 완료: {summary}")
+        logger.info("인센티브 계산 완료: %s", summary)
 
         return IncentiveCalculationResponse(
             success=True,
@@ -248,7 +248,7 @@ async def calculate_monthly_incentives(
 
     except Exception as e:
         await db.rollback()
-        logger.error(f"인센티브 계산 중 오류 발생: {str(e)}")
+        logger.error("인센티브 계산 중 오류 발생: %s", str(e))
         raise HTTPException(status_code=500, detail=f"인센티브 계산 실패: {str(e)}")
 
 @router.get("/", response_model=List[MonthlyIncentiveResponse])
@@ -360,11 +360,11 @@ async def get_monthly_incentives(
 
             response_data.append(MonthlyIncentiveResponse(**incentive_dict))
 
-        logger.info(f"인센티브 목록 조회 완료: {len(response_data)}건")
+        logger.info("인센티브 목록 조회 완료: %s건", len(response_data))
         return response_data
 
     except Exception as e:
-        logger.error(f"인센티브 목록 조회 실패: {str(e)}")
+        logger.error("인센티브 목록 조회 실패: %s", str(e))
         raise HTTPException(status_code=500, detail=f"조회 실패: {str(e)}")
 
 @router.get("/stats", response_model=IncentiveStatsResponse)
@@ -494,14 +494,14 @@ async def update_monthly_incentive(
                 "email": incentive.approver.email
             }
 
-        logger.info(f"인센티브 수정 완료: ID {incentive_id}")
+        logger.info("인센티브 수정 완료: ID %s", incentive_id)
         return MonthlyIncentiveResponse(**incentive_dict)
 
     except HTTPException:
         raise
     except Exception as e:
         await db.rollback()
-        logger.error(f"인센티브 수정 실패: {str(e)}")
+        logger.error("인센티브 수정 실패: %s", str(e))
         raise HTTPException(status_code=500, detail=f"수정 실패: {str(e)}")
 
 @router.delete("/{incentive_id}")
@@ -9,6 +9,9 @@ from app.db.database import get_async_db
 from app.api.deps import get_current_active_user
 from app.models.user import User
 from app.core.cache import cached
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -88,7 +91,7 @@ async def get_unread_notifications_count(
     jwt_user: User = Depends(get_current_active_user)
 ):
     """읽지 않은 알림 개수 조회"""
-    print(f"[NOTIFICATIONS] unread-count request: viewerId={viewerId}, viewerRole={viewerRole}")
+    logger.debug("[NOTIFICATIONS] unread-count request: viewerId=%s, viewerRole=%s", viewerId, viewerRole)
     
     try:
         # Node.js API 호환 모드인지 확인
@@ -98,46 +101,46 @@ async def get_unread_notifications_count(
             user_role = viewerRole or adminRole
             
             if not user_id or not user_role:
-                print(f"[NOTIFICATIONS] ERROR: Missing params - user_id={user_id}, user_role={user_role}")
+                logger.error("[NOTIFICATIONS] ERROR: Missing params - user_id=%s, user_role=%s", user_id, user_role)
                 raise HTTPException(status_code=400, detail="viewerId와 viewerRole이 필요합니다")
             
             # URL 디코딩 및 역할명 매핑
             user_role = unquote(user_role).strip()
             user_role = map_english_role_to_korean(user_role)
-            print(f"[NOTIFICATIONS] Processing user_id={user_id}, user_role='{user_role}'")
+            logger.debug("[NOTIFICATIONS] Processing user_id=%s, user_role='%s'", user_id, user_role)
             
             # 캐시된 사용자 조회
             current_user = await get_user_from_db_cached(user_id, db)
             
             if not current_user:
-                print(f"[NOTIFICATIONS] ERROR: User not found - user_id={user_id}")
+                logger.error("[NOTIFICATIONS] ERROR: User not found - user_id=%s", user_id)
                 raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
             
-            print(f"[NOTIFICATIONS] Found user: {current_user.name}")
+            logger.debug("[NOTIFICATIONS] Found user: %s", current_user.name)
             
             # 캐시된 알림 개수 조회
             result = await get_unread_count_cached(user_id, user_role)
-            print(f"[NOTIFICATIONS] SUCCESS: Returning {result}")
+            logger.debug("[NOTIFICATIONS] SUCCESS: Returning %s", result)
             return result
         else:
             # 기존 API 모드 (JWT 토큰 기반)
             current_user = jwt_user
-            print(f"[NOTIFICATIONS-UNREAD-COUNT-JWT] Request from user_id={current_user.id}, user_role={current_user.role}")
+            logger.debug("[NOTIFICATIONS-UNREAD-COUNT-JWT] Request from user_id=%s, user_role=%s", current_user.id, current_user.role)
             
             try:
                 # JWT 기반 알림 개수 조회
                 user_role = current_user.role.value
                 result = await get_unread_count_cached(current_user.id, user_role)
                 
-                print(f"[NOTIFICATIONS-UNREAD-COUNT-JWT] SUCCESS: Returning {result} for user {current_user.id}")
+                logger.debug("[NOTIFICATIONS-UNREAD-COUNT-JWT] SUCCESS: Returning %s for user %s", result, current_user.id)
                 return result
                 
             except Exception as e:
-                print(f"[NOTIFICATIONS-UNREAD-COUNT-JWT] Unexpected error: {type(e).__name__}: {e}")
+                logger.error("[NOTIFICATIONS-UNREAD-COUNT-JWT] Unexpected error: %s: %s", type(e).__name__, e)
                 # 오류 시 기본값 반환
                 return {"unread_count": 0}
     except Exception as e:
-        print(f"[NOTIFICATIONS] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[NOTIFICATIONS] Unexpected error: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"알림 조회 중 오류: {str(e)}")
 
 
@@ -185,14 +188,14 @@ async def get_notifications(
     else:
         # 기존 API 모드 (JWT 토큰 기반)
         current_user = jwt_user
-        print(f"[NOTIFICATIONS-LIST-JWT] Request from user_id={current_user.id}, user_role={current_user.role}")
+        logger.debug("[NOTIFICATIONS-LIST-JWT] Request from user_id=%s, user_role=%s", current_user.id, current_user.role)
         
         try:
             # JWT 기반 알림 목록 조회
             # 현재는 빈 목록 반환 (실제 알림 시스템 구현 시 DB에서 조회)
             notifications = []
             
-            print(f"[NOTIFICATIONS-LIST-JWT] SUCCESS: Returning {len(notifications)} notifications for user {current_user.id}")
+            logger.debug("[NOTIFICATIONS-LIST-JWT] SUCCESS: Returning %s notifications for user %s", len(notifications), current_user.id)
             
             return NotificationsListResponse(
                 notifications=notifications,
@@ -201,7 +204,7 @@ async def get_notifications(
             )
             
         except Exception as e:
-            print(f"[NOTIFICATIONS-LIST-JWT] Unexpected error: {type(e).__name__}: {e}")
+            logger.error("[NOTIFICATIONS-LIST-JWT] Unexpected error: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"알림 조회 중 오류: {str(e)}")
 
 
@@ -241,17 +244,17 @@ async def mark_notification_as_read(
     else:
         # 기존 API 모드 (JWT 토큰 기반)
         current_user = jwt_user
-        print(f"[NOTIFICATIONS-MARK-READ-JWT] Request from user_id={current_user.id}, notification_id={notification_id}")
+        logger.debug("[NOTIFICATIONS-MARK-READ-JWT] Request from user_id=%s, notification_id=%s", current_user.id, notification_id)
         
         try:
             # JWT 기반 알림 읽음 처리
             # 현재는 성공 응답만 반환 (실제 알림 시스템 구현 시 DB 업데이트)
             
-            print(f"[NOTIFICATIONS-MARK-READ-JWT] SUCCESS: Marked notification {notification_id} as read for user {current_user.id}")
+            logger.debug("[NOTIFICATIONS-MARK-READ-JWT] SUCCESS: Marked notification %s as read for user %s", notification_id, current_user.id)
             return {"message": "알림이 읽음으로 표시되었습니다", "notificationId": notification_id}
             
         except Exception as e:
-            print(f"[NOTIFICATIONS-MARK-READ-JWT] Unexpected error: {type(e).__name__}: {e}")
+            logger.error("[NOTIFICATIONS-MARK-READ-JWT] Unexpected error: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"알림 업데이트 중 오류: {str(e)}")
 
 
@@ -290,15 +293,15 @@ async def mark_all_notifications_as_read(
     else:
         # 기존 API 모드 (JWT 토큰 기반)
         current_user = jwt_user
-        print(f"[NOTIFICATIONS-MARK-ALL-READ-JWT] Request from user_id={current_user.id}")
+        logger.debug("[NOTIFICATIONS-MARK-ALL-READ-JWT] Request from user_id=%s", current_user.id)
         
         try:
             # JWT 기반 모든 알림 읽음 처리
             # 현재는 성공 응답만 반환 (실제 알림 시스템 구현 시 DB에서 모든 알림 업데이트)
             
-            print(f"[NOTIFICATIONS-MARK-ALL-READ-JWT] SUCCESS: Marked all notifications as read for user {current_user.id}")
+            logger.debug("[NOTIFICATIONS-MARK-ALL-READ-JWT] SUCCESS: Marked all notifications as read for user %s", current_user.id)
             return {"message": "모든 알림이 읽음으로 표시되었습니다", "updatedCount": 0}
             
         except Exception as e:
-            print(f"[NOTIFICATIONS-MARK-ALL-READ-JWT] Unexpected error: {type(e).__name__}: {e}")
+            logger.error("[NOTIFICATIONS-MARK-ALL-READ-JWT] Unexpected error: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"알림 업데이트 중 오류: {str(e)}")
\ No newline at end of file
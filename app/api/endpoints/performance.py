@@ -10,7 +10,7 @@ router = APIRouter()
 # 성능 통계 조회 함수
 def get_performance_statistics() -> Dict[str, Any]:
     """성능 통계 조회"""
-    from app.middleware.simple_performance import get_performance_stats
+    from app.middleware.request_metrics import get_performance_stats
     return get_performance_stats()
 
 
@@ -81,7 +81,7 @@ async def get_slow_requests():
 @router.post("/stats/reset")
 async def reset_performance_statistics():
     """성능 통계 초기화"""
-    from app.middleware.simple_performance import reset_performance_stats
+    from app.middleware.request_metrics import reset_performance_stats
     reset_performance_stats()
     return {"message": "Performance statistics reset successfully"}
 
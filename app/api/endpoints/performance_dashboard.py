@@ -8,11 +8,13 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Dict, List, Optional
-import psutil
 import asyncio
 from datetime import datetime, timedelta
 
 from app.middleware.performance_monitor import performance_monitor
+from app.middleware.request_metrics import get_performance_stats
+from app.db import query_metrics
+from app.core.config import settings
 from app.api.deps import get_current_active_user
 from app.models.user import User
 
@@ -48,17 +50,69 @@ async def get_endpoint_performance(
         'total_endpoints': len(endpoint_stats)
     }
 
+@router.get("/metrics/routes", response_model=Dict)
+async def get_route_latency_histograms(
+    sort_by: str = Query("p95_ms", description="정렬 기준 (count, avg_time, p50_ms, p95_ms, p99_ms)"),
+    limit: int = Query(20, ge=1, le=200)
+):
+    """라우트 템플릿별 지연시간 분포 (p50/p95/p99)"""
+    stats = get_performance_stats()
+    endpoints = stats["endpoints"]
+    if sort_by not in ("count", "avg_time", "p50_ms", "p95_ms", "p99_ms"):
+        sort_by = "p95_ms"
+
+    sorted_endpoints = sorted(
+        endpoints.items(),
+        key=lambda x: x[1][sort_by],
+        reverse=True
+    )
+
+    return {
+        'total_requests': stats['total_requests'],
+        'avg_response_time_ms': round(stats['avg_response_time'], 2),
+        'uptime_seconds': stats['uptime_seconds'],
+        'routes': dict(sorted_endpoints[:limit]),
+        'total_routes': len(endpoints),
+        'slow_requests': stats['slow_requests']
+    }
+
 @router.get("/metrics/slow-queries", response_model=List[Dict])
 async def get_slow_queries(
     limit: int = Query(50, ge=1, le=100)
 ):
     """느린 쿼리 목록"""
-    queries = list(performance_monitor.metrics['slow_queries'])
+    queries = list(query_metrics.recent_slow_queries)
     return queries[-limit:]  # 최근 쿼리들
 
+@router.get("/metrics/top-statements", response_model=Dict)
+async def get_top_statements(
+    limit: int = Query(20, ge=1, le=100),
+    sort_by: str = Query("total_ms", description="정렬 기준 (total_ms, avg_ms, max_ms, count)")
+):
+    """fingerprint별 쿼리 누적 통계 상위 K개"""
+    if sort_by not in ("total_ms", "avg_ms", "max_ms", "count"):
+        sort_by = "total_ms"
+    return {
+        'statements': query_metrics.get_top_statements(limit=limit, sort_by=sort_by),
+        'tracked_statements': len(query_metrics.statement_stats)
+    }
+
+@router.get("/metrics/n-plus-one", response_model=Dict)
+async def get_n_plus_one_events(
+    limit: int = Query(50, ge=1, le=100)
+):
+    """N+1 의심 패턴 (한 요청에서 같은 문장이 임계값을 초과해 반복 실행)"""
+    events = list(query_metrics.n_plus_one_events)
+    return {
+        'threshold': settings.SQL_N_PLUS_ONE_THRESHOLD,
+        'events': events[-limit:]
+    }
+
 @router.get("/metrics/system", response_model=Dict)
 async def get_system_metrics():
     """시스템 리소스 사용량"""
+    import psutil  # 조회 시점에만 로드 (워커 부팅 경로에서 제외)
+
     # CPU 사용률
     cpu_percent = psutil.cpu_percent(interval=1)
     
@@ -147,6 +201,7 @@ async def reset_metrics(
         'memory_usage': [],
         'active_connections': 0,
     }
+    query_metrics.reset_query_metrics()
     
     return {"message": "성능 메트릭이 초기화되었습니다", "reset_at": datetime.now().isoformat()}
 
@@ -11,6 +11,9 @@ from app.api.deps import get_current_active_user
 from app.models.user import User, UserRole
 from app.models.product import Product
 from app.models.work_type import WorkType
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -126,7 +129,7 @@ async def get_products(
     else:
         # 기존 API 모드 (JWT 토큰 기반)
         current_user = jwt_user
-        print(f"[PRODUCTS-LIST-JWT] Request from user_id={current_user.id}, user_role={current_user.role}, user_company={current_user.company}")
+        logger.debug("[PRODUCTS-LIST-JWT] Request from user_id=%s, user_role=%s, user_company=%s", current_user.id, current_user.role, current_user.company)
 
         try:
             # 먼저 모든 상품을 조회해서 company 값들을 확인
@@ -134,14 +137,14 @@ async def get_products(
             all_result = await db.execute(all_products_query)
             all_products = all_result.scalars().all()
 
-            print(f"[PRODUCTS-DEBUG] Total active products: {len(all_products)}")
+            logger.debug("[PRODUCTS-DEBUG] Total active products: %s", len(all_products))
             for product in all_products:
-                print(f"[PRODUCTS-DEBUG] Product ID {product.id}: name='{product.name}', company='{product.company}'")
+                logger.debug("[PRODUCTS-DEBUG] Product ID %s: name='%s', company='%s'", product.id, product.name, product.company)
 
             # JWT 기반 상품 목록 조회 (활성 상품만, 회사별 필터링)
             # company 필드가 None인 경우 기본값으로 처리
             user_company = current_user.company or 'default_company'
-            print(f"[PRODUCTS-FILTER] Filtering products for user_company: '{user_company}'")
+            logger.debug("[PRODUCTS-FILTER] Filtering products for user_company: '%s'", user_company)
 
             query = select(Product).where(
                 Product.is_active == True,
@@ -150,7 +153,7 @@ async def get_products(
             result = await db.execute(query)
             products = result.scalars().all()
 
-            print(f"[PRODUCTS-FILTER] Filtered products count: {len(products)}")
+            logger.debug("[PRODUCTS-FILTER] Filtered products count: %s", len(products))
             
             # 응답 데이터 구성
             products_data = []
@@ -173,11 +176,11 @@ async def get_products(
 
                 products_data.append(product_data)
             
-            print(f"[PRODUCTS-LIST-JWT] SUCCESS: Returning {len(products_data)} products")
+            logger.debug("[PRODUCTS-LIST-JWT] SUCCESS: Returning %s products", len(products_data))
             return products_data
             
         except Exception as e:
-            print(f"[PRODUCTS-LIST-JWT] Unexpected error: {type(e).__name__}: {e}")
+            logger.error("[PRODUCTS-LIST-JWT] Unexpected error: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"상품 목록 조회 중 오류: {str(e)}")
 
 
@@ -193,7 +196,7 @@ async def create_product(
     jwt_user: User = Depends(get_current_active_user)
 ):
     """새 상품 생성"""
-    print(f"[PRODUCT-CREATE] Creating product: {product_data.dict()}")
+    logger.debug("[PRODUCT-CREATE] Creating product: %s", product_data.dict())
 
     # Node.js API 호환 모드인지 확인
     if viewerId is not None or adminId is not None:
@@ -215,14 +218,14 @@ async def create_product(
         if not current_user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
 
-        print(f"[PRODUCT-CREATE] Node.js API mode - user_id={user_id}, role={user_role}")
+        logger.debug("[PRODUCT-CREATE] Node.js API mode - user_id=%s, role=%s", user_id, user_role)
 
     else:
         # JWT 기반 모드
         current_user = jwt_user
         user_role = current_user.role.value
 
-        print(f"[PRODUCT-CREATE] JWT mode - user_id={current_user.id}, role={user_role}")
+        logger.debug("[PRODUCT-CREATE] JWT mode - user_id=%s, role=%s", current_user.id, user_role)
 
     try:
         # work_type 처리 - category name으로 work_type_id 찾기 (회사별 필터링)
@@ -273,7 +276,7 @@ async def create_product(
         await db.commit()
         await db.refresh(new_product)
 
-        print(f"[PRODUCT-CREATE] SUCCESS: Created product {new_product.id} by user {current_user.id}")
+        logger.debug("[PRODUCT-CREATE] SUCCESS: Created product %s by user %s", new_product.id, current_user.id)
 
         return {
             "id": new_product.id,
@@ -294,7 +297,7 @@ async def create_product(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[PRODUCT-CREATE] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[PRODUCT-CREATE] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"상품 생성 중 오류: {str(e)}")
 
@@ -311,7 +314,7 @@ async def delete_product(
     jwt_user: User = Depends(get_current_active_user)
 ):
     """상품 삭제 (소프트 삭제)"""
-    print(f"[PRODUCT-DELETE] Deleting product ID: {product_id}")
+    logger.debug("[PRODUCT-DELETE] Deleting product ID: %s", product_id)
 
     # Node.js API 호환 모드인지 확인
     if viewerId is not None or adminId is not None:
@@ -333,14 +336,14 @@ async def delete_product(
         if not current_user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
 
-        print(f"[PRODUCT-DELETE] Node.js API mode - user_id={user_id}, role={user_role}")
+        logger.debug("[PRODUCT-DELETE] Node.js API mode - user_id=%s, role=%s", user_id, user_role)
 
     else:
         # JWT 기반 모드
         current_user = jwt_user
         user_role = current_user.role.value
 
-        print(f"[PRODUCT-DELETE] JWT mode - user_id={current_user.id}, role={user_role}")
+        logger.debug("[PRODUCT-DELETE] JWT mode - user_id=%s, role=%s", current_user.id, user_role)
 
     try:
         # 상품 존재 확인 (회사별 필터링)
@@ -361,7 +364,7 @@ async def delete_product(
         product.is_active = False
         await db.commit()
 
-        print(f"[PRODUCT-DELETE] SUCCESS: Soft deleted product {product_id} by user {current_user.id}")
+        logger.debug("[PRODUCT-DELETE] SUCCESS: Soft deleted product %s by user %s", product_id, current_user.id)
 
         # 204 No Content 응답 (응답 바디 없음)
         return
@@ -369,7 +372,7 @@ async def delete_product(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[PRODUCT-DELETE] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[PRODUCT-DELETE] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"상품 삭제 중 오류: {str(e)}")
 
@@ -387,7 +390,7 @@ async def update_product(
     jwt_user: User = Depends(get_current_active_user)
 ):
     """상품 정보 수정"""
-    print(f"[PRODUCT-UPDATE] Updating product ID: {product_id} with data: {product_data.dict(exclude_unset=True)}")
+    logger.debug("[PRODUCT-UPDATE] Updating product ID: %s with data: %s", product_id, product_data.dict(exclude_unset=True))
 
     # Node.js API 호환 모드인지 확인
     if viewerId is not None or adminId is not None:
@@ -409,14 +412,14 @@ async def update_product(
         if not current_user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
 
-        print(f"[PRODUCT-UPDATE] Node.js API mode - user_id={user_id}, role={user_role}")
+        logger.debug("[PRODUCT-UPDATE] Node.js API mode - user_id=%s, role=%s", user_id, user_role)
 
     else:
         # JWT 기반 모드
         current_user = jwt_user
         user_role = current_user.role.value
 
-        print(f"[PRODUCT-UPDATE] JWT mode - user_id={current_user.id}, role={user_role}")
+        logger.debug("[PRODUCT-UPDATE] JWT mode - user_id=%s, role=%s", current_user.id, user_role)
 
     try:
         # 상품 존재 확인 (회사별 필터링)
@@ -481,7 +484,7 @@ async def update_product(
         await db.commit()
         await db.refresh(product)
 
-        print(f"[PRODUCT-UPDATE] SUCCESS: Updated product {product_id} by user {current_user.id}")
+        logger.debug("[PRODUCT-UPDATE] SUCCESS: Updated product %s by user %s", product_id, current_user.id)
 
         return {
             "id": product.id,
@@ -503,6 +506,6 @@ async def update_product(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[PRODUCT-UPDATE] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[PRODUCT-UPDATE] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"상품 수정 중 오류: {str(e)}")
\ No newline at end of file
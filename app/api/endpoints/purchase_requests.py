@@ -6,7 +6,6 @@ from urllib.parse import unquote
 from datetime import datetime
 import os
 import uuid
-from PIL import Image
 import io
 
 from app.db.database import get_async_db
@@ -16,6 +15,9 @@ from app.models.user import User
 from app.models.purchase_request import PurchaseRequest, RequestStatus
 from app.core.websocket import manager
 from app.services.export_service import export_service
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -172,7 +174,7 @@ async def get_purchase_requests(
     else:
         # 기존 API 모드 (JWT 토큰 기반)
         current_user = jwt_user
-        print(f"[PURCHASE-REQUESTS-LIST-JWT] Request from user_id={current_user.id}, user_role={current_user.role}")
+        logger.debug("[PURCHASE-REQUESTS-LIST-JWT] Request from user_id=%s, user_role=%s", current_user.id, current_user.role)
         
         try:
             # JWT 기반 구매요청 목록 조회
@@ -276,7 +278,7 @@ async def get_purchase_requests(
             
             total_pages = (total + limit - 1) // limit
             
-            print(f"[PURCHASE-REQUESTS-LIST-JWT] Found {len(requests)} requests (page {page}/{total_pages}, total: {total})")
+            logger.debug("[PURCHASE-REQUESTS-LIST-JWT] Found %s requests (page %s/%s, total: %s)", len(requests), page, total_pages, total)
             
             return {
                 "requests": requests_data,
@@ -286,7 +288,7 @@ async def get_purchase_requests(
             }
             
         except Exception as e:
-            print(f"[PURCHASE-REQUESTS-LIST-JWT] Unexpected error: {type(e).__name__}: {e}")
+            logger.error("[PURCHASE-REQUESTS-LIST-JWT] Unexpected error: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"구매요청 조회 중 오류: {str(e)}")
 
 
@@ -304,16 +306,16 @@ async def create_purchase_request(
 ):
     """새 구매요청 생성"""
     # 🔍 프론트엔드에서 보낸 데이터 로그
-    print(f"[PURCHASE-REQUEST-CREATE] Received data:")
-    print(f"  - title: {request_data.title}")
-    print(f"  - description: {request_data.description}")
-    print(f"  - amount: {request_data.amount}")
-    print(f"  - quantity: {request_data.quantity}")
-    print(f"  - vendor: {request_data.vendor}")
-    print(f"  - resource_type: {request_data.resource_type}")
-    print(f"  - priority: {request_data.priority}")
-    print(f"  - due_date: {request_data.due_date}")
-    print(f"  - campaign_id: {request_data.campaign_id}")
+    logger.debug("[PURCHASE-REQUEST-CREATE] Received data:")
+    logger.debug("  - title: %s", request_data.title)
+    logger.debug("  - description: %s", request_data.description)
+    logger.debug("  - amount: %s", request_data.amount)
+    logger.debug("  - quantity: %s", request_data.quantity)
+    logger.debug("  - vendor: %s", request_data.vendor)
+    logger.debug("  - resource_type: %s", request_data.resource_type)
+    logger.debug("  - priority: %s", request_data.priority)
+    logger.debug("  - due_date: %s", request_data.due_date)
+    logger.debug("  - campaign_id: %s", request_data.campaign_id)
 
     # Node.js API 호환 모드인지 확인
     if viewerId is not None or adminId is not None:
@@ -335,7 +337,7 @@ async def create_purchase_request(
         if not requester:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-        print(f"[PURCHASE-REQUEST-CREATE] Node.js API mode - user_id={user_id}, company={requester.company}")
+        logger.debug("[PURCHASE-REQUEST-CREATE] Node.js API mode - user_id=%s, company=%s", user_id, requester.company)
 
         # 새 구매요청 생성
         new_request = PurchaseRequest(
@@ -361,7 +363,7 @@ async def create_purchase_request(
     else:
         # 기존 API 모드 (JWT 토큰 기반)
         current_user = jwt_user
-        print(f"[PURCHASE-REQUEST-CREATE-JWT] Request from user_id={current_user.id}, user_role={current_user.role}")
+        logger.debug("[PURCHASE-REQUEST-CREATE-JWT] Request from user_id=%s, user_role=%s", current_user.id, current_user.role)
         
         try:
             # JWT 기반 구매요청 생성
@@ -384,11 +386,11 @@ async def create_purchase_request(
             await db.commit()
             await db.refresh(new_request)
 
-            print(f"[PURCHASE-REQUEST-CREATE-JWT] SUCCESS: Created request {new_request.id} for user {current_user.id}")
+            logger.debug("[PURCHASE-REQUEST-CREATE-JWT] SUCCESS: Created request %s for user %s", new_request.id, current_user.id)
             return new_request
 
         except Exception as e:
-            print(f"[PURCHASE-REQUEST-CREATE-JWT] Unexpected error: {type(e).__name__}: {e}")
+            logger.error("[PURCHASE-REQUEST-CREATE-JWT] Unexpected error: %s: %s", type(e).__name__, e)
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"구매요청 생성 중 오류: {str(e)}")
 
@@ -458,7 +460,7 @@ async def update_purchase_request(
     else:
         # 기존 API 모드 (JWT 토큰 기반)
         current_user = jwt_user
-        print(f"[PURCHASE-REQUEST-UPDATE-JWT] Request from user_id={current_user.id}, user_role={current_user.role}")
+        logger.debug("[PURCHASE-REQUEST-UPDATE-JWT] Request from user_id=%s, user_role=%s", current_user.id, current_user.role)
         
         try:
             # 구매요청 찾기
@@ -504,13 +506,13 @@ async def update_purchase_request(
                     user_id=purchase_request.requester_id
                 )
             
-            print(f"[PURCHASE-REQUEST-UPDATE-JWT] SUCCESS: Updated request {request_id} by user {current_user.id}")
+            logger.debug("[PURCHASE-REQUEST-UPDATE-JWT] SUCCESS: Updated request %s by user %s", request_id, current_user.id)
             return purchase_request
             
         except HTTPException:
             raise
         except Exception as e:
-            print(f"[PURCHASE-REQUEST-UPDATE-JWT] Unexpected error: {type(e).__name__}: {e}")
+            logger.error("[PURCHASE-REQUEST-UPDATE-JWT] Unexpected error: %s: %s", type(e).__name__, e)
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"구매요청 수정 중 오류: {str(e)}")
 
@@ -595,7 +597,7 @@ async def get_purchase_request_stats(
     else:
         # 기존 API 모드 (JWT 토큰 기반)
         current_user = jwt_user
-        print(f"[PURCHASE-REQUEST-STATS-JWT] Request from user_id={current_user.id}, user_role={current_user.role}, month={month}")
+        logger.debug("[PURCHASE-REQUEST-STATS-JWT] Request from user_id=%s, user_role=%s, month=%s", current_user.id, current_user.role, month)
 
         try:
             # 월간 필터 파싱
@@ -611,9 +613,9 @@ async def get_purchase_request_stats(
                     start_date = datetime(year, month_num, 1)
                     end_date = datetime(year, month_num, last_day, 23, 59, 59)
                     month_filter = (start_date, end_date)
-                    print(f"[PURCHASE-REQUEST-STATS-JWT] Month filter: {start_date.isoformat()} to {end_date.isoformat()}")
+                    logger.debug("[PURCHASE-REQUEST-STATS-JWT] Month filter: %s to %s", start_date.isoformat(), end_date.isoformat())
                 except (ValueError, AttributeError) as e:
-                    print(f"[PURCHASE-REQUEST-STATS-JWT] Invalid month format: {month}, error: {e}")
+                    logger.error("[PURCHASE-REQUEST-STATS-JWT] Invalid month format: %s, error: %s", month, e)
                     raise HTTPException(status_code=400, detail="Invalid month format. Use YYYY-MM format.")
 
             # 권한에 따라 데이터 필터링
@@ -711,7 +713,7 @@ async def get_purchase_request_stats(
             total_amount = await db.scalar(total_amount_query)
             approved_amount = await db.scalar(approved_amount_query)
             
-            print(f"[PURCHASE-REQUEST-STATS-JWT] SUCCESS: Returning stats for user {current_user.id}")
+            logger.debug("[PURCHASE-REQUEST-STATS-JWT] SUCCESS: Returning stats for user %s", current_user.id)
             
             return {
                 "totalRequests": total_count or 0,
@@ -726,7 +728,7 @@ async def get_purchase_request_stats(
             }
             
         except Exception as e:
-            print(f"[PURCHASE-REQUEST-STATS-JWT] Unexpected error: {type(e).__name__}: {e}")
+            logger.error("[PURCHASE-REQUEST-STATS-JWT] Unexpected error: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"통계 조회 중 오류: {str(e)}")
 
 
@@ -754,7 +756,7 @@ async def upload_receipt_new(
         # URL 디코딩
         user_role = unquote(user_role).strip()
 
-        print(f"[RECEIPT-UPLOAD] Node.js mode - user_id={user_id}, role={user_role}, filename={receipt.filename}")
+        logger.debug("[RECEIPT-UPLOAD] Node.js mode - user_id=%s, role=%s, filename=%s", user_id, user_role, receipt.filename)
 
         # 구매요청 찾기
         query = select(PurchaseRequest).where(PurchaseRequest.id == request_id)
@@ -781,7 +783,7 @@ async def upload_receipt_new(
         await db.commit()
         await db.refresh(purchase_request)
 
-        print(f"[RECEIPT-UPLOAD] SUCCESS: Saved receipt for request {request_id}, URL: {receipt_url}")
+        logger.debug("[RECEIPT-UPLOAD] SUCCESS: Saved receipt for request %s, URL: %s", request_id, receipt_url)
 
         return {
             "success": True,
@@ -791,7 +793,7 @@ async def upload_receipt_new(
     else:
         # JWT 토큰 기반
         current_user = jwt_user
-        print(f"[RECEIPT-UPLOAD] JWT mode - user_id={current_user.id}, filename={receipt.filename}")
+        logger.debug("[RECEIPT-UPLOAD] JWT mode - user_id=%s, filename=%s", current_user.id, receipt.filename)
 
         # 구매요청 찾기
         query = select(PurchaseRequest).where(PurchaseRequest.id == request_id)
@@ -817,7 +819,7 @@ async def upload_receipt_new(
         await db.commit()
         await db.refresh(purchase_request)
 
-        print(f"[RECEIPT-UPLOAD] SUCCESS: Saved receipt for request {request_id}, URL: {receipt_url}")
+        logger.debug("[RECEIPT-UPLOAD] SUCCESS: Saved receipt for request %s, URL: %s", request_id, receipt_url)
 
         return {
             "success": True,
@@ -834,7 +836,7 @@ async def upload_receipt_legacy(
     current_user: User = Depends(get_current_active_user)
 ):
     """영수증 파일 업로드 (구버전 - 호환성 유지용)"""
-    print(f"[RECEIPT-UPLOAD-LEGACY] Request from user_id={current_user.id}, request_id={request_id}, filename={file.filename}")
+    logger.debug("[RECEIPT-UPLOAD-LEGACY] Request from user_id=%s, request_id=%s, filename=%s", current_user.id, request_id, file.filename)
 
     try:
         # 구매요청 찾기
@@ -874,6 +876,8 @@ async def upload_receipt_legacy(
 
         # 이미지 검증 및 리사이징 (모바일 최적화)
         try:
+            from PIL import Image
+
             image = Image.open(io.BytesIO(contents))
 
             # EXIF 회전 정보 처리
@@ -900,7 +904,7 @@ async def upload_receipt_legacy(
                 ratio = max_width / image.width
                 new_height = int(image.height * ratio)
                 image = image.resize((max_width, new_height), Image.Resampling.LANCZOS)
-                print(f"[RECEIPT-UPLOAD] Resized image from {image.width}x{image.height} to {max_width}x{new_height}")
+                logger.debug("[RECEIPT-UPLOAD] Resized image from %sx%s to %sx%s", image.width, image.height, max_width, new_height)
 
             # RGB 변환 (PNG 투명도 처리)
             if image.mode in ('RGBA', 'LA', 'P'):
@@ -916,7 +920,7 @@ async def upload_receipt_legacy(
             optimized_contents = output.getvalue()
 
         except Exception as img_error:
-            print(f"[RECEIPT-UPLOAD] Image processing error: {img_error}")
+            logger.error("[RECEIPT-UPLOAD] Image processing error: %s", img_error)
             raise HTTPException(status_code=400, detail="유효하지 않은 이미지 파일입니다.")
 
         # Railway Volume 저장 경로 설정
@@ -943,7 +947,7 @@ async def upload_receipt_legacy(
         await db.commit()
         await db.refresh(purchase_request)
 
-        print(f"[RECEIPT-UPLOAD] SUCCESS: Saved {filename} for request {request_id}")
+        logger.debug("[RECEIPT-UPLOAD] SUCCESS: Saved %s for request %s", filename, request_id)
 
         return {
             "success": True,
@@ -955,7 +959,7 @@ async def upload_receipt_legacy(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[RECEIPT-UPLOAD] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[RECEIPT-UPLOAD] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"파일 업로드 중 오류: {str(e)}")
 
@@ -988,7 +992,7 @@ async def delete_purchase_request(
     else:
         current_user = jwt_user
 
-    print(f"[PURCHASE-REQUEST-DELETE] Request from user_id={current_user.id}, user_role={current_user.role}")
+    logger.debug("[PURCHASE-REQUEST-DELETE] Request from user_id=%s, user_role=%s", current_user.id, current_user.role)
 
     try:
         # 구매요청 찾기
@@ -1021,16 +1025,16 @@ async def delete_purchase_request(
                 file_path = f"/app{purchase_request.receipt_file_url}"
                 if os.path.exists(file_path):
                     os.remove(file_path)
-                    print(f"[PURCHASE-REQUEST-DELETE] Deleted receipt file: {file_path}")
+                    logger.debug("[PURCHASE-REQUEST-DELETE] Deleted receipt file: %s", file_path)
             except Exception as file_error:
-                print(f"[PURCHASE-REQUEST-DELETE] Failed to delete receipt file: {file_error}")
+                logger.error("[PURCHASE-REQUEST-DELETE] Failed to delete receipt file: %s", file_error)
                 # 파일 삭제 실패는 무시하고 계속 진행
 
         # DB에서 삭제
         await db.delete(purchase_request)
         await db.commit()
 
-        print(f"[PURCHASE-REQUEST-DELETE] SUCCESS: Deleted request {request_id} by user {current_user.id}")
+        logger.debug("[PURCHASE-REQUEST-DELETE] SUCCESS: Deleted request %s by user %s", request_id, current_user.id)
 
         return {
             "success": True,
@@ -1041,7 +1045,7 @@ async def delete_purchase_request(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[PURCHASE-REQUEST-DELETE] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[PURCHASE-REQUEST-DELETE] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"구매요청 삭제 중 오류: {str(e)}")
 
@@ -1074,7 +1078,7 @@ async def approve_purchase_request(
     else:
         current_user = jwt_user
 
-    print(f"[PURCHASE-REQUEST-APPROVE] Request from user_id={current_user.id}, user_role={current_user.role}")
+    logger.debug("[PURCHASE-REQUEST-APPROVE] Request from user_id=%s, user_role=%s", current_user.id, current_user.role)
 
     try:
         # 구매요청 찾기
@@ -1108,7 +1112,7 @@ async def approve_purchase_request(
             user_id=purchase_request.requester_id
         )
 
-        print(f"[PURCHASE-REQUEST-APPROVE] SUCCESS: Approved request {request_id} by user {current_user.id}")
+        logger.debug("[PURCHASE-REQUEST-APPROVE] SUCCESS: Approved request %s by user %s", request_id, current_user.id)
 
         return {
             "success": True,
@@ -1124,7 +1128,7 @@ async def approve_purchase_request(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[PURCHASE-REQUEST-APPROVE] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[PURCHASE-REQUEST-APPROVE] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"구매요청 승인 중 오류: {str(e)}")
 
@@ -1157,7 +1161,7 @@ async def reject_purchase_request(
     else:
         current_user = jwt_user
 
-    print(f"[PURCHASE-REQUEST-REJECT] Request from user_id={current_user.id}, user_role={current_user.role}")
+    logger.debug("[PURCHASE-REQUEST-REJECT] Request from user_id=%s, user_role=%s", current_user.id, current_user.role)
 
     try:
         # 구매요청 찾기
@@ -1191,7 +1195,7 @@ async def reject_purchase_request(
             user_id=purchase_request.requester_id
         )
 
-        print(f"[PURCHASE-REQUEST-REJECT] SUCCESS: Rejected request {request_id} by user {current_user.id}")
+        logger.debug("[PURCHASE-REQUEST-REJECT] SUCCESS: Rejected request %s by user %s", request_id, current_user.id)
 
         return {
             "success": True,
@@ -1207,7 +1211,7 @@ async def reject_purchase_request(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[PURCHASE-REQUEST-REJECT] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[PURCHASE-REQUEST-REJECT] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"구매요청 반려 중 오류: {str(e)}")
 
@@ -1240,7 +1244,7 @@ async def generate_purchase_request_documents(
     else:
         current_user = jwt_user
 
-    print(f"[PURCHASE-REQUEST-GENERATE-DOCS] Request from user_id={current_user.id}, user_role={current_user.role}")
+    logger.debug("[PURCHASE-REQUEST-GENERATE-DOCS] Request from user_id=%s, user_role=%s", current_user.id, current_user.role)
 
     try:
         # 구매요청 찾기
@@ -1282,9 +1286,9 @@ async def generate_purchase_request_documents(
             )
             # 상대 경로로 변환
             document_url = document_path.replace('./exports', '/exports')
-            print(f"[PURCHASE-REQUEST-GENERATE-DOCS] SUCCESS: Document generated at {document_url}")
+            logger.debug("[PURCHASE-REQUEST-GENERATE-DOCS] SUCCESS: Document generated at %s", document_url)
         except Exception as doc_error:
-            print(f"[PURCHASE-REQUEST-GENERATE-DOCS] Document generation failed: {doc_error}")
+            logger.error("[PURCHASE-REQUEST-GENERATE-DOCS] Document generation failed: %s", doc_error)
             raise HTTPException(status_code=500, detail=f"문서 생성 중 오류: {str(doc_error)}")
 
         return {
@@ -1300,5 +1304,5 @@ async def generate_purchase_request_documents(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[PURCHASE-REQUEST-GENERATE-DOCS] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[PURCHASE-REQUEST-GENERATE-DOCS] Unexpected error: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"문서 생성 중 오류: {str(e)}")
\ No newline at end of file
@@ -11,7 +11,7 @@ from pydantic import BaseModel, Field
 from app.db.database import get_async_db
 from app.api.deps import get_current_active_user
 from app.models.user import User
-from app.services.search_service import search_service, SortOrder
+from app.services.search_service import search_service, SortOrder, QUICK_SEARCH_SOURCES
 from app.schemas.campaign import CampaignResponse
 from app.schemas.purchase_request import PurchaseRequestResponse
 from datetime import datetime
@@ -328,81 +328,37 @@ async def get_search_suggestions(
 @router.get("/quick")
 async def quick_search(
     q: str = Query(..., min_length=1, description="검색어"),
-    type: Optional[Literal["campaigns", "purchase_requests", "all"]] = Query("all", description="검색 대상"),
+    type: Optional[Literal["campaigns", "posts", "purchase_requests", "products", "board_posts", "all"]] = Query("all", description="검색 대상"),
     limit: int = Query(5, ge=1, le=20, description="각 타입별 최대 결과 수"),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_async_db)
+    current_user: User = Depends(get_current_active_user)
 ):
     """
     빠른 검색 (통합 검색)
     
     - **q**: 검색어
-    - **type**: 검색 대상 (campaigns, purchase_requests, all)
+    - **type**: 검색 대상 (campaigns, posts, purchase_requests, products, board_posts, all)
     - **limit**: 각 타입별 최대 결과 수
     
-    여러 데이터 타입에서 동시에 검색하여 통합 결과를 반환합니다.
+    각 데이터 타입을 별도 DB 세션에서 동시에 검색하여 통합 결과를 반환합니다.
+    소스별 제한 시간을 넘긴 타입은 `timed_out: true`로 표시되고 나머지 결과는 그대로 반환됩니다.
     """
     try:
-        results = {}
-        
-        # 캠페인 검색
-        if type in ["campaigns", "all"]:
-            campaigns, campaign_total = await search_service.search_campaigns(
-                db=db,
-                query_text=q,
-                page=1,
-                page_size=limit,
-                include_relations=False
-            )
-            
-            results["campaigns"] = {
-                "data": [
-                    {
-                        "id": c.id,
-                        "name": c.name,
-                        "client_company": c.client_company,
-                        "status": c.status,
-                        "budget": c.budget
-                    }
-                    for c in campaigns
-                ],
-                "total": campaign_total,
-                "type": "campaigns"
-            }
-        
-        # 구매요청 검색
-        if type in ["purchase_requests", "all"]:
-            requests, request_total = await search_service.search_purchase_requests(
-                db=db,
-                query_text=q,
-                page=1,
-                page_size=limit,
-                include_relations=False
-            )
-            
-            results["purchase_requests"] = {
-                "data": [
-                    {
-                        "id": r.id,
-                        "title": r.title,
-                        "category": r.category,
-                        "status": r.status,
-                        "total_amount": r.total_amount
-                    }
-                    for r in requests
-                ],
-                "total": request_total,
-                "type": "purchase_requests"
-            }
-        
-        # 전체 결과 수 계산
-        total_results = sum(result.get("total", 0) for result in results.values())
+        sources = list(QUICK_SEARCH_SOURCES) if type == "all" else [type]
+        search_result = await search_service.quick_search(
+            query_text=q,
+            sources=sources,
+            user=current_user,
+            limit=limit
+        )
         
         return {
             "query": q,
-            "results": results,
-            "total_results": total_results,
-            "search_time": "< 1s"  # 실제로는 측정할 수 있음
+            "results": search_result["results"],
+            "total_results": search_result["total_results"],
+            "partial": search_result["partial"],
+            "search_time": f"{search_result['search_time_ms'] / 1000:.3f}s",
+            "search_time_ms": search_result["search_time_ms"],
+            "source_timings_ms": search_result["source_timings_ms"]
         }
         
     except Exception as e:
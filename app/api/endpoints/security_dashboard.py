@@ -7,12 +7,14 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from app.security.vulnerability_scanner import vulnerability_scanner
 from app.security.audit_logger import audit_logger, AuditEventType, AuditSeverity
 from app.api.deps import get_current_active_user
+from app.db.database import get_async_db
 from app.models.user import User
 
 router = APIRouter()
@@ -26,6 +28,7 @@ async def get_security_overview():
     return {
         "security_threats": security_report,
         "audit_summary": audit_summary,
+        "audit_sink": audit_logger.sink_stats,
         "system_status": "operational",
         "last_updated": datetime.now().isoformat()
     }
@@ -56,7 +59,8 @@ async def get_audit_events(
     user_email: Optional[str] = Query(None, description="사용자 이메일"),
     severity: Optional[str] = Query(None, description="심각도"),
     resource_type: Optional[str] = Query(None, description="리소스 유형"),
-    limit: int = Query(100, ge=1, le=500, description="조회할 이벤트 수")
+    limit: int = Query(100, ge=1, le=500, description="조회할 이벤트 수"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """감사 로그 이벤트 조회"""
     
@@ -76,7 +80,8 @@ async def get_audit_events(
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid severity: {severity}")
     
-    events = audit_logger.get_events(
+    events = await audit_logger.get_events(
+        db,
         event_type=event_type_enum,
         user_email=user_email,
         severity=severity_enum,
@@ -88,8 +93,8 @@ async def get_audit_events(
     return [
         {
             "event_id": event.event_id,
-            "event_type": event.event_type.value,
-            "severity": event.severity.value,
+            "event_type": event.event_type,
+            "severity": event.severity,
             "user_id": event.user_id,
             "user_email": event.user_email,
             "user_role": event.user_role,
@@ -109,26 +114,29 @@ async def get_audit_events(
 @router.get("/audit/user-activity/{user_email}", response_model=Dict)
 async def get_user_activity(
     user_email: str,
-    days: int = Query(7, ge=1, le=90, description="조회할 일수")
+    days: int = Query(7, ge=1, le=90, description="조회할 일수"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """특정 사용자 활동 분석"""
-    return audit_logger.get_user_activity_summary(user_email, days)
+    return await audit_logger.get_user_activity_summary(db, user_email, days)
 
 @router.get("/security/compliance-report", response_model=Dict)
-async def get_compliance_report():
+async def get_compliance_report(db: AsyncSession = Depends(get_async_db)):
     """규정 준수 리포트"""
-    return audit_logger.generate_compliance_report()
+    return await audit_logger.generate_compliance_report(db)
 
 @router.get("/security/alerts", response_model=List[Dict])
 async def get_security_alerts(
     severity: Optional[str] = Query(None, description="경고 심각도"),
-    limit: int = Query(20, ge=1, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """보안 경고 목록"""
     # 보안 이벤트 중 경고성 이벤트만 필터링
     severity_filter = AuditSeverity(severity) if severity else None
     
-    events = audit_logger.get_events(
+    events = await audit_logger.get_events(
+        db,
         event_type=AuditEventType.SECURITY_THREAT,
         severity=severity_filter,
         limit=limit
@@ -139,7 +147,7 @@ async def get_security_alerts(
         alerts.append({
             "alert_id": event.event_id,
             "type": event.action,
-            "severity": event.severity.value,
+            "severity": event.severity,
             "user_ip": event.user_ip,
             "message": f"Security threat detected: {event.action}",
             "details": event.details,
@@ -151,62 +159,11 @@ async def get_security_alerts(
 
 @router.get("/audit/statistics", response_model=Dict)
 async def get_audit_statistics(
-    days: int = Query(30, ge=1, le=365, description="통계 기간(일)")
+    days: int = Query(30, ge=1, le=365, description="통계 기간(일)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """감사 통계"""
-    cutoff_date = datetime.now() - timedelta(days=days)
-    
-    # 기간 내 이벤트 필터링
-    events = [
-        e for e in audit_logger.events 
-        if e.timestamp >= cutoff_date
-    ]
-    
-    # 통계 계산
-    stats = {
-        'period_days': days,
-        'total_events': len(events),
-        'events_by_type': {},
-        'events_by_severity': {},
-        'events_by_day': {},
-        'active_users': set(),
-        'top_endpoints': {},
-        'security_incidents': 0
-    }
-    
-    for event in events:
-        # 타입별 집계
-        event_type = event.event_type.value
-        stats['events_by_type'][event_type] = stats['events_by_type'].get(event_type, 0) + 1
-        
-        # 심각도별 집계
-        severity = event.severity.value
-        stats['events_by_severity'][severity] = stats['events_by_severity'].get(severity, 0) + 1
-        
-        # 일별 집계
-        day = event.timestamp.date().isoformat()
-        stats['events_by_day'][day] = stats['events_by_day'].get(day, 0) + 1
-        
-        # 활성 사용자
-        if event.user_email:
-            stats['active_users'].add(event.user_email)
-        
-        # 엔드포인트별 집계
-        if event.endpoint:
-            stats['top_endpoints'][event.endpoint] = stats['top_endpoints'].get(event.endpoint, 0) + 1
-        
-        # 보안 사고 카운트
-        if event.event_type in [AuditEventType.SECURITY_THREAT, AuditEventType.SECURITY_VIOLATION]:
-            stats['security_incidents'] += 1
-    
-    # 집합을 개수로 변환
-    stats['active_users'] = len(stats['active_users'])
-    
-    # 상위 엔드포인트만 반환 (상위 10개)
-    top_endpoints = sorted(stats['top_endpoints'].items(), key=lambda x: x[1], reverse=True)[:10]
-    stats['top_endpoints'] = dict(top_endpoints)
-    
-    return stats
+    return await audit_logger.get_statistics(db, days)
 
 @router.post("/security/threats/resolve/{threat_id}")
 async def resolve_security_threat(
@@ -1,21 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.core.security import get_current_user
 from app.models.user import User, UserRole
 from app.models.system_setting import SystemSetting, SettingCategory, SettingType, AccessLevel
-from app.services.company_settings import (
-    get_user_company,
-    get_company_settings,
-    get_company_setting_value,
-    set_company_setting,
-    get_company_info_dict,
-    can_user_edit_company_settings
-)
 from app.schemas.system_setting import (
     SystemSettingCreate,
     SystemSettingUpdate,
@@ -45,6 +37,22 @@ def check_setting_access(user: User, setting: SystemSetting, operation: str = "r
     return False
 
 
+def _access_filters(user: User) -> list:
+    """권한별 조회 조건 (슈퍼 어드민은 제한 없음)"""
+    if user.role == UserRole.SUPER_ADMIN:
+        return []
+    if user.role in [UserRole.AGENCY_ADMIN]:
+        # 어드민은 슈퍼 어드민 전용 설정 제외
+        return [SystemSetting.access_level != AccessLevel.SUPER_ADMIN]
+    # 일반 사용자는 USER 레벨만 조회 가능
+    return [SystemSetting.access_level == AccessLevel.USER]
+
+
+async def _get_setting(db: AsyncSession, setting_key: str) -> Optional[SystemSetting]:
+    result = await db.execute(select(SystemSetting).where(SystemSetting.setting_key == setting_key))
+    return result.scalar_one_or_none()
+
+
 @router.get("/", response_model=SystemSettingListResponse)
 async def get_system_settings(
     category: Optional[SettingCategory] = Query(None, description="카테고리별 필터"),
@@ -53,48 +61,45 @@ async def get_system_settings(
     search: Optional[str] = Query(None, description="설정명/키 검색"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(50, ge=1, le=100, description="페이지 크기"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """시스템 설정 목록 조회"""
 
-    # 기본 쿼리
-    query = db.query(SystemSetting)
-
     # 필터 적용
+    filters = []
     if category:
-        query = query.filter(SystemSetting.category == category)
+        filters.append(SystemSetting.category == category)
 
     if access_level:
-        query = query.filter(SystemSetting.access_level == access_level)
+        filters.append(SystemSetting.access_level == access_level)
 
     if is_active is not None:
-        query = query.filter(SystemSetting.is_active == is_active)
+        filters.append(SystemSetting.is_active == is_active)
 
     if search:
         search_filter = f"%{search}%"
-        query = query.filter(
+        filters.append(
             (SystemSetting.setting_key.ilike(search_filter)) |
             (SystemSetting.display_name.ilike(search_filter))
         )
 
     # 권한 필터링 (슈퍼 어드민이 아닌 경우)
-    if user.role != UserRole.SUPER_ADMIN:
-        if user.role in [UserRole.AGENCY_ADMIN]:
-            # 어드민은 슈퍼 어드민 전용 설정 제외
-            query = query.filter(SystemSetting.access_level != AccessLevel.SUPER_ADMIN)
-        else:
-            # 일반 사용자는 USER 레벨만 조회 가능
-            query = query.filter(SystemSetting.access_level == AccessLevel.USER)
+    filters.extend(_access_filters(user))
 
     # 총 개수 계산
-    total = query.count()
+    total = (await db.execute(
+        select(func.count(SystemSetting.id)).where(*filters)
+    )).scalar()
 
     # 페이징 및 정렬
-    settings = query.order_by(
-        SystemSetting.category,
-        SystemSetting.setting_key
-    ).offset((page - 1) * size).limit(size).all()
+    result = await db.execute(
+        select(SystemSetting).where(*filters).order_by(
+            SystemSetting.category,
+            SystemSetting.setting_key
+        ).offset((page - 1) * size).limit(size)
+    )
+    settings = result.scalars().all()
 
     return SystemSettingListResponse(
         total=total,
@@ -104,53 +109,35 @@ async def get_system_settings(
 
 @router.get("/stats", response_model=SystemSettingStats)
 async def get_system_settings_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """시스템 설정 통계"""
 
-    base_query = db.query(SystemSetting)
-
     # 권한 필터링
-    if user.role != UserRole.SUPER_ADMIN:
-        if user.role in [UserRole.AGENCY_ADMIN]:
-            base_query = base_query.filter(SystemSetting.access_level != AccessLevel.SUPER_ADMIN)
-        else:
-            base_query = base_query.filter(SystemSetting.access_level == AccessLevel.USER)
-
-    # 기본 통계
-    total_settings = base_query.count()
-    active_settings = base_query.filter(SystemSetting.is_active == True).count()
-
-    # 카테고리별 통계
-    category_stats = dict(
-        base_query.with_entities(
-            SystemSetting.category,
-            func.count(SystemSetting.id)
-        ).group_by(SystemSetting.category).all()
-    )
+    filters = _access_filters(user)
 
-    # 접근 레벨별 통계
-    access_level_stats = dict(
-        base_query.with_entities(
-            SystemSetting.access_level,
-            func.count(SystemSetting.id)
-        ).group_by(SystemSetting.access_level).all()
-    )
-
-    # 타입별 통계
-    type_stats = dict(
-        base_query.with_entities(
-            SystemSetting.setting_type,
-            func.count(SystemSetting.id)
-        ).group_by(SystemSetting.setting_type).all()
-    )
-
-    # 오늘 수정된 설정 수
+    # 기본 통계 (전체/활성/오늘 수정 - 한 번에 집계)
     today = date.today()
-    modified_today = base_query.filter(
-        func.date(SystemSetting.updated_at) == today
-    ).count()
+    totals = (await db.execute(
+        select(
+            func.count(SystemSetting.id),
+            func.count(SystemSetting.id).filter(SystemSetting.is_active == True),
+            func.count(SystemSetting.id).filter(func.date(SystemSetting.updated_at) == today),
+        ).where(*filters)
+    )).one()
+    total_settings, active_settings, modified_today = totals
+
+    async def group_counts(column) -> dict:
+        result = await db.execute(
+            select(column, func.count(SystemSetting.id)).where(*filters).group_by(column)
+        )
+        return dict(result.all())
+
+    # 카테고리별 / 접근 레벨별 / 타입별 통계
+    category_stats = await group_counts(SystemSetting.category)
+    access_level_stats = await group_counts(SystemSetting.access_level)
+    type_stats = await group_counts(SystemSetting.setting_type)
 
     return SystemSettingStats(
         total_settings=total_settings,
@@ -165,14 +152,12 @@ async def get_system_settings_stats(
 @router.get("/{setting_key}", response_model=SystemSettingResponse)
 async def get_system_setting(
     setting_key: str = Path(..., description="설정 키"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """특정 시스템 설정 조회"""
 
-    setting = db.query(SystemSetting).filter(
-        SystemSetting.setting_key == setting_key
-    ).first()
+    setting = await _get_setting(db, setting_key)
 
     if not setting:
         raise HTTPException(status_code=404, detail="설정을 찾을 수 없습니다")
@@ -186,7 +171,7 @@ async def get_system_setting(
 @router.post("/", response_model=SystemSettingResponse)
 async def create_system_setting(
     setting_data: SystemSettingCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """새 시스템 설정 생성"""
@@ -200,9 +185,7 @@ async def create_system_setting(
         raise HTTPException(status_code=403, detail="슈퍼 어드민 전용 설정을 생성할 권한이 없습니다")
 
     # 중복 키 확인
-    existing = db.query(SystemSetting).filter(
-        SystemSetting.setting_key == setting_data.setting_key
-    ).first()
+    existing = await _get_setting(db, setting_data.setting_key)
 
     if existing:
         raise HTTPException(status_code=400, detail="이미 존재하는 설정 키입니다")
@@ -214,8 +197,8 @@ async def create_system_setting(
     )
 
     db.add(setting)
-    db.commit()
-    db.refresh(setting)
+    await db.commit()
+    await db.refresh(setting)
 
     return setting
 
@@ -224,14 +207,12 @@ async def create_system_setting(
 async def update_system_setting(
     setting_key: str = Path(..., description="설정 키"),
     setting_data: SystemSettingUpdate = Body(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """시스템 설정 수정"""
 
-    setting = db.query(SystemSetting).filter(
-        SystemSetting.setting_key == setting_key
-    ).first()
+    setting = await _get_setting(db, setting_key)
 
     if not setting:
         raise HTTPException(status_code=404, detail="설정을 찾을 수 없습니다")
@@ -257,8 +238,8 @@ async def update_system_setting(
     setting.modified_by = user.id
     setting.updated_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(setting)
+    await db.commit()
+    await db.refresh(setting)
 
     return setting
 
@@ -266,7 +247,7 @@ async def update_system_setting(
 @router.post("/bulk-update")
 async def bulk_update_settings(
     bulk_data: SystemSettingBulkUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """여러 설정 일괄 업데이트"""
@@ -277,11 +258,15 @@ async def bulk_update_settings(
     updated_settings = []
     errors = []
 
+    # 대상 설정 한 번에 조회
+    result = await db.execute(
+        select(SystemSetting).where(SystemSetting.setting_key.in_(list(bulk_data.settings)))
+    )
+    settings_by_key = {setting.setting_key: setting for setting in result.scalars().all()}
+
     for setting_key, new_value in bulk_data.settings.items():
         try:
-            setting = db.query(SystemSetting).filter(
-                SystemSetting.setting_key == setting_key
-            ).first()
+            setting = settings_by_key.get(setting_key)
 
             if not setting:
                 errors.append(f"설정 '{setting_key}'를 찾을 수 없습니다")
@@ -318,7 +303,7 @@ async def bulk_update_settings(
             errors.append(f"설정 '{setting_key}' 업데이트 중 오류: {str(e)}")
 
     if updated_settings:
-        db.commit()
+        await db.commit()
 
     return {
         "success": True,
@@ -332,7 +317,7 @@ async def bulk_update_settings(
 @router.delete("/{setting_key}")
 async def delete_system_setting(
     setting_key: str = Path(..., description="설정 키"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """시스템 설정 삭제"""
@@ -340,9 +325,7 @@ async def delete_system_setting(
     if user.role != UserRole.SUPER_ADMIN:
         raise HTTPException(status_code=403, detail="설정 삭제는 슈퍼 어드민만 가능합니다")
 
-    setting = db.query(SystemSetting).filter(
-        SystemSetting.setting_key == setting_key
-    ).first()
+    setting = await _get_setting(db, setting_key)
 
     if not setting:
         raise HTTPException(status_code=404, detail="설정을 찾을 수 없습니다")
@@ -350,8 +333,8 @@ async def delete_system_setting(
     if setting.is_system_default:
         raise HTTPException(status_code=400, detail="시스템 기본 설정은 삭제할 수 없습니다")
 
-    db.delete(setting)
-    db.commit()
+    await db.delete(setting)
+    await db.commit()
 
     return {"message": f"설정 '{setting_key}'가 삭제되었습니다"}
 
@@ -361,14 +344,12 @@ async def delete_system_setting(
 @router.post("/reset/{setting_key}")
 async def reset_setting_to_default(
     setting_key: str = Path(..., description="설정 키"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user)
 ):
     """설정을 기본값으로 초기화"""
 
-    setting = db.query(SystemSetting).filter(
-        SystemSetting.setting_key == setting_key
-    ).first()
+    setting = await _get_setting(db, setting_key)
 
     if not setting:
         raise HTTPException(status_code=404, detail="설정을 찾을 수 없습니다")
@@ -380,7 +361,7 @@ async def reset_setting_to_default(
     setting.modified_by = user.id
     setting.updated_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(setting)
+    await db.commit()
+    await db.refresh(setting)
 
     return setting
\ No newline at end of file
@@ -9,7 +9,10 @@ from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from app.services.user_service import UserService
 from app.api.deps import get_current_active_user
 from app.models.user import User, UserRole
-from app.core.security import get_password_hash
+from app.core.security import hash_password_async
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -208,7 +211,7 @@ async def get_clients(
         user_id = current_user.id
         user_role = current_user.role.value
         
-        print(f"[USERS-CLIENTS-JWT] User: {current_user.name}, Role: {user_role}, Company: {current_user.company}")
+        logger.debug("[USERS-CLIENTS-JWT] User: %s, Role: %s, Company: %s", current_user.name, user_role, current_user.company)
         
         # 클라이언트만 필터링
         query = select(User).where(User.role == UserRole.CLIENT)
@@ -245,7 +248,7 @@ async def get_clients(
         result = await db.execute(query)
         clients = result.scalars().all()
         
-        print(f"[USERS-CLIENTS-JWT] Found {len(clients)} clients")
+        logger.debug("[USERS-CLIENTS-JWT] Found %s clients", len(clients))
         return clients
 
 
@@ -344,7 +347,7 @@ async def create_user(
             raise HTTPException(status_code=400, detail="이미 존재하는 이메일입니다")
         
         # 새 사용자 생성 (Pydantic validator에서 이미 역할명 변환됨)
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
 
         new_user = User(
             name=user_data.name,
@@ -471,7 +474,7 @@ async def update_user(
             for field, value in update_data.items():
                 if field == 'password' and value:
                     # 비밀번호는 해시화해서 저장
-                    setattr(user, 'hashed_password', get_password_hash(value))
+                    setattr(user, 'hashed_password', await hash_password_async(value))
                 elif hasattr(user, field):
                     setattr(user, field, value)
                 elif field in ['client_company_name', 'client_business_number', 'client_ceo_name',
@@ -484,14 +487,14 @@ async def update_user(
 
             return user
         except OperationalError as e:
-            print(f"데이터베이스 연결 오류: {str(e)}")
+            logger.debug("데이터베이스 연결 오류: %s", str(e))
             raise HTTPException(
                 status_code=500,
                 detail="데이터베이스 연결에 문제가 있습니다. 잠시 후 다시 시도해주세요."
             )
         except Exception as e:
             await db.rollback()
-            print(f"사용자 정보 수정 중 오류: {str(e)}")
+            logger.debug("사용자 정보 수정 중 오류: %s", str(e))
             raise HTTPException(
                 status_code=500,
                 detail="사용자 정보 수정 중 오류가 발생했습니다."
@@ -499,43 +502,43 @@ async def update_user(
     else:
         # 기존 API 모드 (JWT 토큰 기반)
         try:
-            print(f"[DEBUG] JWT 모드로 사용자 {user_id} 수정 시작")
+            logger.debug("[DEBUG] JWT 모드로 사용자 %s 수정 시작", user_id)
             current_user = jwt_user
-            print(f"[DEBUG] 현재 사용자: {current_user.id}, 역할: {current_user.role}")
+            logger.debug("[DEBUG] 현재 사용자: %s, 역할: %s", current_user.id, current_user.role)
             service = UserService(db)
 
             # 사용자 존재 확인
-            print(f"[DEBUG] 사용자 {user_id} 조회 중...")
+            logger.debug("[DEBUG] 사용자 %s 조회 중...", user_id)
             user = await service.get_user_by_id(user_id)
             if not user:
-                print(f"[DEBUG] 사용자 {user_id} 찾을 수 없음")
+                logger.debug("[DEBUG] 사용자 %s 찾을 수 없음", user_id)
                 raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-            print(f"[DEBUG] 사용자 {user_id} 찾음: {user.name}")
+            logger.debug("[DEBUG] 사용자 %s 찾음: %s", user_id, user.name)
 
             # 권한 확인
-            print(f"[DEBUG] 권한 확인 중...")
+            logger.debug("[DEBUG] 권한 확인 중...")
             if not service.can_update_user(current_user, user):
-                print(f"[DEBUG] 권한 없음")
+                logger.debug("[DEBUG] 권한 없음")
                 raise HTTPException(status_code=403, detail="사용자 수정 권한이 없습니다.")
-            print(f"[DEBUG] 권한 확인 완료")
+            logger.debug("[DEBUG] 권한 확인 완료")
 
             # 이메일 중복 확인 (변경하는 경우)
             if user_data.email and user_data.email != user.email:
-                print(f"[DEBUG] 이메일 중복 확인: {user_data.email}")
+                logger.debug("[DEBUG] 이메일 중복 확인: %s", user_data.email)
                 existing_user = await service.get_user_by_email(user_data.email)
                 if existing_user:
-                    print(f"[DEBUG] 이메일 중복됨")
+                    logger.debug("[DEBUG] 이메일 중복됨")
                     raise HTTPException(status_code=400, detail="이미 존재하는 이메일입니다.")
-                print(f"[DEBUG] 이메일 사용 가능")
+                logger.debug("[DEBUG] 이메일 사용 가능")
 
-            print(f"[DEBUG] 사용자 업데이트 시작...")
-            print(f"[DEBUG] 업데이트 데이터: {user_data.model_dump(exclude_unset=True)}")
+            logger.debug("[DEBUG] 사용자 업데이트 시작...")
+            logger.debug("[DEBUG] 업데이트 데이터: %s", user_data.model_dump(exclude_unset=True))
             result = await service.update_user(user_id, user_data)
-            print(f"[DEBUG] 사용자 업데이트 완료")
+            logger.debug("[DEBUG] 사용자 업데이트 완료")
             return result
         except OperationalError as e:
             # PostgreSQL 연결 오류 처리
-            print(f"데이터베이스 연결 오류: {str(e)}")
+            logger.debug("데이터베이스 연결 오류: %s", str(e))
             raise HTTPException(
                 status_code=500,
                 detail="데이터베이스 연결에 문제가 있습니다. 잠시 후 다시 시도해주세요."
@@ -544,12 +547,12 @@ async def update_user(
             # 기타 예외 처리
             import traceback
             error_details = traceback.format_exc()
-            print(f"=== 사용자 업데이트 오류 상세 ===")
-            print(f"에러 타입: {type(e).__name__}")
-            print(f"에러 메시지: {str(e)}")
-            print(f"스택 트레이스:\n{error_details}")
-            print(f"업데이트 데이터: {user_data.model_dump(exclude_unset=True)}")
-            print(f"===============================")
+            logger.debug("=== 사용자 업데이트 오류 상세 ===")
+            logger.debug("에러 타입: %s", type(e).__name__)
+            logger.debug("에러 메시지: %s", str(e))
+            logger.debug("스택 트레이스:\n%s", error_details)
+            logger.debug("업데이트 데이터: %s", user_data.model_dump(exclude_unset=True))
+            logger.debug("===============================")
             raise HTTPException(
                 status_code=500,
                 detail=f"사용자 정보 수정 중 오류가 발생했습니다: {str(e)}"
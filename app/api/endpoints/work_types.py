@@ -9,6 +9,9 @@ from app.db.database import get_async_db
 from app.api.deps import get_current_active_user
 from app.models.user import User, UserRole
 from app.models.work_type import WorkType
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -79,11 +82,11 @@ async def get_work_types(
                 WorkType.is_active == True,
                 (WorkType.company == user_company) | (WorkType.company.is_(None))
             )
-            print(f"[WORK-TYPES] Using company filtering for user company: {user_company}")
+            logger.debug("[WORK-TYPES] Using company filtering for user company: %s", user_company)
         else:
             # company 컬럼이 없는 경우 fallback
             query = select(WorkType).where(WorkType.is_active == True)
-            print(f"[WORK-TYPES] Company column not found, using fallback query")
+            logger.debug("[WORK-TYPES] Company column not found, using fallback query")
         query = query.order_by(WorkType.sort_order.asc(), WorkType.id.asc())
         result = await db.execute(query)
         work_types = result.scalars().all()
@@ -104,7 +107,7 @@ async def get_work_types(
     else:
         # 기존 API 모드 (JWT 토큰 기반)
         current_user = jwt_user
-        print(f"[WORK-TYPES-LIST-JWT] Request from user_id={current_user.id}, user_role={current_user.role}")
+        logger.debug("[WORK-TYPES-LIST-JWT] Request from user_id=%s, user_role=%s", current_user.id, current_user.role)
 
         try:
             # JWT 기반 작업 유형 목록 조회 (회사별 필터링 - 스키마 체크)
@@ -126,17 +129,17 @@ async def get_work_types(
                     WorkType.is_active == True,
                     (WorkType.company == user_company) | (WorkType.company.is_(None))
                 )
-                print(f"[WORK-TYPES-JWT] Using company filtering for user company: {user_company}")
+                logger.debug("[WORK-TYPES-JWT] Using company filtering for user company: %s", user_company)
             else:
                 # company 컬럼이 없는 경우 fallback
                 query = select(WorkType).where(WorkType.is_active == True)
-                print(f"[WORK-TYPES-JWT] Company column not found, using fallback query")
+                logger.debug("[WORK-TYPES-JWT] Company column not found, using fallback query")
             result = await db.execute(query)
             work_types = result.scalars().all()
 
             # work_types 테이블에서 직접 조회 (하드코딩 제거)
 
-            print(f"[WORK-TYPES-LIST-JWT] SUCCESS: Found {len(work_types)} work types for user {current_user.id}")
+            logger.debug("[WORK-TYPES-LIST-JWT] SUCCESS: Found %s work types for user %s", len(work_types), current_user.id)
 
             return [
                 {
@@ -152,7 +155,7 @@ async def get_work_types(
             ]
             
         except Exception as e:
-            print(f"[WORK-TYPES-LIST-JWT] Unexpected error: {type(e).__name__}: {e}")
+            logger.error("[WORK-TYPES-LIST-JWT] Unexpected error: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"작업 유형 조회 중 오류: {str(e)}")
 
 
@@ -168,7 +171,7 @@ async def create_work_type(
     jwt_user: User = Depends(get_current_active_user)
 ):
     """새 작업 유형 생성"""
-    print(f"[WORK-TYPE-CREATE] Creating work type: {work_type_data.dict()}")
+    logger.debug("[WORK-TYPE-CREATE] Creating work type: %s", work_type_data.dict())
 
     # Node.js API 호환 모드인지 확인
     if viewerId is not None or adminId is not None:
@@ -200,7 +203,7 @@ async def create_work_type(
         if not is_admin:
             raise HTTPException(status_code=403, detail="작업 유형 생성 권한이 없습니다")
 
-        print(f"[WORK-TYPE-CREATE] Node.js API mode - user_id={user_id}, role={user_role}")
+        logger.debug("[WORK-TYPE-CREATE] Node.js API mode - user_id=%s, role=%s", user_id, user_role)
 
     else:
         # JWT 기반 모드
@@ -211,7 +214,7 @@ async def create_work_type(
         if current_user.role not in [UserRole.SUPER_ADMIN, UserRole.AGENCY_ADMIN]:
             raise HTTPException(status_code=403, detail="작업 유형 생성 권한이 없습니다")
 
-        print(f"[WORK-TYPE-CREATE] JWT mode - user_id={current_user.id}, role={user_role}")
+        logger.debug("[WORK-TYPE-CREATE] JWT mode - user_id=%s, role=%s", current_user.id, user_role)
 
     try:
         # company 컬럼 존재 여부 확인
@@ -248,7 +251,7 @@ async def create_work_type(
                 company=user_company,
                 is_active=True
             )
-            print(f"[WORK-TYPE-CREATE] Creating with company: {user_company}")
+            logger.debug("[WORK-TYPE-CREATE] Creating with company: %s", user_company)
         else:
             # company 컬럼이 없는 경우 fallback
             existing_query = select(WorkType).where(
@@ -269,13 +272,13 @@ async def create_work_type(
                 sort_order=work_type_data.sortOrder or 0,
                 is_active=True
             )
-            print(f"[WORK-TYPE-CREATE] Creating without company column (fallback mode)")
+            logger.debug("[WORK-TYPE-CREATE] Creating without company column (fallback mode)")
 
         db.add(new_work_type)
         await db.commit()
         await db.refresh(new_work_type)
 
-        print(f"[WORK-TYPE-CREATE] SUCCESS: Created work type {new_work_type.id} by user {current_user.id}")
+        logger.debug("[WORK-TYPE-CREATE] SUCCESS: Created work type %s by user %s", new_work_type.id, current_user.id)
 
         return {
             "id": new_work_type.id,
@@ -291,7 +294,7 @@ async def create_work_type(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[WORK-TYPE-CREATE] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[WORK-TYPE-CREATE] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"작업 유형 생성 중 오류: {str(e)}")
 
@@ -309,7 +312,7 @@ async def update_work_type(
     jwt_user: User = Depends(get_current_active_user)
 ):
     """작업 유형 수정 (이름, 설명, 활성화 상태)"""
-    print(f"[WORK-TYPE-UPDATE] Updating work type {work_type_id}: {work_type_data.dict(exclude_unset=True)}")
+    logger.debug("[WORK-TYPE-UPDATE] Updating work type %s: %s", work_type_id, work_type_data.dict(exclude_unset=True))
 
     # Node.js API 호환 모드인지 확인
     if viewerId is not None or adminId is not None:
@@ -341,7 +344,7 @@ async def update_work_type(
         if not is_admin:
             raise HTTPException(status_code=403, detail="작업 유형 수정 권한이 없습니다")
 
-        print(f"[WORK-TYPE-UPDATE] Node.js API mode - user_id={user_id}, role={user_role}")
+        logger.debug("[WORK-TYPE-UPDATE] Node.js API mode - user_id=%s, role=%s", user_id, user_role)
 
     else:
         # JWT 기반 모드
@@ -352,7 +355,7 @@ async def update_work_type(
         if current_user.role not in [UserRole.SUPER_ADMIN, UserRole.AGENCY_ADMIN]:
             raise HTTPException(status_code=403, detail="작업 유형 수정 권한이 없습니다")
 
-        print(f"[WORK-TYPE-UPDATE] JWT mode - user_id={current_user.id}, role={user_role}")
+        logger.debug("[WORK-TYPE-UPDATE] JWT mode - user_id=%s, role=%s", current_user.id, user_role)
 
     try:
         # 작업 유형 조회 (is_active 조건 제거 - 비활성 상태도 수정 가능)
@@ -371,12 +374,12 @@ async def update_work_type(
             db_field = field_mapping.get(field, field)
             if hasattr(work_type, db_field):
                 setattr(work_type, db_field, value)
-                print(f"[WORK-TYPE-UPDATE] Updated {db_field}: {value}")
+                logger.debug("[WORK-TYPE-UPDATE] Updated %s: %s", db_field, value)
 
         await db.commit()
         await db.refresh(work_type)
 
-        print(f"[WORK-TYPE-UPDATE] SUCCESS: Updated work type {work_type_id} by user {current_user.id}")
+        logger.debug("[WORK-TYPE-UPDATE] SUCCESS: Updated work type %s by user %s", work_type_id, current_user.id)
 
         return {
             "id": work_type.id,
@@ -392,7 +395,7 @@ async def update_work_type(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[WORK-TYPE-UPDATE] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[WORK-TYPE-UPDATE] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"작업 유형 수정 중 오류: {str(e)}")
 
@@ -409,7 +412,7 @@ async def delete_work_type(
     jwt_user: User = Depends(get_current_active_user)
 ):
     """작업 유형 삭제 (소프트 삭제 - is_active를 False로 변경)"""
-    print(f"[WORK-TYPE-DELETE] Deleting work type: {work_type_id}")
+    logger.debug("[WORK-TYPE-DELETE] Deleting work type: %s", work_type_id)
 
     # Node.js API 호환 모드인지 확인
     if viewerId is not None or adminId is not None:
@@ -441,7 +444,7 @@ async def delete_work_type(
         if not is_admin:
             raise HTTPException(status_code=403, detail="작업 유형 삭제 권한이 없습니다")
 
-        print(f"[WORK-TYPE-DELETE] Node.js API mode - user_id={user_id}, role={user_role}")
+        logger.debug("[WORK-TYPE-DELETE] Node.js API mode - user_id=%s, role=%s", user_id, user_role)
 
     else:
         # JWT 기반 모드
@@ -452,7 +455,7 @@ async def delete_work_type(
         if current_user.role not in [UserRole.SUPER_ADMIN, UserRole.AGENCY_ADMIN]:
             raise HTTPException(status_code=403, detail="작업 유형 삭제 권한이 없습니다")
 
-        print(f"[WORK-TYPE-DELETE] JWT mode - user_id={current_user.id}, role={user_role}")
+        logger.debug("[WORK-TYPE-DELETE] JWT mode - user_id=%s, role=%s", current_user.id, user_role)
 
     try:
         # 작업 유형 조회
@@ -468,7 +471,7 @@ async def delete_work_type(
 
         await db.commit()
 
-        print(f"[WORK-TYPE-DELETE] SUCCESS: Soft deleted work type {work_type_id} by user {current_user.id}")
+        logger.debug("[WORK-TYPE-DELETE] SUCCESS: Soft deleted work type %s by user %s", work_type_id, current_user.id)
 
         # 204 No Content 응답 (body 없음)
         return
@@ -476,6 +479,6 @@ async def delete_work_type(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[WORK-TYPE-DELETE] Unexpected error: {type(e).__name__}: {e}")
+        logger.error("[WORK-TYPE-DELETE] Unexpected error: %s: %s", type(e).__name__, e)
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"작업 유형 삭제 중 오류: {str(e)}")
\ No newline at end of file
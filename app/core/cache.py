@@ -3,19 +3,27 @@ Simple in-memory cache for BrandFlow API
 """
 
 import time
+from collections import OrderedDict
 from typing import Any, Optional, Dict, Tuple
 import asyncio
 from functools import wraps
 import json
 import hashlib
 
+from app.core.config import settings
+
 
 class SimpleCache:
-    """간단한 인메모리 캐시"""
+    """간단한 인메모리 캐시 (항목 수 상한 + LRU 제거)"""
     
-    def __init__(self, default_ttl: int = 300):  # 5분 기본 TTL
-        self.cache: Dict[str, Tuple[Any, float]] = {}  # key: (value, expiry_time)
+    def __init__(self, default_ttl: int = 300, max_entries: int = 10000):  # 5분 기본 TTL
+        # key: (value, expiry_time) - 조회 순서를 유지해 가장 오래 안 쓰인 항목부터 제거
+        self.cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
         self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
         self._lock = asyncio.Lock()
     
     async def get(self, key: str) -> Optional[Any]:
@@ -24,18 +32,25 @@ class SimpleCache:
             if key in self.cache:
                 value, expiry_time = self.cache[key]
                 if time.time() < expiry_time:
+                    self.cache.move_to_end(key)
+                    self.hits += 1
                     return value
                 else:
                     # 만료된 항목 삭제
                     del self.cache[key]
+            self.misses += 1
             return None
     
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """캐시에 값 설정"""
+        """캐시에 값 설정 (상한 초과 시 LRU 항목 제거)"""
         async with self._lock:
             ttl = ttl or self.default_ttl
             expiry_time = time.time() + ttl
             self.cache[key] = (value, expiry_time)
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+                self.evictions += 1
     
     async def delete(self, key: str) -> bool:
         """캐시에서 항목 삭제"""
@@ -45,6 +60,14 @@ class SimpleCache:
                 return True
             return False
     
+    async def delete_prefix(self, prefix: str) -> int:
+        """접두사가 일치하는 항목 일괄 삭제"""
+        async with self._lock:
+            keys = [key for key in self.cache if key.startswith(prefix)]
+            for key in keys:
+                del self.cache[key]
+            return len(keys)
+    
     async def clear(self) -> None:
         """모든 캐시 삭제"""
         async with self._lock:
@@ -71,17 +94,23 @@ class SimpleCache:
             if current_time >= expiry_time
         )
         active_items = total_items - expired_items
+        lookups = self.hits + self.misses
         
         return {
             "total_items": total_items,
             "active_items": active_items,
             "expired_items": expired_items,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0.0,
+            "evictions": self.evictions,
             "memory_usage_estimate": len(str(self.cache))  # 대략적인 메모리 사용량
         }
 
 
 # 전역 캐시 인스턴스
-app_cache = SimpleCache(default_ttl=60)  # 1분 기본 TTL
+app_cache = SimpleCache(default_ttl=60, max_entries=settings.CACHE_MAX_ENTRIES)  # 1분 기본 TTL
 
 
 def cache_key(*args, **kwargs) -> str:
@@ -53,15 +53,94 @@ class Settings(BaseSettings):
 
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 480  # 8시간 (업무 시간 동안 끊김 없음)
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+
+    # 토큰 상태 저장 (app/core/token_store.py)
+    TOKEN_STATE_BACKEND: str = "database"  # database (워커 간 공유) | memory
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 2.0  # 다른 워커의 로그아웃 반영 주기
+    TOKEN_REVOCATION_BLOOM_BITS: int = 0  # 폐기 jti Bloom filter 비트 수 (예: 1048576 = 128KB), 0이면 사용 안 함
     
     # Application settings
     DEBUG: bool = False  # Production mode
 
+    # 로깅 (app/core/logging.py)
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # json | text
+    LOG_SAMPLE_RATES: str = ""  # 로거별 DEBUG/INFO 샘플링 비율 (예: "app.api.endpoints.campaigns=0.1,performance=0.5")
+    LOG_RATE_LIMIT_PER_SECOND: float = 20.0  # 로거+레벨별 초당 최대 기록 수 (0이면 제한 없음)
+    LOG_RATE_LIMIT_BURST: int = 50
+    SQL_ECHO: bool = False  # True면 모든 SQL 문장을 로깅 (개발용)
+
+    # SQL 계측 (app/db/query_metrics.py)
+    SLOW_QUERY_THRESHOLD_MS: int = 100  # 느린 쿼리 기록 기준
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10  # 한 요청에서 같은 문장이 이 횟수를 넘으면 N+1로 기록
+
     # File Storage
     UPLOAD_DIR: str = "/app/data/uploads"  # Railway Volume 마운트 경로
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
+
+    # Rate limiting (app/core/rate_limit.py)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # memory | redis (redis면 모든 워커가 한도 공유)
+    RATE_LIMIT_PER_MINUTE: int = 100  # 클라이언트(JWT subject, 없으면 IP)별
+    RATE_LIMIT_PER_SECOND: int = 10
+    RATE_LIMIT_LOGIN_PER_MINUTE: int = 10  # POST /api/auth/login* IP별
+    # 앞단 신뢰 프록시(로드밸런서) 수 - X-Forwarded-For 오른쪽에서 이 번째 항목을 클라이언트 IP로 사용
+    # 0이면 프록시 헤더를 무시하고 소켓 주소 사용 (프록시 없이 직접 노출된 경우 헤더 위조 방지)
+    TRUSTED_PROXY_HOPS: int = 0
+
+    # 비밀번호 해싱 (app/core/password_hasher.py)
+    BCRYPT_ROUNDS: int = 12  # 변경 시 기존 해시는 다음 로그인 때 자동 재해싱
+    PASSWORD_HASH_WORKERS: int = 0  # 0이면 CPU 코어 수
+    PASSWORD_HASH_MAX_PENDING: int = 0  # 0이면 워커 수 x 8, 초과 시 503
+
+    # 시작 모드: serve - 스키마 버전만 확인하고 바로 트래픽 수신 (마이그레이션은 python -m app.db.migrate)
+    #           all   - 서버 시작 시 마이그레이션/초기 데이터까지 실행 (로컬 개발용)
+    STARTUP_MODE: str = "serve"
+
+    # 엔드포인트 라우터 지연 등록 (app/core/lazy_routers.py) - false면 부팅 시 모두 등록
+    LAZY_ROUTERS: bool = True
+    LAZY_ROUTER_WARMUP: bool = True  # 준비 완료 후 남은 라우터를 백그라운드에서 등록
+    LAZY_ROUTER_WARMUP_DELAY_SECONDS: float = 1.0  # 준비 완료 후 warmup 시작까지 대기 (헬스체크 우선)
+
+    # 대시보드 통계 캐시 (역할/회사/기간별, 초)
+    DASHBOARD_STATS_CACHE_TTL: int = 60
+
+    # 인메모리 캐시 (app/core/cache.py) 항목 수 상한 - 초과 시 LRU 제거
+    CACHE_MAX_ENTRIES: int = 10000
+
+    # 회사별 설정 스냅샷 캐시 (app/services/company_settings.py) - 다른 워커의 변경이 반영되기까지 최대 지연
+    COMPANY_SETTINGS_CACHE_TTL_SECONDS: float = 300.0
+
+    # 병렬 쿼리 실행 (app/db/query_optimizer.py)
+    PARALLEL_QUERY_MAX_CONCURRENCY: int = 8  # 병렬 쿼리가 동시에 점유하는 커넥션 수 상한 (워커 단위)
+    PARALLEL_QUERY_TIMEOUT_SECONDS: float = 10.0
+
+    # 캠페인 포스트 집계 드리프트 점검 (app/services/campaign_aggregates.py)
+    CAMPAIGN_AGGREGATE_RECONCILE_SECONDS: float = 3600.0  # 0이면 비활성
+    CAMPAIGN_AGGREGATE_AUTO_FIX: bool = True  # 드리프트 발견 시 posts 기준으로 보정
+
+    # 포스트 일괄 처리 (POST /api/campaigns/{id}/posts:batch) 요청당 작업 수 상한
+    POST_BATCH_MAX_OPERATIONS: int = 500
+
+    # 다중 캠페인 복사 (POST /api/campaigns/clone) 요청당 캠페인 수 상한
+    CAMPAIGN_CLONE_MAX_CAMPAIGNS: int = 200
+
+    # 소프트 삭제 행 배치 정리 (app/services/soft_delete_purge.py)
+    # 0이면 비활성 (opt-in): 20261018_cascade_deletes의 CASCADE 외래키 적용을 확인한 뒤 86400 등으로 켤 것
+    SOFT_DELETE_PURGE_INTERVAL_SECONDS: float = 0.0
+    SOFT_DELETE_RETENTION_DAYS: int = 30  # 소프트 삭제 후 이 기간이 지난 행만 영구 삭제
+    SOFT_DELETE_PURGE_BATCH_SIZE: int = 5000  # 배치(트랜잭션)당 삭제 행 수
+    SOFT_DELETE_PURGE_MAX_BATCHES: int = 200  # 실행당 테이블별 배치 수 상한
+    SOFT_DELETE_PURGE_PAUSE_SECONDS: float = 0.2  # 배치 사이 대기 (WAL/복제 지연 완화)
+
+    # 감사 로그 배치 기록 (app/security/audit_logger.py)
+    AUDIT_QUEUE_MAX_SIZE: int = 10000  # 초과 시 이벤트 버림 (dropped_events 집계)
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0  # 종료 시 남은 이벤트 기록 대기 상한 (초과 시 writer 취소)
     
     # CORS
     ALLOWED_ORIGINS: List[str] = [
@@ -88,6 +167,16 @@ class Settings(BaseSettings):
     # File Upload
     UPLOAD_DIR: str = "/app/data/uploads" if os.getenv("RAILWAY_ENVIRONMENT") else "./uploads"
     MAX_FILE_SIZE: int = 10485760  # 10MB
+
+    # 회사 로고 (app/services/company_logo.py)
+    LOGO_VARIANT_WIDTHS: List[int] = [64, 128, 256]  # 업로드 시 미리 생성하는 리사이즈 너비 (px)
+    LOGO_CACHE_TTL_SECONDS: float = 300.0  # 회사별 로고 메타데이터 캐시 (다른 워커 업로드 반영 지연)
+    ASSET_CACHE_MAX_AGE_SECONDS: int = 31536000  # 해시 URL 자산의 Cache-Control max-age (1년)
+
+    # 게시글 조회수 모아 쓰기 (app/services/view_counter.py)
+    BOARD_VIEW_FLUSH_INTERVAL_SECONDS: float = 10.0  # 0이면 조회마다 반영
+    BOARD_VIEW_FLUSH_MAX_PENDING: int = 1000  # 미반영 게시글 수가 이를 넘으면 즉시 반영
+    BOARD_VIEW_FLUSH_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0  # 종료 시 진행 중인 반영 대기 상한 (초과 시 취소)
     
     class Config:
         env_file = ".env"
@@ -10,7 +10,6 @@ import hashlib
 from pathlib import Path
 from typing import List, Optional, Dict, Any, BinaryIO
 from fastapi import UploadFile, HTTPException
-from PIL import Image
 import aiofiles
 import aiofiles.os
 from datetime import datetime
@@ -227,6 +226,8 @@ class FileUploadManager:
     async def resize_image(self, image_path: Path, max_width: int = 1920, max_height: int = 1920, quality: int = 85) -> bool:
         """원본 이미지 리사이징 (영수증 등 큰 이미지 최적화)"""
         try:
+            from PIL import Image
+
             with Image.open(image_path) as img:
                 original_size = img.size
 
@@ -264,6 +265,8 @@ class FileUploadManager:
             thumbnail_path = thumbnail_dir / thumbnail_filename
 
             # PIL로 썸네일 생성 (동기 작업)
+            from PIL import Image
+
             with Image.open(image_path) as img:
                 img.thumbnail(size, Image.Resampling.LANCZOS)
                 # RGBA -> RGB 변환 (JPEG 저장을 위해)
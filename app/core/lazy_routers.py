@@ -0,0 +1,131 @@
+"""
+Lazy router mounting for BrandFlow API
+- 엔드포인트 모듈 import와 include_router(라우트/pydantic 모델 생성)가 워커 부팅(import app.main) 시간 대부분을 차지
+- prefix별로 (모듈, prefix, tags)만 등록해 두고, 해당 prefix로 첫 요청이 들어올 때 import 후 include_router
+- 서버 준비 후 warmup 태스크가 남은 라우터를 하나씩 등록해 첫 사용자 요청이 import 비용을 치르지 않게 함
+- /docs, /redoc, /openapi.json 요청 시 남은 라우터를 모두 등록하고 OpenAPI 스키마 캐시를 비움
+- LAZY_ROUTERS=false면 import 시점에 모두 등록 (기존 동작)
+"""
+
+import asyncio
+import importlib
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# 문서 요청 시 전체 라우터가 필요한 경로
+DOCS_PATHS = ("/docs", "/redoc", "/openapi.json")
+
+
+@dataclass
+class LazyRouter:
+    """지연 등록할 라우터 한 개 - match_prefix는 요청 경로 매칭용 (라우터 자체 prefix가 있으면 그 값)"""
+    module: str
+    prefix: str = ""
+    tags: List[str] = field(default_factory=list)
+    match_prefix: str = ""
+    optional: bool = False  # import 실패해도 서버는 계속 (실패 로그만)
+
+    def matches(self, path: str) -> bool:
+        # /api/company 가 /api/company-settings 를 잡지 않도록 경로 구분자 기준으로 비교
+        return path == self.match_prefix or path.startswith(self.match_prefix + "/")
+
+
+class LazyRouterRegistry:
+    """prefix별 라우터 지연 등록 (등록 순서 = include 순서 유지)"""
+
+    def __init__(self, app: FastAPI, warmup_delay: float = 1.0):
+        self.app = app
+        self.warmup_delay = warmup_delay
+        self.pending: List[LazyRouter] = []
+        self.mounted: List[str] = []
+        self.failed: List[str] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, module: str, prefix: str = "", tags: Optional[List[str]] = None,
+            match_prefix: Optional[str] = None, optional: bool = False) -> None:
+        self.pending.append(LazyRouter(
+            module=module,
+            prefix=prefix,
+            tags=list(tags or []),
+            match_prefix=match_prefix if match_prefix is not None else prefix,
+            optional=optional,
+        ))
+
+    def _mount(self, entry: LazyRouter) -> None:
+        self.pending.remove(entry)
+        try:
+            router = importlib.import_module(entry.module).router
+            self.app.include_router(router, prefix=entry.prefix, tags=entry.tags)
+        except Exception as e:
+            if not entry.optional:
+                raise
+            self.failed.append(entry.module)
+            print(f"[ERROR] 라우터 등록 실패 ({entry.module}): {str(e)}")
+            return
+        self.mounted.append(entry.module)
+        # 새 라우트가 문서에 반영되도록 캐시된 OpenAPI 스키마 폐기
+        self.app.openapi_schema = None
+
+    def mount_for_path(self, path: str) -> None:
+        """요청 경로에 해당하는 미등록 라우터를 등록 (겹치는 prefix는 등록 순서대로)"""
+        for entry in [entry for entry in self.pending if entry.matches(path)]:
+            self._mount(entry)
+
+    def mount_all(self) -> None:
+        for entry in list(self.pending):
+            self._mount(entry)
+
+    async def start_warmup(self) -> None:
+        """서버 준비 후 남은 라우터를 이벤트 루프를 양보하며 하나씩 등록"""
+        if not self.pending or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._warmup())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _warmup(self) -> None:
+        await asyncio.sleep(self.warmup_delay)
+        while self.pending:
+            try:
+                self._mount(self.pending[0])
+            except Exception as e:
+                logger.warning("Lazy router warmup failed: %s", e)
+            await asyncio.sleep(0)
+
+    def stats(self) -> dict:
+        return {
+            "mounted": len(self.mounted),
+            "pending": [entry.module for entry in self.pending],
+            "failed": list(self.failed),
+        }
+
+
+class LazyRouterMiddleware:
+    """요청 경로로 필요한 라우터를 라우팅 전에 등록 (HTTP/WebSocket 공통)"""
+
+    def __init__(self, app: ASGIApp, registry: LazyRouterRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and self.registry.pending:
+            path = scope["path"]
+            if path in DOCS_PATHS:
+                self.registry.mount_all()
+            else:
+                self.registry.mount_for_path(path)
+        await self.app(scope, receive, send)
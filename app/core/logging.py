@@ -1,13 +1,21 @@
 """
 Secure logging system for BrandFlow API
 민감한 정보 로깅 방지 및 보안 로깅
+- QueueHandler/QueueListener 기반 비동기 출력 (요청 처리 스레드에서 I/O 없음)
+- 구조화된 JSON 레코드
+- 로거별 샘플링 및 rate limiting
 """
 
+import copy
 import logging
+import queue
+import random
 import re
 import json
-from typing import Any, Dict, Optional, List
-from datetime import datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, List, Tuple
+from datetime import datetime, timezone
 import hashlib
 
 
@@ -191,27 +199,181 @@ def hash_pii(data: str) -> str:
 security_logger = SecurityLogger()
 
 
+# LogRecord 기본 속성 (extra로 전달된 구조화 필드와 구분하기 위함)
+_RESERVED_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """한 줄 JSON 로그 포매터
+
+    `logger.info("...", extra={"campaign_id": 1})`처럼 전달된 extra 필드는 최상위 키로 기록됩니다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class LazyQueueHandler(QueueHandler):
+    """메시지 포매팅을 리스너 스레드로 미루는 QueueHandler
+
+    기본 QueueHandler.prepare()는 호출 스레드에서 메시지를 완성합니다. 여기서는 인자가
+    불변 기본 타입일 때만 포매팅을 미루고, ORM 객체 등은 호출 시점 값이 보존되도록
+    즉시 문자열로 만듭니다.
+    """
+
+    _LAZY_ARG_TYPES = (str, int, float, bool, type(None))
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.args and not all(isinstance(arg, self._LAZY_ARG_TYPES) for arg in _record_args(record)):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+def _record_args(record: logging.LogRecord):
+    if isinstance(record.args, dict):
+        return record.args.values()
+    return record.args
+
+
+class SamplingFilter(logging.Filter):
+    """로거 이름 접두사별 DEBUG/INFO 레코드 샘플링 (WARNING 이상은 항상 통과)"""
+
+    def __init__(self, sample_rates: Dict[str, float]):
+        super().__init__()
+        self.sample_rates = sample_rates
+        self._rate_cache: Dict[str, float] = {}
+
+    def _rate_for(self, name: str) -> float:
+        rate = self._rate_cache.get(name)
+        if rate is None:
+            rate = 1.0
+            matched = -1
+            for prefix, prefix_rate in self.sample_rates.items():
+                if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > matched:
+                    rate, matched = prefix_rate, len(prefix)
+            self._rate_cache[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate_for(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class RateLimitFilter(logging.Filter):
+    """로거+레벨별 토큰 버킷 rate limiting
+
+    제한으로 버려진 건수는 다음으로 통과하는 레코드의 `suppressed` 필드에 기록됩니다.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int):
+        super().__init__()
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._buckets: Dict[Tuple[str, int], List[float]] = {}  # key: [tokens, last_refill, suppressed]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate_per_second <= 0:
+            return True
+        now = time.monotonic()
+        key = (record.name, record.levelno)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(self.burst), now, 0]
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate_per_second)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            bucket[2] += 1
+            return False
+        bucket[0] = tokens - 1
+        if bucket[2]:
+            record.suppressed = int(bucket[2])
+            bucket[2] = 0
+        return True
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """"logger=0.1,other=0.5" 형식의 샘플링 설정 파싱"""
+    rates = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        name, rate = item.split("=", 1)
+        try:
+            rates[name.strip()] = max(0.0, min(1.0, float(rate)))
+        except ValueError:
+            continue
+    return rates
+
+
+_queue_listener: Optional[QueueListener] = None
+
+
 # 애플리케이션 로거 설정
 def setup_application_logging():
-    """애플리케이션 로깅 설정"""
-    # 루트 로거 설정
-    root_logger = logging.getLogger("brandflow")
-    root_logger.setLevel(logging.INFO)
-    
-    # 콘솔 핸들러 (개발용)
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(
-        SecureFormatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-        )
-    )
-    root_logger.addHandler(console_handler)
-    
+    """애플리케이션 로깅 설정
+
+    루트 로거에 LazyQueueHandler를 연결하고, 실제 출력(stdout)은 QueueListener
+    스레드에서 수행합니다. 여러 번 호출해도 핸들러는 한 번만 등록됩니다.
+    """
+    global _queue_listener
+    from app.core.config import settings
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(settings.LOG_LEVEL.upper())
+
+    if _queue_listener is None:
+        # 콘솔 핸들러 (리스너 스레드에서 실행)
+        console_handler = logging.StreamHandler()
+        if settings.LOG_FORMAT.lower() == "json":
+            console_handler.setFormatter(JSONFormatter())
+        else:
+            console_handler.setFormatter(
+                logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            )
+
+        log_queue: queue.Queue = queue.Queue(-1)
+        queue_handler = LazyQueueHandler(log_queue)
+        queue_handler.addFilter(SamplingFilter(parse_sample_rates(settings.LOG_SAMPLE_RATES)))
+        queue_handler.addFilter(RateLimitFilter(settings.LOG_RATE_LIMIT_PER_SECOND, settings.LOG_RATE_LIMIT_BURST))
+        root_logger.addHandler(queue_handler)
+
+        _queue_listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+        _queue_listener.start()
+
     # SQLAlchemy 로거 설정 (민감한 정보 포함 가능)
     sql_logger = logging.getLogger("sqlalchemy.engine")
-    sql_logger.setLevel(logging.WARNING)  # SQL 쿼리 로그 비활성화
-    
-    return root_logger
+    sql_logger.setLevel(logging.INFO if settings.SQL_ECHO else logging.WARNING)
+
+    return logging.getLogger("brandflow")
+
+
+def shutdown_application_logging():
+    """남은 로그 레코드를 모두 출력하고 리스너 스레드 종료"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
 
 
 # 로깅 데코레이터
@@ -0,0 +1,82 @@
+"""
+Password hashing executor
+bcrypt 연산(12 rounds 기준 수백 ms CPU)을 이벤트 루프 밖 전용 스레드 풀에서 실행합니다.
+- bcrypt 확장 모듈은 해싱 중 GIL을 해제하므로 스레드 수만큼 병렬 처리
+- 대기 작업 수가 상한을 넘으면 즉시 503 반환 (로그인 폭주 시 다른 요청 보호)
+"""
+
+import asyncio
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherOverloaded(HTTPException):
+    """해싱 대기열 포화"""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="로그인 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
+class PasswordHasherExecutor:
+    """bcrypt 전용 스레드 풀 + 대기열 깊이 제한"""
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        # 워커당 대기 허용 작업 수 기본값 8
+        self.max_pending = max_pending or self.workers * 8
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.pending = 0
+        self.stats = {'completed': 0, 'rejected': 0}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def run(self, func: Callable, *args) -> Any:
+        """풀에서 func(*args) 실행 - 대기열이 가득 차면 PasswordHasherOverloaded"""
+        if self.pending >= self.max_pending:
+            self.stats['rejected'] += 1
+            logger.warning("Password hashing queue full (%d pending) - rejecting request", self.pending)
+            raise PasswordHasherOverloaded()
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.pending -= 1
+            self.stats['completed'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            'pending': self.pending,
+            **self.stats
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hasher = PasswordHasherExecutor(
+    workers=settings.PASSWORD_HASH_WORKERS or None,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING or None
+)
@@ -0,0 +1,210 @@
+"""
+Rate limiting engine for BrandFlow API
+GCRA(Generic Cell Rate Algorithm) 기반 - 키당 값 하나(TAT)만 저장
+- 메모리 백엔드: 워커 단위, 유휴 키 주기적 정리
+- Redis 백엔드: Lua 스크립트로 원자적 처리, 모든 워커가 같은 한도 공유
+"""
+
+import math
+import time
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """기간(period) 동안 limit 회 허용 (최대 limit 회까지 버스트 허용)"""
+    limit: int
+    period: float  # 초
+
+    @property
+    def emission_interval(self) -> float:
+        return self.period / self.limit
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # 초 (허용된 경우 0)
+
+
+@dataclass(frozen=True)
+class RouteRateLimit:
+    """경로 접두사별 추가 한도"""
+    path_prefix: str
+    rate: RateLimit
+    method: str = "*"
+    key_by: str = "ip"  # ip | user
+
+
+def _gcra(tat: Optional[float], now: float, rate: RateLimit) -> Tuple[RateLimitResult, Optional[float]]:
+    """GCRA 판정. (결과, 저장할 새 TAT) 반환 - 거부 시 TAT는 변경하지 않음"""
+    interval = rate.emission_interval
+    new_tat = max(tat or now, now) + interval
+    delay = new_tat - now
+    if delay > rate.period:
+        return RateLimitResult(False, rate.limit, 0, delay - rate.period), None
+    remaining = int((rate.period - delay) / interval + 1e-9)
+    return RateLimitResult(True, rate.limit, remaining, 0.0), new_tat
+
+
+class MemoryRateLimitBackend:
+    """프로세스 메모리 백엔드
+
+    TAT가 현재 시각보다 과거인 키는 새 키와 동일하므로 sweep_interval마다 일괄 삭제합니다.
+    """
+
+    def __init__(self, sweep_interval: float = 60.0):
+        self._tats: Dict[str, float] = {}
+        self.sweep_interval = sweep_interval
+        self._last_sweep = time.monotonic()
+
+    async def hit(self, key: str, rate: RateLimit) -> RateLimitResult:
+        now = time.monotonic()
+        if now - self._last_sweep > self.sweep_interval:
+            self._sweep(now)
+
+        result, new_tat = _gcra(self._tats.get(key), now, rate)
+        if new_tat is not None:
+            self._tats[key] = new_tat
+        return result
+
+    def _sweep(self, now: float) -> None:
+        expired = [key for key, tat in self._tats.items() if tat <= now]
+        for key in expired:
+            del self._tats[key]
+        self._last_sweep = now
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+
+class RedisRateLimitBackend:
+    """Redis 공유 백엔드 (redis 패키지 필요)
+
+    키 TTL을 TAT까지로 설정하므로 유휴 키는 Redis가 자동으로 만료시킵니다.
+    """
+
+    GCRA_SCRIPT = """
+    local now = tonumber(ARGV[1])
+    local interval = tonumber(ARGV[2])
+    local period = tonumber(ARGV[3])
+    local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+    if tat < now then tat = now end
+    local new_tat = tat + interval
+    local delay = new_tat - now
+    if delay > period then
+        return {0, tostring(delay - period)}
+    end
+    redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(delay))
+    return {1, tostring(period - delay)}
+    """
+
+    def __init__(self, redis_url: str, key_prefix: str = "brandflow:ratelimit:"):
+        import redis.asyncio as redis_asyncio
+
+        self.redis = redis_asyncio.from_url(redis_url)
+        self.key_prefix = key_prefix
+        self._script = self.redis.register_script(self.GCRA_SCRIPT)
+
+    async def hit(self, key: str, rate: RateLimit) -> RateLimitResult:
+        interval_ms = rate.emission_interval * 1000
+        allowed, value = await self._script(
+            keys=[self.key_prefix + key],
+            args=[time.time() * 1000, interval_ms, rate.period * 1000]
+        )
+        value = float(value)
+        if int(allowed):
+            return RateLimitResult(True, rate.limit, int(value / interval_ms + 1e-9), 0.0)
+        return RateLimitResult(False, rate.limit, 0, value / 1000)
+
+
+class RateLimiter:
+    """클라이언트(IP 또는 JWT subject)별 전역 한도 + 경로별 한도 판정"""
+
+    def __init__(
+        self,
+        backend,
+        global_limits: List[RateLimit],
+        route_limits: Optional[List[RouteRateLimit]] = None
+    ):
+        self.backend = backend
+        self.global_limits = global_limits
+        self.route_limits = route_limits or []
+
+    async def check(self, method: str, path: str, client_ip: str, subject: Optional[str]) -> RateLimitResult:
+        """모든 해당 한도를 확인하고 가장 엄격한 결과 반환 (거부 시 즉시 반환)"""
+        client_key = f"user:{subject}" if subject else f"ip:{client_ip}"
+        strictest: Optional[RateLimitResult] = None
+
+        for rate in self.global_limits:
+            result = await self.backend.hit(f"{client_key}:{rate.limit}/{rate.period:g}", rate)
+            if not result.allowed:
+                return result
+            if strictest is None or result.remaining < strictest.remaining:
+                strictest = result
+
+        for route in self.route_limits:
+            if route.method not in ("*", method) or not path.startswith(route.path_prefix):
+                continue
+            route_client = f"user:{subject}" if route.key_by == "user" and subject else f"ip:{client_ip}"
+            result = await self.backend.hit(f"route:{route.method}:{route.path_prefix}:{route_client}", route.rate)
+            if not result.allowed:
+                return result
+            if strictest is None or result.remaining < strictest.remaining:
+                strictest = result
+
+        return strictest or RateLimitResult(True, 0, 0, 0.0)
+
+
+@lru_cache(maxsize=4096)
+def subject_from_token(token: str) -> Optional[str]:
+    """서명이 유효한 JWT의 subject 반환 (만료 여부는 인증 단계에서 확인)"""
+    from jose import JWTError, jwt
+    try:
+        payload = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+            options={"verify_exp": False}
+        )
+    except JWTError:
+        return None
+    subject = payload.get("sub")
+    return str(subject) if subject else None
+
+
+def create_rate_limiter(requests_per_minute: int, requests_per_second: int) -> RateLimiter:
+    """설정(RATE_LIMIT_BACKEND)에 따른 레이트 리미터 생성"""
+    backend = None
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        try:
+            backend = RedisRateLimitBackend(settings.REDIS_URL)
+        except ImportError:
+            logger.warning("redis package not installed - falling back to in-memory rate limiting")
+    if backend is None:
+        backend = MemoryRateLimitBackend()
+
+    return RateLimiter(
+        backend,
+        global_limits=[
+            RateLimit(requests_per_second, 1),
+            RateLimit(requests_per_minute, 60),
+        ],
+        route_limits=[
+            # 로그인 무차별 대입 방지: IP 기준
+            RouteRateLimit("/api/auth/login", RateLimit(settings.RATE_LIMIT_LOGIN_PER_MINUTE, 60), method="POST"),
+        ]
+    )
+
+
+def retry_after_header(result: RateLimitResult) -> str:
+    return str(max(1, math.ceil(result.retry_after)))
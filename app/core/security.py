@@ -1,26 +1,27 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Any, Union, Dict
+from typing import Optional, Any, Union, Dict, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 import secrets
 import hashlib
 import time
 
 from app.core.config import settings
+from app.core.password_hasher import password_hasher
+from app.core.token_store import token_store
 
 # 패스워드 해싱 컨텍스트 (보안 강화)
+# min/max rounds를 현재 설정과 같게 두면 라운드가 다른 기존 해시는 needs_update 대상이 됨
 pwd_context = CryptContext(
     schemes=["bcrypt"], 
     deprecated="auto",
-    bcrypt__rounds=12  # bcrypt 라운드 수 증가 (기본값 12)
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS
 )
 
-# JWT 블랙리스트 (간단한 메모리 기반, 프로덕션에서는 Redis 사용 권장)
-_token_blacklist = set()
-_refresh_tokens = {}  # refresh_token: {user_id, expires_at, jti}
-
-
 def create_access_token(
     subject: Union[str, Any], 
     expires_delta: Optional[timedelta] = None,
@@ -57,47 +58,24 @@ def create_access_token(
     return encoded_jwt
 
 
-def create_refresh_token(user_id: Union[str, int]) -> str:
-    """리프레시 토큰 생성"""
-    now = datetime.now(timezone.utc)
-    expire = now + timedelta(days=7)  # 7일 유효
-    
-    jti = secrets.token_urlsafe(32)
-    refresh_token = secrets.token_urlsafe(64)
-    
-    # 리프레시 토큰 정보 저장
-    _refresh_tokens[refresh_token] = {
-        "user_id": str(user_id),
-        "expires_at": expire,
-        "jti": jti,
-        "created_at": now
-    }
-    
-    return refresh_token
+async def create_refresh_token(db: AsyncSession, user_id: Union[str, int]) -> str:
+    """리프레시 토큰 생성 (refresh_tokens 테이블에 해시로 저장)"""
+    return await token_store.create_refresh_token(db, user_id)
 
 
-def verify_refresh_token(refresh_token: str) -> Optional[str]:
-    """리프레시 토큰 검증"""
-    if refresh_token not in _refresh_tokens:
-        return None
-    
-    token_data = _refresh_tokens[refresh_token]
-    now = datetime.now(timezone.utc)
-    
-    # 만료 시간 체크
-    if now > token_data["expires_at"]:
-        del _refresh_tokens[refresh_token]
-        return None
-    
-    return token_data["user_id"]
+async def verify_refresh_token(db: AsyncSession, refresh_token: str) -> Optional[str]:
+    """리프레시 토큰 검증 - 유효하면 user_id 반환"""
+    return await token_store.verify_refresh_token(db, refresh_token)
+
 
+async def rotate_refresh_token(db: AsyncSession, refresh_token: str) -> Optional[str]:
+    """리프레시 토큰 사용 처리 (재사용 불가) - 유효했으면 user_id 반환"""
+    return await token_store.consume_refresh_token(db, refresh_token)
 
-def revoke_refresh_token(refresh_token: str) -> bool:
+
+async def revoke_refresh_token(db: AsyncSession, refresh_token: str) -> bool:
     """리프레시 토큰 무효화"""
-    if refresh_token in _refresh_tokens:
-        del _refresh_tokens[refresh_token]
-        return True
-    return False
+    return await token_store.revoke_refresh_token(db, refresh_token)
 
 
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
@@ -116,9 +94,9 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
         if payload.get("type") != "access":
             return None
         
-        # JTI 블랙리스트 확인
+        # JTI 폐기 여부 확인 (app/core/token_store.py)
         jti = payload.get("jti")
-        if jti in _token_blacklist:
+        if token_store.is_revoked(jti):
             return None
         
         # 현재 시간 체크 (추가 안전장치)
@@ -135,40 +113,24 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def blacklist_token(token: str) -> bool:
-    """토큰을 블랙리스트에 추가 (로그아웃시 사용)"""
+async def blacklist_token(token: str) -> bool:
+    """토큰 jti 폐기 (로그아웃시 사용) - 토큰 만료 시각까지만 보관"""
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
         jti = payload.get("jti")
         if jti:
-            _token_blacklist.add(jti)
+            await token_store.revoke(jti, payload.get("exp"))
             return True
     except JWTError:
         pass
     return False
 
 
-def cleanup_expired_tokens():
-    """만료된 토큰들 정리"""
-    now = datetime.now(timezone.utc)
-    
-    # 만료된 리프레시 토큰 정리
-    expired_refresh_tokens = [
-        token for token, data in _refresh_tokens.items()
-        if now > data["expires_at"]
-    ]
-    
-    for token in expired_refresh_tokens:
-        del _refresh_tokens[token]
-    
-    # 블랙리스트는 주기적으로 완전히 초기화 (메모리 누수 방지)
-    # 프로덕션에서는 Redis TTL 사용 권장
-    if len(_token_blacklist) > 10000:
-        _token_blacklist.clear()
-    
-    return len(expired_refresh_tokens)
+async def cleanup_expired_tokens():
+    """만료된 폐기 기록 / 리프레시 토큰 정리"""
+    await token_store.purge_expired()
 
 
 def get_password_hash(password: str) -> str:
@@ -185,6 +147,23 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """패스워드 해싱 (전용 스레드 풀에서 실행, 요청 핸들러용)"""
+    if not validate_password_strength(password):
+        raise ValueError("패스워드가 보안 요구사항을 충족하지 않습니다.")
+
+    return await password_hasher.run(pwd_context.hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """패스워드 검증 (전용 스레드 풀에서 실행)
+
+    Returns:
+        (검증 결과, 새 해시) - BCRYPT_ROUNDS가 바뀐 경우 새 해시를 반환하므로 호출자가 저장
+    """
+    return await password_hasher.run(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
 def validate_password_strength(password: str) -> bool:
     """패스워드 강도 검증"""
     # 최소 8자 이상
@@ -0,0 +1,155 @@
+"""
+Fast JSON serialization for BrandFlow API
+- 필드 스펙으로 엔티티별 직렬화 함수를 한 번만 생성 (행마다 getattr/hasattr, 중복 키 재계산 제거)
+- FastJSONResponse: orjson 기반 응답 클래스 - 엔드포인트가 직접 반환하면 jsonable_encoder를 거치지 않음
+- datetime/Enum/Decimal은 인코더가 처리하므로 직렬화 함수에서 .isoformat()을 호출하지 않음
+- orjson이 없으면 표준 json으로 동일한 형태의 출력
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from fastapi.responses import JSONResponse
+
+# Optional orjson import with graceful fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class Field:
+    """
+    직렬화 필드 스펙
+    - key: 출력 키, attr: 읽을 속성 (기본값 key) - 같은 attr을 여러 키가 쓰면 한 번만 읽음
+    - kind: value | enum (.value) | float (Decimal 등 -> float) | nested | many
+    - default: 값이 falsy일 때 대체값 (value는 `값 or default`, float는 None일 때)
+    - optional: 모델에 없을 수 있는 속성 (getattr(obj, attr, None))
+    - const: 항상 같은 값, compute: compute(obj) 결과 (requires: compute가 읽는 속성)
+    """
+    key: str
+    attr: Optional[str] = None
+    kind: str = "value"
+    default: Any = None
+    serializer: Optional[Callable[[Any], Dict[str, Any]]] = None
+    where: Optional[str] = None  # many: 이 속성이 참인 항목만 포함
+    optional: bool = False
+    const: Any = _MISSING
+    compute: Optional[Callable[[Any], Any]] = None
+    requires: Tuple[str, ...] = ()
+
+
+def compile_serializer(name: str, fields: Sequence[Field]) -> Callable[[Any], Dict[str, Any]]:
+    """필드 스펙으로 `def name(obj): return {...}` 함수를 생성 (모듈 import 시 한 번)"""
+    namespace: Dict[str, Any] = {}
+    body = []
+    items = []
+    loaded: Dict[str, str] = {}
+
+    for index, spec in enumerate(fields):
+        if spec.const is not _MISSING:
+            namespace[f"_const{index}"] = spec.const
+            items.append(f"        {spec.key!r}: _const{index},")
+            continue
+        if spec.compute is not None:
+            namespace[f"_compute{index}"] = spec.compute
+            items.append(f"        {spec.key!r}: _compute{index}(obj),")
+            continue
+
+        attr = spec.attr or spec.key
+        if not attr.isidentifier():
+            raise ValueError(f"{name}: 잘못된 속성 이름 {attr!r}")
+        local = loaded.get(attr)
+        if local is None:
+            local = f"v{len(loaded)}"
+            loaded[attr] = local
+            getter = f"getattr(obj, {attr!r}, None)" if spec.optional else f"obj.{attr}"
+            body.append(f"    {local} = {getter}")
+
+        if spec.kind == "value":
+            if spec.default is None:
+                expr = local
+            elif spec.default == [] and isinstance(spec.default, list):
+                expr = f"({local} or [])"  # 응답마다 새 리스트
+            else:
+                namespace[f"_default{index}"] = spec.default
+                expr = f"({local} or _default{index})"
+        elif spec.kind == "enum":
+            expr = f"({local}.value if {local} is not None else None)"
+        elif spec.kind == "float":
+            namespace[f"_default{index}"] = spec.default
+            expr = f"(float({local}) if {local} is not None else _default{index})"
+        elif spec.kind == "nested":
+            namespace[f"_serializer{index}"] = spec.serializer
+            expr = f"(_serializer{index}({local}) if {local} is not None else None)"
+        elif spec.kind == "many":
+            namespace[f"_serializer{index}"] = spec.serializer
+            condition = f" if item.{spec.where}" if spec.where else ""
+            expr = f"[_serializer{index}(item) for item in ({local} or ()){condition}]"
+        else:
+            raise ValueError(f"{name}: 알 수 없는 필드 종류 {spec.kind!r}")
+        items.append(f"        {spec.key!r}: {expr},")
+
+    source = "\n".join([f"def {name}(obj):", *body, "    return {", *items, "    }", ""])
+    exec(compile(source, f"<serializer {name}>", "exec"), namespace)
+    serializer = namespace[name]
+    serializer.__source__ = source
+    serializer.fields = tuple(fields)  # load_only 컬럼 선택 등에 재사용
+    return serializer
+
+
+def source_attributes(fields: Sequence[Field]) -> Tuple[str, ...]:
+    """스펙이 읽는 속성 이름 (load_only 컬럼 선택용, 중복 제거/순서 유지)"""
+    names = []
+    for spec in fields:
+        if spec.const is not _MISSING:
+            continue
+        for attr in spec.requires if spec.compute is not None else (spec.attr or spec.key,):
+            if attr not in names:
+                names.append(attr)
+    return tuple(names)
+
+
+def _default(obj: Any) -> Any:
+    """orjson/json이 기본으로 처리하지 못하는 타입 변환"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date, time)):
+        # orjson은 datetime을 직접 처리 - 표준 json fallback 경로에서만 사용
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """응답 본문 인코딩 (UTF-8 bytes, 한글 그대로)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson 기반 JSON 응답
+    - 앱 기본 응답 클래스로 사용 (FastAPI(default_response_class=...))
+    - 엔드포인트가 FastJSONResponse(content)를 직접 반환하면 jsonable_encoder/response_model 검증을 건너뜀
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,57 @@
+"""
+Startup phase timings for BrandFlow API
+- lifespan / migrate 각 단계 소요 시간 기록
+- /health에서 콜드 스타트 분석용으로 노출
+"""
+
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class StartupTimer:
+    """시작 단계별 소요 시간 기록기"""
+
+    def __init__(self):
+        self.phases: List[Dict[str, Any]] = []
+        self.mode: Optional[str] = None
+        self.ready_at: Optional[float] = None
+        self.schema: Dict[str, Any] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """with startup_timer.phase("create_tables"): ... - 예외가 나도 소요 시간과 실패 여부를 기록"""
+        start = time.perf_counter()
+        entry = {"name": name, "ok": True}
+        try:
+            yield entry
+        except BaseException as e:
+            entry["ok"] = False
+            entry["error"] = str(e)[:200]
+            raise
+        finally:
+            entry["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            self.phases.append(entry)
+
+    def mark_ready(self) -> None:
+        self.ready_at = time.time()
+
+    def report(self) -> Dict[str, Any]:
+        import psutil  # /health 조회 시점에만 로드 (워커 부팅 경로에서 제외)
+
+        process_started_at = psutil.Process().create_time()
+        return {
+            "mode": self.mode,
+            "ready": self.ready_at is not None,
+            "ready_at": datetime.fromtimestamp(self.ready_at).isoformat() if self.ready_at else None,
+            # 인터프리터 시작(모듈 import 포함)부터 트래픽 수신 가능까지
+            "process_start_to_ready_ms": (
+                round((self.ready_at - process_started_at) * 1000, 1) if self.ready_at else None
+            ),
+            "phases": list(self.phases),
+            "schema": self.schema,
+        }
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,291 @@
+"""
+Token state store for BrandFlow API
+- 액세스 토큰 폐기(jti): 만료 시각 버킷 단위로 관리해 만료된 항목은 버킷째 삭제
+- 선택적 Bloom filter: 대부분의 (폐기되지 않은) 토큰은 비트 검사만으로 통과
+- 공유 백엔드(database): revoked_tokens 테이블에 기록하고 각 워커가 증분 동기화
+- 리프레시 토큰: refresh_tokens 테이블에 SHA-256 해시로 저장
+"""
+
+import asyncio
+import hashlib
+import logging
+import secrets
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 만료 시각 버킷 크기 (초) - 버킷이 통째로 지나가면 그 안의 jti를 한 번에 삭제
+REVOCATION_BUCKET_SECONDS = 300
+# 만료된 revoked_tokens / refresh_tokens 행 삭제 주기 (초)
+PURGE_INTERVAL_SECONDS = 600
+
+
+class BloomFilter:
+    """고정 크기 Bloom filter (blake2b 이중 해싱)"""
+
+    def __init__(self, size_bits: int, hash_count: int = 4):
+        self.size_bits = size_bits
+        self.hash_count = hash_count
+        self.bits = bytearray((size_bits + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        for position in self._positions(key):
+            if not self.bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def clear(self) -> None:
+        self.bits = bytearray(len(self.bits))
+
+
+class TimeBucketedRevocations:
+    """만료 시각 버킷 기반 jti 폐기 목록
+
+    메모리는 '폐기되었지만 아직 만료되지 않은' 토큰 수로 제한됩니다.
+    """
+
+    def __init__(self, bucket_seconds: int = REVOCATION_BUCKET_SECONDS, bloom_bits: int = 0):
+        self.bucket_seconds = bucket_seconds
+        self._expiry: Dict[str, float] = {}
+        self._buckets: Dict[int, List[str]] = {}
+        self._next_eviction = 0.0
+        self.bloom = BloomFilter(bloom_bits) if bloom_bits else None
+
+    def add(self, jti: str, expires_at: float) -> None:
+        if jti in self._expiry or expires_at <= time.time():
+            return
+        self._expiry[jti] = expires_at
+        self._buckets.setdefault(int(expires_at // self.bucket_seconds), []).append(jti)
+        if self.bloom is not None:
+            self.bloom.add(jti)
+
+    def contains(self, jti: str) -> bool:
+        now = time.time()
+        if now >= self._next_eviction:
+            self._evict(now)
+        if self.bloom is not None and jti not in self.bloom:
+            return False
+        expires_at = self._expiry.get(jti)
+        return expires_at is not None and expires_at > now
+
+    def _evict(self, now: float) -> None:
+        current_bucket = int(now // self.bucket_seconds)
+        expired_buckets = [bucket for bucket in self._buckets if bucket < current_bucket]
+        for bucket in expired_buckets:
+            for jti in self._buckets.pop(bucket):
+                self._expiry.pop(jti, None)
+
+        # Bloom filter는 삭제를 지원하지 않으므로 남은 항목으로 재구성
+        if expired_buckets and self.bloom is not None:
+            self.bloom.clear()
+            for jti in self._expiry:
+                self.bloom.add(jti)
+        self._next_eviction = (current_bucket + 1) * self.bucket_seconds
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+
+def hash_refresh_token(refresh_token: str) -> str:
+    """리프레시 토큰 저장 키 (토큰 자체가 고엔트로피이므로 솔트 없는 SHA-256으로 충분)"""
+    return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+
+class TokenStateStore:
+    """토큰 폐기 / 리프레시 토큰 상태 관리
+
+    backend:
+        memory   - 워커 메모리만 사용 (재시작 시 폐기 목록 초기화)
+        database - revoked_tokens 테이블에 기록, sync_interval마다 다른 워커의 폐기를 반영
+    """
+
+    def __init__(self, backend: str = "database", sync_interval: float = 2.0, bloom_bits: int = 0):
+        self.backend = backend
+        self.sync_interval = sync_interval
+        self.revocations = TimeBucketedRevocations(bloom_bits=bloom_bits)
+        self._last_synced_at: Optional[datetime] = None
+        self._last_purge = 0.0
+        self._sync_task: Optional[asyncio.Task] = None
+
+    # 액세스 토큰 폐기
+    def is_revoked(self, jti: str) -> bool:
+        """verify_token에서 호출 - 로컬 조회만 하므로 요청 경로에 I/O 없음"""
+        return self.revocations.contains(jti)
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """jti 폐기 - 현재 워커에는 즉시, 다른 워커에는 다음 동기화 때 반영"""
+        self.revocations.add(jti, expires_at)
+        if self.backend != "database":
+            return
+
+        from sqlalchemy.dialects.postgresql import insert
+        from app.db.database import AsyncSessionLocal
+        from app.models.token_state import RevokedToken
+
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                insert(RevokedToken)
+                .values(
+                    jti=jti,
+                    expires_at=datetime.utcfromtimestamp(expires_at),
+                    revoked_at=datetime.utcnow()
+                )
+                .on_conflict_do_nothing(index_elements=["jti"])
+            )
+            await session.commit()
+
+    async def start(self) -> None:
+        """공유 백엔드 동기화 시작 (lifespan startup)"""
+        if self.backend != "database" or self._sync_task is not None:
+            return
+        try:
+            await self.sync()
+        except Exception as e:
+            logger.error("Initial token revocation sync failed: %s", e)
+        self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def stop(self) -> None:
+        if self._sync_task is None:
+            return
+        self._sync_task.cancel()
+        try:
+            await self._sync_task
+        except asyncio.CancelledError:
+            pass
+        self._sync_task = None
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+                if time.monotonic() - self._last_purge > PURGE_INTERVAL_SECONDS:
+                    await self.purge_expired()
+            except Exception as e:
+                logger.warning("Token revocation sync failed: %s", e)
+
+    async def sync(self) -> int:
+        """마지막 동기화 이후 다른 워커가 폐기한 jti를 반영 (revoked_at 인덱스 조회)"""
+        from sqlalchemy import select
+        from app.db.database import AsyncSessionLocal
+        from app.models.token_state import RevokedToken
+
+        now = datetime.utcnow()
+        query = select(RevokedToken.jti, RevokedToken.expires_at).where(RevokedToken.expires_at > now)
+        if self._last_synced_at is not None:
+            # 트랜잭션 커밋 지연을 고려해 약간 겹치게 조회
+            query = query.where(RevokedToken.revoked_at >= self._last_synced_at - timedelta(seconds=5))
+
+        async with AsyncSessionLocal() as session:
+            rows = (await session.execute(query)).all()
+
+        for jti, expires_at in rows:
+            self.revocations.add(jti, (expires_at - datetime(1970, 1, 1)).total_seconds())
+        self._last_synced_at = now
+        return len(rows)
+
+    async def purge_expired(self) -> None:
+        """만료된 폐기 기록 / 리프레시 토큰 삭제"""
+        from sqlalchemy import delete
+        from app.db.database import AsyncSessionLocal
+        from app.models.token_state import RevokedToken, RefreshToken
+
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+            await session.execute(delete(RefreshToken).where(RefreshToken.expires_at <= now))
+            await session.commit()
+        self._last_purge = time.monotonic()
+
+    # 리프레시 토큰
+    async def create_refresh_token(self, db, user_id: int) -> str:
+        from app.models.token_state import RefreshToken
+
+        now = datetime.utcnow()
+        refresh_token = secrets.token_urlsafe(64)
+        db.add(RefreshToken(
+            token_hash=hash_refresh_token(refresh_token),
+            user_id=int(user_id),
+            jti=secrets.token_urlsafe(32),
+            created_at=now,
+            expires_at=now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        ))
+        await db.flush()
+        return refresh_token
+
+    async def verify_refresh_token(self, db, refresh_token: str) -> Optional[str]:
+        from sqlalchemy import select
+        from app.models.token_state import RefreshToken
+
+        result = await db.execute(
+            select(RefreshToken.user_id).where(
+                RefreshToken.token_hash == hash_refresh_token(refresh_token),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > datetime.utcnow()
+            )
+        )
+        user_id = result.scalar_one_or_none()
+        return str(user_id) if user_id is not None else None
+
+    async def consume_refresh_token(self, db, refresh_token: str) -> Optional[str]:
+        """리프레시 토큰을 한 번만 사용하도록 폐기하면서 user_id 반환 (토큰 회전용, 원자적)"""
+        from sqlalchemy import update
+        from app.models.token_state import RefreshToken
+
+        now = datetime.utcnow()
+        result = await db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == hash_refresh_token(refresh_token),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now
+            )
+            .values(revoked_at=now)
+            .returning(RefreshToken.user_id)
+        )
+        user_id = result.scalar_one_or_none()
+        return str(user_id) if user_id is not None else None
+
+    async def revoke_refresh_token(self, db, refresh_token: str) -> bool:
+        from sqlalchemy import update
+        from app.models.token_state import RefreshToken
+
+        result = await db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == hash_refresh_token(refresh_token),
+                RefreshToken.revoked_at.is_(None)
+            )
+            .values(revoked_at=datetime.utcnow())
+        )
+        return result.rowcount > 0
+
+    def get_stats(self) -> Dict:
+        return {
+            "backend": self.backend,
+            "revoked_tokens": len(self.revocations),
+            "bloom_filter": self.revocations.bloom is not None,
+            "last_synced_at": self._last_synced_at.isoformat() if self._last_synced_at else None,
+        }
+
+
+token_store = TokenStateStore(
+    backend=settings.TOKEN_STATE_BACKEND,
+    sync_interval=settings.TOKEN_REVOCATION_SYNC_SECONDS,
+    bloom_bits=settings.TOKEN_REVOCATION_BLOOM_BITS
+)
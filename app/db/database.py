@@ -4,6 +4,7 @@ from sqlalchemy.orm import sessionmaker
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
+from app.db.query_metrics import install_query_instrumentation
 from app.models.base import Base
 # 모든 모델을 import하여 테이블 생성 보장
 from app.models.user import User
@@ -16,6 +17,9 @@ from app.models.company_logo import CompanyLogo
 from app.models.post import Post
 from app.models.order_request import OrderRequest
 from app.models.company_settings import CompanySettings
+# 엔드포인트 모듈에서만 import되던 모델 (라우터 지연 등록 시에도 매퍼/테이블 생성에 포함)
+from app.models.system_setting import SystemSetting
+from app.models.user_telegram_setting import UserTelegramSetting, TelegramNotificationLog
 
 
 # Railway PostgreSQL 데이터베이스 URL 가져오기
@@ -29,13 +33,13 @@ sync_engine = create_engine(
     database_url.replace("postgresql+asyncpg://", "postgresql://"),
     pool_pre_ping=True,
     pool_recycle=300,
-    echo=True
+    echo=False  # SQL 로그는 SQL_ECHO 설정으로 sqlalchemy.engine 로거 레벨 제어 (app/core/logging.py)
 )
 
 # PostgreSQL용 비동기 엔진 (Railway 연결 최적화)
 async_engine = create_async_engine(
     database_url,
-    echo=True,
+    echo=False,  # SQL 로그는 SQL_ECHO 설정으로 sqlalchemy.engine 로거 레벨 제어 (app/core/logging.py)
     future=True,
     pool_pre_ping=True,
     pool_recycle=300,  # 5분마다 연결 갱신
@@ -49,6 +53,9 @@ async_engine = create_async_engine(
     }
 )
 
+# 요청 단위 쿼리 수/DB 시간/N+1 계측
+install_query_instrumentation(async_engine.sync_engine)
+
 # 세션 생성기
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
@@ -0,0 +1,342 @@
+"""
+인덱스 어드바이저
+- pg_stat_statements(실행 통계) + pg_stat_user_tables(순차/인덱스 스캔 비율) 수집
+- 애플리케이션 쿼리 fingerprint(app/db/query_metrics.py)와 대조해 어느 코드 경로의 쿼리인지 표시
+- WHERE / ORDER BY 컬럼으로 후보 인덱스를 만들고, hypopg 가상 인덱스로 EXPLAIN 비용 감소를 추정
+- app/db/indexes.py에 정의됐지만 한 번도 사용되지 않은(쓰기만 느리게 하는) 인덱스 표시
+
+pg_stat_statements / hypopg 확장이 없어도 동작합니다
+(각각 애플리케이션 측 쿼리 통계 사용 / 비용 추정 생략).
+"""
+
+import json
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import query_metrics
+
+logger = logging.getLogger(__name__)
+
+PREPARED_STATEMENT_NAME = "index_advisor_stmt"
+
+_QUALIFIED_PREDICATE = re.compile(
+    r'"?(\w+)"?\."?(\w+)"?\s*(=|>=|<=|<>|!=|<|>|\bIN\b|\bIS\b|\bI?LIKE\b|\bBETWEEN\b)',
+    re.IGNORECASE
+)
+_QUALIFIED_COLUMN = re.compile(r'"?(\w+)"?\."?(\w+)"?')
+_TABLE_ALIAS = re.compile(r'\b(?:FROM|JOIN)\s+"?(\w+)"?\s+AS\s+"?(\w+)"?', re.IGNORECASE)
+_WHERE_CLAUSE = re.compile(
+    r'\bWHERE\b(.*?)(?=\bGROUP BY\b|\bORDER BY\b|\bLIMIT\b|\bOFFSET\b|\bFOR UPDATE\b|\bRETURNING\b|$)',
+    re.IGNORECASE | re.DOTALL
+)
+_ORDER_BY_CLAUSE = re.compile(r'\bORDER BY\b(.*?)(?=\bLIMIT\b|\bOFFSET\b|\bFOR UPDATE\b|$)', re.IGNORECASE | re.DOTALL)
+_PARAM = re.compile(r'\$(\d+)')
+_EQUALITY_OPERATORS = {"=", "IN", "IS"}
+MAX_INDEX_COLUMNS = 3
+
+
+def extract_index_candidates(statement: str) -> Dict[str, List[str]]:
+    """문장에서 테이블별 후보 인덱스 컬럼 추출
+
+    등호 조건 컬럼을 앞에, 범위 조건 또는 ORDER BY 컬럼 하나를 뒤에 둡니다.
+    SQLAlchemy가 만드는 'table.column' 형태의 한정 이름만 인식합니다.
+    """
+    aliases = {alias: table for table, alias in _TABLE_ALIAS.findall(statement)}
+    equality: Dict[str, List[str]] = {}
+    trailing: Dict[str, str] = {}
+
+    for where in _WHERE_CLAUSE.findall(statement):
+        for qualifier, column, operator in _QUALIFIED_PREDICATE.findall(where):
+            table = aliases.get(qualifier, qualifier)
+            if operator.upper() in _EQUALITY_OPERATORS:
+                columns = equality.setdefault(table, [])
+                if column not in columns:
+                    columns.append(column)
+            else:
+                trailing.setdefault(table, column)
+
+    order_by = _ORDER_BY_CLAUSE.search(statement)
+    if order_by:
+        for qualifier, column in _QUALIFIED_COLUMN.findall(order_by.group(1)):
+            trailing.setdefault(aliases.get(qualifier, qualifier), column)
+
+    candidates = {}
+    for table in set(equality) | set(trailing):
+        columns = list(equality.get(table, []))
+        if table in trailing and trailing[table] not in columns:
+            columns.append(trailing[table])
+        candidates[table] = columns[:MAX_INDEX_COLUMNS]
+    return candidates
+
+
+def _is_covered(columns: List[str], existing: List[List[str]]) -> bool:
+    """기존 인덱스의 선두 컬럼이 후보와 같으면 이미 지원되는 것으로 간주"""
+    return any(index_columns[:len(columns)] == columns for index_columns in existing)
+
+
+def _plan_cost(raw_plan: Any) -> float:
+    if isinstance(raw_plan, str):
+        raw_plan = json.loads(raw_plan)
+    return float(raw_plan[0]["Plan"]["Total Cost"])
+
+
+class IndexAdvisor:
+    """실시간 쿼리 통계 기반 인덱스 추천"""
+
+    def __init__(self, min_table_rows: int = 1000, statement_limit: int = 50, min_improvement_pct: float = 10.0):
+        self.min_table_rows = min_table_rows
+        self.statement_limit = statement_limit
+        self.min_improvement_pct = min_improvement_pct
+
+    async def analyze(self, db: AsyncSession) -> Dict[str, Any]:
+        conn = await db.connection()
+        extensions = await self._installed_extensions(conn)
+        tables = await self._table_stats(conn)
+        statements = await self._statements(conn, extensions["pg_stat_statements"])
+        existing = await self._existing_indexes(conn)
+
+        recommendations = self._build_candidates(statements, tables, existing)
+        if extensions["hypopg"]:
+            for recommendation in recommendations:
+                await self._estimate_benefit(conn, recommendation)
+            recommendations = [
+                rec for rec in recommendations
+                if rec["estimated_improvement_pct"] is None
+                or rec["estimated_improvement_pct"] >= self.min_improvement_pct
+            ]
+            recommendations.sort(key=lambda rec: rec["estimated_benefit"] or 0, reverse=True)
+        else:
+            recommendations.sort(key=lambda rec: rec["total_ms"], reverse=True)
+
+        unused_indexes = await self._unused_indexes(conn)
+        # 조회와 EXPLAIN만 수행했으므로 트랜잭션은 항상 되돌림
+        await db.rollback()
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "extensions": extensions,
+            "statement_source": "pg_stat_statements" if extensions["pg_stat_statements"] else "application",
+            "analyzed_statements": len(statements),
+            "tables": [table for table in tables.values() if table["seq_scan_heavy"]],
+            "recommendations": recommendations,
+            "unused_indexes": unused_indexes,
+        }
+
+    async def _installed_extensions(self, conn) -> Dict[str, bool]:
+        result = await conn.exec_driver_sql(
+            "SELECT extname FROM pg_extension WHERE extname IN ('pg_stat_statements', 'hypopg')"
+        )
+        names = {row[0] for row in result}
+        return {"pg_stat_statements": "pg_stat_statements" in names, "hypopg": "hypopg" in names}
+
+    async def _table_stats(self, conn) -> Dict[str, Dict[str, Any]]:
+        result = await conn.exec_driver_sql("""
+            SELECT relname, seq_scan, seq_tup_read, COALESCE(idx_scan, 0), n_live_tup,
+                   n_tup_ins + n_tup_upd + n_tup_del
+            FROM pg_stat_user_tables
+            WHERE schemaname = 'public'
+        """)
+        tables = {}
+        for name, seq_scan, seq_tup_read, idx_scan, live_rows, writes in result:
+            tables[name] = {
+                "table": name,
+                "seq_scan": seq_scan,
+                "seq_tup_read": seq_tup_read,
+                "idx_scan": idx_scan,
+                "live_rows": live_rows,
+                "writes": writes,
+                "seq_scan_heavy": seq_scan > idx_scan and live_rows >= self.min_table_rows,
+            }
+        return tables
+
+    async def _statements(self, conn, use_pg_stat_statements: bool) -> List[Dict[str, Any]]:
+        """총 실행 시간 상위 문장 + 애플리케이션 fingerprint 대조"""
+        app_stats = query_metrics.statement_stats
+        if not use_pg_stat_statements:
+            return [
+                {
+                    "query": entry.sample,
+                    "calls": entry.count,
+                    "total_ms": round(entry.total_time * 1000, 2),
+                    "fingerprint": fp,
+                    "seen_in_app": True,
+                }
+                for fp, entry in sorted(app_stats.items(), key=lambda item: item[1].total_time, reverse=True)
+                if fp.upper().startswith(("SELECT", "UPDATE", "DELETE"))
+            ][:self.statement_limit]
+
+        # PostgreSQL 13부터 total_time -> total_exec_time
+        result = await conn.exec_driver_sql("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_name = 'pg_stat_statements' AND column_name = 'total_exec_time'
+        """)
+        time_column = "total_exec_time" if result.first() else "total_time"
+        result = await conn.exec_driver_sql(f"""
+            SELECT query, calls, {time_column}
+            FROM pg_stat_statements
+            WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+              AND query ~* '^\\s*(SELECT|UPDATE|DELETE)'
+            ORDER BY {time_column} DESC
+            LIMIT {int(self.statement_limit)}
+        """)
+        statements = []
+        for query, calls, total_ms in result:
+            fp = query_metrics.fingerprint(query)
+            statements.append({
+                "query": query,
+                "calls": calls,
+                "total_ms": round(total_ms, 2),
+                "fingerprint": fp,
+                "seen_in_app": fp in app_stats,
+            })
+        return statements
+
+    async def _existing_indexes(self, conn) -> Dict[str, List[List[str]]]:
+        result = await conn.exec_driver_sql("""
+            SELECT t.relname, array_agg(a.attname ORDER BY k.ord)
+            FROM pg_index i
+            JOIN pg_class t ON t.oid = i.indrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace AND n.nspname = 'public'
+            CROSS JOIN LATERAL unnest(i.indkey) WITH ORDINALITY AS k(attnum, ord)
+            JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+            WHERE i.indisvalid
+            GROUP BY t.relname, i.indexrelid
+        """)
+        existing: Dict[str, List[List[str]]] = {}
+        for table, columns in result:
+            existing.setdefault(table, []).append(list(columns))
+        return existing
+
+    def _build_candidates(
+        self,
+        statements: List[Dict[str, Any]],
+        tables: Dict[str, Dict[str, Any]],
+        existing: Dict[str, List[List[str]]]
+    ) -> List[Dict[str, Any]]:
+        candidates: Dict[Tuple[str, Tuple[str, ...]], Dict[str, Any]] = {}
+        for statement in statements:
+            for table, columns in extract_index_candidates(statement["query"]).items():
+                table_stats = tables.get(table)
+                if not columns or table_stats is None or table_stats["live_rows"] < self.min_table_rows:
+                    continue
+                if _is_covered(columns, existing.get(table, [])):
+                    continue
+                key = (table, tuple(columns))
+                candidate = candidates.get(key)
+                if candidate is None:
+                    candidate = candidates[key] = {
+                        "table": table,
+                        "columns": columns,
+                        "ddl": f"CREATE INDEX CONCURRENTLY ix_{table}_{'_'.join(columns)} ON {table} ({', '.join(columns)})",
+                        "table_seq_scans": table_stats["seq_scan"],
+                        "table_writes": table_stats["writes"],
+                        "calls": 0,
+                        "total_ms": 0.0,
+                        "cost_before": None,
+                        "cost_after": None,
+                        "estimated_improvement_pct": None,
+                        "estimated_benefit": None,
+                        "statements": [],
+                    }
+                candidate["calls"] += statement["calls"]
+                candidate["total_ms"] = round(candidate["total_ms"] + statement["total_ms"], 2)
+                candidate["statements"].append({
+                    "query": statement["query"][:500],
+                    "calls": statement["calls"],
+                    "total_ms": statement["total_ms"],
+                    "seen_in_app": statement["seen_in_app"],
+                })
+        return list(candidates.values())
+
+    async def _generic_plan_cost(self, conn, query: str) -> Optional[float]:
+        """파라미터($n) 문장의 일반 계획(generic plan) 비용 - 값과 무관한 계획을 비교하기 위함"""
+        param_count = max((int(n) for n in _PARAM.findall(query)), default=0)
+        savepoint = await conn.begin_nested()
+        prepared = False
+        try:
+            await conn.exec_driver_sql("SET LOCAL plan_cache_mode = force_generic_plan")
+            await conn.exec_driver_sql(f"PREPARE {PREPARED_STATEMENT_NAME} AS {query}")
+            prepared = True
+            args = f"({', '.join(['NULL'] * param_count)})" if param_count else ""
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) EXECUTE {PREPARED_STATEMENT_NAME}{args}")
+            cost = _plan_cost(result.scalar())
+            await savepoint.commit()
+            return cost
+        except Exception as e:
+            logger.debug("Index advisor could not explain statement: %s", e)
+            await savepoint.rollback()
+            return None
+        finally:
+            # PREPARE는 트랜잭션으로 되돌려지지 않으므로 직접 해제
+            if prepared:
+                try:
+                    await conn.exec_driver_sql(f"DEALLOCATE {PREPARED_STATEMENT_NAME}")
+                except Exception:
+                    pass
+
+    async def _estimate_benefit(self, conn, recommendation: Dict[str, Any]) -> None:
+        """hypopg 가상 인덱스 전후의 EXPLAIN 비용으로 효과 추정 (호출 수 가중)"""
+        quote = conn.dialect.identifier_preparer.quote
+        columns = ", ".join(quote(column) for column in recommendation["columns"])
+        create_sql = f"CREATE INDEX ON {quote(recommendation['table'])} ({columns})"
+        cost_before = cost_after = 0.0
+        benefit = 0.0
+        explained = 0
+
+        for statement in recommendation["statements"][:3]:
+            before = await self._generic_plan_cost(conn, statement["query"])
+            if before is None:
+                continue
+            # DDL 문자열은 바인드 파라미터로 전달 (쿼리 문자열에 끼워 넣지 않음)
+            await conn.execute(text("SELECT * FROM hypopg_create_index(:create_sql)"), {"create_sql": create_sql})
+            try:
+                after = await self._generic_plan_cost(conn, statement["query"])
+            finally:
+                await conn.exec_driver_sql("SELECT hypopg_reset()")
+            if after is None:
+                continue
+            explained += 1
+            cost_before += before
+            cost_after += after
+            benefit += (before - after) * statement["calls"]
+
+        if explained:
+            recommendation["cost_before"] = round(cost_before, 2)
+            recommendation["cost_after"] = round(cost_after, 2)
+            recommendation["estimated_improvement_pct"] = (
+                round((cost_before - cost_after) / cost_before * 100, 1) if cost_before else 0.0
+            )
+            recommendation["estimated_benefit"] = round(benefit, 1)
+
+    async def _unused_indexes(self, conn) -> List[Dict[str, Any]]:
+        """app/db/indexes.py 인덱스 중 통계 초기화 이후 스캔이 없는 인덱스"""
+        from app.db.indexes import all_indexes
+
+        names = [index.name for index in all_indexes]
+        result = await conn.exec_driver_sql("""
+            SELECT s.indexrelname, s.relname, s.idx_scan, pg_relation_size(s.indexrelid),
+                   t.n_tup_ins + t.n_tup_upd + t.n_tup_del
+            FROM pg_stat_user_indexes s
+            JOIN pg_stat_user_tables t ON t.relid = s.relid
+            WHERE s.schemaname = 'public'
+        """)
+        usage = {row[0]: row for row in result}
+
+        unused = []
+        for name in names:
+            row = usage.get(name)
+            if row is None:
+                unused.append({"index": name, "status": "missing"})
+            elif row[2] == 0:
+                unused.append({
+                    "index": name,
+                    "table": row[1],
+                    "status": "unused",
+                    "size_bytes": row[3],
+                    "table_writes": row[4],
+                })
+        return unused
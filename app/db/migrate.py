@@ -0,0 +1,151 @@
+"""
+Schema migration / seeding entry point for BrandFlow API
+- 배포 시 한 번만 실행 (Railway preDeployCommand): python -m app.db.migrate
+- PostgreSQL advisory lock으로 여러 인스턴스가 동시에 실행해도 한 번에 하나만 진행
+- 서버(serve 모드)는 verify_schema_version()으로 버전만 한 번 확인하고 바로 트래픽을 받음
+"""
+
+import asyncio
+import logging
+import sys
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from app.core.config import settings
+from app.core.startup_timing import startup_timer
+
+logger = logging.getLogger(__name__)
+
+# 현재 코드가 기대하는 Alembic 리비전 - 새 마이그레이션을 추가하면 함께 갱신
+# (serve 시작 경로에서 alembic을 import하지 않도록 상수로 유지, tests/test_alembic_chain.py가 head와 비교)
+SCHEMA_REVISION = "20261018_company_logo_assets"
+
+# create_tables()와 database.py 보정 함수가 대신 맞춰 온 마지막 리비전
+# alembic_version이 없거나 이보다 오래된/알 수 없는 리비전이면 여기로 stamp한 뒤 이후 리비전만 실행
+LEGACY_BASELINE_REVISION = "20251201_add_product_name"
+
+# pg_advisory_lock 키 (임의의 고정 64비트 값)
+MIGRATION_LOCK_ID = 7_236_041_835_201_551
+
+
+def _run_alembic_upgrade(current: List[str]) -> None:
+    """
+    alembic env.py가 asyncio.run()을 사용하므로 이벤트 루프가 없는 스레드에서 실행
+    - current가 기준 리비전 이후 체인에 없으면(미적용/레거시/알 수 없는 리비전) 기준 리비전으로 stamp 후 upgrade
+    """
+    from alembic import command
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    alembic_cfg = Config("alembic.ini")
+    alembic_cfg.set_main_option("sqlalchemy.url", settings.get_database_url)
+
+    script = ScriptDirectory.from_config(alembic_cfg)
+    managed = {LEGACY_BASELINE_REVISION} | {
+        revision.revision for revision in script.iterate_revisions("heads", LEGACY_BASELINE_REVISION)
+    }
+    if not current or not set(current) <= managed:
+        logger.warning(
+            "Alembic revision %s is not on the managed chain, stamping %s",
+            current or None, LEGACY_BASELINE_REVISION
+        )
+        command.stamp(alembic_cfg, LEGACY_BASELINE_REVISION, purge=True)
+    command.upgrade(alembic_cfg, "head")
+
+
+async def _current_revisions(conn) -> List[str]:
+    """alembic_version의 리비전 목록 (테이블이 없으면 빈 목록)"""
+    try:
+        result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+    except ProgrammingError:
+        # alembic_version 테이블 없음 - 한 번도 migrate하지 않은 데이터베이스
+        await conn.rollback()
+        return []
+    return [row[0] for row in result]
+
+
+async def run_migrations() -> None:
+    """스키마 생성/마이그레이션/데이터 보정/초기 데이터 (멱등, advisory lock 보호)"""
+    from app.db.database import (
+        async_engine, get_async_db, create_tables, add_client_user_id_column,
+        migrate_client_company_to_user_id, add_campaign_date_columns, update_null_campaign_dates
+    )
+    from app.db.init_data import init_database_data
+
+    async with async_engine.connect() as lock_conn:
+        with startup_timer.phase("migration_lock"):
+            await lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_ID})
+            # 세션 단위 잠금이므로 트랜잭션은 바로 종료 (idle in transaction 방지)
+            await lock_conn.commit()
+        try:
+            with startup_timer.phase("create_tables"):
+                await create_tables()
+
+            # 실패하면 예외를 그대로 올려 migrate가 0이 아닌 코드로 끝나게 함 (배포 중단)
+            with startup_timer.phase("alembic_upgrade"):
+                current = await _current_revisions(lock_conn)
+                await lock_conn.commit()
+                await asyncio.to_thread(_run_alembic_upgrade, current)
+
+            with startup_timer.phase("add_client_user_id_column"):
+                await add_client_user_id_column()
+            with startup_timer.phase("migrate_client_company_to_user_id"):
+                await migrate_client_company_to_user_id()
+            with startup_timer.phase("add_campaign_date_columns"):
+                await add_campaign_date_columns()
+            with startup_timer.phase("update_null_campaign_dates"):
+                await update_null_campaign_dates()
+
+            try:
+                with startup_timer.phase("init_database_data"):
+                    async for db in get_async_db():
+                        await init_database_data(db)
+                        break
+            except Exception as data_error:
+                logger.error("Database data initialization failed (non-critical): %s", data_error)
+        finally:
+            await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_ID})
+            await lock_conn.commit()
+
+
+async def verify_schema_version() -> Dict[str, Any]:
+    """alembic_version 단일 조회로 스키마 버전 확인 (serve 모드 시작 경로)"""
+    from app.db.database import async_engine
+
+    status = {"expected": SCHEMA_REVISION, "current": None, "up_to_date": False}
+    async with async_engine.connect() as conn:
+        status["current"] = ",".join(await _current_revisions(conn)) or None
+    status["up_to_date"] = SCHEMA_REVISION in (status["current"] or "").split(",")
+    return status
+
+
+async def main() -> int:
+    from app.core.logging import setup_application_logging, shutdown_application_logging
+    from app.db.database import async_engine
+
+    setup_application_logging()
+    startup_timer.mode = "migrate"
+    exit_code = 0
+    try:
+        await run_migrations()
+        startup_timer.schema = await verify_schema_version()
+        if not startup_timer.schema["up_to_date"]:
+            logger.error("Schema revision %s != %s after migration", startup_timer.schema["current"], SCHEMA_REVISION)
+            exit_code = 1
+    except Exception as e:
+        logger.error("Migration failed: %s", e)
+        exit_code = 1
+    finally:
+        await async_engine.dispose()
+
+    for phase in startup_timer.phases:
+        logger.info("[MIGRATE] %-36s %8.1fms %s", phase["name"], phase["duration_ms"], "ok" if phase["ok"] else "FAILED")
+    logger.info("[MIGRATE] schema: %s", startup_timer.schema)
+    shutdown_application_logging()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,179 @@
+"""
+SQLAlchemy 쿼리 계측
+- 요청 단위 쿼리 수 / DB 시간 집계 (contextvar)
+- 문장 fingerprint 기반 N+1 패턴 감지
+- fingerprint별 느린 쿼리 상위 K개 테이블
+"""
+
+import re
+import time
+import logging
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# fingerprint 테이블 최대 크기 (초과 시 누적 시간이 가장 적은 항목 교체)
+MAX_TRACKED_STATEMENTS = 1000
+RECENT_SLOW_QUERY_HISTORY = 100
+N_PLUS_ONE_HISTORY = 100
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):[A-Za-z_]\w*|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """리터럴과 바인드 파라미터를 제거한 정규화 문장
+
+    SQLAlchemy는 컴파일 캐시로 같은 문자열을 반복 사용하므로 lru_cache 적중률이 높습니다.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class RequestQueryStats:
+    """요청 하나에서 실행된 쿼리 통계"""
+
+    __slots__ = ("query_count", "total_time", "fingerprints")
+
+    def __init__(self):
+        self.query_count = 0
+        self.total_time = 0.0
+        self.fingerprints: Dict[str, int] = {}
+
+    @property
+    def total_time_ms(self) -> float:
+        return self.total_time * 1000
+
+    def repeated_statements(self, threshold: int) -> Dict[str, int]:
+        """threshold 회를 초과해 반복된 fingerprint (N+1 후보)"""
+        return {fp: count for fp, count in self.fingerprints.items() if count > threshold}
+
+
+class StatementStats:
+    """fingerprint별 누적 실행 통계"""
+
+    __slots__ = ("count", "total_time", "max_time", "sample")
+
+    def __init__(self, sample: str):
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.sample = sample
+
+    def to_dict(self, fp: str) -> Dict[str, Any]:
+        return {
+            "fingerprint": fp,
+            "sample": self.sample[:500],
+            "count": self.count,
+            "total_ms": round(self.total_time * 1000, 2),
+            "avg_ms": round(self.total_time / self.count * 1000, 2) if self.count else 0,
+            "max_ms": round(self.max_time * 1000, 2),
+        }
+
+
+_current_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "current_request_query_stats", default=None
+)
+
+statement_stats: Dict[str, StatementStats] = {}
+recent_slow_queries: deque = deque(maxlen=RECENT_SLOW_QUERY_HISTORY)
+n_plus_one_events: deque = deque(maxlen=N_PLUS_ONE_HISTORY)
+
+
+def begin_request() -> RequestQueryStats:
+    """현재 요청 컨텍스트에 쿼리 통계 객체 연결"""
+    stats = RequestQueryStats()
+    _current_request_stats.set(stats)
+    return stats
+
+
+def current_request_stats() -> Optional[RequestQueryStats]:
+    return _current_request_stats.get()
+
+
+def record_n_plus_one(endpoint: str, stats: RequestQueryStats) -> None:
+    """요청 종료 시 반복 쿼리 패턴 기록"""
+    threshold = settings.SQL_N_PLUS_ONE_THRESHOLD
+    for fp, count in stats.repeated_statements(threshold).items():
+        n_plus_one_events.append({
+            "endpoint": endpoint,
+            "fingerprint": fp[:500],
+            "count": count,
+            "threshold": threshold,
+            "timestamp": datetime.now().isoformat()
+        })
+        logger.warning("N+1 query pattern: %s ran %d times - %.120s", endpoint, count, fp)
+
+
+def _record_statement(fp: str, statement: str, elapsed: float) -> None:
+    entry = statement_stats.get(fp)
+    if entry is None:
+        if len(statement_stats) >= MAX_TRACKED_STATEMENTS:
+            evicted = min(statement_stats, key=lambda key: statement_stats[key].total_time)
+            del statement_stats[evicted]
+        entry = statement_stats[fp] = StatementStats(statement)
+    entry.count += 1
+    entry.total_time += elapsed
+    if elapsed > entry.max_time:
+        entry.max_time = elapsed
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start_time
+    fp = fingerprint(statement)
+
+    request_stats = _current_request_stats.get()
+    if request_stats is not None:
+        request_stats.query_count += 1
+        request_stats.total_time += elapsed
+        request_stats.fingerprints[fp] = request_stats.fingerprints.get(fp, 0) + 1
+
+    _record_statement(fp, statement, elapsed)
+
+    if elapsed * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+        recent_slow_queries.append({
+            "query": statement[:200] + "..." if len(statement) > 200 else statement,
+            "duration": round(elapsed, 3),
+            "timestamp": datetime.now().isoformat(),
+            "parameters": str(parameters)[:100] if parameters else None
+        })
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """엔진에 커서 실행 훅 등록 (AsyncEngine은 .sync_engine 전달)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def get_top_statements(limit: int = 20, sort_by: str = "total_ms") -> List[Dict[str, Any]]:
+    """느린 쿼리 상위 K개 (fingerprint 기준)"""
+    rows = [entry.to_dict(fp) for fp, entry in statement_stats.items()]
+    rows.sort(key=lambda row: row.get(sort_by, 0), reverse=True)
+    return rows[:limit]
+
+
+def reset_query_metrics() -> None:
+    statement_stats.clear()
+    recent_slow_queries.clear()
+    n_plus_one_events.clear()
@@ -1,26 +1,73 @@
 """
 데이터베이스 쿼리 최적화 도구
 - 느린 쿼리 감지 및 개선
-- 인덱스 추천 시스템
+- 인덱스 추천 시스템 (app/db/index_advisor.py)
 - 쿼리 캐싱 전략
 - N+1 문제 해결
 """
 
-from sqlalchemy import text, select
+from sqlalchemy import text, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
-from typing import List, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 import asyncio
 from datetime import datetime
 
-from app.models.user import User
+from app.core.cache import app_cache
+from app.core.config import settings
+from app.models.user import User, UserRole
 from app.models.campaign import Campaign
 from app.models.purchase_request import PurchaseRequest
 
+QueryFunc = Callable[[AsyncSession], Awaitable[Any]]
+
+DASHBOARD_CACHE_PREFIX = "query_optimizer:dashboard:"
+
+
+class ParallelQueryExecutor:
+    """독립 쿼리들을 각자의 세션(풀 커넥션)에서 동시에 실행
+
+    AsyncSession 하나는 동시 실행을 지원하지 않으므로 분기마다 AsyncSessionLocal()로 세션을 새로 엽니다.
+    세마포어로 워커 전체의 동시 점유 커넥션 수를 제한해 커넥션 풀 고갈을 막습니다.
+    """
+
+    def __init__(self, max_concurrency: int = 8, timeout: float = 10.0):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _run_one(self, query_func: QueryFunc) -> Any:
+        from app.db.database import AsyncSessionLocal
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            async with AsyncSessionLocal() as session:
+                return await query_func(session)
+
+    async def run(self, *query_funcs: QueryFunc, timeout: Optional[float] = None) -> List[Any]:
+        """모든 분기 결과를 순서대로 반환
+
+        하나라도 실패하거나 전체 제한 시간을 넘기면 남은 분기를 취소하고 예외를 그대로 전파합니다
+        (제한 시간 초과 시 asyncio.TimeoutError).
+        """
+        tasks = [asyncio.ensure_future(self._run_one(query_func)) for query_func in query_funcs]
+        try:
+            return await asyncio.wait_for(asyncio.gather(*tasks), timeout or self.timeout)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
 class QueryOptimizer:
-    def __init__(self):
-        self.query_cache = {}
-        self.cache_ttl = 300  # 5분 캐시
+    def __init__(self, executor: Optional[ParallelQueryExecutor] = None):
+        self.executor = executor or ParallelQueryExecutor(
+            max_concurrency=settings.PARALLEL_QUERY_MAX_CONCURRENCY,
+            timeout=settings.PARALLEL_QUERY_TIMEOUT_SECONDS
+        )
+        self.cache_ttl = settings.DASHBOARD_STATS_CACHE_TTL
     
     async def get_campaigns_with_users_optimized(self, db: AsyncSession, company: str = None) -> List[Campaign]:
         """캠페인+사용자 정보를 효율적으로 조회 (N+1 문제 해결)"""
@@ -43,48 +90,51 @@ class QueryOptimizer:
         result = await db.execute(query)
         return result.scalar_one_or_none()
     
-    async def get_dashboard_data_optimized(self, db: AsyncSession, user_id: int, user_role: str) -> Dict:
-        """대시보드 데이터를 최적화된 쿼리로 조회"""
-        cache_key = f"dashboard_{user_id}_{user_role}"
+    async def get_dashboard_data_optimized(self, user: User) -> Dict:
+        """대시보드 데이터를 최적화된 쿼리로 조회 (권한 범위별 캐시)
+
+        캠페인/구매요청/사용자 집계는 서로 독립적이므로 ParallelQueryExecutor로 동시에 실행합니다.
+        """
+        if user.role == UserRole.SUPER_ADMIN:
+            scope = "all"
+        elif user.role == UserRole.CLIENT:
+            scope = f"user:{user.id}"
+        else:
+            scope = f"company:{user.company}"
+        cache_key = f"{DASHBOARD_CACHE_PREFIX}{user.role.value}:{scope}"
         
         # 캐시 확인
-        if cache_key in self.query_cache:
-            cached_data, timestamp = self.query_cache[cache_key]
-            if (datetime.now() - timestamp).seconds < self.cache_ttl:
-                return cached_data
+        cached_data = await app_cache.get(cache_key)
+        if cached_data is not None:
+            return cached_data
         
-        # 병렬로 여러 쿼리 실행
-        tasks = []
-        
-        # 1. 캠페인 통계
-        campaigns_task = self._get_campaign_stats(db, user_id, user_role)
-        tasks.append(campaigns_task)
-        
-        # 2. 구매요청 통계  
-        purchase_requests_task = self._get_purchase_request_stats(db, user_id, user_role)
-        tasks.append(purchase_requests_task)
-        
-        # 3. 사용자별 데이터
-        user_data_task = self._get_user_data(db, user_id)
-        tasks.append(user_data_task)
-        
-        # 모든 쿼리 병렬 실행
-        campaign_stats, purchase_stats, user_data = await asyncio.gather(*tasks)
+        campaign_stats, purchase_stats, user_stats = await self.executor.run(
+            lambda session: self._get_campaign_stats(session, user),
+            lambda session: self._get_purchase_request_stats(session, user),
+            lambda session: self._get_user_stats(session, user)
+        )
         
         dashboard_data = {
             'campaigns': campaign_stats,
             'purchase_requests': purchase_stats,
-            'user': user_data,
+            'users': user_stats,
+            'user': {
+                'id': user.id,
+                'name': user.name,
+                'email': user.email,
+                'company': user.company,
+                'role': user.role.value
+            },
             'generated_at': datetime.now().isoformat()
         }
         
         # 캐시 저장
-        self.query_cache[cache_key] = (dashboard_data, datetime.now())
+        await app_cache.set(cache_key, dashboard_data, ttl=self.cache_ttl)
         
         return dashboard_data
     
-    async def _get_campaign_stats(self, db: AsyncSession, user_id: int, user_role: str) -> Dict:
-        """캠페인 통계 조회 (최적화된 집계 쿼리)"""
+    async def _get_campaign_stats(self, db: AsyncSession, user: User) -> Dict:
+        """캠페인 상태별 개수/예산 합계 (GROUP BY 한 번)"""
         base_query = select(
             Campaign.status,
             func.count(Campaign.id).label('count'),
@@ -92,31 +142,25 @@ class QueryOptimizer:
         ).group_by(Campaign.status)
         
         # 권한별 필터링
-        if user_role == '클라이언트':
-            base_query = base_query.where(Campaign.creator_id == user_id)
-        elif user_role in ['대행사 어드민', '직원']:
+        if user.role == UserRole.CLIENT:
+            base_query = base_query.where(Campaign.creator_id == user.id)
+        elif user.role != UserRole.SUPER_ADMIN:
             # 같은 회사 사용자들의 캠페인만
-            user_subquery = select(User.id).where(
-                User.company == select(User.company).where(User.id == user_id).scalar_subquery()
-            )
-            base_query = base_query.where(Campaign.creator_id.in_(user_subquery))
+            base_query = base_query.join(User, Campaign.creator_id == User.id).where(User.company == user.company)
         
         result = await db.execute(base_query)
-        rows = result.fetchall()
         
         stats = {}
-        for row in rows:
-            stats[row.status] = {
+        for row in result:
+            stats[_status_key(row.status)] = {
                 'count': row.count,
                 'total_budget': float(row.total_budget)
             }
         
         return stats
     
-    async def _get_purchase_request_stats(self, db: AsyncSession, user_id: int, user_role: str) -> Dict:
-        """구매요청 통계 조회"""
-        from sqlalchemy import func
-        
+    async def _get_purchase_request_stats(self, db: AsyncSession, user: User) -> Dict:
+        """구매요청 상태별 개수/금액 합계"""
         base_query = select(
             PurchaseRequest.status,
             func.count(PurchaseRequest.id).label('count'),
@@ -124,51 +168,40 @@ class QueryOptimizer:
         ).group_by(PurchaseRequest.status)
         
         # 권한별 필터링 (캠페인과 동일한 로직)
-        if user_role == '클라이언트':
-            base_query = base_query.where(PurchaseRequest.requester_id == user_id)
-        elif user_role in ['대행사 어드민', '직원']:
-            user_subquery = select(User.id).where(
-                User.company == select(User.company).where(User.id == user_id).scalar_subquery()
-            )
-            base_query = base_query.where(PurchaseRequest.requester_id.in_(user_subquery))
+        if user.role == UserRole.CLIENT:
+            base_query = base_query.where(PurchaseRequest.requester_id == user.id)
+        elif user.role != UserRole.SUPER_ADMIN:
+            base_query = base_query.join(User, PurchaseRequest.requester_id == User.id).where(User.company == user.company)
         
         result = await db.execute(base_query)
-        rows = result.fetchall()
         
         stats = {}
-        for row in rows:
-            stats[row.status] = {
+        for row in result:
+            stats[_status_key(row.status)] = {
                 'count': row.count,
                 'total_amount': float(row.total_amount) if row.total_amount else 0
             }
         
         return stats
     
-    async def _get_user_data(self, db: AsyncSession, user_id: int) -> Dict:
-        """사용자 기본 정보 조회"""
-        query = select(User).where(User.id == user_id)
-        result = await db.execute(query)
-        user = result.scalar_one_or_none()
+    async def _get_user_stats(self, db: AsyncSession, user: User) -> Dict:
+        """범위 내 사용자 수 / 활성 사용자 수"""
+        if user.role == UserRole.CLIENT:
+            return {'total': 1, 'active': 1 if user.is_active else 0}
         
-        if not user:
-            return {}
+        query = select(
+            func.count(User.id).label('total'),
+            func.count(User.id).filter(User.is_active == True).label('active')
+        )
+        if user.role != UserRole.SUPER_ADMIN:
+            query = query.where(User.company == user.company)
         
-        return {
-            'id': user.id,
-            'name': user.name,
-            'email': user.email,
-            'company': user.company,
-            'role': user.role.value if hasattr(user.role, 'value') else user.role
-        }
+        row = (await db.execute(query)).one()
+        return {'total': row.total or 0, 'active': row.active or 0}
     
-    def clear_cache(self, pattern: str = None):
-        """캐시 정리"""
-        if pattern:
-            keys_to_remove = [key for key in self.query_cache.keys() if pattern in key]
-            for key in keys_to_remove:
-                del self.query_cache[key]
-        else:
-            self.query_cache.clear()
+    async def clear_cache(self, pattern: str = None) -> int:
+        """대시보드 캐시 정리 (pattern: 역할/범위 접두사, 예: 'AGENCY_ADMIN:company:브랜드플로우')"""
+        return await app_cache.delete_prefix(DASHBOARD_CACHE_PREFIX + (pattern or ""))
     
     async def analyze_slow_queries(self, db: AsyncSession) -> List[Dict]:
         """느린 쿼리 분석 및 개선 제안"""
@@ -219,5 +252,10 @@ class QueryOptimizer:
         
         return slow_queries
 
+
+def _status_key(status) -> str:
+    return status.value if hasattr(status, 'value') else str(status)
+
+
 # 전역 쿼리 최적화 인스턴스
-query_optimizer = QueryOptimizer()
\ No newline at end of file
+query_optimizer = QueryOptimizer()
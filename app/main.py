@@ -7,58 +7,38 @@ import uvicorn
 import os
 
 from app.core.config import settings
-from app.db.database import create_tables, create_performance_indexes, get_async_db, add_client_user_id_column, migrate_client_company_to_user_id, add_campaign_date_columns, update_null_campaign_dates
-from app.db.init_data import init_database_data
-from alembic.config import Config
-from alembic import command
+from app.core.logging import setup_application_logging, shutdown_application_logging
+from app.core.serialization import FastJSONResponse
+from app.core.startup_timing import startup_timer
+from app.db.database import get_async_db
+from app.db.migrate import run_migrations, verify_schema_version
 import subprocess
-from app.api.endpoints import auth, users, campaigns, purchase_requests, company_logo, products, work_types, notifications, file_upload, performance, monitoring, dashboard, search, export, admin, websocket, security_dashboard, performance_dashboard, cache, health, dashboard_simple, migration, monthly_incentives, incentives, campaign_costs, board
+from app.core.lazy_routers import LazyRouterMiddleware, LazyRouterRegistry
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 구조화/비동기 로깅 파이프라인 시작 (QueueHandler -> QueueListener)
+    setup_application_logging()
+
     # Startup - Railway 배포용 안전한 시작
     print("Starting BrandFlow FastAPI v2.3.0...")
     print("Railway deployment mode - Health API enabled")
+    startup_timer.mode = settings.STARTUP_MODE
     
-    # Railway에서 안전한 데이터베이스 초기화
+    # 스키마 마이그레이션/데이터 보정/초기 데이터는 배포 시 한 번만 실행 (python -m app.db.migrate)
+    # STARTUP_MODE=all(로컬 개발)일 때만 서버 시작 과정에서 함께 실행
     try:
-        print("Attempting database connection...")
-        await create_tables()
-        print("Database tables created successfully")
-
-        # Alembic 마이그레이션 실행
-        try:
-            print("Running Alembic migrations...")
-            alembic_cfg = Config("alembic.ini")
-            command.upgrade(alembic_cfg, "head")
-            print("Alembic migrations completed successfully")
-        except Exception as alembic_error:
-            print(f"Alembic migration failed (non-critical): {str(alembic_error)}")
-
-        # client_user_id 컬럼 추가 (스키마 마이그레이션)
-        await add_client_user_id_column()
-
-        # 기존 client_company 데이터를 client_user_id로 마이그레이션
-        await migrate_client_company_to_user_id()
-
-        # campaigns 테이블에 start_date, end_date 컬럼 추가
-        await add_campaign_date_columns()
-
-        # 기존 캠페인들의 NULL 날짜 필드들에 기본값 설정
-        await update_null_campaign_dates()
-
-
-        # 초기 데이터 생성 (선택적)
-        try:
-            print("Initializing database data...")
-            async for db in get_async_db():
-                await init_database_data(db)
-                break
-            print("Database data initialization completed")
-        except Exception as data_error:
-            print(f"Database data initialization failed (non-critical): {str(data_error)}")
-            
+        if settings.STARTUP_MODE == "all":
+            await run_migrations()
+
+        with startup_timer.phase("verify_schema_version"):
+            startup_timer.schema = await verify_schema_version()
+        if not startup_timer.schema["up_to_date"]:
+            print(
+                f"[WARNING] Schema revision {startup_timer.schema['current']} != "
+                f"{startup_timer.schema['expected']} - run 'python -m app.db.migrate'"
+            )
     except Exception as db_error:
         print(f"Database connection failed: {str(db_error)}")
         print("Server starting in offline mode - API endpoints will return appropriate errors")
@@ -67,7 +47,8 @@ async def lifespan(app: FastAPI):
     # 파일 업로드 디렉토리 초기화 (Railway Volume 지원)
     try:
         from app.core.file_upload import file_manager
-        await file_manager.ensure_upload_dir()
+        with startup_timer.phase("upload_dir"):
+            await file_manager.ensure_upload_dir()
         print(f"✅ Upload directory initialized: {file_manager.upload_dir}")
     except Exception as e:
         print(f"❌ Upload directory initialization error: {str(e)}")
@@ -103,8 +84,35 @@ async def lifespan(app: FastAPI):
     except Exception as scheduler_error:
         print(f"[ERROR] 텔레그램 스케줄러 시작 실패: {str(scheduler_error)}")
 
+    # 감사 이벤트 배치 writer 시작 (audit_events 테이블)
+    from app.security.audit_logger import audit_logger
+    with startup_timer.phase("audit_logger"):
+        await audit_logger.start()
+
+    # 토큰 폐기 목록 동기화 시작 (revoked_tokens 테이블)
+    from app.core.token_store import token_store
+    with startup_timer.phase("token_store"):
+        await token_store.start()
+
+    # 캠페인 포스트 집계 드리프트 점검
+    from app.services.campaign_aggregates import campaign_aggregate_reconciler
+    await campaign_aggregate_reconciler.start()
+
+    # 소프트 삭제 행 배치 정리
+    from app.services.soft_delete_purge import soft_delete_purger
+    await soft_delete_purger.start()
+
+    # 게시글 조회수 모아 쓰기
+    from app.services.view_counter import view_counter
+    await view_counter.start()
+
+    startup_timer.mark_ready()
     print("BrandFlow FastAPI v2.3.0 ready!")
 
+    # 지연 등록 라우터 warmup (첫 사용자 요청 전에 엔드포인트 모듈 import)
+    if settings.LAZY_ROUTERS and settings.LAZY_ROUTER_WARMUP:
+        await routers.start_warmup()
+
     yield
     # Shutdown
     try:
@@ -113,7 +121,19 @@ async def lifespan(app: FastAPI):
         print("텔레그램 스케줄러 중지됨")
     except:
         pass
+    await routers.stop()
+    from app.core.password_hasher import password_hasher
+    password_hasher.shutdown()
+    await token_store.stop()
+    await campaign_aggregate_reconciler.stop()
+    await soft_delete_purger.stop()
+    await view_counter.stop()  # 남은 조회수 반영
+    try:
+        await audit_logger.stop()
+    except Exception as audit_error:
+        print(f"[ERROR] 감사 로그 flush 실패: {str(audit_error)}")
     print("BrandFlow server shutdown completed")
+    shutdown_application_logging()
 
 
 app = FastAPI(
@@ -121,6 +141,7 @@ app = FastAPI(
     description="BrandFlow 캠페인 관리 시스템 API - 캐시 무효화 버전",
     version="2.3.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # UTF-8 JSON 처리 미들웨어 추가 (가장 먼저 적용)
@@ -135,7 +156,14 @@ app = FastAPI(
 # from app.middleware.security_audit import SecurityAuditMiddleware
 # app.add_middleware(SecurityAuditMiddleware)  # 임시 비활성화
 # app.add_middleware(RequestSanitizationMiddleware, max_body_size=10*1024*1024)  # 임시 비활성화
-# app.add_middleware(RateLimitMiddleware, requests_per_minute=100, requests_per_second=10)  # 임시 비활성화
+from app.middleware.security import RateLimitMiddleware
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        requests_per_minute=settings.RATE_LIMIT_PER_MINUTE,
+        requests_per_second=settings.RATE_LIMIT_PER_SECOND,
+        trusted_proxy_hops=settings.TRUSTED_PROXY_HOPS
+    )
 # app.add_middleware(SecurityHeadersMiddleware)  # 임시 비활성화
 
 # 모니터링 미들웨어 추가 (Railway 배포 시 임시 비활성화)
@@ -155,9 +183,9 @@ import os
 #     app.add_middleware(HTTPSRedirectMiddleware)
 #     print("HTTPS 리다이렉트 미들웨어 활성화")
 
-# 성능 모니터링 미들웨어 추가
-from app.middleware.simple_performance import SimplePerformanceMiddleware
-app.add_middleware(SimplePerformanceMiddleware)
+# 성능 모니터링 미들웨어 추가 (pure ASGI, 라우트 템플릿별 히스토그램)
+from app.middleware.request_metrics import RequestMetricsMiddleware
+app.add_middleware(RequestMetricsMiddleware)
 
 # CORS 에러 핸들러 추가
 @app.exception_handler(Exception)
@@ -908,67 +936,54 @@ async def create_test_users_endpoint():
         return {"status": "error", "message": f"Database connection failed: {str(e)}"}
 
 
-# API 라우터 등록 - 핵심 기능
-app.include_router(auth.router, prefix="/api/auth", tags=["인증"])
-app.include_router(users.router, prefix="/api/users", tags=["사용자"])
-app.include_router(campaigns.router, prefix="/api/campaigns", tags=["캠페인"])
-app.include_router(purchase_requests.router, prefix="/api/purchase-requests", tags=["구매요청"])
-app.include_router(company_logo.router, prefix="/api/company", tags=["회사"])
-app.include_router(products.router, prefix="/api/products", tags=["상품"])
-app.include_router(work_types.router, prefix="/api/work-types", tags=["작업유형"])
-app.include_router(notifications.router, prefix="/api/notifications", tags=["알림"])
-app.include_router(file_upload.router, prefix="/api/files", tags=["파일"])
-app.include_router(monthly_incentives.router, prefix="/api/monthly-incentives", tags=["월간인센티브"])
-app.include_router(incentives.router, prefix="/api/incentives", tags=["인센티브"])
-app.include_router(campaign_costs.router, prefix="/api/campaign-costs", tags=["캠페인원가"])
-app.include_router(board.router, tags=["게시판"])
-
-# API 라우터 등록 - 대시보드 & 분석
-app.include_router(dashboard.router, prefix="/api/dashboard", tags=["대시보드"])
-app.include_router(dashboard_simple.router, prefix="/api/dashboard-simple", tags=["간단대시보드"])
-app.include_router(search.router, prefix="/api/search", tags=["검색"])
-app.include_router(export.router, prefix="/api/export", tags=["내보내기"])
-app.include_router(performance_dashboard.router, prefix="/api/performance-dashboard", tags=["성능대시보드"])
-app.include_router(security_dashboard.router, prefix="/api/security-dashboard", tags=["보안대시보드"])
-
-# API 라우터 등록 - 시스템 & 관리
-app.include_router(admin.router, prefix="/api/admin", tags=["관리자"])
-
-# 시스템 설정 라우터 별도 import 및 등록
-try:
-    from app.api.endpoints import system_settings
-    app.include_router(system_settings.router, prefix="/api/admin/system-settings", tags=["시스템설정"])
-    print("[OK] 시스템 설정 라우터 등록 완료")
-except Exception as e:
-    print(f"[ERROR] 시스템 설정 라우터 등록 실패: {str(e)}")
-
-# 텔레그램 설정 라우터 등록
-try:
-    from app.api.endpoints import telegram_settings
-    app.include_router(telegram_settings.router, prefix="/api/telegram", tags=["텔레그램알림"])
-    print("[OK] 텔레그램 설정 라우터 등록 완료")
-except Exception as e:
-    print(f"[ERROR] 텔레그램 설정 라우터 등록 실패: {str(e)}")
-
-# 회사별 설정 라우터 등록
-try:
-    from app.api.endpoints import company_settings
-    app.include_router(company_settings.router, prefix="/api/company-settings", tags=["회사설정"])
-    print("[OK] 회사별 설정 라우터 등록 완료")
-except Exception as e:
-    print(f"[ERROR] 회사별 설정 라우터 등록 실패: {str(e)}")
-
-app.include_router(performance.router, prefix="/api/performance", tags=["성능"])
-app.include_router(monitoring.router, prefix="/api/monitoring", tags=["모니터링"])
-app.include_router(cache.router, prefix="/api/cache", tags=["캐시"])
-app.include_router(health.router, prefix="/api/system", tags=["시스템상태"])
-app.include_router(websocket.router, prefix="/api/ws", tags=["웹소켓"])
+# API 라우터 등록 - 엔드포인트 모듈은 prefix로 첫 요청이 올 때(또는 준비 후 warmup에서) import/등록
+# (app/core/lazy_routers.py, LAZY_ROUTERS=false면 부팅 시 모두 등록)
+routers = LazyRouterRegistry(app, warmup_delay=settings.LAZY_ROUTER_WARMUP_DELAY_SECONDS)
+
+# 핵심 기능
+routers.add("app.api.endpoints.auth", "/api/auth", ["인증"])
+routers.add("app.api.endpoints.users", "/api/users", ["사용자"])
+routers.add("app.api.endpoints.campaigns", "/api/campaigns", ["캠페인"])
+routers.add("app.api.endpoints.purchase_requests", "/api/purchase-requests", ["구매요청"])
+routers.add("app.api.endpoints.company_logo", "/api/company", ["회사"])
+routers.add("app.api.endpoints.products", "/api/products", ["상품"])
+routers.add("app.api.endpoints.work_types", "/api/work-types", ["작업유형"])
+routers.add("app.api.endpoints.notifications", "/api/notifications", ["알림"])
+routers.add("app.api.endpoints.file_upload", "/api/files", ["파일"])
+routers.add("app.api.endpoints.monthly_incentives", "/api/monthly-incentives", ["월간인센티브"])
+routers.add("app.api.endpoints.incentives", "/api/incentives", ["인센티브"])
+routers.add("app.api.endpoints.campaign_costs", "/api/campaign-costs", ["캠페인원가"])
+routers.add("app.api.endpoints.board", "", ["게시판"], match_prefix="/api/board")  # 라우터 자체 prefix
+
+# 대시보드 & 분석
+routers.add("app.api.endpoints.dashboard", "/api/dashboard", ["대시보드"])
+routers.add("app.api.endpoints.dashboard_simple", "/api/dashboard-simple", ["간단대시보드"])
+routers.add("app.api.endpoints.search", "/api/search", ["검색"])
+routers.add("app.api.endpoints.export", "/api/export", ["내보내기"])
+routers.add("app.api.endpoints.performance_dashboard", "/api/performance-dashboard", ["성능대시보드"])
+routers.add("app.api.endpoints.security_dashboard", "/api/security-dashboard", ["보안대시보드"])
+
+# 시스템 & 관리 (설정 라우터는 import 실패해도 서버는 계속)
+routers.add("app.api.endpoints.admin", "/api/admin", ["관리자"])
+routers.add("app.api.endpoints.system_settings", "/api/admin/system-settings", ["시스템설정"], optional=True)
+routers.add("app.api.endpoints.telegram_settings", "/api/telegram", ["텔레그램알림"], optional=True)
+routers.add("app.api.endpoints.company_settings", "/api/company-settings", ["회사설정"], optional=True)
+
+routers.add("app.api.endpoints.performance", "/api/performance", ["성능"])
+routers.add("app.api.endpoints.monitoring", "/api/monitoring", ["모니터링"])
+routers.add("app.api.endpoints.cache", "/api/cache", ["캐시"])
+routers.add("app.api.endpoints.health", "/api/system", ["시스템상태"])
+routers.add("app.api.endpoints.websocket", "/api/ws", ["웹소켓"])
 
 # 마이그레이션 라우터 추가 (임시 비활성화 - crashed 해결)
-# from app.api.endpoints import migration, simple_migration
-app.include_router(migration.router, prefix="/api/migration", tags=["마이그레이션"])
+routers.add("app.api.endpoints.migration", "/api/migration", ["마이그레이션"])
 # app.include_router(simple_migration.router, prefix="/api/migrate", tags=["간단마이그레이션"])
 
+if settings.LAZY_ROUTERS:
+    app.add_middleware(LazyRouterMiddleware, registry=routers)
+else:
+    routers.mount_all()
+
 @app.get("/uploads/{category}/{filename}")
 async def serve_uploaded_file(category: str, filename: str):
     """업로드된 파일 직접 서빙 (StaticFiles 백업용)"""
@@ -1116,7 +1131,9 @@ async def health_check():
         "version": "2.2.2",
         "message": "BrandFlow FastAPI Health Check - All APIs Connected",
         "timestamp": "2025-09-06T03:45:00Z",
-        "registered_apis": 21
+        "registered_apis": 21,
+        "startup": startup_timer.report(),
+        "routers": routers.stats()
     }
 
 
@@ -1128,6 +1145,7 @@ async def debug_routes():
     """
     if os.getenv("ENABLE_SETUP_ENDPOINTS", "false").lower() != "true":
         raise HTTPException(status_code=404, detail="Not Found")
+    routers.mount_all()
     routes_info = []
     for route in app.router.routes:
         if hasattr(route, 'path') and hasattr(route, 'methods'):
@@ -7,7 +7,6 @@ import time
 import json
 import asyncio
 import logging
-import psutil
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
 from fastapi import Request, Response
@@ -55,10 +54,14 @@ class SystemMonitor:
     
     def get_cpu_usage(self) -> float:
         """CPU 사용률 (백분율)"""
+        import psutil  # 조회 시점에만 로드 (워커 부팅 경로에서 제외)
+
         return psutil.cpu_percent(interval=0.1)
     
     def get_memory_usage(self) -> Dict[str, Any]:
         """메모리 사용 정보"""
+        import psutil
+
         memory = psutil.virtual_memory()
         return {
             "total": memory.total,
@@ -69,6 +72,8 @@ class SystemMonitor:
     
     def get_disk_usage(self) -> Dict[str, Any]:
         """디스크 사용 정보"""
+        import psutil
+
         disk = psutil.disk_usage('/')
         return {
             "total": disk.total,
@@ -8,7 +8,6 @@
 
 import time
 import asyncio
-import psutil
 import json
 from datetime import datetime
 from typing import Dict, List
@@ -16,8 +15,8 @@ from collections import defaultdict, deque
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
+
+from app.db import query_metrics
 
 class PerformanceMonitor:
     def __init__(self):
@@ -46,7 +45,7 @@ class PerformanceMonitor:
     
     def record_memory_usage(self):
         """메모리 사용량 기록"""
-        memory_info = psutil.Process().memory_info()
+        memory_info = _process_memory_info()
         self.metrics['memory_usage'].append({
             'timestamp': datetime.now().isoformat(),
             'rss': memory_info.rss / 1024 / 1024,  # MB
@@ -91,9 +90,16 @@ class PerformanceMonitor:
             'slow_endpoints': slow_endpoints[:5],
             'error_rates': dict(self.metrics['error_count']),
             'memory_mb': list(self.metrics['memory_usage'])[-1] if self.metrics['memory_usage'] else None,
-            'slow_queries_count': len(self.metrics['slow_queries'])
+            'slow_queries_count': len(query_metrics.recent_slow_queries)
         }
 
+def _process_memory_info():
+    """현재 프로세스 메모리 정보 (psutil은 첫 요청 시점에 로드 - 워커 부팅 경로에서 제외)"""
+    import psutil
+
+    return psutil.Process().memory_info()
+
+
 # 전역 모니터 인스턴스
 performance_monitor = PerformanceMonitor()
 
@@ -121,7 +127,7 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
             
             # 응답 헤더에 성능 정보 추가
             response.headers["X-Response-Time"] = f"{duration:.3f}s"
-            response.headers["X-Process-Memory"] = f"{psutil.Process().memory_info().rss / 1024 / 1024:.1f}MB"
+            response.headers["X-Process-Memory"] = f"{_process_memory_info().rss / 1024 / 1024:.1f}MB"
             
             # 느린 요청 경고
             if duration > 1.0:  # 1초 이상
@@ -137,21 +143,4 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
         finally:
             self.monitor.metrics['active_connections'] -= 1
 
-# SQLAlchemy 쿼리 모니터링
-@event.listens_for(Engine, "before_cursor_execute")
-def receive_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    context._query_start_time = time.time()
-
-@event.listens_for(Engine, "after_cursor_execute") 
-def receive_after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    total = time.time() - context._query_start_time
-    
-    # 느린 쿼리 기록 (100ms 이상)
-    if total > 0.1:
-        performance_monitor.metrics['slow_queries'].append({
-            'query': statement[:200] + '...' if len(statement) > 200 else statement,
-            'duration': round(total, 3),
-            'timestamp': datetime.now().isoformat(),
-            'parameters': str(parameters)[:100] if parameters else None
-        })
-        print(f" 느린 쿼리: {total:.3f}s - {statement[:100]}...")
\ No newline at end of file
+# SQLAlchemy 쿼리 모니터링은 app/db/query_metrics.py에서 async_engine에 직접 등록
@@ -0,0 +1,257 @@
+"""
+Pure ASGI request metrics middleware
+- 매칭된 라우트 템플릿 기준 집계 (/api/campaigns/{campaign_id})
+- HDR 방식 고정 크기 지연시간 히스토그램 (p50/p95/p99)
+- BaseHTTPMiddleware 없이 send 래핑만 하므로 요청당 오버헤드 최소화
+- 요청별 쿼리 수/DB 시간을 Server-Timing 헤더로 노출하고 N+1 패턴 기록
+"""
+
+import time
+import logging
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.db import query_metrics
+
+perf_logger = logging.getLogger("performance")
+
+# 히스토그램 정밀도: 2의 거듭제곱 구간마다 8개 하위 버킷 (상대 오차 12.5% 이하)
+SUB_BUCKET_BITS = 3
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+# 최대 추적 값: 2^26 µs ≈ 67초 (초과 값은 마지막 버킷에 기록)
+MAX_EXPONENT = 26
+BUCKET_COUNT = SUB_BUCKET_COUNT + (MAX_EXPONENT - SUB_BUCKET_BITS + 1) * SUB_BUCKET_COUNT
+
+UNMATCHED_ROUTE = "<unmatched>"
+SLOW_REQUEST_THRESHOLD_MS = 500
+SLOW_REQUEST_HISTORY = 50
+
+
+def _bucket_index(value_us: int) -> int:
+    """마이크로초 값을 버킷 인덱스로 변환 (O(1))"""
+    if value_us < SUB_BUCKET_COUNT:
+        return value_us if value_us > 0 else 0
+    exponent = value_us.bit_length() - 1
+    if exponent > MAX_EXPONENT:
+        return BUCKET_COUNT - 1
+    sub_bucket = (value_us >> (exponent - SUB_BUCKET_BITS)) - SUB_BUCKET_COUNT
+    return SUB_BUCKET_COUNT + (exponent - SUB_BUCKET_BITS) * SUB_BUCKET_COUNT + sub_bucket
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """버킷 인덱스의 상한값 (마이크로초)"""
+    if index < SUB_BUCKET_COUNT:
+        return index + 1
+    offset = index - SUB_BUCKET_COUNT
+    shift = offset // SUB_BUCKET_COUNT
+    sub_bucket = offset % SUB_BUCKET_COUNT
+    return (SUB_BUCKET_COUNT + sub_bucket + 1) << shift
+
+
+class LatencyHistogram:
+    """고정 크기 로그-선형 지연시간 히스토그램"""
+
+    __slots__ = ("counts", "total_count")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * BUCKET_COUNT
+        self.total_count = 0
+
+    def record(self, value_us: int) -> None:
+        self.counts[_bucket_index(value_us)] += 1
+        self.total_count += 1
+
+    def percentile(self, percent: float) -> float:
+        """백분위 값 반환 (밀리초)"""
+        if self.total_count == 0:
+            return 0.0
+        target = max(1, int(self.total_count * percent / 100 + 0.5))
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return _bucket_upper_bound(index) / 1000
+        return _bucket_upper_bound(BUCKET_COUNT - 1) / 1000
+
+
+class RouteStats:
+    """라우트별 누적 통계"""
+
+    __slots__ = ("count", "errors", "total_us", "min_us", "max_us", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+        self.histogram = LatencyHistogram()
+
+    def record(self, duration_us: int, status_code: int) -> None:
+        if self.count == 0 or duration_us < self.min_us:
+            self.min_us = duration_us
+        if duration_us > self.max_us:
+            self.max_us = duration_us
+        self.count += 1
+        self.total_us += duration_us
+        if status_code >= 400:
+            self.errors += 1
+        self.histogram.record(duration_us)
+
+    def to_dict(self) -> Dict[str, Any]:
+        histogram = self.histogram
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_time": self.total_us / self.count / 1000 if self.count else 0,
+            "min_time_ms": self.min_us / 1000,
+            "max_time_ms": self.max_us / 1000,
+            "p50_ms": histogram.percentile(50),
+            "p95_ms": histogram.percentile(95),
+            "p99_ms": histogram.percentile(99),
+        }
+
+
+class RequestMetricsRegistry:
+    """라우트 템플릿별 요청 메트릭 저장소
+
+    키는 (method, route template)이므로 항목 수는 등록된 라우트 수로 제한됩니다.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+        self.total_requests = 0
+        self.total_us = 0
+        self.slow_requests: deque = deque(maxlen=SLOW_REQUEST_HISTORY)
+        self.started_at = time.time()
+
+    def record(self, method: str, route: str, duration_us: int, status_code: int) -> None:
+        key = (method, route)
+        stats = self.routes.get(key)
+        if stats is None:
+            stats = self.routes[key] = RouteStats()
+        stats.record(duration_us, status_code)
+        self.total_requests += 1
+        self.total_us += duration_us
+
+        if duration_us > SLOW_REQUEST_THRESHOLD_MS * 1000:
+            duration_ms = duration_us / 1000
+            self.slow_requests.append({
+                "endpoint": f"{method} {route}",
+                "duration_ms": round(duration_ms, 1),
+                "timestamp": time.time(),
+                "status_code": status_code
+            })
+            if duration_ms > 1000:
+                perf_logger.warning("%s %s - %.1fms - %s [SLOW]", method, route, duration_ms, status_code)
+
+    def export(self) -> Dict[str, Any]:
+        """대시보드용 메트릭 스냅샷"""
+        endpoints = {
+            f"{method} {route}": stats.to_dict()
+            for (method, route), stats in self.routes.items()
+        }
+        return {
+            "total_requests": self.total_requests,
+            "total_time": self.total_us / 1_000_000,
+            "avg_response_time": self.total_us / self.total_requests / 1000 if self.total_requests else 0,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "endpoints": endpoints,
+            "slow_requests": list(self.slow_requests),
+        }
+
+
+request_metrics = RequestMetricsRegistry()
+
+
+class RequestMetricsMiddleware:
+    """라우트 템플릿 기준 요청 메트릭 수집 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, registry: Optional[RequestMetricsRegistry] = None):
+        self.app = app
+        self.registry = registry or request_metrics
+        # endpoint -> 해당 endpoint를 가진 라우트 목록 (라우터 변경 시 재생성)
+        self._routes_by_endpoint: Dict[Any, list] = {}
+        self._indexed_route_count = -1
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter_ns()
+        query_stats = query_metrics.begin_request()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+                server_timing = (
+                    f'db;dur={query_stats.total_time_ms:.1f};desc="{query_stats.query_count} queries", '
+                    f'total;dur={elapsed_ms:.1f}'
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", server_timing.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_us = (time.perf_counter_ns() - start) // 1000
+            method = scope["method"]
+            route = self._route_template(scope)
+            self.registry.record(method, route, duration_us, status_code)
+            if query_stats.query_count > settings.SQL_N_PLUS_ONE_THRESHOLD:
+                query_metrics.record_n_plus_one(f"{method} {route}", query_stats)
+
+    def _route_template(self, scope: Scope) -> str:
+        """라우터가 scope에 남긴 endpoint로 매칭된 라우트 템플릿 조회"""
+        endpoint = scope.get("endpoint")
+        router = scope.get("router")
+        if endpoint is None or router is None:
+            return UNMATCHED_ROUTE
+
+        if len(router.routes) != self._indexed_route_count:
+            self._index_routes(router.routes)
+
+        candidates = self._routes_by_endpoint.get(endpoint)
+        if not candidates:
+            return UNMATCHED_ROUTE
+        if len(candidates) == 1:
+            return candidates[0].path
+
+        # 같은 endpoint가 여러 경로에 등록된 경우에만 경로 매칭
+        from starlette.routing import Match
+        for route in candidates:
+            match, _ = route.matches(scope)
+            if match != Match.NONE:
+                return route.path
+        return candidates[0].path
+
+    def _index_routes(self, routes: list) -> None:
+        index: Dict[Any, list] = {}
+        for route in routes:
+            endpoint = getattr(route, "endpoint", None) or getattr(route, "app", None)
+            if endpoint is not None and hasattr(route, "path"):
+                index.setdefault(endpoint, []).append(route)
+        self._routes_by_endpoint = index
+        self._indexed_route_count = len(routes)
+
+
+def get_performance_stats() -> Dict[str, Any]:
+    """성능 통계 반환 (/api/performance, /api/performance-dashboard 공용)"""
+    return request_metrics.export()
+
+
+def reset_performance_stats() -> None:
+    """통계 초기화"""
+    request_metrics.reset()
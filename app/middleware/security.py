@@ -4,8 +4,10 @@ Security middleware for BrandFlow API
 """
 
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from typing import Callable
 import secrets
 
@@ -101,92 +103,86 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """간단한 레이트 리미팅 미들웨어"""
-    
-    def __init__(self, app, **kwargs):
-        super().__init__(app)
+class RateLimitMiddleware:
+    """GCRA 기반 레이트 리미팅 ASGI 미들웨어 (app/core/rate_limit.py)
+
+    인증된 요청은 JWT subject, 그 외에는 클라이언트 IP 기준으로 한도를 적용합니다.
+    """
+
+    def __init__(self, app: ASGIApp, **kwargs):
+        from app.core.rate_limit import create_rate_limiter
+
+        self.app = app
         self.requests_per_minute = kwargs.get('requests_per_minute', 100)
         self.requests_per_second = kwargs.get('requests_per_second', 10)
-        # 메모리 기반 간단한 레이트 리미터 (프로덕션에서는 Redis 사용 권장)
-        self.client_requests = {}
-        import time
-        self.time = time
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        from fastapi import HTTPException, status
-        
-        # 클라이언트 IP 가져오기
-        client_ip = self._get_client_ip(request)
-        current_time = self.time.time()
-        
-        # 클라이언트별 요청 기록 초기화
-        if client_ip not in self.client_requests:
-            self.client_requests[client_ip] = {
-                'minute_requests': [],
-                'second_requests': []
-            }
-        
-        client_data = self.client_requests[client_ip]
-        
-        # 1분 이전 요청 제거
-        client_data['minute_requests'] = [
-            req_time for req_time in client_data['minute_requests']
-            if current_time - req_time < 60
-        ]
-        
-        # 1초 이전 요청 제거
-        client_data['second_requests'] = [
-            req_time for req_time in client_data['second_requests']
-            if current_time - req_time < 1
-        ]
-        
-        # 레이트 리밋 체크
-        if len(client_data['minute_requests']) >= self.requests_per_minute:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="분당 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
-            )
-        
-        if len(client_data['second_requests']) >= self.requests_per_second:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="초당 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
-            )
-        
-        # 현재 요청 기록
-        client_data['minute_requests'].append(current_time)
-        client_data['second_requests'].append(current_time)
-        
-        response = await call_next(request)
-        
-        # 레이트 리밋 정보를 헤더에 추가
-        response.headers["X-RateLimit-Minute-Limit"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Minute-Remaining"] = str(
-            self.requests_per_minute - len(client_data['minute_requests'])
+        # 앞단 신뢰 프록시 수 (0이면 X-Forwarded-For/X-Real-IP를 믿지 않음)
+        self.trusted_proxy_hops = kwargs.get('trusted_proxy_hops', 0)
+        self.limiter = kwargs.get('limiter') or create_rate_limiter(
+            self.requests_per_minute, self.requests_per_second
         )
-        response.headers["X-RateLimit-Second-Limit"] = str(self.requests_per_second)
-        response.headers["X-RateLimit-Second-Remaining"] = str(
-            self.requests_per_second - len(client_data['second_requests'])
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        from app.core.rate_limit import retry_after_header, subject_from_token
+
+        headers = Headers(scope=scope)
+        authorization = headers.get("authorization", "")
+        subject = None
+        if authorization[:7].lower() == "bearer ":
+            subject = subject_from_token(authorization[7:].strip())
+
+        result = await self.limiter.check(
+            scope["method"], scope["path"], self._get_client_ip(scope, headers), subject
         )
-        
-        return response
-    
-    def _get_client_ip(self, request: Request) -> str:
-        """클라이언트 IP 주소 추출"""
-        # X-Forwarded-For 헤더 확인 (프록시/로드밸런서 사용시)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            # 첫 번째 IP가 실제 클라이언트 IP
-            return forwarded_for.split(",")[0].strip()
-        
-        # X-Real-IP 헤더 확인
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-        
-        # 기본 클라이언트 IP
-        return request.client.host if request.client else "unknown"
+
+        if not result.allowed:
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."},
+                headers={
+                    "Retry-After": retry_after_header(result),
+                    "X-RateLimit-Limit": str(result.limit),
+                    "X-RateLimit-Remaining": "0",
+                }
+            )
+            await response(scope, receive, send)
+            return
+
+        rate_headers = [
+            (b"x-ratelimit-limit", str(result.limit).encode("latin-1")),
+            (b"x-ratelimit-remaining", str(result.remaining).encode("latin-1")),
+        ]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + rate_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _get_client_ip(self, scope: Scope, headers: Headers) -> str:
+        """클라이언트 IP 주소 추출
+
+        X-Forwarded-For의 앞쪽 항목은 클라이언트가 임의로 넣을 수 있으므로 쓰지 않고,
+        신뢰 프록시가 오른쪽에 추가한 항목(오른쪽에서 trusted_proxy_hops 번째)을 사용합니다.
+        """
+        if self.trusted_proxy_hops > 0:
+            forwarded = [ip.strip() for ip in headers.get("x-forwarded-for", "").split(",") if ip.strip()]
+            if forwarded:
+                # 항목이 홉 수보다 적으면 맨 앞 항목도 신뢰 프록시가 추가한 것
+                return forwarded[-min(self.trusted_proxy_hops, len(forwarded))]
+
+            # X-Forwarded-For 대신 X-Real-IP를 설정하는 프록시
+            real_ip = headers.get("x-real-ip")
+            if real_ip:
+                return real_ip.strip()
+
+        # 기본 클라이언트 IP (프록시 뒤가 아니면 소켓 주소)
+        client = scope.get("client")
+        return client[0] if client else "unknown"
 
 
 class RequestSanitizationMiddleware(BaseHTTPMiddleware):
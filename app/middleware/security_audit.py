@@ -9,73 +9,107 @@
 import json
 import time
 from typing import Dict, List
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from starlette.status import HTTP_403_FORBIDDEN, HTTP_429_TOO_MANY_REQUESTS
 
 from app.security.vulnerability_scanner import vulnerability_scanner, SecurityThreat
 from app.security.audit_logger import audit_logger, AuditEventType, AuditSeverity
 
-class SecurityAuditMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
+class SecurityAuditMiddleware:
+    """보안 스캔 + 감사 로깅 ASGI 미들웨어
+
+    본문은 receive를 래핑해 청크 단위로 검사하므로 전체 본문을 따로 복사하지 않습니다.
+    검사 상한(vulnerability_scanner.max_body_scan_bytes)까지만 버퍼링하고 나머지는 그대로 전달합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self.blocked_ips = set()
         self.rate_limits = {}  # IP별 요청 제한
-        
-    async def dispatch(self, request: Request, call_next):
-        client_ip = request.client.host
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        client_ip = request.client.host if request.client else ""
         user_agent = request.headers.get('user-agent', '')
-        
+
         # 차단된 IP 확인
         if client_ip in self.blocked_ips:
             await self._log_blocked_request(client_ip, "Blocked IP attempted access")
-            return JSONResponse(
-                content={"detail": "Access denied"}, 
+            response = JSONResponse(
+                content={"detail": "Access denied"},
                 status_code=HTTP_403_FORBIDDEN
             )
-        
-        # Request Body 읽기 (보안 스캔용)
-        body = b""
-        if request.method in ["POST", "PUT", "PATCH"]:
-            body = await request.body()
-            # Request를 다시 사용할 수 있도록 새로 생성
-            from starlette.datastructures import Headers
-            scope = request.scope.copy()
-            scope["body"] = body
-            request = Request(scope)
-        
-        # 보안 스캔 실행
-        threats = vulnerability_scanner.scan_request(request, body.decode('utf-8', errors='ignore'))
-        
+            await response(scope, receive, send)
+            return
+
+        # URL 파라미터 / 헤더 / IP 스캔
+        threats = vulnerability_scanner.scan_request_metadata(
+            dict(request.query_params), request.headers, client_ip
+        )
+
+        # Request Body 스캔 (검사 상한까지 청크 단위로 수신하며 검사)
+        buffered_messages: List[Message] = []
+        if scope["method"] in ("POST", "PUT", "PATCH"):
+            inspector = vulnerability_scanner.body_inspector(request.headers.get('content-type', ''))
+            while not inspector.truncated:
+                message = await receive()
+                buffered_messages.append(message)
+                if message["type"] != "http.request":
+                    break
+                more_body = message.get("more_body", False)
+                inspector.feed(message.get("body", b""), more_body)
+                if not more_body:
+                    break
+            threats.extend(inspector.threats)
+
         # 위협 발견 시 처리
         if threats:
             high_threats = [t for t in threats if t.get('severity') == SecurityThreat.HIGH]
             if high_threats:
                 await self._handle_security_threats(client_ip, user_agent, high_threats, request)
-                return JSONResponse(
-                    content={"detail": "Security threat detected"}, 
+                response = JSONResponse(
+                    content={"detail": "Security threat detected"},
                     status_code=HTTP_403_FORBIDDEN
                 )
-            
+                await response(scope, receive, send)
+                return
+
             # 중간 위협은 로그만 남기고 통과
             await self._log_security_threats(client_ip, user_agent, threats, request)
-        
+
+        async def replay_receive() -> Message:
+            # 검사하며 읽은 메시지를 먼저 돌려주고 이후는 원래 receive로 전달
+            if buffered_messages:
+                return buffered_messages.pop(0)
+            return await receive()
+
+        response_info = {"status_code": 500, "content_type": None}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_info["status_code"] = message["status"]
+                response_info["content_type"] = Headers(raw=message.get("headers", [])).get("content-type")
+            await send(message)
+
         # 요청 처리
         start_time = time.time()
         try:
-            response = await call_next(request)
-            
-            # 응답 후 감사 로깅
-            await self._log_api_access(request, response, time.time() - start_time)
-            
-            return response
-            
+            await self.app(scope, replay_receive, send_wrapper)
         except Exception as e:
             # 에러 발생 시 감사 로깅
             await self._log_api_error(request, str(e))
             raise
-    
+
+        # 응답 후 감사 로깅
+        await self._log_api_access(request, response_info, time.time() - start_time)
+
     async def _handle_security_threats(self, ip: str, user_agent: str, 
                                        threats: List[Dict], request: Request):
         """보안 위협 처리"""
@@ -146,7 +180,7 @@ class SecurityAuditMiddleware(BaseHTTPMiddleware):
                 }
             )
     
-    async def _log_api_access(self, request: Request, response: Response, 
+    async def _log_api_access(self, request: Request, response_info: Dict,
                               duration: float):
         """API 접근 로깅"""
         
@@ -159,14 +193,14 @@ class SecurityAuditMiddleware(BaseHTTPMiddleware):
             user_id=user_info.get('user_id'),
             user_email=user_info.get('user_email'), 
             user_role=user_info.get('user_role'),
-            user_ip=request.client.host,
+            user_ip=request.client.host if request.client else None,
             user_agent=request.headers.get('user-agent'),
             endpoint=str(request.url),
             http_method=request.method,
-            response_status=response.status_code,
+            response_status=response_info['status_code'],
             details={
                 'response_time': round(duration, 3),
-                'content_type': response.headers.get('content-type'),
+                'content_type': response_info['content_type'],
                 'user_authenticated': user_info.get('authenticated', False)
             }
         )
@@ -180,7 +214,7 @@ class SecurityAuditMiddleware(BaseHTTPMiddleware):
             severity=AuditSeverity.ERROR,
             user_id=user_info.get('user_id'),
             user_email=user_info.get('user_email'),
-            user_ip=request.client.host,
+            user_ip=request.client.host if request.client else None,
             endpoint=str(request.url),
             http_method=request.method,
             response_status=500,
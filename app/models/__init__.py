@@ -21,3 +21,7 @@ from .campaign_refund import CampaignRefund, RefundType, RefundStatus
 from .post_refund import PostRefund
 # 게임 에셋 모델
 from .game_asset import GameAsset, GameAssetType, GameAssetCategory
+# 감사 로그 모델
+from .audit_event import AuditEventRecord
+# 토큰 상태 모델 (폐기 jti, 리프레시 토큰)
+from .token_state import RevokedToken, RefreshToken
@@ -0,0 +1,54 @@
+from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime, JSON, Index
+
+from .base import Base
+
+
+class AuditEventRecord(Base):
+    """감사 이벤트 영구 저장 (app/security/audit_logger.py 배치 writer가 기록)
+
+    사용자 삭제 후에도 기록이 남아야 하므로 users 테이블에 외래키를 걸지 않습니다.
+    """
+    __tablename__ = "audit_events"
+
+    id = Column(BigInteger, primary_key=True)
+    event_id = Column(String(36), nullable=False, unique=True)
+    event_type = Column(String(50), nullable=False)
+    severity = Column(String(20), nullable=False)
+
+    # 사용자 정보
+    user_id = Column(Integer, nullable=True)
+    user_email = Column(String(255), nullable=True)
+    user_role = Column(String(50), nullable=True)
+    user_ip = Column(String(64), nullable=True)
+    user_agent = Column(Text, nullable=True)
+
+    # 대상 리소스
+    resource_type = Column(String(100), nullable=True)
+    resource_id = Column(String(100), nullable=True)
+    resource_name = Column(String(255), nullable=True)
+
+    # 작업 내용
+    action = Column(String(100), nullable=True)
+    details = Column(JSON, nullable=True)
+    old_values = Column(JSON, nullable=True)
+    new_values = Column(JSON, nullable=True)
+
+    # 요청 정보
+    request_id = Column(String(100), nullable=True)
+    session_id = Column(String(100), nullable=True)
+    endpoint = Column(Text, nullable=True)
+    http_method = Column(String(10), nullable=True)
+    response_status = Column(Integer, nullable=True)
+
+    timestamp = Column(DateTime, nullable=False)
+
+    # 대시보드 조회 패턴: 사용자별 / 유형별 / 기간별 최신순
+    __table_args__ = (
+        Index('idx_audit_events_timestamp', 'timestamp'),
+        Index('idx_audit_events_user_email_timestamp', 'user_email', 'timestamp'),
+        Index('idx_audit_events_event_type_timestamp', 'event_type', 'timestamp'),
+        Index('idx_audit_events_severity_timestamp', 'severity', 'timestamp'),
+    )
+
+    def __repr__(self):
+        return f"<AuditEventRecord(event_type={self.event_type}, user_email={self.user_email}, timestamp={self.timestamp})>"
@@ -57,6 +57,17 @@ class Campaign(Base, TimestampMixin):
     refund_amount = Column(Numeric(12, 2), default=0, nullable=True)  # 비정규화: 총 환불액
     is_refunded = Column(Boolean, default=False, nullable=True)
 
+    # 활성 포스트 집계 (비정규화) - app/services/campaign_aggregates.py가 포스트 변경과 같은 트랜잭션에서 증분 갱신
+    # budget도 활성 포스트가 있으면 포스트 budget 합계로 유지
+    active_post_count = Column(Integer, default=0, server_default="0", nullable=False)
+    invoiced_post_count = Column(Integer, default=0, server_default="0", nullable=False)  # 계산서 발행 완료
+    paid_post_count = Column(Integer, default=0, server_default="0", nullable=False)  # 입금 완료
+    cancelled_post_count = Column(Integer, default=0, server_default="0", nullable=False)  # 취소된 활성 포스트
+
+    # 환불 기록 건수 (비정규화) - 취소/환불 처리와 같은 트랜잭션에서 증가, 총 환불액은 refund_amount
+    campaign_refund_count = Column(Integer, default=0, server_default="0", nullable=False)
+    post_refund_count = Column(Integer, default=0, server_default="0", nullable=False)
+
     # 외래키
     creator_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     client_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # 클라이언트 사용자 ID
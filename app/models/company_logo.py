@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON
 
 from .base import Base, TimestampMixin
 
@@ -9,9 +9,14 @@ class CompanyLogo(Base, TimestampMixin):
     id = Column(Integer, primary_key=True, index=True)
     logo_url = Column(String(500), nullable=True)
     company_id = Column(String(100), default="default")
+
+    # 버전 URL용 콘텐츠 해시 (app/services/company_logo.py) - 없으면 logo_url을 그대로 사용하는 기존 업로드
+    content_hash = Column(String(64), nullable=True)
+    asset_ext = Column(String(10), nullable=True)
+    variant_widths = Column(JSON, nullable=True, default=list)  # 미리 생성한 리사이즈 너비
     
     # 외래키
     updated_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     def __repr__(self):
-        return f"<CompanyLogo(id={self.id}, company_id={self.company_id})>"
\ No newline at end of file
+        return f"<CompanyLogo(id={self.id}, company_id={self.company_id})>"
@@ -22,9 +22,9 @@ class OrderRequest(Base, TimestampMixin):
     resource_type = Column(String(100), nullable=True)
 
     # 관계 필드
-    post_id = Column(Integer, ForeignKey("posts.id"), nullable=False)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)  # 발주 요청자
-    campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
+    campaign_id = Column(Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False)
 
     # 상태 필드
     is_active = Column(Boolean, default=True)
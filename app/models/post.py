@@ -41,7 +41,7 @@ class Post(Base, TimestampMixin):
     is_cancelled = Column(Boolean, default=False, nullable=True)
     refund_amount = Column(Float, nullable=True, default=0.0)
 
-    campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
+    campaign_id = Column(Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False)
     assigned_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # 포스트 담당자
     is_active = Column(Boolean, default=True)
 
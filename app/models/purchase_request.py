@@ -33,7 +33,7 @@ class PurchaseRequest(Base, TimestampMixin):
     
     # 외래키
     requester_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=True)
+    campaign_id = Column(Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=True)
     
     # 관계 설정
     requester = relationship("User", back_populates="purchase_requests")
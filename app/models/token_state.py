@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+
+from .base import Base
+
+
+class RevokedToken(Base):
+    """폐기된 액세스 토큰 jti (워커 간 공유, 만료 후 주기적으로 삭제)"""
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(64), primary_key=True)
+    expires_at = Column(DateTime, nullable=False)  # 토큰 exp (UTC) - 이후에는 보관할 필요 없음
+    revoked_at = Column(DateTime, nullable=False)  # 다른 워커의 증분 동기화 기준
+
+    __table_args__ = (
+        Index('idx_revoked_tokens_revoked_at', 'revoked_at'),
+        Index('idx_revoked_tokens_expires_at', 'expires_at'),
+    )
+
+    def __repr__(self):
+        return f"<RevokedToken(jti={self.jti}, expires_at={self.expires_at})>"
+
+
+class RefreshToken(Base):
+    """리프레시 토큰 (원문은 저장하지 않고 SHA-256 해시만 보관)"""
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    token_hash = Column(String(64), nullable=False, unique=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    jti = Column(String(64), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<RefreshToken(user_id={self.user_id}, expires_at={self.expires_at})>"
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from app.models.campaign import CampaignStatus
@@ -74,10 +74,46 @@ class CampaignDuplicateRequest(BaseModel):
     end_date: datetime = Field(..., description="종료일")
     staff_id: Optional[int] = Field(None, description="담당자 ID (미지정 시 현재 사용자)")
     budget: float = Field(..., ge=0, description="예산")
+    include_posts: bool = Field(False, description="업무(포스트) 복사 여부 - 진행/재무 상태와 일정은 초기화")
+    include_contracts: bool = Field(False, description="계약서 복사 여부")
 
 
 class CampaignDuplicateResponse(BaseModel):
     """캠페인 복사 응답"""
     success: bool
     message: str
-    campaign: CampaignResponse
\ No newline at end of file
+    campaign: CampaignResponse
+    copied_posts: int = 0
+    copied_contracts: int = 0
+
+
+class CampaignCloneItem(BaseModel):
+    """다중 캠페인 복사 항목 (월 단위 반복 계약)"""
+    source_campaign_id: int = Field(..., description="원본 캠페인 ID")
+    new_name: Optional[str] = Field(None, min_length=2, max_length=200, description="새 캠페인명 (미지정 시 원본 이름)")
+    start_date: datetime = Field(..., description="시작일")
+    end_date: datetime = Field(..., description="종료일")
+    staff_id: Optional[int] = Field(None, description="담당자 ID (미지정 시 원본 담당자)")
+    budget: Optional[float] = Field(None, ge=0, description="예산 (미지정 시 원본 예산)")
+
+
+class CampaignBulkCloneRequest(BaseModel):
+    """다중 캠페인 복사 요청"""
+    campaigns: List[CampaignCloneItem] = Field(..., min_length=1)
+    include_posts: bool = Field(True, description="업무(포스트) 복사 여부 - 진행/재무 상태와 일정은 초기화")
+    include_contracts: bool = Field(True, description="계약서 복사 여부")
+
+
+class CampaignCloneResult(BaseModel):
+    source_campaign_id: int
+    campaign_id: int
+    name: str
+
+
+class CampaignBulkCloneResponse(BaseModel):
+    """다중 캠페인 복사 응답"""
+    success: bool
+    message: str
+    campaigns: List[CampaignCloneResult]
+    copied_posts: int = 0
+    copied_contracts: int = 0
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List
+from typing import Any, Dict, Literal, Optional, List
 from datetime import datetime
 
 
@@ -53,6 +53,19 @@ class PostUpdate(BaseModel):
     assigned_user_id: Optional[int] = Field(None, alias="assignedUserId")  # 포스트 담당자
 
 
+class PostBatchOperation(BaseModel):
+    """포스트 일괄 처리 항목 - create: data는 PostCreate 형식, update: data는 단건 수정 API와 같은 키"""
+    model_config = ConfigDict(populate_by_name=True)
+
+    op: Literal["create", "update", "delete"]
+    post_id: Optional[int] = Field(None, alias="postId")  # update/delete 대상
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
+class PostBatchRequest(BaseModel):
+    operations: List[PostBatchOperation] = Field(..., min_length=1)
+
+
 class PostResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
@@ -0,0 +1,304 @@
+"""
+캠페인/포스트/발주요청 응답 직렬화 함수
+- app.core.serialization.compile_serializer로 import 시 한 번 생성
+- 출력 키(프론트엔드 호환용 camelCase/snake_case 중복 포함)는 기존 엔드포인트 응답과 동일하게 유지
+- datetime 값은 그대로 두고 FastJSONResponse가 ISO 형식으로 인코딩
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.serialization import Field, compile_serializer
+
+serialize_user_brief = compile_serializer("serialize_user_brief", [
+    Field("id"),
+    Field("name"),
+    Field("role", kind="enum"),
+    Field("company"),
+])
+
+serialize_client_user = compile_serializer("serialize_client_user", [
+    Field("id"),
+    Field("name"),
+    Field("email"),
+    Field("company"),
+    Field("business_number", optional=True),
+    Field("contact"),
+    # 클라이언트 실제 회사 정보
+    Field("client_company_name"),
+    Field("client_business_number"),
+    Field("client_ceo_name"),
+    Field("client_company_address"),
+    Field("client_business_type"),
+    Field("client_business_item"),
+])
+
+serialize_contract = compile_serializer("serialize_contract", [
+    Field("id"),
+    Field("file_url"),
+    Field("file_name"),
+    Field("file_size"),
+    Field("uploaded_at"),
+])
+
+# GET /api/campaigns 목록에 포함되는 포스트 (include=posts)
+CAMPAIGN_LIST_POST_FIELDS = [
+    Field("id"),
+    Field("title"),
+    Field("work_type"),
+    Field("workType", "work_type"),  # 프론트엔드 호환성
+    Field("topicStatus", "topic_status"),
+    Field("outline"),
+    Field("outlineStatus", "outline_status"),
+    Field("rejectReason", "reject_reason"),
+    Field("images", default=[]),
+    Field("published_url"),
+    Field("publishedUrl", "published_url"),  # 프론트엔드 호환성
+    Field("orderRequestStatus", "order_request_status"),
+    Field("orderRequestId", "order_request_id"),
+    Field("startDate", "start_date"),
+    Field("dueDate", "due_date"),
+    Field("productId", "product_id"),
+    Field("product_name"),
+    Field("productName", "product_name"),  # 프론트엔드 호환성
+    Field("quantity"),
+    Field("budget", default=0.0),
+    # 재무 관련 필드
+    Field("invoiceIssued", "invoice_issued", default=False),
+    Field("paymentCompleted", "payment_completed", default=False),
+    Field("invoiceDueDate", "invoice_due_date"),
+    Field("paymentDueDate", "payment_due_date"),
+    Field("is_active"),
+    Field("createdAt", "created_at"),
+    Field("updatedAt", "updated_at"),
+]
+serialize_campaign_list_post = compile_serializer("serialize_campaign_list_post", CAMPAIGN_LIST_POST_FIELDS)
+
+# GET /api/campaigns fields= 로 고를 수 있는 캠페인 필드 (출력 순서)
+CAMPAIGN_LIST_FIELDS: Dict[str, Field] = {spec.key: spec for spec in [
+    Field("id"),
+    Field("name"),
+    Field("description"),
+    Field("status", kind="enum"),
+    Field("client_company"),
+    Field("budget"),
+    Field("start_date"),
+    Field("end_date"),
+    # 계산서/입금 상태는 Post 레벨로 이동 - 기존 응답 키 유지
+    Field("invoiceIssued", const=False),
+    Field("paymentCompleted", const=False),
+    Field("creator_id"),
+    Field("staff_id"),
+    Field("created_at"),
+    Field("updated_at"),
+    # 취소/환불 관련 필드
+    Field("cancelled_at"),
+    Field("cancellation_reason"),
+    Field("refund_amount", kind="float", default=0),
+    Field("is_refunded"),
+    # 활성 포스트 집계 (campaigns 비정규화 컬럼 - app/services/campaign_aggregates.py)
+    Field("post_count", "active_post_count"),
+    Field(
+        "posts_budget",
+        compute=lambda campaign: campaign.budget if campaign.active_post_count else 0.0,
+        requires=("budget", "active_post_count"),
+    ),
+    Field("invoiced_post_count"),
+    Field("paid_post_count"),
+]}
+
+# include= 로 포함하는 관계 (출력 키는 기존 응답과 동일)
+CAMPAIGN_LIST_INCLUDES: Dict[str, Field] = {
+    "creator": Field("User", "creator", kind="nested", serializer=serialize_user_brief),
+    "staff_user": Field("staff_user", kind="nested", serializer=serialize_user_brief),
+    "client_user": Field("client_user", kind="nested", serializer=serialize_client_user),
+    "posts": Field("posts", kind="many", serializer=serialize_campaign_list_post, where="is_active"),
+    "contracts": Field("contracts", kind="many", serializer=serialize_contract, where="is_active"),
+}
+
+# fields/include 미지정 시 목록 화면용 요약
+CAMPAIGN_LIST_DEFAULT_FIELDS = (
+    "id", "name", "status", "client_company", "budget", "start_date", "end_date",
+    "creator_id", "staff_id", "created_at", "updated_at", "is_refunded", "post_count", "posts_budget",
+)
+CAMPAIGN_LIST_DEFAULT_INCLUDES = ("creator", "staff_user")
+
+
+@dataclass(frozen=True)
+class CampaignListView:
+    """GET /api/campaigns 응답 형태 - fields/include 조합별로 한 번 생성"""
+    fields: Tuple[str, ...]
+    includes: Tuple[str, ...]
+    serializer: Callable[[Any], Dict[str, Any]]
+
+
+def _parse_names(raw: Optional[str]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+
+
+@lru_cache(maxsize=128)
+def campaign_list_view(fields: Optional[str] = None, include: Optional[str] = None) -> CampaignListView:
+    """
+    fields/include 쿼리 문자열 해석 (알 수 없는 이름은 ValueError)
+    - fields=*: 모든 캠페인 필드, include=*: 모든 관계 (기존 전체 응답)
+    - id는 항상 포함
+    """
+    requested = _parse_names(fields) if fields is not None else CAMPAIGN_LIST_DEFAULT_FIELDS
+    if requested == ("*",):
+        requested = tuple(CAMPAIGN_LIST_FIELDS)
+    includes = _parse_names(include) if include is not None else CAMPAIGN_LIST_DEFAULT_INCLUDES
+    if includes == ("*",):
+        includes = tuple(CAMPAIGN_LIST_INCLUDES)
+
+    unknown = [name for name in requested if name not in CAMPAIGN_LIST_FIELDS]
+    if unknown:
+        raise ValueError(f"알 수 없는 fields 값: {', '.join(unknown)}")
+    unknown = [name for name in includes if name not in CAMPAIGN_LIST_INCLUDES]
+    if unknown:
+        raise ValueError(f"알 수 없는 include 값: {', '.join(unknown)}")
+
+    # 출력 순서는 요청 순서와 무관하게 정의 순서로 고정 (조합별 캐시 효율)
+    selected = [key for key in CAMPAIGN_LIST_FIELDS if key == "id" or key in requested]
+    includes = tuple(key for key in CAMPAIGN_LIST_INCLUDES if key in includes)
+    specs = [CAMPAIGN_LIST_FIELDS[key] for key in selected] + [CAMPAIGN_LIST_INCLUDES[key] for key in includes]
+    return CampaignListView(
+        fields=tuple(selected),
+        includes=includes,
+        serializer=compile_serializer("serialize_campaign_list_view", specs),
+    )
+
+
+# 기존 전체 응답 (fields=*&include=* 과 같은 키, 기존 키 순서)
+serialize_campaign_list_item = compile_serializer("serialize_campaign_list_item", [
+    *[CAMPAIGN_LIST_FIELDS[key] for key in (
+        "id", "name", "description", "status", "client_company", "budget", "start_date", "end_date",
+        "invoiceIssued", "paymentCompleted", "creator_id", "staff_id", "created_at", "updated_at",
+    )],
+    *[CAMPAIGN_LIST_INCLUDES[key] for key in ("creator", "staff_user", "client_user", "posts", "contracts")],
+    *[CAMPAIGN_LIST_FIELDS[key] for key in ("cancelled_at", "cancellation_reason", "refund_amount", "is_refunded")],
+])
+
+# GET /api/campaigns/{id} - CampaignResponse 스키마와 같은 키
+serialize_campaign_detail = compile_serializer("serialize_campaign_detail", [
+    Field("name"),
+    Field("description"),
+    Field("client_company"),
+    Field("budget"),
+    Field("staff_id"),
+    Field("start_date"),
+    Field("end_date"),
+    Field("project_due_date"),
+    Field("cost", kind="float"),
+    Field("margin", kind="float"),
+    Field("margin_rate", kind="float"),
+    Field("estimated_cost", kind="float"),
+    Field("id"),
+    Field("status", kind="enum"),
+    Field("creator_id"),
+    Field("client_user_id"),
+    Field("created_at"),
+    Field("updated_at"),
+    Field("creator_name", compute=lambda campaign: campaign.creator.name if campaign.creator else None),
+    Field("client_name", "client_company"),
+    Field("client_user", kind="nested", serializer=serialize_client_user),
+])
+
+# GET /api/campaigns/{id}/posts/jwt - productName/productCost는 Product로 보완
+_serialize_campaign_post = compile_serializer("_serialize_campaign_post", [
+    Field("id"),
+    Field("title"),
+    Field("workType", "work_type"),
+    Field("topicStatus", "topic_status"),
+    Field("outline"),
+    Field("outlineStatus", "outline_status"),
+    Field("rejectReason", "reject_reason"),
+    Field("images", default=[]),
+    Field("publishedUrl", "published_url"),
+    Field("orderRequestStatus", "order_request_status"),
+    Field("orderRequestId", "order_request_id"),
+    Field("startDate", "start_date"),
+    Field("dueDate", "due_date"),
+    Field("productId", "product_id"),
+    Field("productName", "product_name"),
+    Field("quantity"),
+    Field("cost"),
+    Field("productCost", "product_cost"),
+    Field("budget", default=0.0),
+    # 재무 관련 필드
+    Field("invoiceIssued", "invoice_issued", default=False),
+    Field("paymentCompleted", "payment_completed", default=False),
+    Field("invoiceDueDate", "invoice_due_date"),
+    Field("paymentDueDate", "payment_due_date"),
+    Field("campaignId", "campaign_id"),
+    Field("createdAt", "created_at"),
+])
+
+# GET /api/campaigns/{id}/posts/ (Node.js 호환) - productName/productCost는 Product 값
+_serialize_campaign_post_compat = compile_serializer("_serialize_campaign_post_compat", [
+    Field("id"),
+    Field("title"),
+    Field("workType", "work_type"),
+    Field("topicStatus", "topic_status"),
+    Field("outline"),
+    Field("outlineStatus", "outline_status"),
+    Field("images", default=[]),
+    Field("publishedUrl", "published_url"),
+    Field("orderRequestStatus", "order_request_status"),
+    Field("orderRequestId", "order_request_id"),
+    Field("startDate", "start_date"),
+    Field("dueDate", "due_date"),
+    Field("productId", "product_id"),
+    Field("productName", const=None),
+    Field("productCost", const=None),
+    Field("quantity"),
+    Field("campaignId", "campaign_id"),
+    Field("createdAt", "created_at"),
+])
+
+_serialize_order_request = compile_serializer("_serialize_order_request", [
+    Field("id"),
+    Field("title"),
+    Field("description"),
+    Field("status"),
+    Field("cost_price"),
+    Field("resource_type"),
+    Field("post_id"),
+    Field("user_id"),
+    Field("campaign_id"),
+    Field("created_at"),
+    Field("updated_at"),
+])
+
+
+def serialize_campaign_post(post: Any, product: Optional[Any]) -> Dict[str, Any]:
+    """포스트 + Product 조인 행 (post.product_name/product_cost 우선, 없으면 Product 값)"""
+    data = _serialize_campaign_post(post)
+    if product is not None:
+        data["productName"] = data["productName"] or product.name
+        data["productCost"] = data["productCost"] or product.cost
+    return data
+
+
+def serialize_campaign_post_compat(post: Any, product: Optional[Any]) -> Dict[str, Any]:
+    """Node.js 호환 포스트 목록 행"""
+    data = _serialize_campaign_post_compat(post)
+    if product is not None:
+        data["productName"] = product.name
+        data["productCost"] = product.cost
+    return data
+
+
+def serialize_order_request_row(order_request: Any, post: Any, campaign: Any, product: Optional[Any],
+                                requester_name: Optional[str]) -> Dict[str, Any]:
+    """발주요청 목록 행 (포스트/캠페인/상품/요청자 정보 포함)"""
+    data = _serialize_order_request(order_request)
+    data["post_title"] = post.title
+    data["campaign_name"] = campaign.name
+    data["product_name"] = post.product_name or (product.name if product else None)
+    data["product_cost"] = product.cost if product else 0  # products 테이블 원가
+    data["quantity"] = post.quantity or 1
+    data["total_cost"] = order_request.cost_price or 0  # order_requests 테이블 원장 값
+    data["requester_name"] = requester_name
+    data["work_type"] = post.work_type
+    return data
@@ -179,4 +179,5 @@ class UserLogin(BaseModel):
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
-    user: UserResponse
\ No newline at end of file
+    user: UserResponse
+    refresh_token: Optional[str] = None
\ No newline at end of file
@@ -9,13 +9,25 @@
 
 import json
 import uuid
-from datetime import datetime
+import asyncio
+import logging
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from enum import Enum
 from dataclasses import dataclass, asdict
-from collections import deque
 import hashlib
 
+from sqlalchemy import select, func, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.audit_event import AuditEventRecord
+
+logger = logging.getLogger(__name__)
+
+# writer 종료 신호 (큐에 먼저 들어온 이벤트를 모두 기록한 뒤 종료)
+_STOP = object()
+
 class AuditEventType(str, Enum):
     """감사 이벤트 유형"""
     USER_LOGIN = "user_login"
@@ -84,8 +96,32 @@ class AuditEvent:
             self.event_id = str(uuid.uuid4())
 
 class AuditLogger:
-    def __init__(self, max_events: int = 10000):
-        self.events = deque(maxlen=max_events)
+    """감사 이벤트 기록기
+
+    log_event는 비동기 큐에 넣기만 하고, 백그라운드 writer가 배치로 audit_events 테이블에 기록합니다.
+    큐가 가득 차면 요청 처리를 막지 않고 이벤트를 버리며 dropped_events로 집계합니다.
+    """
+
+    def __init__(
+        self,
+        max_events: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        shutdown_timeout: float = 10.0
+    ):
+        self.max_events = max_events
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self.sink_stats = {
+            'queued': 0,
+            'written': 0,
+            'dropped_events': 0,
+            'write_failures': 0,
+            'last_flush_at': None
+        }
         self.event_counts = {
             'total': 0,
             'by_type': {},
@@ -93,7 +129,106 @@ class AuditLogger:
             'by_user': {},
             'today': 0
         }
-    
+
+    async def start(self):
+        """배치 writer 시작 (lifespan startup)"""
+        if self._writer_task is not None:
+            return
+        self.queue = asyncio.Queue(maxsize=self.max_events)
+        self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def stop(self):
+        """남은 이벤트를 기록하고 writer 종료 (lifespan shutdown)
+
+        종료 신호를 큐에 넣어 writer가 진행 중인 배치와 앞선 이벤트를 모두 기록한 뒤 스스로 끝나게 합니다.
+        shutdown_timeout 안에 끝나지 않을 때만 writer를 취소합니다 (진행 중이던 배치는 유실).
+        """
+        if self._writer_task is None:
+            return
+        writer = self._writer_task
+
+        async def drain():
+            await self.queue.put(_STOP)
+            await asyncio.shield(writer)
+
+        try:
+            await asyncio.wait_for(drain(), self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Audit writer did not drain within %.1fs, cancelling (%d events queued)",
+                self.shutdown_timeout, self.queue.qsize()
+            )
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+        self._writer_task = None
+
+        # 종료 신호 뒤에 들어온 이벤트 (이후 이벤트는 queue가 없으므로 dropped_events로 집계)
+        queue, self.queue = self.queue, None
+        remaining = []
+        while not queue.empty():
+            event = queue.get_nowait()
+            if event is not _STOP:
+                remaining.append(event)
+        for index in range(0, len(remaining), self.batch_size):
+            await self._write_batch(remaining[index:index + self.batch_size])
+
+    def _enqueue(self, event: AuditEvent):
+        if self.queue is None:
+            # writer가 시작되지 않은 경우 (스크립트/테스트 등) 기록하지 않음
+            self.sink_stats['dropped_events'] += 1
+            return
+        try:
+            self.queue.put_nowait(event)
+            self.sink_stats['queued'] += 1
+        except asyncio.QueueFull:
+            self.sink_stats['dropped_events'] += 1
+
+    async def _writer_loop(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            event = await self.queue.get()
+            if event is _STOP:
+                return
+            batch = [event]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    event = self.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        event = await asyncio.wait_for(self.queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if event is _STOP:
+                    stopping = True
+                    break
+                batch.append(event)
+            await self._write_batch(batch)
+
+    async def _write_batch(self, batch: List[AuditEvent]):
+        """다중 행 INSERT 한 번으로 배치 기록"""
+        if not batch:
+            return
+        from sqlalchemy import insert
+        from app.db.database import AsyncSessionLocal
+
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(AuditEventRecord), [_event_row(event) for event in batch])
+                await session.commit()
+            self.sink_stats['written'] += len(batch)
+            self.sink_stats['last_flush_at'] = datetime.now().isoformat()
+        except Exception as e:
+            self.sink_stats['write_failures'] += len(batch)
+            logger.error("Audit event batch write failed (%d events): %s", len(batch), e)
+
     def log_event(
         self,
         event_type: AuditEventType,
@@ -141,7 +276,7 @@ class AuditLogger:
             response_status=response_status
         )
         
-        self.events.append(event)
+        self._enqueue(event)
         self._update_counts(event)
         
         # 중요 이벤트는 즉시 출력
@@ -268,99 +403,191 @@ class AuditLogger:
             new_values=new_values
         )
     
-    # 조회 메서드들
-    def get_events(self, 
-                   event_type: Optional[AuditEventType] = None,
-                   user_email: Optional[str] = None,
-                   severity: Optional[AuditSeverity] = None,
-                   resource_type: Optional[str] = None,
-                   limit: int = 100) -> List[AuditEvent]:
-        """감사 이벤트 조회"""
-        
-        events = list(self.events)
-        
-        # 필터링
+    # 조회 메서드들 (audit_events 인덱스 컬럼 기준)
+    async def get_events(self,
+                         db: AsyncSession,
+                         event_type: Optional[AuditEventType] = None,
+                         user_email: Optional[str] = None,
+                         severity: Optional[AuditSeverity] = None,
+                         resource_type: Optional[str] = None,
+                         since: Optional[datetime] = None,
+                         limit: int = 100) -> List[AuditEventRecord]:
+        """감사 이벤트 조회 (최신순)"""
+        query = select(AuditEventRecord)
+
         if event_type:
-            events = [e for e in events if e.event_type == event_type]
+            query = query.where(AuditEventRecord.event_type == event_type.value)
         if user_email:
-            events = [e for e in events if e.user_email == user_email]
+            query = query.where(AuditEventRecord.user_email == user_email)
         if severity:
-            events = [e for e in events if e.severity == severity]
+            query = query.where(AuditEventRecord.severity == severity.value)
         if resource_type:
-            events = [e for e in events if e.resource_type == resource_type]
-        
-        # 최신순 정렬 후 제한
-        events.sort(key=lambda x: x.timestamp, reverse=True)
-        return events[:limit]
-    
-    def get_user_activity_summary(self, user_email: str, days: int = 7) -> Dict:
+            query = query.where(AuditEventRecord.resource_type == resource_type)
+        if since:
+            query = query.where(AuditEventRecord.timestamp >= since)
+
+        query = query.order_by(AuditEventRecord.timestamp.desc()).limit(limit)
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_user_activity_summary(self, db: AsyncSession, user_email: str, days: int = 7) -> Dict:
         """사용자 활동 요약"""
-        cutoff_date = datetime.now().date() - timedelta(days=days)
-        user_events = [
-            e for e in self.events 
-            if e.user_email == user_email and e.timestamp.date() >= cutoff_date
-        ]
-        
-        activity_by_day = {}
-        event_types = {}
-        resources_accessed = set()
-        
-        for event in user_events:
-            day = event.timestamp.date().isoformat()
-            activity_by_day[day] = activity_by_day.get(day, 0) + 1
-            
-            event_type = event.event_type.value
-            event_types[event_type] = event_types.get(event_type, 0) + 1
-            
-            if event.resource_type:
-                resources_accessed.add(f"{event.resource_type}:{event.resource_id}")
-        
+        cutoff = datetime.combine(datetime.now().date() - timedelta(days=days), datetime.min.time())
+        user_filter = and_(
+            AuditEventRecord.user_email == user_email,
+            AuditEventRecord.timestamp >= cutoff
+        )
+
+        day = func.date(AuditEventRecord.timestamp)
+        by_day = await db.execute(
+            select(day, func.count()).where(user_filter).group_by(day)
+        )
+        by_type = await db.execute(
+            select(AuditEventRecord.event_type, func.count()).where(user_filter)
+            .group_by(AuditEventRecord.event_type)
+        )
+        totals = (await db.execute(
+            select(
+                func.count(),
+                func.count(func.distinct(
+                    AuditEventRecord.resource_type + ':' + func.coalesce(AuditEventRecord.resource_id, '')
+                )),
+                func.max(AuditEventRecord.timestamp)
+            ).where(user_filter)
+        )).one()
+
+        activity_by_day = {str(row[0]): row[1] for row in by_day}
+        event_types = {row[0]: row[1] for row in by_type}
+        total_events, unique_resources, last_activity = totals
+
         return {
             'user_email': user_email,
             'period_days': days,
-            'total_events': len(user_events),
+            'total_events': total_events,
             'activity_by_day': activity_by_day,
             'event_types': event_types,
-            'unique_resources': len(resources_accessed),
-            'last_activity': user_events[0].timestamp.isoformat() if user_events else None
+            'unique_resources': unique_resources,
+            'last_activity': last_activity.isoformat() if last_activity else None
         }
-    
-    def generate_compliance_report(self) -> Dict:
+
+    async def get_statistics(self, db: AsyncSession, days: int = 30) -> Dict:
+        """기간별 감사 통계 (DB 집계)"""
+        cutoff = datetime.now() - timedelta(days=days)
+        in_period = AuditEventRecord.timestamp >= cutoff
+        security_types = [AuditEventType.SECURITY_THREAT.value, AuditEventType.SECURITY_VIOLATION.value]
+
+        totals = (await db.execute(
+            select(
+                func.count(),
+                func.count(func.distinct(AuditEventRecord.user_email)),
+                func.count().filter(AuditEventRecord.event_type.in_(security_types))
+            ).where(in_period)
+        )).one()
+
+        by_type = await db.execute(
+            select(AuditEventRecord.event_type, func.count()).where(in_period)
+            .group_by(AuditEventRecord.event_type)
+        )
+        by_severity = await db.execute(
+            select(AuditEventRecord.severity, func.count()).where(in_period)
+            .group_by(AuditEventRecord.severity)
+        )
+        day = func.date(AuditEventRecord.timestamp)
+        by_day = await db.execute(
+            select(day, func.count()).where(in_period).group_by(day).order_by(day)
+        )
+        endpoint_count = func.count().label('count')
+        top_endpoints = await db.execute(
+            select(AuditEventRecord.endpoint, endpoint_count)
+            .where(in_period, AuditEventRecord.endpoint.isnot(None))
+            .group_by(AuditEventRecord.endpoint)
+            .order_by(endpoint_count.desc())
+            .limit(10)
+        )
+
+        total_events, active_users, security_incidents = totals
+        return {
+            'period_days': days,
+            'total_events': total_events,
+            'events_by_type': {row[0]: row[1] for row in by_type},
+            'events_by_severity': {row[0]: row[1] for row in by_severity},
+            'events_by_day': {str(row[0]): row[1] for row in by_day},
+            'active_users': active_users,
+            'top_endpoints': {row[0]: row[1] for row in top_endpoints},
+            'security_incidents': security_incidents
+        }
+
+    async def generate_compliance_report(self, db: AsyncSession) -> Dict:
         """규정 준수 리포트"""
-        total_events = len(self.events)
-        if total_events == 0:
+        total_events = (await db.execute(select(func.count()).select_from(AuditEventRecord))).scalar()
+        if not total_events:
             return {'message': 'No events to report'}
-        
+
         # 최근 30일 이벤트
-        recent_date = datetime.now().date() - timedelta(days=30)
-        recent_events = [
-            e for e in self.events 
-            if e.timestamp.date() >= recent_date
+        recent_date = datetime.combine(datetime.now().date() - timedelta(days=30), datetime.min.time())
+        security_types = [
+            AuditEventType.SECURITY_THREAT.value,
+            AuditEventType.PERMISSION_DENIED.value,
+            AuditEventType.USER_LOGIN_FAILED.value
         ]
-        
-        # 보안 이벤트 분석
-        security_events = [
-            e for e in recent_events 
-            if e.event_type in [AuditEventType.SECURITY_THREAT, AuditEventType.PERMISSION_DENIED, AuditEventType.USER_LOGIN_FAILED]
+        data_access_types = [
+            AuditEventType.DATA_READ.value,
+            AuditEventType.DATA_UPDATE.value,
+            AuditEventType.DATA_DELETE.value
         ]
-        
-        # 데이터 접근 분석
-        data_access_events = [
-            e for e in recent_events 
-            if e.event_type in [AuditEventType.DATA_READ, AuditEventType.DATA_UPDATE, AuditEventType.DATA_DELETE]
-        ]
-        
+
+        recent = (await db.execute(
+            select(
+                func.count(),
+                func.count().filter(AuditEventRecord.event_type.in_(security_types)),
+                func.count().filter(AuditEventRecord.event_type.in_(data_access_types)),
+                func.count(func.distinct(AuditEventRecord.user_email))
+            ).where(AuditEventRecord.timestamp >= recent_date)
+        )).one()
+
+        by_type = await db.execute(
+            select(AuditEventRecord.event_type, func.count()).group_by(AuditEventRecord.event_type)
+        )
+        by_severity = await db.execute(
+            select(AuditEventRecord.severity, func.count()).group_by(AuditEventRecord.severity)
+        )
+
+        recent_events, security_events, data_access_events, unique_users = recent
         return {
             'report_period': '30 days',
             'total_events': total_events,
-            'recent_events': len(recent_events),
-            'security_incidents': len(security_events),
-            'data_access_events': len(data_access_events),
-            'unique_users': len(set(e.user_email for e in recent_events if e.user_email)),
-            'event_breakdown': self.event_counts['by_type'].copy(),
-            'severity_breakdown': self.event_counts['by_severity'].copy(),
+            'recent_events': recent_events,
+            'security_incidents': security_events,
+            'data_access_events': data_access_events,
+            'unique_users': unique_users,
+            'event_breakdown': {row[0]: row[1] for row in by_type},
+            'severity_breakdown': {row[0]: row[1] for row in by_severity},
             'generated_at': datetime.now().isoformat()
         }
 
-# 전역 감사 로거 인스턴스  
-audit_logger = AuditLogger()
\ No newline at end of file
+
+def _jsonable(value: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """JSON 컬럼에 넣을 수 있도록 직렬화 불가능한 값은 문자열로 변환"""
+    if value is None:
+        return None
+    return json.loads(json.dumps(value, default=str, ensure_ascii=False))
+
+
+def _event_row(event: AuditEvent) -> Dict[str, Any]:
+    """AuditEvent -> audit_events 행"""
+    row = asdict(event)
+    row['event_type'] = event.event_type.value
+    row['severity'] = event.severity.value
+    row['details'] = _jsonable(event.details)
+    row['old_values'] = _jsonable(event.old_values)
+    row['new_values'] = _jsonable(event.new_values)
+    return row
+
+
+# 전역 감사 로거 인스턴스
+audit_logger = AuditLogger(
+    max_events=settings.AUDIT_QUEUE_MAX_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    shutdown_timeout=settings.AUDIT_SHUTDOWN_TIMEOUT_SECONDS
+)
\ No newline at end of file
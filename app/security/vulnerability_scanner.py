@@ -8,6 +8,7 @@
 """
 
 import re
+import codecs
 import hashlib
 import json
 from datetime import datetime, timedelta
@@ -30,6 +31,15 @@ class SecurityThreat:
     BRUTE_FORCE = "brute_force"
     SUSPICIOUS_PATTERN = "suspicious_pattern"
 
+# 본문 검사 상한 (초과분은 검사 없이 통과)
+MAX_BODY_SCAN_BYTES = 64 * 1024
+# 청크 경계에 걸친 짧은 패턴을 수신 중에 바로 찾기 위해 이전 청크 끝부분을 유지하는 길이
+# (.* 처럼 길이 제한이 없는 패턴이 이보다 길게 걸치면 마지막 청크에서 전체 본문 재검사로 찾음)
+STREAM_OVERLAP_CHARS = 256
+
+SUSPICIOUS_AGENTS = ('sqlmap', 'nikto', 'nmap', 'dirb', 'burp')
+
+
 class VulnerabilityScanner:
     def __init__(self):
         self.threat_patterns = {
@@ -57,123 +67,181 @@ class VulnerabilityScanner:
                 r"token.*=.*null"
             ]
         }
+
+        # 패턴별 사전 필터 리터럴 (소문자) - 이 중 하나라도 값에 있어야 해당 패턴이 매칭될 수 있음
+        # threat_patterns를 수정하면 같은 순서로 함께 수정해야 합니다
+        self.pattern_triggers = {
+            SecurityThreat.SQL_INJECTION: [
+                ("select", "insert", "update", "delete"),
+                ("table",),
+                ("exec", "sp_", "xp_"),
+                ("--", "#", "*"),
+                ("or",),
+                ("1=1", "1=2", "true=true")
+            ],
+            SecurityThreat.XSS: [
+                ("<script",),
+                ("javascript:",),
+                ("=",),
+                ("<iframe",),
+                ("<object",),
+                ("eval",),
+                ("document.",)
+            ],
+            SecurityThreat.AUTH_BYPASS: [
+                ("admin",),
+                ("password",),
+                ("bypass", "skip"),
+                ("token",)
+            ]
+        }
         
         self.failed_attempts = defaultdict(deque)  # IP별 실패 시도
         self.suspicious_ips = set()
         self.security_alerts = deque(maxlen=1000)  # 최근 1000개 알림
-        
+
+        self.max_body_scan_bytes = MAX_BODY_SCAN_BYTES
+        self._compile_patterns()
+
+    def _compile_patterns(self):
+        """패턴 사전 컴파일 + 리터럴 사전 필터 구성
+
+        모든 트리거 리터럴을 하나의 정규식으로 묶어 소문자화한 값에서 한 번만 훑고,
+        트리거가 나온 패턴만 확인용 정규식으로 검사합니다. 정상 값은 대부분 전방탐색 없는 단순 검색
+        (_trigger_any)에서 끝나고, 트리거가 있을 때만 겹치는 리터럴까지 모으는 전방탐색 findall을 실행합니다.
+        """
+        self._compiled_patterns = []
+        self._patterns_by_trigger: Dict[str, List[int]] = defaultdict(list)
+        for threat_type, patterns in self.threat_patterns.items():
+            for pattern, triggers in zip(patterns, self.pattern_triggers[threat_type]):
+                index = len(self._compiled_patterns)
+                self._compiled_patterns.append(
+                    (threat_type, pattern, re.compile(pattern, re.IGNORECASE))
+                )
+                for trigger in triggers:
+                    self._patterns_by_trigger[trigger].append(index)
+
+        # 전방탐색 (?=(...))로 모든 위치에서 매칭해 겹치는 리터럴도 찾음 (예: "tableval("의 "table"과 "eval")
+        # 같은 위치에서는 가장 긴 리터럴 하나만 잡히므로 다른 리터럴에 포함된 리터럴의 패턴도 함께 후보로 등록
+        # (예: "1=1"이 매칭되면 "="의 패턴도 검사)
+        triggers = sorted(self._patterns_by_trigger, key=len, reverse=True)
+        for trigger in triggers:
+            for inner in triggers:
+                if inner != trigger and inner in trigger:
+                    self._patterns_by_trigger[trigger].extend(self._patterns_by_trigger[inner])
+        alternation = "|".join(re.escape(trigger) for trigger in triggers)
+        self._trigger_any = re.compile(alternation)
+        self._trigger_pattern = re.compile("(?=(" + alternation + "))")
+
+    def _find_threats(self, text: str):
+        """사전 필터 후 확인 정규식 검사 - (위협 유형, 패턴, match) 를 패턴별로 한 번씩 반환"""
+        lowered = text.lower()
+        # 트리거가 하나도 없으면 (정상 값 대부분) 위치마다 전방탐색하는 findall 없이 종료
+        if not self._trigger_any.search(lowered):
+            return
+        triggered = set(self._trigger_pattern.findall(lowered))
+
+        candidates = set()
+        for trigger in triggered:
+            candidates.update(self._patterns_by_trigger[trigger])
+
+        for index in sorted(candidates):
+            threat_type, pattern, compiled = self._compiled_patterns[index]
+            match = compiled.search(text)
+            if match:
+                yield threat_type, pattern, match
+
     def scan_request(self, request: Request, body: str = None) -> List[Dict]:
         """요청 전체 보안 스캔"""
-        threats = []
-        
-        # URL 파라미터 스캔
-        url_threats = self._scan_parameters(dict(request.query_params))
-        if url_threats:
-            threats.extend(url_threats)
-        
+        threats = self.scan_request_metadata(
+            dict(request.query_params),
+            request.headers,
+            request.client.host if request.client else ""
+        )
+
         # Request Body 스캔
         if body:
-            try:
-                body_data = json.loads(body) if body.startswith('{') else {'body': body}
-                body_threats = self._scan_parameters(body_data)
-                if body_threats:
-                    threats.extend(body_threats)
-            except:
-                # JSON이 아닌 경우 텍스트로 스캔
-                text_threats = self._scan_text(body)
-                if text_threats:
-                    threats.extend(text_threats)
-        
+            threats.extend(self.scan_body(body[:self.max_body_scan_bytes]))
+
+        return threats
+
+    def scan_request_metadata(self, query_params: Dict, headers, client_ip: str) -> List[Dict]:
+        """URL 파라미터, 헤더, IP 평판 스캔 (본문 제외)"""
+        threats = []
+
+        # URL 파라미터 스캔
+        if query_params:
+            threats.extend(self._scan_parameters(query_params))
+
         # 헤더 스캔
-        header_threats = self._scan_headers(dict(request.headers))
-        if header_threats:
-            threats.extend(header_threats)
-        
+        threats.extend(self._scan_headers(headers))
+
         # IP 평판 확인
-        client_ip = request.client.host
-        ip_threats = self._check_ip_reputation(client_ip)
-        if ip_threats:
-            threats.extend(ip_threats)
-        
+        if client_ip:
+            threats.extend(self._check_ip_reputation(client_ip))
+
         return threats
-    
+
+    def scan_body(self, body: str) -> List[Dict]:
+        """요청 본문 스캔 - JSON 객체는 필드별, 그 외는 텍스트로 검사"""
+        if body.startswith('{'):
+            try:
+                body_data = json.loads(body)
+            except ValueError:
+                body_data = None
+            if isinstance(body_data, dict):
+                return self._scan_parameters(body_data)
+        return self._scan_text(body)
+
+    def body_inspector(self, content_type: str = "") -> "StreamingBodyInspector":
+        """청크 단위 본문 검사기 생성 (ASGI receive 래핑용)"""
+        return StreamingBodyInspector(self, content_type, self.max_body_scan_bytes)
+
     def _scan_parameters(self, params: Dict) -> List[Dict]:
         """파라미터 스캔"""
         threats = []
-        
+
         for key, value in params.items():
-            if isinstance(value, (list, dict)):
+            if isinstance(value, (list, dict)) or value is None:
                 continue
-                
-            value_str = str(value).lower()
-            
-            # SQL 인젝션 패턴 검사
-            for pattern in self.threat_patterns[SecurityThreat.SQL_INJECTION]:
-                if re.search(pattern, value_str, re.IGNORECASE):
-                    threats.append({
-                        'type': SecurityThreat.SQL_INJECTION,
-                        'severity': SecurityThreat.HIGH,
-                        'parameter': key,
-                        'value': str(value)[:100],  # 처음 100자만
-                        'pattern': pattern,
-                        'timestamp': datetime.now().isoformat()
-                    })
-            
-            # XSS 패턴 검사
-            for pattern in self.threat_patterns[SecurityThreat.XSS]:
-                if re.search(pattern, value_str, re.IGNORECASE):
-                    threats.append({
-                        'type': SecurityThreat.XSS,
-                        'severity': SecurityThreat.HIGH,
-                        'parameter': key,
-                        'value': str(value)[:100],
-                        'pattern': pattern,
-                        'timestamp': datetime.now().isoformat()
-                    })
-            
-            # 인증 우회 패턴 검사
-            for pattern in self.threat_patterns[SecurityThreat.AUTH_BYPASS]:
-                if re.search(pattern, value_str, re.IGNORECASE):
-                    threats.append({
-                        'type': SecurityThreat.AUTH_BYPASS,
-                        'severity': SecurityThreat.HIGH,
-                        'parameter': key,
-                        'value': str(value)[:100],
-                        'pattern': pattern,
-                        'timestamp': datetime.now().isoformat()
-                    })
-        
+
+            value_str = value if isinstance(value, str) else str(value)
+            for threat_type, pattern, _ in self._find_threats(value_str):
+                threats.append({
+                    'type': threat_type,
+                    'severity': SecurityThreat.HIGH,
+                    'parameter': key,
+                    'value': value_str[:100],  # 처음 100자만
+                    'pattern': pattern,
+                    'timestamp': datetime.now().isoformat()
+                })
+
         return threats
-    
-    def _scan_text(self, text: str) -> List[Dict]:
+
+    def _scan_text(self, text: str, offset: int = 0) -> List[Dict]:
         """일반 텍스트 스캔"""
         threats = []
-        text_lower = text.lower()
-        
-        for threat_type, patterns in self.threat_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-                for match in matches:
-                    threats.append({
-                        'type': threat_type,
-                        'severity': SecurityThreat.HIGH,
-                        'content': match.group()[:100],
-                        'position': match.start(),
-                        'pattern': pattern,
-                        'timestamp': datetime.now().isoformat()
-                    })
-        
+
+        for threat_type, pattern, match in self._find_threats(text):
+            threats.append({
+                'type': threat_type,
+                'severity': SecurityThreat.HIGH,
+                'content': match.group()[:100],
+                'position': offset + match.start(),
+                'pattern': pattern,
+                'timestamp': datetime.now().isoformat()
+            })
+
         return threats
-    
+
     def _scan_headers(self, headers: Dict) -> List[Dict]:
         """HTTP 헤더 스캔"""
         threats = []
         
         # 위험한 User-Agent 패턴
         user_agent = headers.get('user-agent', '').lower()
-        suspicious_agents = ['sqlmap', 'nikto', 'nmap', 'dirb', 'burp']
         
-        for agent in suspicious_agents:
+        for agent in SUSPICIOUS_AGENTS:
             if agent in user_agent:
                 threats.append({
                     'type': SecurityThreat.SUSPICIOUS_PATTERN,
@@ -280,5 +348,93 @@ class VulnerabilityScanner:
             'generated_at': datetime.now().isoformat()
         }
 
+class StreamingBodyInspector:
+    """ASGI 본문 청크를 받으면서 검사하는 검사기
+
+    - JSON 본문: 상한 이내로 모두 수신되면 필드별 검사 (기존 scan_request와 동일한 의미)
+    - 그 외 본문: 청크가 들어올 때마다 새 부분만 한 번 검사, 경계 매칭을 위해 끝부분(STREAM_OVERLAP_CHARS) 유지.
+      여러 청크로 들어온 본문은 마지막 청크에서 전체를 한 번 더 검사해 유지 길이보다 길게 걸친 .* 패턴도 찾음
+      (이미 보고된 패턴은 제외, 본문은 미들웨어가 어차피 상한까지 버퍼링하므로 추가 비용은 검사 한 번)
+    - 상한을 넘는 부분은 검사하지 않음 (truncated)
+    """
+
+    def __init__(self, scanner: VulnerabilityScanner, content_type: str, max_bytes: int):
+        self.scanner = scanner
+        self.max_bytes = max_bytes
+        self.is_json = "json" in content_type.lower()
+        self.threats: List[Dict] = []
+        self.received_bytes = 0
+        self.truncated = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self._json_chunks: List[str] = []
+        self._tail = ""
+        self._text_offset = 0
+        self._text_chunks: List[str] = []
+
+    def feed(self, chunk: bytes, more_body: bool) -> List[Dict]:
+        """청크 검사 - 이번 청크에서 새로 발견된 위협 반환"""
+        if self.truncated:
+            return []
+
+        remaining = self.max_bytes - self.received_bytes
+        if len(chunk) > remaining:
+            chunk = chunk[:remaining]
+            self.truncated = True
+            more_body = False
+        self.received_bytes += len(chunk)
+
+        text = self._decoder.decode(chunk, final=not more_body)
+        if self.is_json:
+            new_threats = self._feed_json(text, more_body)
+        else:
+            new_threats = self._feed_text(text, more_body)
+        self.threats.extend(new_threats)
+        return new_threats
+
+    def _feed_json(self, text: str, more_body: bool) -> List[Dict]:
+        self._json_chunks.append(text)
+        if more_body:
+            return []
+        body = "".join(self._json_chunks)
+        self._json_chunks = []
+        if self.truncated:
+            # 잘린 JSON은 파싱할 수 없으므로 텍스트로 검사
+            return self.scanner._scan_text(body)
+        return self.scanner.scan_body(body)
+
+    def _feed_text(self, text: str, more_body: bool) -> List[Dict]:
+        threats = []
+        if text:
+            threats = self._scan_chunk(text)
+            self._text_chunks.append(text)
+        if more_body:
+            return threats
+        if len(self._text_chunks) > 1:
+            # 청크 경계를 STREAM_OVERLAP_CHARS보다 길게 걸친 패턴 (예: "select" ... 수 KB ... "from")
+            reported = {threat['pattern'] for threat in self.threats + threats}
+            body = "".join(self._text_chunks)
+            threats.extend(
+                threat for threat in self.scanner._scan_text(body)
+                if threat['pattern'] not in reported
+            )
+        self._text_chunks = []
+        return threats
+
+    def _scan_chunk(self, text: str) -> List[Dict]:
+        window = self._tail + text
+        window_offset = self._text_offset - len(self._tail)
+        tail_length = len(self._tail)
+
+        threats = []
+        for threat in self.scanner._scan_text(window, offset=window_offset):
+            # 이전 청크에서 이미 검사한 영역 안의 매칭은 제외
+            if threat['position'] - window_offset + len(threat['content']) > tail_length:
+                threats.append(threat)
+
+        self._text_offset += len(text)
+        self._tail = window[-STREAM_OVERLAP_CHARS:]
+        return threats
+
+
 # 전역 취약점 스캐너 인스턴스
 vulnerability_scanner = VulnerabilityScanner()
\ No newline at end of file
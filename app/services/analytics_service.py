@@ -7,12 +7,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, extract, case, desc, asc
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
+import asyncio
 import calendar
 
 from app.models.user import User, UserRole
 from app.models.campaign import Campaign, CampaignStatus
 from app.models.purchase_request import PurchaseRequest, RequestStatus
-from app.core.cache import cached
+from app.core.cache import cached, app_cache
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
 from app.core.logging import security_logger
 
 
@@ -28,7 +31,7 @@ class AnalyticsService:
         date_from: Optional[datetime] = None, 
         date_to: Optional[datetime] = None
     ) -> Dict[str, Any]:
-        """권한별 대시보드 통계 조회"""
+        """권한별 대시보드 통계 조회 (역할/회사/기간별 캐시)"""
         
         # 기본 날짜 설정 (최근 30일)
         if not date_to:
@@ -36,14 +39,33 @@ class AnalyticsService:
         if not date_from:
             date_from = date_to - timedelta(days=30)
         
+        # 캐시 범위: 슈퍼 어드민은 전체, 대행사 어드민/직원은 회사, 클라이언트는 본인
         if user.role == UserRole.SUPER_ADMIN:
-            return await self._get_super_admin_stats(date_from, date_to)
+            scope = "all"
+        elif user.role == UserRole.CLIENT:
+            scope = f"user:{user.id}"
+        else:
+            scope = f"company:{user.company}"
+        key = (
+            f"dashboard_stats:{user.role.value}:{scope}:"
+            f"{date_from.date().isoformat()}:{date_to.date().isoformat()}"
+        )
+        
+        stats = await app_cache.get(key)
+        if stats is not None:
+            return stats
+        
+        if user.role == UserRole.SUPER_ADMIN:
+            stats = await self._get_super_admin_stats(date_from, date_to)
         elif user.role == UserRole.AGENCY_ADMIN:
-            return await self._get_agency_admin_stats(user, date_from, date_to)
+            stats = await self._get_agency_admin_stats(user, date_from, date_to)
         elif user.role == UserRole.CLIENT:
-            return await self._get_client_stats(user, date_from, date_to)
+            stats = await self._get_client_stats(user, date_from, date_to)
         else:  # STAFF
-            return await self._get_staff_stats(user, date_from, date_to)
+            stats = await self._get_staff_stats(user, date_from, date_to)
+        
+        await app_cache.set(key, stats, ttl=settings.DASHBOARD_STATS_CACHE_TTL)
+        return stats
     
     async def _get_super_admin_stats(
         self, 
@@ -52,44 +74,34 @@ class AnalyticsService:
     ) -> Dict[str, Any]:
         """슈퍼 어드민 전체 통계"""
         
-        # 캠페인 통계
-        total_campaigns = await self._count_campaigns()
-        active_campaigns = await self._count_campaigns(status=CampaignStatus.ACTIVE)
-        completed_campaigns = await self._count_campaigns(status=CampaignStatus.COMPLETED)
-        
-        # 사용자 통계
-        total_users = await self._count_users()
-        active_users = await self._count_users(active_only=True)
-        
-        # 구매요청 통계
-        total_requests = await self._count_purchase_requests()
-        pending_requests = await self._count_purchase_requests(status=RequestStatus.PENDING)
-        approved_requests = await self._count_purchase_requests(status=RequestStatus.APPROVED)
-        
-        # 비용 통계
-        total_expenses = await self._calculate_total_expenses()
-        monthly_expenses = await self._calculate_monthly_expenses(date_from, date_to)
-        
-        # 성과 지표
-        conversion_rate = await self._calculate_conversion_rate()
-        average_campaign_budget = await self._calculate_average_campaign_budget()
+        # 서로 독립적인 집계를 각자의 커넥션에서 동시에 실행
+        campaigns, users, requests, monthly_expenses, recent_activities = await asyncio.gather(
+            self._campaign_aggregates(),
+            self._user_aggregates(),
+            self._purchase_request_aggregates(),
+            self._calculate_monthly_expenses(date_from, date_to),
+            self._get_recent_activities(limit=10)
+        )
         
-        # 최근 활동
-        recent_activities = await self._get_recent_activities(limit=10)
+        # 전환율 (완료된 캠페인 / 전체 캠페인)
+        conversion_rate = (
+            round((campaigns["completed"] / campaigns["total"]) * 100, 2)
+            if campaigns["total"] else 0.0
+        )
         
         return {
-            "total_campaigns": total_campaigns,
-            "active_campaigns": active_campaigns,
-            "completed_campaigns": completed_campaigns,
-            "total_users": total_users,
-            "active_users": active_users,
-            "total_expenses": total_expenses,
+            "total_campaigns": campaigns["total"],
+            "active_campaigns": campaigns["active"],
+            "completed_campaigns": campaigns["completed"],
+            "total_users": users["total"],
+            "active_users": users["active"],
+            "total_expenses": campaigns["budget_sum"] + requests["amount_sum"],
             "monthly_expenses": monthly_expenses,
-            "total_requests": total_requests,
-            "pending_requests": pending_requests,
-            "approved_requests": approved_requests,
+            "total_requests": requests["total"],
+            "pending_requests": requests["pending"],
+            "approved_requests": requests["approved"],
             "conversion_rate": conversion_rate,
-            "average_campaign_budget": average_campaign_budget,
+            "average_campaign_budget": campaigns["budget_avg"],
             "recent_activities": recent_activities,
             "date_range": {
                 "from": date_from.isoformat(),
@@ -108,40 +120,21 @@ class AnalyticsService:
         # 회사 필터링 조건
         company_filter = User.company == user.company
         
-        # 캠페인 통계 (회사별)
-        total_campaigns = await self._count_campaigns(company_filter=company_filter)
-        active_campaigns = await self._count_campaigns(
-            status=CampaignStatus.ACTIVE, 
-            company_filter=company_filter
-        )
-        
-        # 회사 사용자 통계
-        company_users = await self._count_users(company_filter=company_filter)
-        active_company_users = await self._count_users(
-            active_only=True, 
-            company_filter=company_filter
-        )
-        
-        # 회사 구매요청 통계
-        company_requests = await self._count_purchase_requests(company_filter=company_filter)
-        
-        # 회사 비용 통계
-        company_expenses = await self._calculate_total_expenses(company_filter=company_filter)
-        
-        # 최근 활동 (회사별)
-        recent_activities = await self._get_recent_activities(
-            limit=10, 
-            company_filter=company_filter
+        campaigns, users, requests, recent_activities = await asyncio.gather(
+            self._campaign_aggregates(company_filter=company_filter),
+            self._user_aggregates(company_filter=company_filter),
+            self._purchase_request_aggregates(company_filter=company_filter),
+            self._get_recent_activities(limit=10, company_filter=company_filter)
         )
         
         return {
-            "total_campaigns": total_campaigns,
-            "active_campaigns": active_campaigns,
-            "total_users": company_users,
-            "active_users": active_company_users,
-            "total_expenses": company_expenses,
+            "total_campaigns": campaigns["total"],
+            "active_campaigns": campaigns["active"],
+            "total_users": users["total"],
+            "active_users": users["active"],
+            "total_expenses": campaigns["budget_sum"] + requests["amount_sum"],
             "monthly_expenses": 0,  # TODO: 월별 계산 추가
-            "total_requests": company_requests,
+            "total_requests": requests["total"],
             "recent_activities": recent_activities,
             "company": user.company
         }
@@ -154,36 +147,19 @@ class AnalyticsService:
     ) -> Dict[str, Any]:
         """클라이언트 개인 통계"""
         
-        # 개인 캠페인 통계
-        user_campaigns = await self._count_campaigns(creator_id=user.id)
-        active_campaigns = await self._count_campaigns(
-            creator_id=user.id, 
-            status=CampaignStatus.ACTIVE
-        )
-        
-        # 개인 구매요청 통계
-        user_requests = await self._count_purchase_requests(requester_id=user.id)
-        pending_requests = await self._count_purchase_requests(
-            requester_id=user.id, 
-            status=RequestStatus.PENDING
-        )
-        
-        # 개인 비용 통계
-        user_expenses = await self._calculate_total_expenses(creator_id=user.id)
-        
-        # 최근 활동 (개인)
-        recent_activities = await self._get_recent_activities(
-            limit=5, 
-            creator_id=user.id
+        campaigns, requests, recent_activities = await asyncio.gather(
+            self._campaign_aggregates(creator_id=user.id),
+            self._purchase_request_aggregates(requester_id=user.id),
+            self._get_recent_activities(limit=5, creator_id=user.id)
         )
         
         return {
-            "total_campaigns": user_campaigns,
-            "active_campaigns": active_campaigns,
-            "total_expenses": user_expenses,
+            "total_campaigns": campaigns["total"],
+            "active_campaigns": campaigns["active"],
+            "total_expenses": campaigns["budget_sum"] + requests["amount_sum"],
             "monthly_expenses": 0,
-            "total_requests": user_requests,
-            "pending_requests": pending_requests,
+            "total_requests": requests["total"],
+            "pending_requests": requests["pending"],
             "recent_activities": recent_activities,
             "user_id": user.id
         }
@@ -197,7 +173,7 @@ class AnalyticsService:
         """직원 기본 통계"""
         
         # 회사 기본 정보만 제공
-        company_users = await self._count_users(
+        users = await self._user_aggregates(
             company_filter=(User.company == user.company)
         )
         
@@ -206,25 +182,36 @@ class AnalyticsService:
             "active_campaigns": 0,
             "total_expenses": 0,
             "monthly_expenses": 0,
-            "total_users": company_users,
+            "total_users": users["total"],
             "recent_activities": [],
             "access_level": "staff"
         }
     
     # 기본 통계 메서드들
-    async def _count_campaigns(
+    async def _fetch(self, query) -> List[Any]:
+        """독립 세션(풀의 별도 커넥션)에서 쿼리 실행 - asyncio.gather로 동시 실행하기 위함
+
+        AsyncSession 하나는 동시에 여러 쿼리를 실행할 수 없으므로 self.db를 공유하지 않습니다.
+        """
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(query)
+            return result.all()
+    
+    async def _campaign_aggregates(
         self, 
-        status: Optional[CampaignStatus] = None,
         company_filter: Optional[Any] = None,
         creator_id: Optional[int] = None
-    ) -> int:
-        """캠페인 개수 조회"""
-        query = select(func.count(Campaign.id))
+    ) -> Dict[str, Any]:
+        """캠페인 개수/상태별 개수/예산 합계·평균 (단일 쿼리, FILTER 조건부 집계)"""
+        query = select(
+            func.count(Campaign.id).label("total"),
+            func.count(Campaign.id).filter(Campaign.status == CampaignStatus.ACTIVE).label("active"),
+            func.count(Campaign.id).filter(Campaign.status == CampaignStatus.COMPLETED).label("completed"),
+            func.sum(Campaign.budget).label("budget_sum"),
+            func.avg(Campaign.budget).label("budget_avg")
+        )
         
         conditions = []
-        if status:
-            conditions.append(Campaign.status == status)
-        
         if creator_id:
             conditions.append(Campaign.creator_id == creator_id)
         
@@ -235,43 +222,45 @@ class AnalyticsService:
         if conditions:
             query = query.where(and_(*conditions))
         
-        result = await self.db.execute(query)
-        return result.scalar() or 0
+        row = (await self._fetch(query))[0]
+        return {
+            "total": row.total or 0,
+            "active": row.active or 0,
+            "completed": row.completed or 0,
+            "budget_sum": float(row.budget_sum or 0.0),
+            "budget_avg": float(row.budget_avg or 0.0)
+        }
     
-    async def _count_users(
+    async def _user_aggregates(
         self, 
-        active_only: bool = False,
         company_filter: Optional[Any] = None
-    ) -> int:
-        """사용자 개수 조회"""
-        query = select(func.count(User.id))
-        
-        conditions = []
-        if active_only:
-            conditions.append(User.is_active == True)
+    ) -> Dict[str, int]:
+        """사용자 개수 / 활성 사용자 개수 (단일 쿼리)"""
+        query = select(
+            func.count(User.id).label("total"),
+            func.count(User.id).filter(User.is_active == True).label("active")
+        )
         
         if company_filter is not None:
-            conditions.append(company_filter)
-        
-        if conditions:
-            query = query.where(and_(*conditions))
+            query = query.where(company_filter)
         
-        result = await self.db.execute(query)
-        return result.scalar() or 0
+        row = (await self._fetch(query))[0]
+        return {"total": row.total or 0, "active": row.active or 0}
     
-    async def _count_purchase_requests(
+    async def _purchase_request_aggregates(
         self, 
-        status: Optional[RequestStatus] = None,
         company_filter: Optional[Any] = None,
         requester_id: Optional[int] = None
-    ) -> int:
-        """구매요청 개수 조회"""
-        query = select(func.count(PurchaseRequest.id))
+    ) -> Dict[str, Any]:
+        """구매요청 개수/상태별 개수/금액 합계 (단일 쿼리)"""
+        query = select(
+            func.count(PurchaseRequest.id).label("total"),
+            func.count(PurchaseRequest.id).filter(PurchaseRequest.status == RequestStatus.PENDING).label("pending"),
+            func.count(PurchaseRequest.id).filter(PurchaseRequest.status == RequestStatus.APPROVED).label("approved"),
+            func.sum(PurchaseRequest.amount).label("amount_sum")
+        )
         
         conditions = []
-        if status:
-            conditions.append(PurchaseRequest.status == status)
-        
         if requester_id:
             conditions.append(PurchaseRequest.requester_id == requester_id)
         
@@ -282,49 +271,13 @@ class AnalyticsService:
         if conditions:
             query = query.where(and_(*conditions))
         
-        result = await self.db.execute(query)
-        return result.scalar() or 0
-    
-    async def _calculate_total_expenses(
-        self, 
-        company_filter: Optional[Any] = None,
-        creator_id: Optional[int] = None
-    ) -> float:
-        """총 비용 계산"""
-        # 캠페인 예산 합계
-        campaign_query = select(func.sum(Campaign.budget))
-        
-        # 구매요청 비용 합계
-        request_query = select(func.sum(PurchaseRequest.amount))
-        
-        conditions_campaign = []
-        conditions_request = []
-        
-        if creator_id:
-            conditions_campaign.append(Campaign.creator_id == creator_id)
-            conditions_request.append(PurchaseRequest.requester_id == creator_id)
-        
-        if company_filter is not None:
-            campaign_query = campaign_query.join(User, Campaign.creator_id == User.id)
-            request_query = request_query.join(User, PurchaseRequest.requester_id == User.id)
-            conditions_campaign.append(company_filter)
-            conditions_request.append(company_filter)
-        
-        if conditions_campaign:
-            campaign_query = campaign_query.where(and_(*conditions_campaign))
-        
-        if conditions_request:
-            request_query = request_query.where(and_(*conditions_request))
-        
-        # 캠페인 예산 합계
-        campaign_result = await self.db.execute(campaign_query)
-        campaign_total = campaign_result.scalar() or 0.0
-        
-        # 구매요청 비용 합계
-        request_result = await self.db.execute(request_query)
-        request_total = request_result.scalar() or 0.0
-        
-        return float(campaign_total + request_total)
+        row = (await self._fetch(query))[0]
+        return {
+            "total": row.total or 0,
+            "pending": row.pending or 0,
+            "approved": row.approved or 0,
+            "amount_sum": float(row.amount_sum or 0.0)
+        }
     
     async def _calculate_monthly_expenses(
         self, 
@@ -350,10 +303,9 @@ class AnalyticsService:
             extract('month', Campaign.created_at)
         )
         
-        result = await self.db.execute(monthly_query)
         monthly_data = []
         
-        for row in result:
+        for row in await self._fetch(monthly_query):
             month_name = calendar.month_name[int(row.month)]
             monthly_data.append({
                 "year": int(row.year),
@@ -364,24 +316,6 @@ class AnalyticsService:
         
         return monthly_data
     
-    async def _calculate_conversion_rate(self) -> float:
-        """전환율 계산 (완료된 캠페인 / 전체 캠페인)"""
-        total = await self._count_campaigns()
-        completed = await self._count_campaigns(status=CampaignStatus.COMPLETED)
-        
-        if total == 0:
-            return 0.0
-        
-        return round((completed / total) * 100, 2)
-    
-    async def _calculate_average_campaign_budget(self) -> float:
-        """평균 캠페인 예산 계산"""
-        query = select(func.avg(Campaign.budget))
-        result = await self.db.execute(query)
-        avg_budget = result.scalar()
-        
-        return float(avg_budget or 0.0)
-    
     async def _get_recent_activities(
         self, 
         limit: int = 10,
@@ -436,9 +370,13 @@ class AnalyticsService:
         if conditions_request:
             request_query = request_query.where(and_(*conditions_request))
         
-        # 캠페인 활동 조회
-        campaign_result = await self.db.execute(campaign_query)
-        for row in campaign_result:
+        # 캠페인 / 구매요청 활동 동시 조회
+        campaign_rows, request_rows = await asyncio.gather(
+            self._fetch(campaign_query),
+            self._fetch(request_query)
+        )
+        
+        for row in campaign_rows:
             activities.append({
                 "type": "campaign",
                 "id": row.id,
@@ -449,9 +387,7 @@ class AnalyticsService:
                 "description": f"캠페인 '{row.name}' 생성됨"
             })
         
-        # 구매요청 활동 조회
-        request_result = await self.db.execute(request_query)
-        for row in request_result:
+        for row in request_rows:
             activities.append({
                 "type": "purchase_request",
                 "id": row.id,
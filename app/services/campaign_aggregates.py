@@ -0,0 +1,346 @@
+"""
+Campaign post aggregates for BrandFlow API
+- campaigns.budget / active_post_count / invoiced_post_count / paid_post_count를 포스트 변경과
+  같은 트랜잭션에서 증분 UPDATE로 유지 (포스트 쓰기마다 SUM 재계산 제거)
+- 비활성(삭제) 포스트는 집계에서 제외, 활성 포스트가 없는 캠페인의 budget은 캠페인 예산 그대로 유지
+- 취소 포스트 수(cancelled_post_count)와 환불 기록 건수(campaign_refund_count/post_refund_count)도 같은 방식으로 유지
+  (환불 요약을 원본 행 재집계 없이 캠페인 행에서 바로 응답)
+- CampaignAggregateReconciler가 주기적으로 posts/환불 기록과 비교해 드리프트를 감지/보정
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence
+
+from sqlalchemy import case, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.models.campaign import Campaign
+from app.models.post import Post
+
+logger = logging.getLogger(__name__)
+
+# Float budget 합계 비교 허용 오차 (원)
+BUDGET_TOLERANCE = 0.01
+
+
+class PostContribution(NamedTuple):
+    """포스트 하나가 캠페인 집계에 더하는 값"""
+    budget: float = 0.0
+    active: int = 0
+    invoiced: int = 0
+    paid: int = 0
+    cancelled: int = 0
+
+
+NO_CONTRIBUTION = PostContribution()
+
+
+def post_contribution(post: Optional[Post]) -> PostContribution:
+    """현재 포스트 상태의 집계 기여분 (flush 전 새 포스트의 is_active=None은 컬럼 기본값 True로 간주)"""
+    if post is None or post.is_active is False:
+        return NO_CONTRIBUTION
+    return PostContribution(
+        budget=float(post.budget or 0.0),
+        active=1,
+        invoiced=1 if post.invoice_issued else 0,
+        paid=1 if post.payment_completed else 0,
+        cancelled=1 if post.is_cancelled else 0,
+    )
+
+
+def values_contribution(values: Mapping[str, Any]) -> PostContribution:
+    """컬럼 값 dict 기준 기여분 (일괄 insert/update 행용, 없는 is_active는 컬럼 기본값 True)"""
+    if values.get("is_active", True) is False:
+        return NO_CONTRIBUTION
+    return PostContribution(
+        budget=float(values.get("budget") or 0.0),
+        active=1,
+        invoiced=1 if values.get("invoice_issued") else 0,
+        paid=1 if values.get("payment_completed") else 0,
+        cancelled=1 if values.get("is_cancelled") else 0,
+    )
+
+
+def total_contribution(contributions: Iterable[PostContribution]) -> PostContribution:
+    """여러 포스트 기여분 합계 (일괄 처리 후 apply_post_delta 1회 호출용)"""
+    return PostContribution(*(sum(column) for column in zip(NO_CONTRIBUTION, *contributions)))
+
+
+async def apply_post_delta(
+    db: AsyncSession,
+    campaign_id: int,
+    before: PostContribution = NO_CONTRIBUTION,
+    after: PostContribution = NO_CONTRIBUTION,
+) -> None:
+    """
+    포스트 변경 전/후 기여분 차이를 캠페인에 반영 (UPDATE 1회, 호출한 트랜잭션에 포함)
+    - 생성: before 생략, 삭제: after 생략
+    - 첫 활성 포스트가 생기면 budget을 캠페인 예산 대신 포스트 budget 합계로 전환
+    """
+    delta = PostContribution(*(a - b for a, b in zip(after, before)))
+    if delta == NO_CONTRIBUTION:
+        return
+
+    await db.execute(
+        update(Campaign)
+        .where(Campaign.id == campaign_id)
+        .values(
+            budget=case((Campaign.active_post_count == 0, 0.0), else_=Campaign.budget) + delta.budget,
+            active_post_count=Campaign.active_post_count + delta.active,
+            invoiced_post_count=Campaign.invoiced_post_count + delta.invoiced,
+            paid_post_count=Campaign.paid_post_count + delta.paid,
+            cancelled_post_count=Campaign.cancelled_post_count + delta.cancelled,
+        )
+        # 세션에 로드된 Campaign 객체는 커밋 시 만료되므로 별도 동기화 불필요
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def delete_post_refunds(db: AsyncSession, campaign_id: int, post_ids: Sequence[int]) -> int:
+    """
+    하드 삭제할 포스트의 환불 기록을 먼저 삭제하고 post_refund_count 차감 (호출한 트랜잭션에 포함)
+    - DB의 ON DELETE CASCADE에 맡기면 캠페인 환불 건수 집계가 어긋나므로 포스트 삭제 전에 호출
+    """
+    from app.models.post_refund import PostRefund
+
+    if not post_ids:
+        return 0
+    result = await db.execute(
+        delete(PostRefund)
+        .where(PostRefund.post_id.in_(post_ids))
+        .returning(PostRefund.id)
+        .execution_options(synchronize_session=False)
+    )
+    removed = len(result.all())
+    if removed:
+        await db.execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id)
+            .values(post_refund_count=Campaign.post_refund_count - removed)
+            .execution_options(synchronize_session=False)
+        )
+    return removed
+
+
+def _expected_aggregates_subquery(campaign_ids: Optional[Sequence[int]] = None):
+    """posts 기준 캠페인별 기대 집계 (campaign_ids가 있으면 해당 캠페인만 집계)"""
+    query = (
+        select(
+            Post.campaign_id.label("campaign_id"),
+            func.count().label("active"),
+            func.count().filter(Post.invoice_issued == True).label("invoiced"),
+            func.count().filter(Post.payment_completed == True).label("paid"),
+            func.count().filter(Post.is_cancelled == True).label("cancelled"),
+            func.coalesce(func.sum(Post.budget), 0.0).label("budget"),
+        )
+        .where(Post.is_active == True)
+        .group_by(Post.campaign_id)
+    )
+    if campaign_ids is not None:
+        query = query.where(Post.campaign_id.in_(campaign_ids))
+    return query.subquery()
+
+
+async def recompute_aggregates(db: AsyncSession, campaign_ids: Sequence[int]) -> None:
+    """
+    지정 캠페인의 집계를 posts 기준으로 다시 계산 (UPDATE ... FROM 1회, 포스트를 집합 단위로 복사한 직후용)
+    - 활성 포스트가 없는 캠페인은 건드리지 않음 (집계 0, budget은 캠페인 예산 유지)
+    """
+    if not campaign_ids:
+        return
+    expected = _expected_aggregates_subquery(campaign_ids)
+    await db.execute(
+        update(Campaign)
+        .where(Campaign.id == expected.c.campaign_id)
+        .values(
+            budget=expected.c.budget,
+            active_post_count=expected.c.active,
+            invoiced_post_count=expected.c.invoiced,
+            paid_post_count=expected.c.paid,
+            cancelled_post_count=expected.c.cancelled,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _refund_count_subquery(model, campaign_ids: Optional[Sequence[int]] = None):
+    """환불 기록 테이블 기준 캠페인별 건수 (campaign_ids가 있으면 해당 캠페인만 집계)"""
+    query = select(model.campaign_id.label("campaign_id"), func.count().label("count")).group_by(model.campaign_id)
+    if campaign_ids is not None:
+        query = query.where(model.campaign_id.in_(campaign_ids))
+    return query.subquery()
+
+
+async def find_drift(db: AsyncSession, limit: int = 500) -> List[Dict[str, Any]]:
+    """저장된 집계와 posts/환불 기록에서 계산한 값이 다른 캠페인 (쿼리 1회)"""
+    from app.models.campaign_refund import CampaignRefund
+    from app.models.post_refund import PostRefund
+
+    expected = _expected_aggregates_subquery()
+    campaign_refunds = _refund_count_subquery(CampaignRefund)
+    post_refunds = _refund_count_subquery(PostRefund)
+    active = func.coalesce(expected.c.active, 0)
+    budget = func.coalesce(expected.c.budget, 0.0)
+    # 저장 컬럼 -> 기대값
+    counts = {
+        "active_post_count": active,
+        "invoiced_post_count": func.coalesce(expected.c.invoiced, 0),
+        "paid_post_count": func.coalesce(expected.c.paid, 0),
+        "cancelled_post_count": func.coalesce(expected.c.cancelled, 0),
+        "campaign_refund_count": func.coalesce(campaign_refunds.c.count, 0),
+        "post_refund_count": func.coalesce(post_refunds.c.count, 0),
+    }
+
+    query = (
+        select(
+            Campaign.id, Campaign.budget, budget,
+            *(getattr(Campaign, column) for column in counts),
+            *counts.values(),
+        )
+        .outerjoin(expected, expected.c.campaign_id == Campaign.id)
+        .outerjoin(campaign_refunds, campaign_refunds.c.campaign_id == Campaign.id)
+        .outerjoin(post_refunds, post_refunds.c.campaign_id == Campaign.id)
+        .where(or_(
+            *(getattr(Campaign, column) != value for column, value in counts.items()),
+            # 활성 포스트가 없는 캠페인의 budget은 캠페인 예산이므로 비교하지 않음
+            (active > 0) & (func.abs(Campaign.budget - budget) > BUDGET_TOLERANCE),
+        ))
+        .order_by(Campaign.id)
+        .limit(limit)
+    )
+    rows = (await db.execute(query)).all()
+    size = len(counts)
+    drift = []
+    for row in rows:
+        stored = dict(zip(counts, row[3:3 + size]))
+        expected_values = dict(zip(counts, row[3 + size:]))
+        drift.append({
+            "campaign_id": row[0],
+            "stored": {"budget": row[1], **stored},
+            "expected": {"budget": float(row[2]) if expected_values["active_post_count"] else row[1], **expected_values},
+        })
+    return drift
+
+
+async def fix_drift(db: AsyncSession, campaign_ids: Sequence[int]) -> int:
+    """
+    지정 캠페인의 집계를 posts/환불 기록 기준으로 다시 계산해 덮어쓰기 (호출자가 커밋)
+    - 캠페인 행을 FOR UPDATE로 먼저 잠근 뒤 재계산하므로, 진행 중이던 포스트/환불 트랜잭션
+      (apply_post_delta 등으로 같은 행을 갱신)이 커밋된 결과를 보고 계산하고 이후 증분과도 어긋나지 않음
+    - find_drift 시점의 값이 아니라 잠근 후의 값으로 UPDATE ... FROM 1회 (오래된 절대값을 쓰지 않음)
+    """
+    from app.models.campaign_refund import CampaignRefund
+    from app.models.post_refund import PostRefund
+
+    if not campaign_ids:
+        return 0
+    campaign_ids = sorted(set(campaign_ids))
+    locked = (await db.execute(
+        select(Campaign.id).where(Campaign.id.in_(campaign_ids)).order_by(Campaign.id).with_for_update()
+    )).scalars().all()
+    if not locked:
+        return 0
+
+    expected = _expected_aggregates_subquery(locked)
+    campaign_refunds = _refund_count_subquery(CampaignRefund, locked)
+    post_refunds = _refund_count_subquery(PostRefund, locked)
+    target = aliased(Campaign)
+    recomputed = (
+        select(
+            target.id.label("campaign_id"),
+            func.coalesce(expected.c.active, 0).label("active"),
+            func.coalesce(expected.c.invoiced, 0).label("invoiced"),
+            func.coalesce(expected.c.paid, 0).label("paid"),
+            func.coalesce(expected.c.cancelled, 0).label("cancelled"),
+            expected.c.budget.label("budget"),
+            func.coalesce(campaign_refunds.c.count, 0).label("campaign_refunds"),
+            func.coalesce(post_refunds.c.count, 0).label("post_refunds"),
+        )
+        .outerjoin(expected, expected.c.campaign_id == target.id)
+        .outerjoin(campaign_refunds, campaign_refunds.c.campaign_id == target.id)
+        .outerjoin(post_refunds, post_refunds.c.campaign_id == target.id)
+        .where(target.id.in_(locked))
+        .subquery()
+    )
+    result = await db.execute(
+        update(Campaign)
+        .where(Campaign.id == recomputed.c.campaign_id)
+        .values(
+            # 활성 포스트가 없는 캠페인의 budget은 캠페인 예산 그대로 유지
+            budget=case((recomputed.c.active > 0, recomputed.c.budget), else_=Campaign.budget),
+            active_post_count=recomputed.c.active,
+            invoiced_post_count=recomputed.c.invoiced,
+            paid_post_count=recomputed.c.paid,
+            cancelled_post_count=recomputed.c.cancelled,
+            campaign_refund_count=recomputed.c.campaign_refunds,
+            post_refund_count=recomputed.c.post_refunds,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount or 0
+
+
+class CampaignAggregateReconciler:
+    """집계 드리프트 주기 점검 (워커마다 실행되지만 쿼리 1회라 부담 적음, interval 0이면 비활성)"""
+
+    def __init__(self, interval: float = 3600.0, auto_fix: bool = True):
+        self.interval = interval
+        self.auto_fix = auto_fix
+        self.last_result: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.interval <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once(fix=self.auto_fix)
+            except Exception as e:
+                logger.warning("Campaign aggregate reconciliation failed: %s", e)
+
+    async def run_once(self, fix: bool = False) -> Dict[str, Any]:
+        from datetime import datetime
+        from app.db.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            drift = await find_drift(db)
+            fixed = 0
+            if drift and fix:
+                fixed = await fix_drift(db, [item["campaign_id"] for item in drift])
+                await db.commit()
+
+        if drift:
+            logger.warning(
+                "Campaign aggregate drift detected in %s campaigns (fixed=%s): %s",
+                len(drift), fixed, [item["campaign_id"] for item in drift[:20]]
+            )
+        self.last_result = {
+            "checked_at": datetime.utcnow().isoformat(),
+            "drifted": len(drift),
+            "fixed": fixed,
+            "campaigns": drift,
+        }
+        return self.last_result
+
+
+campaign_aggregate_reconciler = CampaignAggregateReconciler(
+    interval=settings.CAMPAIGN_AGGREGATE_RECONCILE_SECONDS,
+    auto_fix=settings.CAMPAIGN_AGGREGATE_AUTO_FIX,
+)
@@ -0,0 +1,166 @@
+"""
+Campaign cloning for BrandFlow API
+- 캠페인 기본 정보는 일괄 INSERT, 포스트/계약서는 INSERT ... SELECT로 복사 (행마다 ORM 객체를 만들지 않음)
+- 여러 캠페인을 복사해도 문장 수는 고정: 캠페인 INSERT 1회 + 포스트/계약서 INSERT ... SELECT 각 1회 + 집계 UPDATE 1회
+- 원본 캠페인 ID -> 새 캠페인 ID는 CASE 식으로 SELECT 안에서 매핑
+- 포스트의 진행/재무 상태(주제·개요 승인, 발주 요청, 계산서/입금, 취소/환불)와 일정, 콘텐츠는 초기화
+- 발주 요청(order_requests)은 실제 요청 이력이므로 복사하지 않고 포스트의 발주 상태만 비움
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import case, func, insert, literal, null, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.campaign_contract import CampaignContract
+from app.models.post import Post
+from app.services.campaign_aggregates import recompute_aggregates
+
+# 원본 값을 그대로 복사하는 포스트 컬럼 (업무 정의)
+POST_COPY_COLUMNS = (
+    "title", "work_type", "company", "product_id", "product_name", "product_cost",
+    "quantity", "cost", "budget", "assigned_user_id",
+)
+
+# 복사본에서 초기값으로 되돌리는 포스트 컬럼 (None은 NULL)
+POST_RESET_VALUES: Dict[str, Any] = {
+    "topic_status": "주제 승인 대기",
+    "outline": None,
+    "outline_status": None,
+    "reject_reason": None,
+    "images": None,
+    "published_url": None,
+    "order_request_status": None,
+    "order_request_id": None,
+    "start_date": None,
+    "due_date": None,
+    "start_datetime": None,
+    "due_datetime": None,
+    "invoice_issued": False,
+    "payment_completed": False,
+    "invoice_due_date": None,
+    "payment_due_date": None,
+    "is_cancelled": False,
+    "refund_amount": 0.0,
+    "is_active": True,
+}
+
+
+@dataclass
+class CloneSpec:
+    """복사할 캠페인 하나 (source는 권한 확인을 마친 원본)"""
+    source: Campaign
+    name: str
+    start_date: datetime
+    end_date: datetime
+    budget: Optional[float]
+    staff_id: Optional[int]
+
+
+@dataclass
+class CloneResult:
+    campaign_ids: List[int]  # specs 순서
+    copied_posts: int = 0
+    copied_contracts: int = 0
+
+
+def _naive(value: datetime) -> datetime:
+    """DB는 timezone-naive datetime 사용"""
+    return value.replace(tzinfo=None) if value.tzinfo else value
+
+
+def _constant(column, value):
+    return null() if value is None else literal(value, column.type)
+
+
+async def clone_campaigns(
+    db: AsyncSession,
+    specs: Sequence[CloneSpec],
+    creator_id: int,
+    include_posts: bool = False,
+    include_contracts: bool = False,
+) -> CloneResult:
+    """specs의 캠페인을 한 번에 복사 (호출자가 커밋 - 같은 트랜잭션)"""
+    if not specs:
+        return CloneResult(campaign_ids=[])
+    if len({spec.source.id for spec in specs}) != len(specs):
+        # 포스트/계약서를 원본 캠페인 ID로 새 캠페인에 매핑하므로 원본은 요청당 한 번만
+        raise ValueError("같은 원본 캠페인을 한 요청에서 여러 번 복사할 수 없습니다")
+
+    campaign_rows = [
+        {
+            # 기본 정보 복사
+            "name": spec.name,
+            "description": spec.source.description,
+            "budget": spec.budget if spec.budget is not None else spec.source.budget,
+            "start_date": _naive(spec.start_date),
+            "end_date": _naive(spec.end_date),
+            # 클라이언트 정보 복사
+            "company": spec.source.company,
+            "client_company": spec.source.client_company,
+            "client_user_id": spec.source.client_user_id,
+            # 새로 설정 (카톡 정보/취소·환불 상태는 컬럼 기본값)
+            "status": CampaignStatus.ACTIVE,
+            "creator_id": creator_id,
+            "staff_id": spec.staff_id or creator_id,
+        }
+        for spec in specs
+    ]
+    inserted = await db.execute(
+        insert(Campaign).returning(Campaign.id, sort_by_parameter_order=True), campaign_rows
+    )
+    campaign_ids = list(inserted.scalars().all())
+    result = CloneResult(campaign_ids=campaign_ids)
+
+    id_map = {spec.source.id: new_id for spec, new_id in zip(specs, campaign_ids)}
+
+    if include_posts:
+        new_campaign_id = case(id_map, value=Post.campaign_id)
+        columns = [*POST_COPY_COLUMNS, *POST_RESET_VALUES, "campaign_id", "created_at", "updated_at"]
+        source_posts = (
+            select(
+                *(getattr(Post, name) for name in POST_COPY_COLUMNS),
+                *(_constant(getattr(Post, name), value) for name, value in POST_RESET_VALUES.items()),
+                new_campaign_id,
+                func.now(),
+                func.now(),
+            )
+            .where(
+                Post.campaign_id.in_(id_map),
+                Post.is_active == True,
+                or_(Post.is_cancelled.is_(None), Post.is_cancelled == False),
+            )
+            .order_by(Post.campaign_id, Post.id)
+        )
+        copied = await db.execute(insert(Post).from_select(columns, source_posts, include_defaults=False))
+        result.copied_posts = copied.rowcount or 0
+        if result.copied_posts:
+            await recompute_aggregates(db, campaign_ids)
+
+    if include_contracts:
+        new_campaign_id = case(id_map, value=CampaignContract.campaign_id)
+        source_contracts = (
+            select(
+                new_campaign_id,
+                CampaignContract.file_url,
+                CampaignContract.file_name,
+                CampaignContract.file_size,
+                func.now(),
+                _constant(CampaignContract.is_active, True),
+            )
+            .where(CampaignContract.campaign_id.in_(id_map), CampaignContract.is_active == True)
+            .order_by(CampaignContract.campaign_id, CampaignContract.id)
+        )
+        copied = await db.execute(
+            insert(CampaignContract).from_select(
+                ["campaign_id", "file_url", "file_name", "file_size", "uploaded_at", "is_active"],
+                source_contracts,
+                include_defaults=False,
+            )
+        )
+        result.copied_contracts = copied.rowcount or 0
+
+    return result
@@ -0,0 +1,180 @@
+"""
+Company logo assets for BrandFlow API
+- 업로드 파일은 콘텐츠 해시(sha256 앞 16자) 이름으로 저장. 내용이 바뀌면 URL도 바뀌므로 브라우저/CDN이 영구 캐시 가능
+- 업로드 시 LOGO_VARIANT_WIDTHS 너비의 리사이즈 파일을 미리 생성 (PIL, 스레드에서 실행)
+- 회사별 로고 메타데이터를 메모리에 캐시해 헤더 로고 조회가 DB를 거치지 않음. 업로드/삭제 시 버전을 올려 무효화
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import time
+import uuid
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import UploadFile
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.file_upload import FileUploadError, file_manager
+from app.models.company_logo import CompanyLogo
+
+logger = logging.getLogger(__name__)
+
+ASSET_DIR = "logos"
+ASSET_ROUTE = "/api/company/logo/assets"
+LOGO_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp", "svg"}
+RESIZABLE_EXTENSIONS = {"png", "jpg", "jpeg", "webp"}
+ASSET_NAME_PATTERN = re.compile(r"^([0-9a-f]{16})(?:_w(\d{1,4}))?\.(png|jpe?g|gif|webp|svg)$")
+
+
+def asset_name(content_hash: str, ext: str, width: Optional[int] = None) -> str:
+    suffix = f"_w{width}" if width else ""
+    return f"{content_hash}{suffix}.{ext}"
+
+
+def asset_url(content_hash: str, ext: str, width: Optional[int] = None) -> str:
+    return f"{ASSET_ROUTE}/{asset_name(content_hash, ext, width)}"
+
+
+def asset_path(name: str) -> Path:
+    return Path(settings.UPLOAD_DIR) / ASSET_DIR / name
+
+
+def _write_atomic(path: Path, write) -> None:
+    """임시 파일에 쓴 뒤 교체 (같은 해시를 동시에 업로드해도 읽는 쪽이 반쯤 쓴 파일을 보지 않음)"""
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _write_assets(content: bytes, content_hash: str, ext: str, widths: Sequence[int]) -> List[int]:
+    """원본과 리사이즈 파일 저장 (동기 - 스레드에서 실행), 생성된 너비 반환"""
+    original = asset_path(asset_name(content_hash, ext))
+    original.parent.mkdir(parents=True, exist_ok=True)
+    if not original.exists():
+        _write_atomic(original, lambda path: path.write_bytes(content))
+
+    if ext not in RESIZABLE_EXTENSIONS:
+        return []
+
+    generated = []
+    try:
+        from PIL import Image
+
+        with Image.open(BytesIO(content)) as img:
+            for width in sorted(set(widths)):
+                if width <= 0 or width >= img.width:
+                    continue  # 원본보다 큰 변형은 만들지 않음
+                path = asset_path(asset_name(content_hash, ext, width))
+                if not path.exists():
+                    height = max(1, round(img.height * width / img.width))
+                    variant = img.resize((width, height), Image.Resampling.LANCZOS)
+                    if ext in ("jpg", "jpeg") and variant.mode in ("RGBA", "P"):
+                        variant = variant.convert("RGB")
+                    image_format = "JPEG" if ext in ("jpg", "jpeg") else ext.upper()
+                    _write_atomic(path, lambda target: variant.save(target, image_format, optimize=True))
+                generated.append(width)
+    except Exception as e:
+        logger.warning("Logo variant generation failed for %s: %s", content_hash, e)
+    return generated
+
+
+async def store_logo_file(upload: UploadFile) -> Dict[str, Any]:
+    """로고 파일 검증 후 해시 이름으로 저장 (CompanyLogo 컬럼 값 반환)"""
+    file_info = file_manager.validate_file(upload)
+    ext = file_info["extension"]
+    if ext not in LOGO_EXTENSIONS:
+        raise FileUploadError(f"로고는 이미지 파일만 업로드할 수 있습니다: .{ext}")
+
+    content = await upload.read()
+    if not content:
+        raise FileUploadError("빈 파일입니다.")
+    content_hash = hashlib.sha256(content).hexdigest()[:16]
+    widths = await asyncio.to_thread(_write_assets, content, content_hash, ext, settings.LOGO_VARIANT_WIDTHS)
+
+    return {
+        "logo_url": asset_url(content_hash, ext),
+        "content_hash": content_hash,
+        "asset_ext": ext,
+        "variant_widths": widths,
+    }
+
+
+def logo_payload(logo: CompanyLogo) -> Dict[str, Any]:
+    """로고 조회/업로드 응답 (해시가 없는 기존 업로드는 logo_url 그대로)"""
+    uploaded_at = logo.updated_at or logo.created_at
+    variants = {}
+    if logo.content_hash:
+        logo_url = asset_url(logo.content_hash, logo.asset_ext)
+        variants = {
+            str(width): asset_url(logo.content_hash, logo.asset_ext, width)
+            for width in (logo.variant_widths or [])
+        }
+    else:
+        logo_url = logo.logo_url
+    return {
+        "id": logo.id,
+        "logoUrl": logo_url,
+        "uploadedAt": uploaded_at.isoformat() if uploaded_at else None,
+        "companyId": logo.company_id,
+        "updatedBy": logo.updated_by,
+        "version": logo.content_hash,
+        "variants": variants,
+    }
+
+
+class CompanyLogoCache:
+    """회사별 로고 메타데이터 캐시 (로고가 없는 회사도 None으로 캐시)"""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        # company -> (적재 시점 버전, 만료 시각, 응답 payload 또는 None)
+        self._entries: Dict[str, Tuple[int, float, Optional[Dict[str, Any]]]] = {}
+        self._versions: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, company: str) -> None:
+        self._versions[company] = self._versions.get(company, 0) + 1
+        self._entries.pop(company, None)
+
+    async def get(self, db: AsyncSession, company: str) -> Optional[Dict[str, Any]]:
+        version = self._versions.get(company, 0)
+        cached = self._entries.get(company)
+        if cached is not None and cached[0] == version and cached[1] > time.monotonic():
+            self.hits += 1
+            return cached[2]
+
+        self.misses += 1
+        result = await db.execute(
+            select(CompanyLogo).where(CompanyLogo.company_id == company).order_by(CompanyLogo.id.desc()).limit(1)
+        )
+        logo = result.scalar_one_or_none()
+        payload = logo_payload(logo) if logo else None
+        # 조회 중 업로드/삭제가 있었으면 저장하지 않음
+        if self._versions.get(company, 0) == version:
+            self._entries[company] = (version, time.monotonic() + self.ttl, payload)
+        return payload
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "companies": len(self._entries),
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0.0,
+        }
+
+
+company_logo_cache = CompanyLogoCache(ttl=settings.LOGO_CACHE_TTL_SECONDS)
@@ -1,10 +1,87 @@
-from sqlalchemy.orm import Session
-from typing import Dict, List, Optional
-from app.models.system_setting import SystemSetting, SettingCategory
+"""
+Company settings service for BrandFlow API
+- AsyncSession 기반 (이벤트 루프를 막지 않음)
+- 회사별 설정 전체를 dict 하나(스냅샷)로 메모리에 보관: 키 조회/get_many는 DB 없이 처리
+- 쓰기 시 회사 버전을 올려 스냅샷 무효화 - 쓰기 전에 시작된 조회가 오래된 스냅샷을 다시 저장하지 못함
+- 다른 워커의 쓰기는 TTL(COMPANY_SETTINGS_CACHE_TTL_SECONDS) 안에 반영
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
 from app.models.company_settings import CompanySettings, CompanyInfo
 from app.models.user import User, UserRole
 
 
+class CompanySettingsCache:
+    """회사별 설정 스냅샷 캐시 (읽기 시 적재, 쓰기 시 버전 증가로 무효화)"""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        # company -> (적재 시점 버전, 만료 시각, {setting_key: setting_value})
+        self._snapshots: Dict[str, Tuple[int, float, Dict[str, Optional[str]]]] = {}
+        self._versions: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, company: str) -> int:
+        return self._versions.get(company, 0)
+
+    def invalidate(self, company: str) -> None:
+        """쓰기 후 호출 - 버전을 올리고 스냅샷 삭제"""
+        self._versions[company] = self.version(company) + 1
+        self._snapshots.pop(company, None)
+
+    def clear(self) -> None:
+        for company in list(self._snapshots):
+            self.invalidate(company)
+
+    async def snapshot(self, db: AsyncSession, company: str) -> Dict[str, Optional[str]]:
+        """회사 설정 전체 (반환 dict는 공유되므로 수정 금지)"""
+        version = self.version(company)
+        cached = self._snapshots.get(company)
+        if cached is not None and cached[0] == version and cached[1] > time.monotonic():
+            self.hits += 1
+            return cached[2]
+
+        self.misses += 1
+        result = await db.execute(
+            select(CompanySettings.setting_key, CompanySettings.setting_value)
+            .where(CompanySettings.company == company)
+        )
+        values = dict(result.all())
+        # 조회 중 쓰기가 있었으면 저장하지 않음 (다음 조회에서 다시 적재)
+        if self.version(company) == version:
+            self._snapshots[company] = (version, time.monotonic() + self.ttl, values)
+        return values
+
+    async def get(self, db: AsyncSession, company: str, setting_key: str, default: Optional[str] = None) -> Optional[str]:
+        values = await self.snapshot(db, company)
+        return values.get(setting_key, default)
+
+    async def get_many(self, db: AsyncSession, company: str, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+        """여러 키를 한 번에 조회 (없는 키는 None)"""
+        values = await self.snapshot(db, company)
+        return {key: values.get(key) for key in keys}
+
+    def stats(self) -> Dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "companies": len(self._snapshots),
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0.0,
+        }
+
+
+company_settings_cache = CompanySettingsCache(ttl=settings.COMPANY_SETTINGS_CACHE_TTL_SECONDS)
+
+
 def get_user_company(user: User) -> Optional[str]:
     """사용자의 회사 정보를 반환합니다.
 
@@ -18,68 +95,96 @@ def get_user_company(user: User) -> Optional[str]:
     return user.company
 
 
-def get_company_settings(db: Session, company: str, setting_key: Optional[str] = None) -> List[CompanySettings]:
-    """특정 회사의 설정들을 조회합니다."""
-    query = db.query(CompanySettings).filter(CompanySettings.company == company)
+async def get_company_settings(db: AsyncSession, company: str) -> Dict[str, Optional[str]]:
+    """특정 회사의 설정들을 {setting_key: setting_value}로 조회합니다. (캐시)"""
+    return await company_settings_cache.snapshot(db, company)
 
-    if setting_key:
-        query = query.filter(CompanySettings.setting_key == setting_key)
 
-    return query.all()
+async def get_company_setting_value(db: AsyncSession, company: str, setting_key: str) -> Optional[str]:
+    """특정 회사의 특정 설정 값을 조회합니다. (캐시)"""
+    return await company_settings_cache.get(db, company, setting_key)
 
 
-def get_company_setting_value(db: Session, company: str, setting_key: str) -> Optional[str]:
-    """특정 회사의 특정 설정 값을 조회합니다."""
-    company_setting = db.query(CompanySettings).filter(
-        CompanySettings.company == company,
-        CompanySettings.setting_key == setting_key
-    ).first()
+async def get_company_setting_values(db: AsyncSession, company: str, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+    """특정 회사의 여러 설정 값을 한 번에 조회합니다. (캐시)"""
+    return await company_settings_cache.get_many(db, company, keys)
 
-    if company_setting:
-        return company_setting.setting_value
 
-    return None
+async def set_company_settings(db: AsyncSession, company: str, values: Dict[str, Optional[str]], user: User) -> List[str]:
+    """회사별 설정을 일괄 생성/업데이트하고 커밋합니다. (변경된 키 목록 반환)"""
+    if not values:
+        return []
 
-
-def set_company_setting(db: Session, company: str, setting_key: str, value: str, user: User) -> CompanySettings:
-    """회사별 설정을 생성하거나 업데이트합니다."""
-    # 기존 회사별 설정 확인
-    existing = db.query(CompanySettings).filter(
-        CompanySettings.company == company,
-        CompanySettings.setting_key == setting_key
-    ).first()
-
-    if existing:
-        # 업데이트
-        existing.setting_value = value
-        existing.modified_by = user.id
-        db.commit()
-        db.refresh(existing)
-        return existing
-    else:
-        # 새로운 회사별 설정 생성
-        new_setting = CompanySettings(
-            company=company,
-            setting_key=setting_key,
-            setting_value=value,
-            modified_by=user.id
+    result = await db.execute(
+        select(CompanySettings).where(
+            CompanySettings.company == company,
+            CompanySettings.setting_key.in_(list(values)),
         )
-
-        db.add(new_setting)
-        db.commit()
-        db.refresh(new_setting)
-        return new_setting
+    )
+    existing = {setting.setting_key: setting for setting in result.scalars().all()}
+
+    for setting_key, value in values.items():
+        setting = existing.get(setting_key)
+        if setting:
+            setting.setting_value = value
+            setting.modified_by = user.id
+        else:
+            db.add(CompanySettings(
+                company=company,
+                setting_key=setting_key,
+                setting_value=value,
+                modified_by=user.id
+            ))
+
+    try:
+        await db.commit()
+    finally:
+        company_settings_cache.invalidate(company)
+    return list(values)
+
+
+async def set_company_setting(db: AsyncSession, company: str, setting_key: str, value: str, user: User) -> None:
+    """회사별 설정을 생성하거나 업데이트합니다."""
+    await set_company_settings(db, company, {setting_key: value}, user)
 
 
-def get_company_info_dict(db: Session, company: str) -> Dict[str, str]:
+async def delete_company_setting(db: AsyncSession, company: str, setting_key: str) -> bool:
+    """회사별 설정을 삭제합니다. (삭제 여부 반환)"""
+    result = await db.execute(
+        delete(CompanySettings).where(
+            CompanySettings.company == company,
+            CompanySettings.setting_key == setting_key,
+        )
+    )
+    try:
+        await db.commit()
+    finally:
+        company_settings_cache.invalidate(company)
+    return bool(result.rowcount)
+
+
+def company_info_from_user(user: User) -> Dict[str, str]:
+    """company_settings가 비어 있을 때 SUPER_ADMIN/AGENCY_ADMIN의 client_* 필드에서 회사 정보 구성"""
+    if user.role not in [UserRole.SUPER_ADMIN, UserRole.AGENCY_ADMIN]:
+        return {}
+    fields = {
+        'company_name': user.client_company_name,
+        'business_number': user.client_business_number,
+        'ceo_name': user.client_ceo_name,
+        'company_address': user.client_company_address,
+        'business_type': user.client_business_type,
+        'business_item': user.client_business_item,
+    }
+    return {key: value for key, value in fields.items() if value}
+
+
+async def get_company_info_dict(db: AsyncSession, company: str, user: Optional[User] = None) -> Dict[str, str]:
     """회사 정보를 딕셔너리 형태로 반환합니다. (DocumentTemplateBuilder용)"""
-    company_settings = get_company_settings(db, company)
+    settings_dict = await get_company_settings(db, company)
+    if not settings_dict and user is not None:
+        settings_dict = company_info_from_user(user)
 
     # CompanyInfo 헬퍼 클래스 사용
-    settings_dict = {}
-    for setting in company_settings:
-        settings_dict[setting.setting_key] = setting.setting_value
-
     company_info = CompanyInfo(company, settings_dict)
     return company_info.to_dict()
 
@@ -92,4 +197,4 @@ def can_user_edit_company_settings(user: User, target_company: str) -> bool:
     if user.role == UserRole.AGENCY_ADMIN:
         return user.company == target_company  # 본인 회사만 편집 가능
 
-    return False  # STAFF, CLIENT는 편집 불가
\ No newline at end of file
+    return False  # STAFF, CLIENT는 편집 불가
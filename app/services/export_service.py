@@ -8,16 +8,6 @@ import os
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
-import pandas as pd
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.pdfgen import canvas
-from reportlab.pdfbase import pdfutils
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfbase import pdfmetrics
 import logging
 
 from app.models.campaign import Campaign
@@ -34,6 +24,19 @@ class ExportService:
         self.export_dir = Path("./exports")
         self.export_dir.mkdir(exist_ok=True)
 
+        # PDF 폰트/스타일은 첫 PDF 생성 시 초기화 (reportlab import 지연)
+        self._pdf_styles_ready = False
+
+    def _ensure_pdf_styles(self) -> None:
+        """한글 폰트 등록 및 PDF 스타일 설정 (최초 1회)"""
+        if self._pdf_styles_ready:
+            return
+
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.pdfbase.ttfonts import TTFont
+        from reportlab.pdfbase import pdfmetrics
+
         # 한글 폰트 등록
         try:
             # NanumGothic 폰트 등록 (Railway에서 설치 필요)
@@ -80,8 +83,12 @@ class ExportService:
             alignment=1  # 중앙 정렬
         )
     
+        self._pdf_styles_ready = True
+
     async def export_campaigns_excel(self, campaigns: List[Campaign], user_id: int) -> str:
         """캠페인 데이터를 Excel로 내보내기"""
+        import pandas as pd
+
         try:
             # 데이터 준비
             data = []
@@ -146,6 +153,8 @@ class ExportService:
     
     async def export_purchase_requests_excel(self, requests: List[PurchaseRequest], user_id: int) -> str:
         """구매요청 데이터를 Excel로 내보내기"""
+        import pandas as pd
+
         try:
             # 데이터 준비
             data = []
@@ -213,6 +222,12 @@ class ExportService:
     
     async def export_campaigns_pdf(self, campaigns: List[Campaign], user_id: int) -> str:
         """캠페인 데이터를 PDF로 내보내기"""
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+        self._ensure_pdf_styles()
         try:
             # 파일명 생성
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -322,6 +337,8 @@ class ExportService:
     
     async def export_csv(self, data: List[Dict[str, Any]], filename_prefix: str, user_id: int) -> str:
         """일반 데이터를 CSV로 내보내기"""
+        import pandas as pd
+
         try:
             if not data:
                 raise ValueError("내보낼 데이터가 없습니다.")
@@ -359,6 +376,12 @@ class ExportService:
     
     async def create_dashboard_report_pdf(self, dashboard_data: Dict[str, Any], user_id: int) -> str:
         """대시보드 데이터를 종합 리포트 PDF로 생성"""
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+        self._ensure_pdf_styles()
         try:
             # 파일명 생성
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -485,6 +508,13 @@ class ExportService:
         approver: User
     ) -> str:
         """구매요청 지출품의서 PDF 생성"""
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+        self._ensure_pdf_styles()
         try:
             # 파일명 생성
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
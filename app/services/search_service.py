@@ -4,20 +4,137 @@
 """
 
 from typing import List, Dict, Any, Optional, Union, Tuple
-from sqlalchemy import select, and_, or_, desc, asc, func, text
+from sqlalchemy import select, and_, or_, desc, asc, func, text, false
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 from datetime import datetime, timedelta
 from enum import Enum
 import re
+import time
+import asyncio
 import logging
 
 from app.models.campaign import Campaign
 from app.models.purchase_request import PurchaseRequest, RequestStatus
-from app.models.user import User
+from app.models.user import User, UserRole
+from app.models.post import Post
+from app.models.product import Product
+from app.models.board import BoardPost
 
 logger = logging.getLogger(__name__)
 
+# 빠른 검색 소스별 제한 시간 (초) - 초과 시 해당 소스만 부분 결과로 처리
+QUICK_SEARCH_SOURCE_TIMEOUT = 2.0
+
+def _role_value(user: User) -> str:
+    return user.role.value if hasattr(user.role, "value") else str(user.role)
+
+
+def _campaign_scope(user: User) -> List[Any]:
+    """캠페인 목록 API(get_campaigns)와 같은 역할별 조회 범위"""
+    role = _role_value(user)
+    if role == UserRole.SUPER_ADMIN.value:
+        return []
+    if role == UserRole.AGENCY_ADMIN.value:
+        if not user.company:
+            return [false()]
+        return [or_(
+            Campaign.company == user.company,
+            Campaign.creator_id == user.id,
+            Campaign.staff_id == user.id,
+        )]
+    if role == UserRole.CLIENT.value:
+        return [Campaign.client_user_id == user.id]
+    if role == UserRole.TEAM_LEADER.value:
+        team_members = select(User.id).where(User.company == user.company, User.team_leader_id == user.id)
+        return [or_(
+            Campaign.creator_id == user.id,
+            Campaign.staff_id == user.id,
+            Campaign.creator_id.in_(team_members),
+            Campaign.staff_id.in_(team_members),
+        )]
+    if role == UserRole.STAFF.value:
+        return [or_(Campaign.creator_id == user.id, Campaign.staff_id == user.id)]
+    # 그 외 역할은 생성자 회사 기준
+    return [Campaign.creator_id.in_(select(User.id).where(User.company == user.company))]
+
+
+def _post_scope(user: User) -> List[Any]:
+    """조회 가능한 캠페인에 속한 활성 포스트"""
+    conditions = [Post.is_active == True]
+    campaign_scope = _campaign_scope(user)
+    if campaign_scope:
+        conditions.append(Post.campaign_id.in_(select(Campaign.id).where(and_(*campaign_scope))))
+    return conditions
+
+
+def _purchase_request_scope(user: User) -> List[Any]:
+    """구매요청 목록 API와 같은 역할별 조회 범위 (CLIENT는 접근 불가)"""
+    role = _role_value(user)
+    if role == UserRole.SUPER_ADMIN.value:
+        return []
+    if role == UserRole.AGENCY_ADMIN.value:
+        return [PurchaseRequest.company == user.company]
+    if role == UserRole.TEAM_LEADER.value:
+        team_members = select(User.id).where(User.company == user.company, User.team_leader_id == user.id)
+        return [
+            PurchaseRequest.company == user.company,
+            or_(PurchaseRequest.requester_id == user.id, PurchaseRequest.requester_id.in_(team_members)),
+        ]
+    if role == UserRole.STAFF.value:
+        return [PurchaseRequest.requester_id == user.id]
+    return [false()]
+
+
+def _product_scope(user: User) -> List[Any]:
+    """상품 목록 API와 같은 범위 (자기 회사 상품 + 회사 미지정 공용 상품)"""
+    return [
+        Product.is_active == True,
+        or_(Product.company == (user.company or 'default_company'), Product.company.is_(None)),
+    ]
+
+
+def _board_post_scope(user: User) -> List[Any]:
+    """게시판 목록 API와 같은 범위 (같은 회사 게시글만, 회사가 없으면 빈 결과)"""
+    if not user.company:
+        return [false()]
+    return [BoardPost.is_deleted == False, BoardPost.company == user.company]
+
+
+# 빠른 검색 대상 정의: 모델, 검색 컬럼, 응답 컬럼, 사용자별 조회 범위 조건
+QUICK_SEARCH_SOURCES = {
+    "campaigns": {
+        "model": Campaign,
+        "search_columns": ("name", "description", "client_company"),
+        "result_columns": ("id", "name", "client_company", "status", "budget"),
+        "conditions": _campaign_scope,
+    },
+    "posts": {
+        "model": Post,
+        "search_columns": ("title", "product_name", "published_url"),
+        "result_columns": ("id", "title", "work_type", "topic_status", "campaign_id"),
+        "conditions": _post_scope,
+    },
+    "purchase_requests": {
+        "model": PurchaseRequest,
+        "search_columns": ("title", "description", "resource_type"),
+        "result_columns": ("id", "title", "resource_type", "status", "amount"),
+        "conditions": _purchase_request_scope,
+    },
+    "products": {
+        "model": Product,
+        "search_columns": ("name", "description", "category", "sku"),
+        "result_columns": ("id", "name", "category", "price", "company"),
+        "conditions": _product_scope,
+    },
+    "board_posts": {
+        "model": BoardPost,
+        "search_columns": ("title", "content"),
+        "result_columns": ("id", "title", "post_type", "is_notice", "created_at"),
+        "conditions": _board_post_scope,
+    },
+}
+
 class SortOrder(str, Enum):
     """정렬 순서"""
     ASC = "asc"
@@ -403,6 +520,111 @@ class SearchService:
             logger.error(f"Get search suggestions failed: {e}")
             return []
     
+    def build_quick_search_query(self, source: str, query_text: str, limit: int, user: User):
+        """
+        빠른 검색용 단일 쿼리 생성
+
+        전체 개수는 별도 count 서브쿼리 대신 윈도우 함수(COUNT(*) OVER ())로
+        같은 쿼리에서 함께 조회하고, 응답에 필요한 컬럼만 선택합니다.
+        각 소스의 목록 API와 같은 회사/역할 조건을 적용합니다.
+        """
+        spec = QUICK_SEARCH_SOURCES[source]
+        model = spec["model"]
+        pattern = f"%{query_text}%"
+
+        columns = [getattr(model, name) for name in spec["result_columns"]]
+        query = select(*columns, func.count().over().label("total_count"))
+        query = query.where(
+            or_(*[getattr(model, name).ilike(pattern) for name in spec["search_columns"]])
+        )
+        conditions = spec["conditions"](user)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        return query.order_by(desc(model.created_at)).limit(limit)
+
+    async def _run_quick_search_source(
+        self,
+        source: str,
+        query_text: str,
+        limit: int,
+        timeout: float,
+        user: User
+    ) -> Dict[str, Any]:
+        """소스 하나를 별도 풀 세션에서 제한 시간 내에 검색"""
+        from app.db.database import AsyncSessionLocal
+
+        spec = QUICK_SEARCH_SOURCES[source]
+        started = time.perf_counter()
+        result: Dict[str, Any] = {"data": [], "total": 0, "type": source, "timed_out": False}
+
+        async def execute():
+            async with AsyncSessionLocal() as session:
+                rows = (await session.execute(
+                    self.build_quick_search_query(source, query_text, limit, user)
+                )).all()
+                return rows
+
+        try:
+            rows = await asyncio.wait_for(execute(), timeout=timeout)
+            result["data"] = [
+                {name: getattr(row, name) for name in spec["result_columns"]}
+                for row in rows
+            ]
+            result["total"] = rows[0].total_count if rows else 0
+        except asyncio.TimeoutError:
+            logger.warning(f"Quick search source '{source}' timed out after {timeout}s")
+            result["timed_out"] = True
+        except Exception as e:
+            logger.error(f"Quick search source '{source}' failed: {e}")
+            result["error"] = str(e)
+
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    async def quick_search(
+        self,
+        query_text: str,
+        sources: List[str],
+        user: User,
+        limit: int = 5,
+        timeout: float = QUICK_SEARCH_SOURCE_TIMEOUT
+    ) -> Dict[str, Any]:
+        """
+        여러 엔티티 동시 빠른 검색
+
+        소스마다 커넥션 풀에서 별도 세션을 받아 병렬로 실행하므로 전체 소요 시간은
+        가장 느린 소스 하나에 수렴합니다. 제한 시간을 넘긴 소스는 빈 결과와
+        timed_out 플래그로 반환되고 나머지 결과는 그대로 응답됩니다.
+
+        Args:
+            query_text: 검색어
+            sources: 검색 대상 (QUICK_SEARCH_SOURCES 키)
+            user: 검색하는 사용자 (소스별 회사/역할 조회 범위 적용)
+            limit: 소스별 최대 결과 수
+            timeout: 소스별 제한 시간 (초)
+
+        Returns:
+            소스별 결과, 전체 결과 수, 측정된 소요 시간
+        """
+        started = time.perf_counter()
+        sources = [source for source in sources if source in QUICK_SEARCH_SOURCES]
+
+        source_results = await asyncio.gather(*[
+            self._run_quick_search_source(source, query_text, limit, timeout, user)
+            for source in sources
+        ])
+        results = dict(zip(sources, source_results))
+
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        return {
+            "results": results,
+            "total_results": sum(result["total"] for result in source_results),
+            "partial": any(result["timed_out"] or "error" in result for result in source_results),
+            "search_time_ms": elapsed_ms,
+            "source_timings_ms": {source: result["elapsed_ms"] for source, result in results.items()},
+        }
+
     def get_searchable_fields(self, model_type: str) -> Dict[str, Any]:
         """검색 가능 필드 목록 반환"""
         if model_type == "campaigns":
@@ -0,0 +1,196 @@
+"""
+Soft-delete purge for BrandFlow API
+- 소프트 삭제된 포스트(is_active=false)/게시글(is_deleted)/발주요청(is_active=false)을 보존 기간이 지나면 영구 삭제
+- 배치마다 별도 트랜잭션: PostgreSQL은 DELETE ... WHERE ctid IN (SELECT ctid ... LIMIT n)로 잠금 시간과 WAL 폭증을 제한
+- 자식 행(발주요청/텔레그램 로그/환불 기록/첨부파일)은 ON DELETE CASCADE로 DB가 함께 삭제
+  (PostgreSQL에서 posts를 참조하는 외래키 중 CASCADE가 아닌 것이 남아 있으면 posts 정리는 건너뜀)
+- 기본 비활성(SOFT_DELETE_PURGE_INTERVAL_SECONDS=0): CASCADE 외래키 적용 확인 후 켜는 opt-in
+- 여러 워커 중 advisory lock을 잡은 하나만 실행, 실행별 테이블별 삭제 건수는 last_result / 누적은 totals
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, delete, func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_lock 키 (임의의 고정 64비트 값, 마이그레이션 잠금과 다른 값)
+PURGE_LOCK_ID = 7_236_041_835_201_552
+
+PURGE_TABLES = ("order_requests", "board_posts", "posts")
+
+# posts를 참조하면서 ON DELETE CASCADE가 아닌 외래키 수 (0이어야 포스트 영구 삭제 가능)
+NON_CASCADE_POST_FKEYS_SQL = text(
+    "SELECT count(*) FROM pg_constraint "
+    "WHERE contype = 'f' AND confrelid = 'posts'::regclass AND confdeltype <> 'c'"
+)
+
+
+def _purge_targets(cutoff: datetime) -> List[Tuple[str, Any, Any]]:
+    """(이름, 모델, 삭제 조건) - 보존 기간(cutoff) 이전에 소프트 삭제된 행"""
+    from app.models.board import BoardPost
+    from app.models.order_request import OrderRequest
+    from app.models.post import Post
+
+    return [
+        ("order_requests", OrderRequest, and_(OrderRequest.is_active == False, OrderRequest.updated_at < cutoff)),
+        ("board_posts", BoardPost, and_(
+            BoardPost.is_deleted == True,
+            func.coalesce(BoardPost.deleted_at, BoardPost.updated_at) < cutoff,
+        )),
+        ("posts", Post, and_(Post.is_active == False, Post.updated_at < cutoff)),
+    ]
+
+
+async def purge_batch(db: AsyncSession, model: Any, condition: Any, batch_size: int) -> int:
+    """조건에 맞는 행을 최대 batch_size개 삭제 (호출자가 커밋)"""
+    table = model.__table__
+    if db.bind.dialect.name == "postgresql":
+        # 인덱스로 찾은 행을 물리 위치(ctid)로 바로 삭제
+        ctid = literal_column("ctid")
+        batch = select(ctid).select_from(table).where(condition).limit(batch_size)
+        statement = delete(table).where(ctid.in_(batch))
+    else:
+        batch = select(table.c.id).where(condition).limit(batch_size)
+        statement = delete(table).where(table.c.id.in_(batch))
+    result = await db.execute(statement)
+    return result.rowcount or 0
+
+
+class SoftDeletePurger:
+    """소프트 삭제 행 주기 정리 (interval 0이면 비활성)"""
+
+    def __init__(
+        self,
+        interval: float = 0.0,
+        retention_days: int = 30,
+        batch_size: int = 5000,
+        max_batches: int = 200,
+        pause: float = 0.2,
+    ):
+        self.interval = interval
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.pause = pause
+        self.totals: Dict[str, int] = {name: 0 for name in PURGE_TABLES}
+        self.runs = 0
+        self.last_result: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.interval <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.warning("Soft-delete purge failed: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "interval_seconds": self.interval,
+            "retention_days": self.retention_days,
+            "batch_size": self.batch_size,
+            "runs": self.runs,
+            "totals": dict(self.totals),
+            "last_result": self.last_result,
+        }
+
+    async def run_once(
+        self,
+        tables: Sequence[str] = PURGE_TABLES,
+        retention_days: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """테이블별로 배치 삭제를 반복 (배치가 batch_size보다 작으면 해당 테이블 종료)"""
+        from app.db.database import AsyncSessionLocal, async_engine
+
+        retention = self.retention_days if retention_days is None else retention_days
+        cutoff = datetime.utcnow() - timedelta(days=retention)
+        result: Dict[str, Any] = {"started_at": datetime.utcnow().isoformat(), "retention_days": retention, "tables": {}}
+
+        async with async_engine.connect() as lock_conn:
+            is_postgres = lock_conn.dialect.name == "postgresql"
+            if is_postgres:
+                locked = (await lock_conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": PURGE_LOCK_ID}
+                )).scalar()
+                await lock_conn.commit()
+                if not locked:
+                    result["skipped"] = "다른 인스턴스에서 정리 중"
+                    return result
+            try:
+                for name, model, condition in _purge_targets(cutoff):
+                    if name not in tables:
+                        continue
+                    if name == "posts" and is_postgres:
+                        non_cascade = (await lock_conn.execute(NON_CASCADE_POST_FKEYS_SQL)).scalar()
+                        await lock_conn.commit()
+                        if non_cascade:
+                            # CASCADE 마이그레이션 전 스키마: 발주요청/환불 기록이 남아 있으면 외래키 위반
+                            result["tables"][name] = {"skipped": f"CASCADE가 아닌 외래키 {non_cascade}개"}
+                            logger.warning("Soft-delete purge skipped posts: %s non-cascade foreign keys", non_cascade)
+                            continue
+                    started = time.perf_counter()
+                    purged = batches = 0
+                    while batches < self.max_batches:
+                        async with AsyncSessionLocal() as db:
+                            count = await purge_batch(db, model, condition, self.batch_size)
+                            await db.commit()
+                        batches += 1
+                        purged += count
+                        if count < self.batch_size:
+                            break
+                        await asyncio.sleep(self.pause)
+                    self.totals[name] += purged
+                    result["tables"][name] = {
+                        "purged": purged,
+                        "batches": batches,
+                        "seconds": round(time.perf_counter() - started, 3),
+                    }
+            finally:
+                if is_postgres:
+                    await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": PURGE_LOCK_ID})
+                    await lock_conn.commit()
+
+        # 삭제된 포스트의 환불 기록이 CASCADE로 함께 지워지므로 캠페인 환불 건수 집계 보정
+        if result["tables"].get("posts", {}).get("purged"):
+            from app.services.campaign_aggregates import campaign_aggregate_reconciler
+            await campaign_aggregate_reconciler.run_once(fix=settings.CAMPAIGN_AGGREGATE_AUTO_FIX)
+
+        self.runs += 1
+        self.last_result = result
+        purged_total = sum(table.get("purged", 0) for table in result["tables"].values())
+        if purged_total:
+            logger.info("Soft-delete purge removed %s rows: %s", purged_total, result["tables"])
+        return result
+
+
+soft_delete_purger = SoftDeletePurger(
+    interval=settings.SOFT_DELETE_PURGE_INTERVAL_SECONDS,
+    retention_days=settings.SOFT_DELETE_RETENTION_DAYS,
+    batch_size=settings.SOFT_DELETE_PURGE_BATCH_SIZE,
+    max_batches=settings.SOFT_DELETE_PURGE_MAX_BATCHES,
+    pause=settings.SOFT_DELETE_PURGE_PAUSE_SECONDS,
+)
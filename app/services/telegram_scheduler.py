@@ -84,13 +84,16 @@ class TelegramScheduler:
                     post, campaign, days_left = post_info
 
                     # 이미 알림을 보낸 적이 있는지 확인
+                    # created_at을 범위 조건으로 비교해야 (user_id, post_id, created_at) 인덱스를 사용
+                    today_start = datetime.combine(datetime.utcnow().date(), time.min)
                     existing_log = db.query(TelegramNotificationLog).filter(
                         and_(
                             TelegramNotificationLog.user_id == user.id,
                             TelegramNotificationLog.post_id == post.id,
                             TelegramNotificationLog.notification_type == "due_date_reminder",
                             TelegramNotificationLog.is_sent == True,
-                            func.date(TelegramNotificationLog.created_at) == func.date(datetime.utcnow())
+                            TelegramNotificationLog.created_at >= today_start,
+                            TelegramNotificationLog.created_at < today_start + timedelta(days=1)
                         )
                     ).first()
 
@@ -5,7 +5,7 @@ from datetime import datetime
 
 from app.models.user import User, UserRole, UserStatus
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash
+from app.core.security import hash_password_async
 
 
 class UserService:
@@ -56,7 +56,7 @@ class UserService:
 
     async def create_user(self, user_data: UserCreate, creator_id: Optional[int] = None) -> User:
         """새 사용자 생성"""
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
 
         # business_number와 client_business_number 동기화
         business_num = user_data.business_number or user_data.client_business_number
@@ -105,7 +105,7 @@ class UserService:
         # 비밀번호 처리
         if "password" in update_data:
             if update_data["password"]:  # 빈 문자열이 아닌 경우만
-                update_data["hashed_password"] = get_password_hash(update_data["password"])
+                update_data["hashed_password"] = await hash_password_async(update_data["password"])
             del update_data["password"]
 
         # business_number와 client_business_number 동기화
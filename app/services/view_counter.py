@@ -0,0 +1,136 @@
+"""
+Board post view counter for BrandFlow API
+- 조회마다 UPDATE/커밋하지 않고 워커 메모리에 증가분을 모아 주기적으로 한 번에 반영
+- 반영: UPDATE board_posts SET view_count = view_count + v.delta FROM (VALUES ...) v WHERE id = v.id
+- 반영 전까지 DB 조회수는 근사값 (응답에는 이 워커의 미반영 증가분을 더해 표시)
+- 반영 실패/취소 시 증가분을 되돌려 다음 주기에 재시도, 종료 시 루프를 취소하지 않고 멈춘 뒤 남은 증가분 반영
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from sqlalchemy import Integer, case, column, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def apply_view_counts(db: AsyncSession, counts: Dict[int, int]) -> int:
+    """게시글별 증가분을 UPDATE 한 번으로 반영 (호출자가 커밋), 갱신된 행 수 반환"""
+    from app.models.board import BoardPost
+
+    if not counts:
+        return 0
+    statement = update(BoardPost).execution_options(synchronize_session=False)
+    if db.bind.dialect.name == "postgresql":
+        deltas = values(
+            column("id", Integer), column("delta", Integer), name="view_deltas"
+        ).data(list(counts.items()))
+        statement = statement.where(BoardPost.id == deltas.c.id)
+        delta = deltas.c.delta
+    else:
+        # VALUES 별칭 컬럼을 지원하지 않는 DB (SQLite 개발 환경)
+        statement = statement.where(BoardPost.id.in_(list(counts)))
+        delta = case(counts, value=BoardPost.id, else_=0)
+    # updated_at의 onupdate가 조회수 반영으로 바뀌지 않도록 기존 값 유지
+    result = await db.execute(
+        statement.values(view_count=BoardPost.view_count + delta, updated_at=BoardPost.updated_at)
+    )
+    return result.rowcount or 0
+
+
+class ViewCounter:
+    """게시글 조회수 증가분 모아 쓰기 (interval마다 flush)"""
+
+    def __init__(self, interval: float = 10.0, max_pending: int = 1000, shutdown_timeout: float = 10.0):
+        self.interval = interval
+        self.shutdown_timeout = shutdown_timeout
+        # 이 수의 게시글이 쌓이면 주기를 기다리지 않고 반영 (interval 0이면 조회마다 백그라운드에서 반영)
+        self.max_pending = max_pending if interval > 0 else 1
+        self._pending: Dict[int, int] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    def increment(self, post_id: int, amount: int = 1) -> None:
+        self._pending[post_id] = self._pending.get(post_id, 0) + amount
+        if len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+
+    def pending(self, post_id: int) -> int:
+        """아직 반영되지 않은 이 워커의 증가분"""
+        return self._pending.get(post_id, 0)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """
+        루프를 깨워 진행 중인 flush가 끝난 뒤 스스로 종료하게 하고 남은 증가분 반영
+        (shutdown_timeout 안에 끝나지 않으면 취소 - 취소된 flush의 증가분은 되돌려져 아래에서 다시 반영)
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), self.shutdown_timeout)
+            except asyncio.TimeoutError:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error("Board view count flush on shutdown failed (%s posts): %s", len(self._pending), e)
+
+    async def _loop(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval if self.interval > 0 else None)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._stopping:
+                break  # 남은 증가분은 stop()에서 반영
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning("Board view count flush failed: %s", e)
+
+    async def flush(self) -> int:
+        """모인 증가분을 반영하고 비움 (실패하거나 취소되면 증가분을 되돌림)"""
+        from app.db.database import AsyncSessionLocal
+
+        async with self._lock:
+            counts, self._pending = self._pending, {}
+            if not counts:
+                return 0
+            try:
+                async with AsyncSessionLocal() as db:
+                    updated = await apply_view_counts(db, counts)
+                    await db.commit()
+            except BaseException:
+                # CancelledError 포함 - 꺼낸 증가분이 반영되지 않은 채 사라지지 않도록
+                for post_id, amount in counts.items():
+                    self._pending[post_id] = self._pending.get(post_id, 0) + amount
+                raise
+
+        logger.debug("Flushed board view counts: %s posts, %s views", updated, sum(counts.values()))
+        return updated
+
+
+view_counter = ViewCounter(
+    interval=settings.BOARD_VIEW_FLUSH_INTERVAL_SECONDS,
+    max_pending=settings.BOARD_VIEW_FLUSH_MAX_PENDING,
+    shutdown_timeout=settings.BOARD_VIEW_FLUSH_SHUTDOWN_TIMEOUT_SECONDS,
+)
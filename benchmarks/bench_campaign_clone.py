@@ -0,0 +1,168 @@
+"""
+캠페인 복사 벤치마크
+
+포스트 500개짜리 캠페인(계약서 포함)을 복사하는 비용을 비교합니다.
+- before: 원본 포스트/계약서를 ORM으로 읽어 행마다 객체를 만들어 add_all + flush (기존 ORM 복사 방식)
+- after:  app.services.campaign_clone.clone_campaigns (캠페인 INSERT + 포스트/계약서 INSERT ... SELECT)
+- bulk:   월초 일괄 복사 - 캠페인 여러 개를 clone_campaigns 한 번으로 복사
+각 복사는 트랜잭션 하나로 실행 후 롤백해 매 반복이 같은 원본에서 시작합니다.
+
+기본 DB는 메모리 SQLite(aiosqlite 필요)이며, 실제 수치는 빈 PostgreSQL 데이터베이스 URL로 확인하세요.
+(지정한 DB에 테이블을 생성하고 원본 데이터를 넣으므로 운영 DB에는 사용하지 마세요)
+
+실행:
+    python benchmarks/bench_campaign_clone.py [반복 횟수] [포스트 수] [일괄 복사 캠페인 수] [DB URL]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+import app.models  # noqa: E402,F401  (매퍼 관계 해석용)
+import app.models.user_telegram_setting  # noqa: E402,F401
+from app.models.base import Base  # noqa: E402
+from app.models.campaign import Campaign, CampaignStatus  # noqa: E402
+from app.models.campaign_contract import CampaignContract  # noqa: E402
+from app.models.post import Post  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.services.campaign_clone import POST_COPY_COLUMNS, POST_RESET_VALUES, CloneSpec, clone_campaigns  # noqa: E402
+
+START = datetime(2026, 11, 1)
+END = START + timedelta(days=29)
+
+
+async def seed(session_factory, campaign_count, post_count):
+    """원본 캠페인 campaign_count개 (각 포스트 post_count개, 계약서 2개)"""
+    now = datetime(2026, 10, 1)
+    async with session_factory() as db:
+        user = User(name="벤치", email="bench@brandflow.kr", hashed_password="x", role=UserRole.SUPER_ADMIN)
+        db.add(user)
+        await db.flush()
+        campaign_ids = []
+        for c in range(campaign_count):
+            campaign = Campaign(
+                name=f"월간 캠페인 {c}", client_company="예시상사", budget=5_000_000.0, start_date=now,
+                end_date=now + timedelta(days=30), status=CampaignStatus.ACTIVE, creator_id=user.id, staff_id=user.id,
+            )
+            db.add(campaign)
+            await db.flush()
+            campaign_ids.append(campaign.id)
+            db.add_all([
+                Post(
+                    title=f"포스트 {p} - 월간 블로그 리뷰", work_type="블로그", topic_status="주제 승인",
+                    outline="세부 개요 " * 20, outline_status="승인", published_url="https://blog.example.com/post",
+                    order_request_status="발주 완료", product_name="블로그 포스팅", quantity=1, cost=50_000.0,
+                    budget=250_000.0, invoice_issued=True, payment_completed=True, campaign_id=campaign.id,
+                )
+                for p in range(post_count)
+            ])
+            db.add_all([
+                CampaignContract(campaign_id=campaign.id, file_url="https://cdn.example.com/contract.pdf",
+                                 file_name=f"계약서{i}.pdf", file_size=204800)
+                for i in range(2)
+            ])
+        await db.commit()
+        return user.id, campaign_ids
+
+
+async def clone_orm(db, source, creator_id):
+    """기존 방식: 원본 행을 ORM 객체로 읽고 새 객체를 만들어 flush"""
+    new_campaign = Campaign(
+        name=source.name, description=source.description, budget=source.budget, start_date=START, end_date=END,
+        company=source.company, client_company=source.client_company, status=CampaignStatus.ACTIVE,
+        creator_id=creator_id, staff_id=creator_id, client_user_id=source.client_user_id,
+    )
+    db.add(new_campaign)
+    await db.flush()
+
+    posts = (await db.execute(
+        select(Post).where(Post.campaign_id == source.id, Post.is_active == True)
+    )).scalars().all()
+    db.add_all([
+        Post(
+            **{name: getattr(post, name) for name in POST_COPY_COLUMNS},
+            **POST_RESET_VALUES,
+            campaign_id=new_campaign.id,
+        )
+        for post in posts
+    ])
+    contracts = (await db.execute(
+        select(CampaignContract).where(CampaignContract.campaign_id == source.id, CampaignContract.is_active == True)
+    )).scalars().all()
+    db.add_all([
+        CampaignContract(campaign_id=new_campaign.id, file_url=contract.file_url, file_name=contract.file_name,
+                         file_size=contract.file_size)
+        for contract in contracts
+    ])
+    new_campaign.budget = sum(post.budget or 0.0 for post in posts) or new_campaign.budget
+    await db.flush()
+
+
+async def run_before(session_factory, creator_id, campaign_ids):
+    async with session_factory() as db:
+        sources = (await db.execute(select(Campaign).where(Campaign.id.in_(campaign_ids)))).scalars().all()
+        for source in sources:
+            await clone_orm(db, source, creator_id)
+        await db.rollback()
+
+
+async def run_after(session_factory, creator_id, campaign_ids):
+    async with session_factory() as db:
+        sources = (await db.execute(select(Campaign).where(Campaign.id.in_(campaign_ids)))).scalars().all()
+        specs = [
+            CloneSpec(source=source, name=source.name, start_date=START, end_date=END, budget=None, staff_id=None)
+            for source in sources
+        ]
+        await clone_campaigns(db, specs, creator_id, include_posts=True, include_contracts=True)
+        await db.rollback()
+
+
+async def measure(fn, runs, *args):
+    await fn(*args)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(runs):
+        await fn(*args)
+    return (time.perf_counter() - start) / runs * 1000
+
+
+async def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    post_count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    bulk_count = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    database_url = sys.argv[4] if len(sys.argv) > 4 else "sqlite+aiosqlite://"
+
+    try:
+        engine = create_async_engine(database_url)
+    except ImportError as e:
+        print(f"[SKIP] DB 드라이버가 없습니다 ({e}). aiosqlite를 설치하거나 PostgreSQL URL을 지정하세요.")
+        sys.exit(0)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    creator_id, campaign_ids = await seed(session_factory, bulk_count, post_count)
+    single = campaign_ids[:1]
+
+    before_ms = await measure(run_before, runs, session_factory, creator_id, single)
+    after_ms = await measure(run_after, runs, session_factory, creator_id, single)
+    bulk_before_ms = await measure(run_before, max(1, runs // 5), session_factory, creator_id, campaign_ids)
+    bulk_after_ms = await measure(run_after, max(1, runs // 5), session_factory, creator_id, campaign_ids)
+    await engine.dispose()
+
+    print(f"db={engine.url.get_backend_name()}, posts/campaign={post_count}, runs={runs}")
+    print(f"single campaign  before (ORM 객체 복사):    {before_ms:9.2f} ms")
+    print(f"single campaign  after  (INSERT ... SELECT): {after_ms:9.2f} ms  ({before_ms / after_ms:.1f}x)")
+    print(f"{bulk_count} campaigns     before (ORM 객체 복사):    {bulk_before_ms:9.2f} ms")
+    print(f"{bulk_count} campaigns     after  (clone_campaigns 1회): {bulk_after_ms:9.2f} ms  "
+          f"({bulk_before_ms / bulk_after_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,230 @@
+"""
+캠페인 목록 응답 직렬화 벤치마크
+
+GET /api/campaigns 한 페이지(캠페인 100개 x 포스트 20개)를 JSON bytes로 만드는 비용을 비교합니다.
+- before: 행마다 dict 직접 구성(.isoformat()/getattr/hasattr) + jsonable_encoder + json.dumps (기본 JSONResponse)
+- after:  미리 생성한 serialize_campaign_list_item + FastJSONResponse (orjson, jsonable_encoder 생략)
+- summary: fields/include 미지정 시 기본 요약 응답 (포스트/계약서/클라이언트 정보 제외)
+두 경로의 결과가 같은 JSON인지도 확인합니다. 메모리는 tracemalloc 기준 페이지당 최대 할당량.
+
+실행:
+    python benchmarks/bench_campaign_serialization.py [반복 횟수] [캠페인 수] [캠페인당 포스트 수]
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+import app.models  # noqa: E402,F401  (매퍼 관계 해석용)
+import app.models.campaign_contract  # noqa: E402,F401
+import app.models.user_telegram_setting  # noqa: E402,F401
+from app.core.serialization import ORJSON_AVAILABLE, FastJSONResponse  # noqa: E402
+from app.models.campaign import Campaign, CampaignStatus  # noqa: E402
+from app.models.campaign_contract import CampaignContract  # noqa: E402
+from app.models.post import Post  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.schemas.serializers import campaign_list_view, serialize_campaign_list_item  # noqa: E402
+
+
+def build_page(campaign_count, post_count):
+    """DB 없이 ORM 인스턴스로 한 페이지 구성 (실제 응답과 같은 속성 접근 비용)"""
+    now = datetime(2026, 10, 18, 9, 30, 15, 123456)
+    creator = User(id=1, name="김대표", email="ceo@brandflow.kr", role=UserRole.AGENCY_ADMIN, company="브랜드플로우")
+    staff = User(id=2, name="이직원", email="staff@brandflow.kr", role=UserRole.STAFF, company="브랜드플로우")
+    client = User(
+        id=3, name="박클라이언트", email="client@example.com", role=UserRole.CLIENT, company="브랜드플로우",
+        contact="010-1234-5678", client_company_name="예시상사", client_business_number="123-45-67890",
+        client_ceo_name="박대표", client_company_address="서울시 강남구", client_business_type="서비스",
+        client_business_item="광고",
+    )
+    campaigns = []
+    for c in range(campaign_count):
+        campaign = Campaign(
+            id=c + 1, name=f"캠페인 {c}", description="가을 시즌 블로그 마케팅", client_company="예시상사",
+            budget=5_000_000.0, start_date=now, end_date=now + timedelta(days=30), status=CampaignStatus.ACTIVE,
+            creator_id=1, staff_id=2, client_user_id=3, created_at=now, updated_at=now,
+            cancelled_at=None, cancellation_reason=None, refund_amount=Decimal("0"), is_refunded=False,
+        )
+        campaign.creator = creator
+        campaign.staff_user = staff
+        campaign.client_user = client
+        campaign.posts = [
+            Post(
+                id=c * post_count + p + 1, title=f"포스트 {p} - 가을 신상품 리뷰", work_type="블로그",
+                topic_status="주제 승인", outline="세부 개요 " * 10, outline_status="승인", reject_reason=None,
+                images=["https://cdn.example.com/a.png"], published_url="https://blog.example.com/post",
+                order_request_status="발주 완료", order_request_id=p, start_date="2026-10-01",
+                due_date="2026-10-20", product_id=7, product_name="블로그 포스팅", quantity=1,
+                budget=250_000.0, invoice_issued=False, payment_completed=None, invoice_due_date=now,
+                payment_due_date=None, is_active=p % 10 != 0, created_at=now, updated_at=now,
+            )
+            for p in range(post_count)
+        ]
+        campaign.active_post_count = sum(1 for post in campaign.posts if post.is_active)
+        campaign.contracts = [
+            CampaignContract(id=c + 1, file_url="https://cdn.example.com/contract.pdf", file_name="계약서.pdf",
+                             file_size=204800, uploaded_at=now, is_active=True)
+        ]
+        campaigns.append(campaign)
+    return campaigns
+
+
+def serialize_before(campaign):
+    """변경 전 get_campaigns의 행 직렬화"""
+    return {
+        "id": campaign.id,
+        "name": campaign.name,
+        "description": campaign.description,
+        "status": campaign.status.value if campaign.status else None,
+        "client_company": campaign.client_company,
+        "budget": campaign.budget,
+        "start_date": campaign.start_date.isoformat() if campaign.start_date else None,
+        "end_date": campaign.end_date.isoformat() if campaign.end_date else None,
+        "invoiceIssued": getattr(campaign, 'invoice_issued', False) if hasattr(campaign, 'invoice_issued') else False,
+        "paymentCompleted": getattr(campaign, 'payment_completed', False) if hasattr(campaign, 'payment_completed') else False,
+        "creator_id": campaign.creator_id,
+        "staff_id": campaign.staff_id,
+        "created_at": campaign.created_at.isoformat() if campaign.created_at else None,
+        "updated_at": campaign.updated_at.isoformat() if campaign.updated_at else None,
+        "User": {
+            "id": campaign.creator.id,
+            "name": campaign.creator.name,
+            "role": campaign.creator.role.value,
+            "company": campaign.creator.company
+        } if campaign.creator else None,
+        "staff_user": {
+            "id": campaign.staff_user.id,
+            "name": campaign.staff_user.name,
+            "role": campaign.staff_user.role.value,
+            "company": campaign.staff_user.company
+        } if campaign.staff_user else None,
+        "client_user": {
+            "id": campaign.client_user.id,
+            "name": campaign.client_user.name,
+            "email": campaign.client_user.email,
+            "company": campaign.client_user.company,
+            "business_number": getattr(campaign.client_user, 'business_number', None),
+            "contact": campaign.client_user.contact,
+            "client_company_name": getattr(campaign.client_user, 'client_company_name', None),
+            "client_business_number": getattr(campaign.client_user, 'client_business_number', None),
+            "client_ceo_name": getattr(campaign.client_user, 'client_ceo_name', None),
+            "client_company_address": getattr(campaign.client_user, 'client_company_address', None),
+            "client_business_type": getattr(campaign.client_user, 'client_business_type', None),
+            "client_business_item": getattr(campaign.client_user, 'client_business_item', None)
+        } if campaign.client_user else None,
+        "posts": [
+            {
+                "id": post.id,
+                "title": post.title,
+                "work_type": post.work_type,
+                "workType": post.work_type,
+                "topicStatus": post.topic_status,
+                "outline": post.outline,
+                "outlineStatus": post.outline_status,
+                "rejectReason": post.reject_reason,
+                "images": post.images or [],
+                "published_url": post.published_url,
+                "publishedUrl": post.published_url,
+                "orderRequestStatus": post.order_request_status,
+                "orderRequestId": post.order_request_id,
+                "startDate": post.start_date,
+                "dueDate": post.due_date,
+                "productId": post.product_id,
+                "product_name": post.product_name,
+                "productName": post.product_name,
+                "quantity": post.quantity,
+                "budget": post.budget or 0.0,
+                "invoiceIssued": post.invoice_issued or False,
+                "paymentCompleted": post.payment_completed or False,
+                "invoiceDueDate": post.invoice_due_date.isoformat() if post.invoice_due_date else None,
+                "paymentDueDate": post.payment_due_date.isoformat() if post.payment_due_date else None,
+                "is_active": post.is_active,
+                "createdAt": post.created_at.isoformat() if post.created_at else None,
+                "updatedAt": post.updated_at.isoformat() if post.updated_at else None
+            } for post in (campaign.posts or []) if post.is_active
+        ],
+        "contracts": [
+            {
+                "id": contract.id,
+                "file_url": contract.file_url,
+                "file_name": contract.file_name,
+                "file_size": contract.file_size,
+                "uploaded_at": contract.uploaded_at.isoformat() if contract.uploaded_at else None
+            } for contract in (campaign.contracts or []) if contract.is_active
+        ],
+        "cancelled_at": campaign.cancelled_at.isoformat() if getattr(campaign, 'cancelled_at', None) else None,
+        "cancellation_reason": getattr(campaign, 'cancellation_reason', None),
+        "refund_amount": float(campaign.refund_amount) if getattr(campaign, 'refund_amount', None) else 0,
+        "is_refunded": getattr(campaign, 'is_refunded', False)
+    }
+
+
+def encode_before(campaigns):
+    content = {"data": [serialize_before(campaign) for campaign in campaigns], "pagination": {"page": 1}}
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def encode_after(campaigns):
+    content = {"data": [serialize_campaign_list_item(campaign) for campaign in campaigns], "pagination": {"page": 1}}
+    return FastJSONResponse(content).body
+
+
+def encode_summary(campaigns):
+    """기본 목록 응답 (fields/include 미지정 - 요약 필드 + 비정규화 포스트 집계)"""
+    serializer = campaign_list_view().serializer
+    data = [serializer(campaign) for campaign in campaigns]
+    return FastJSONResponse({"data": data, "pagination": {"page": 1}}).body
+
+
+def measure(fn, campaigns, runs):
+    fn(campaigns)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn(campaigns)
+    elapsed_ms = (time.perf_counter() - start) / runs * 1000
+
+    tracemalloc.start()
+    fn(campaigns)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    campaign_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    post_count = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    campaigns = build_page(campaign_count, post_count)
+
+    before_body = encode_before(campaigns)
+    after_body = encode_after(campaigns)
+    if json.loads(before_body) != json.loads(after_body):
+        print("[FAIL] before/after 응답 JSON이 다릅니다")
+        sys.exit(1)
+
+    before_ms, before_peak = measure(encode_before, campaigns, runs)
+    after_ms, after_peak = measure(encode_after, campaigns, runs)
+    summary_ms, summary_peak = measure(encode_summary, campaigns, runs)
+    summary_body = encode_summary(campaigns)
+
+    print(f"campaigns={campaign_count}, posts/campaign={post_count}, runs={runs}, "
+          f"orjson={'yes' if ORJSON_AVAILABLE else 'no (json fallback)'}")
+    print(f"body size: {len(before_body) / 1024:.1f} KB (before), {len(after_body) / 1024:.1f} KB (after)")
+    print(f"before (dict + jsonable_encoder + json): {before_ms:8.2f} ms/page, peak {before_peak / 1024:8.1f} KB")
+    print(f"after  (compiled + FastJSONResponse):   {after_ms:8.2f} ms/page, peak {after_peak / 1024:8.1f} KB")
+    print(f"speedup: {before_ms / after_ms:.1f}x, memory: {before_peak / after_peak:.1f}x less")
+    print(f"summary (기본 fields/include):          {summary_ms:8.2f} ms/page, peak {summary_peak / 1024:8.1f} KB, "
+          f"body {len(summary_body) / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
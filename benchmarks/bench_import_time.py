@@ -0,0 +1,111 @@
+"""
+워커 부팅(import app.main) 시간 회귀 벤치마크
+
+uvicorn/gunicorn 워커가 새로 뜰 때마다 치르는 모듈 import 비용을 측정합니다.
+- 매 회 새 인터프리터에서 python -X importtime -c "import app.main" 실행, 최소값 기준으로 보고
+- pandas / reportlab / openpyxl / PIL / numpy / psutil 같은 무거운 라이브러리가 부팅 경로에서
+  로드되지 않는지 확인 (내보내기/이미지 처리/메트릭 조회 시점에만 import되어야 함)
+- 패키지별 import 시간 상위 항목을 출력해 회귀 원인을 바로 찾을 수 있게 함
+
+실행:
+    python benchmarks/bench_import_time.py [반복 횟수] [예산(초)]
+예산을 넘거나 무거운 라이브러리가 로드되면 종료 코드 1 (CI 회귀 검사용)
+
+기본 예산 1.0초: 엔드포인트 라우터는 지연 등록(app/core/lazy_routers.py)이라 부팅 경로에는
+sqlalchemy/fastapi/pydantic 자체 import와 모델 정의만 남음. 측정치 최소 0.7초 안팎
+(LAZY_ROUTERS=false로 전체 라우터를 부팅 시 등록하면 1.3~1.5초)
+"""
+
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 부팅 경로에서 로드되면 안 되는 무거운 라이브러리 (최상위 패키지 이름)
+HEAVY_MODULES = ("pandas", "reportlab", "openpyxl", "PIL", "numpy", "psutil")
+
+PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import app.main\n"
+    "elapsed = time.perf_counter() - start\n"
+    f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+    "print('RESULT', elapsed, ','.join(heavy))\n"
+)
+
+
+def run_once():
+    """새 인터프리터에서 import app.main 1회 - (경과 초, 로드된 무거운 모듈, importtime 로그)"""
+    env = dict(os.environ)
+    # 벤치마크 중 외부 연결/로그 출력 최소화
+    env.setdefault("LOG_LEVEL", "WARNING")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import app.main 실패:\n{proc.stderr[-2000:]}")
+
+    result_line = next(line for line in proc.stdout.splitlines() if line.startswith("RESULT "))
+    fields = result_line.split(" ")
+    heavy = fields[2].split(",") if len(fields) > 2 and fields[2] else []
+    return float(fields[1]), heavy, proc.stderr
+
+
+def top_modules(importtime_log: str, limit: int = 15):
+    """-X importtime 출력의 self 시간을 최상위 패키지별로 합산 (중복 집계 없이 어디서 시간이 드는지)"""
+    totals = {}
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # 헤더 행
+        # 형식: "import time: <self> | <cumulative> | <들여쓰기><모듈>"
+        self_us = int(parts[0].split(":", 1)[1])
+        root = parts[2].strip().split(".")[0]
+        totals[root] = totals.get(root, 0) + self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+
+    timings = []
+    heavy_loaded = set()
+    best_log = ""
+    for _ in range(runs):
+        elapsed, heavy, log = run_once()
+        if not timings or elapsed < min(timings):
+            best_log = log
+        timings.append(elapsed)
+        heavy_loaded.update(heavy)
+
+    best = min(timings)
+    median = sorted(timings)[len(timings) // 2]
+    print(f"runs={runs}, budget={budget:.2f}s")
+    print(f"import app.main: min {best * 1000:8.1f} ms, median {median * 1000:8.1f} ms")
+
+    print("\n패키지별 import 시간 (self 합계, 최소 실행 기준):")
+    for name, self_us in top_modules(best_log):
+        print(f"  {name:<28} {self_us / 1000:8.1f} ms")
+
+    failed = False
+    if heavy_loaded:
+        failed = True
+        print(f"\n[FAIL] 부팅 경로에서 무거운 라이브러리 로드됨: {', '.join(sorted(heavy_loaded))}")
+    if best > budget:
+        failed = True
+        print(f"\n[FAIL] import 시간이 예산 초과: {best:.2f}s > {budget:.2f}s")
+    if not failed:
+        print("\n[OK] 예산 내 부팅, 무거운 라이브러리 지연 로드 확인")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+로깅 오버헤드 벤치마크
+
+get_campaigns + monthly-stats 한 번의 요청이 남기던 로그 패턴을 재현해 요청당 비용을 비교합니다.
+- before: print(f"...") 5회 + 포스트별 logger.warning(f"...") (동기 StreamHandler)
+- after:  logger.debug("...", args) + QueueHandler/QueueListener 파이프라인 (LOG_LEVEL=INFO)
+
+실행:
+    python benchmarks/bench_logging.py [요청 수] [캠페인당 포스트 수]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import logging as app_logging  # noqa: E402
+
+
+class FakeUser:
+    id = 42
+    name = "홍길동"
+    company = "브랜드플로우"
+    role = "AGENCY_ADMIN"
+
+    def __repr__(self):
+        return f"<User(id={self.id}, name={self.name}, role={self.role})>"
+
+
+class FakePost:
+    def __init__(self, post_id):
+        self.id = post_id
+        self.start_date = "2026-10-01"
+        self.budget = 150000.0
+
+
+def request_before(logger, user, posts):
+    print(f"[CAMPAIGNS-LIST] JWT User: {user.name}, Role: {user.role}, Company: {user.company}")
+    print(f"[CAMPAIGNS-LIST] Pagination - page={1}, size={10}, offset={0}")
+    print(f"[CAMPAIGNS-LIST] 월별 필터링 없음 - 전체 기간 조회")
+    print(f"[CAMPAIGNS-LIST-JWT] Found {len(posts)} campaigns (page 1/1, total: {len(posts)})")
+    logger.warning(f"[MONTHLY-STATS] Getting monthly stats for user={user!r}")
+    for post in posts:
+        logger.warning(f"[POST-FILTER] Post {post.id} using start_date: {post.start_date}, budget={post.budget}")
+    print(f"[MONTHLY-STATS] Stats calculated: {dict(total=len(posts))}")
+
+
+def request_after(logger, user, posts):
+    logger.debug("[CAMPAIGNS-LIST] JWT User: %s, Role: %s, Company: %s", user.name, user.role, user.company)
+    logger.debug("[CAMPAIGNS-LIST] Pagination - page=%s, size=%s, offset=%s", 1, 10, 0)
+    logger.debug("[CAMPAIGNS-LIST] 월별 필터링 없음 - 전체 기간 조회")
+    logger.debug("[CAMPAIGNS-LIST-JWT] Found %s campaigns (page 1/1, total: %s)", len(posts), len(posts))
+    logger.debug("[MONTHLY-STATS] Getting monthly stats for user=%r", user)
+    for post in posts:
+        logger.debug("[POST-FILTER] Post %s using start_date: %s, budget=%s", post.id, post.start_date, post.budget)
+    logger.debug("[MONTHLY-STATS] Stats calculated: %s", {"total": len(posts)})
+
+
+def measure(fn, logger, requests, posts):
+    user = FakeUser()
+    start = time.perf_counter()
+    for _ in range(requests):
+        fn(logger, user, posts)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    post_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    posts = [FakePost(i) for i in range(post_count)]
+
+    # 컨테이너 stdout을 흉내내기 위해 실제 파일에 라인 버퍼링으로 기록
+    with tempfile.TemporaryFile("w", buffering=1, encoding="utf-8") as sink:
+        before_logger = logging.getLogger("bench.before")
+        before_logger.propagate = False
+        before_logger.addHandler(logging.StreamHandler(sink))
+        with redirect_stdout(sink):
+            before_us = measure(request_before, before_logger, requests, posts)
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        os.environ.setdefault("LOG_LEVEL", "INFO")
+        app_logging.setup_application_logging()
+        after_logger = logging.getLogger("bench.after")
+        after_us = measure(request_after, after_logger, requests, posts)
+        app_logging.shutdown_application_logging()
+
+    print(f"requests={requests}, posts/request={post_count}")
+    print(f"before (print + sync warning): {before_us:9.1f} µs/request")
+    print(f"after  (lazy debug + queue):   {after_us:9.1f} µs/request")
+    print(f"speedup: {before_us / after_us:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+로그인 처리량 / 이벤트 루프 지연 벤치마크
+
+동시 로그인 N건을 처리하는 동안 같은 루프에서 도는 다른 요청(10ms 주기 ticker)이 얼마나 밀리는지 비교합니다.
+- before: 핸들러에서 pwd_context.verify 직접 호출 (이벤트 루프 블로킹)
+- after:  verify_password_async (전용 스레드 풀, 코어 수만큼 병렬)
+
+실행:
+    python benchmarks/bench_password_hashing.py [동시 로그인 수]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.password_hasher import password_hasher  # noqa: E402
+from app.core.security import pwd_context, verify_password_async  # noqa: E402
+
+PASSWORD = "Brandflow!2026"
+
+
+async def login_before(hashed):
+    return pwd_context.verify(PASSWORD, hashed)
+
+
+async def login_after(hashed):
+    valid, _ = await verify_password_async(PASSWORD, hashed)
+    return valid
+
+
+async def ticker(stop: asyncio.Event, lags: list):
+    """다른 요청을 흉내내는 10ms 주기 작업 - 예정보다 늦은 시간을 기록"""
+    interval = 0.01
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run(login, hashed, concurrency):
+    stop = asyncio.Event()
+    lags: list = []
+    ticker_task = asyncio.create_task(ticker(stop, lags))
+    await asyncio.sleep(0.02)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login(hashed) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker_task
+    assert all(results)
+    return concurrency / elapsed, max(lags) * 1000 if lags else 0.0
+
+
+async def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    password_hasher.max_pending = max(password_hasher.max_pending, concurrency)
+    hashed = pwd_context.hash(PASSWORD)
+
+    before_tps, before_lag = await run(login_before, hashed, concurrency)
+    after_tps, after_lag = await run(login_after, hashed, concurrency)
+
+    print(f"concurrent logins={concurrency}, workers={password_hasher.workers}, cpu={os.cpu_count()}")
+    print(f"before (verify on event loop): {before_tps:6.1f} logins/s, max loop lag {before_lag:8.1f} ms")
+    print(f"after  (hashing thread pool):  {after_tps:6.1f} logins/s, max loop lag {after_lag:8.1f} ms")
+    password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
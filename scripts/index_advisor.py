@@ -0,0 +1,84 @@
+"""
+인덱스 어드바이저 CLI
+- GET /api/admin/index-advisor와 같은 분석을 DATABASE_URL 데이터베이스에 대해 실행
+- 정확한 비용 추정을 위해 로컬 Postgres에 확장 설치 권장:
+    shared_preload_libraries = 'pg_stat_statements'
+    CREATE EXTENSION pg_stat_statements;
+    CREATE EXTENSION hypopg;
+  pg_stat_statements가 없으면 이 프로세스에서 실행한 쿼리가 없으므로 추천이 비어 있습니다.
+
+실행:
+    python scripts/index_advisor.py [--min-rows N] [--limit N] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from app.db.database import AsyncSessionLocal
+from app.db.index_advisor import IndexAdvisor
+
+
+def print_report(report: dict) -> None:
+    extensions = report["extensions"]
+    print("인덱스 어드바이저 리포트")
+    print("=" * 60)
+    print(f"pg_stat_statements: {'사용' if extensions['pg_stat_statements'] else '없음'}, "
+          f"hypopg: {'사용' if extensions['hypopg'] else '없음 (비용 추정 생략)'}")
+    print(f"분석한 문장 수: {report['analyzed_statements']} ({report['statement_source']})")
+
+    print("\n순차 스캔이 많은 테이블:")
+    for table in report["tables"]:
+        print(f"  - {table['table']}: seq_scan={table['seq_scan']}, idx_scan={table['idx_scan']}, "
+              f"rows={table['live_rows']}")
+
+    print("\n추천 인덱스:")
+    if not report["recommendations"]:
+        print("  (없음)")
+    for rec in report["recommendations"]:
+        print(f"  {rec['ddl']};")
+        print(f"    calls={rec['calls']}, total={rec['total_ms']}ms", end="")
+        if rec["estimated_improvement_pct"] is not None:
+            print(f", cost {rec['cost_before']} -> {rec['cost_after']} "
+                  f"({rec['estimated_improvement_pct']}%), benefit={rec['estimated_benefit']}", end="")
+        print()
+        for statement in rec["statements"][:3]:
+            marker = "app" if statement["seen_in_app"] else "   "
+            print(f"    [{marker}] {statement['query'][:120]}")
+
+    print("\n미사용 인덱스 (app/db/indexes.py):")
+    if not report["unused_indexes"]:
+        print("  (없음)")
+    for index in report["unused_indexes"]:
+        if index["status"] == "missing":
+            print(f"  - {index['index']}: 생성되지 않음")
+        else:
+            print(f"  - {index['index']} on {index['table']}: idx_scan=0, "
+                  f"size={index['size_bytes']}B, table writes={index['table_writes']}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="pg_stat_statements 기반 인덱스 추천")
+    parser.add_argument("--min-rows", type=int, default=1000, help="이 행 수 미만 테이블은 후보에서 제외")
+    parser.add_argument("--limit", type=int, default=50, help="분석할 상위 문장 수")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    advisor = IndexAdvisor(min_table_rows=args.min_rows, statement_limit=args.limit)
+    async with AsyncSessionLocal() as db:
+        report = await advisor.analyze(db)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
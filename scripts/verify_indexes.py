@@ -0,0 +1,130 @@
+"""
+핫 쿼리 인덱스 검증 스크립트
+- 20261018_hot_path_indexes 마이그레이션 적용 후 실행
+- 각 핫 쿼리를 EXPLAIN (FORMAT JSON)으로 확인해 기대한 인덱스를 사용하는지 검사
+- 개발 DB처럼 데이터가 적으면 플래너가 순차 스캔을 고르므로 기본적으로 enable_seqscan = off로
+  '인덱스를 사용할 수 있는지'를 확인합니다 (--allow-seqscan으로 실제 통계 기반 계획 확인)
+
+실행:
+    python scripts/verify_indexes.py [--allow-seqscan]
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import text
+
+from app.db.database import async_engine
+
+
+# (설명, 쿼리, 기대 인덱스) - 애플리케이션의 실제 필터/정렬 조건과 동일하게 유지
+HOT_QUERIES = [
+    (
+        "캠페인별 활성 포스트",
+        "SELECT * FROM posts WHERE campaign_id = 1 AND is_active = true",
+        "ix_posts_campaign_id_is_active",
+    ),
+    (
+        "담당자별 포스트",
+        "SELECT * FROM posts WHERE assigned_user_id = 1",
+        "ix_posts_assigned_user_id",
+    ),
+    (
+        "회사별 활성 발주요청 (최신순)",
+        "SELECT * FROM order_requests WHERE is_active = true AND company = 'brandflow' "
+        "ORDER BY created_at DESC LIMIT 20",
+        "ix_order_requests_company_created_active",
+    ),
+    (
+        "요청자별 발주요청",
+        "SELECT * FROM order_requests WHERE user_id = 1",
+        "ix_order_requests_user_id",
+    ),
+    (
+        "회사별 캠페인 (최신순)",
+        "SELECT * FROM campaigns WHERE company = 'brandflow' ORDER BY created_at DESC LIMIT 20",
+        "ix_campaigns_company_created",
+    ),
+    (
+        "담당 직원별 캠페인",
+        "SELECT * FROM campaigns WHERE staff_id = 1",
+        "ix_campaigns_staff_id",
+    ),
+    (
+        "클라이언트 사용자별 캠페인",
+        "SELECT * FROM campaigns WHERE client_user_id = 1",
+        "ix_campaigns_client_user_id",
+    ),
+    (
+        "게시판 목록 (공지 우선, 최신순)",
+        "SELECT * FROM board_posts WHERE is_deleted = false AND company = 'brandflow' "
+        "ORDER BY is_notice DESC, created_at DESC LIMIT 20",
+        "ix_board_posts_company_notice_created",
+    ),
+    (
+        "텔레그램 당일 중복 알림 확인",
+        "SELECT * FROM telegram_notification_logs WHERE user_id = 1 AND post_id = 1 "
+        "AND notification_type = 'due_date_reminder' AND is_sent = true "
+        "AND created_at >= date_trunc('day', now()) AND created_at < date_trunc('day', now()) + interval '1 day' "
+        "LIMIT 1",
+        "ix_telegram_notification_logs_user_post_created",
+    ),
+    (
+        "포스트 삭제 시 텔레그램 로그 정리",
+        "SELECT id FROM telegram_notification_logs WHERE post_id = 1",
+        "ix_telegram_notification_logs_post_id",
+    ),
+    (
+        "캠페인별 포스트 환불 내역 (최신순)",
+        "SELECT * FROM post_refunds WHERE campaign_id = 1 ORDER BY created_at DESC",
+        "ix_post_refunds_campaign_created",
+    ),
+]
+
+
+def _used_indexes(plan: dict) -> set:
+    """실행 계획 트리에서 사용된 인덱스 이름 수집"""
+    names = set()
+    if "Index Name" in plan:
+        names.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        names |= _used_indexes(child)
+    return names
+
+
+async def verify_indexes(allow_seqscan: bool = False) -> bool:
+    failures = 0
+
+    async with async_engine.connect() as conn:
+        for description, query, expected_index in HOT_QUERIES:
+            # 쿼리마다 트랜잭션을 분리해 SET LOCAL이 다른 검사에 영향을 주지 않도록 함
+            async with conn.begin():
+                if not allow_seqscan:
+                    await conn.execute(text("SET LOCAL enable_seqscan = off"))
+                result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {query}"))
+                raw_plan = result.scalar()
+                # asyncpg는 json 컬럼을 문자열로 반환
+                if isinstance(raw_plan, str):
+                    raw_plan = json.loads(raw_plan)
+                plan = raw_plan[0]["Plan"]
+
+            used = _used_indexes(plan)
+            if expected_index in used:
+                print(f"[OK]   {description}: {expected_index}")
+            else:
+                failures += 1
+                print(f"[FAIL] {description}: expected {expected_index}, plan used {sorted(used) or plan['Node Type']}")
+
+    print(f"\n{len(HOT_QUERIES) - failures}/{len(HOT_QUERIES)} 쿼리가 기대한 인덱스를 사용합니다")
+    return failures == 0
+
+
+if __name__ == "__main__":
+    ok = asyncio.run(verify_indexes(allow_seqscan="--allow-seqscan" in sys.argv))
+    sys.exit(0 if ok else 1)
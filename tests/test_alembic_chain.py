@@ -0,0 +1,55 @@
+"""
+Alembic 리비전 체인 검사 (DB 없이 실행)
+
+체인이 끊기면 ScriptDirectory가 KeyError를 내고 배포 시 migrate가 실패하므로
+head가 하나이고 app/db/migrate.py의 SCHEMA_REVISION / LEGACY_BASELINE_REVISION과 맞는지 확인합니다.
+"""
+
+import os
+
+import pytest
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+from app.db.migrate import LEGACY_BASELINE_REVISION, SCHEMA_REVISION
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def script():
+    config = Config(os.path.join(PROJECT_ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(PROJECT_ROOT, "alembic"))
+    return ScriptDirectory.from_config(config)
+
+
+def test_single_head_matches_schema_revision(script):
+    assert script.get_heads() == [SCHEMA_REVISION]
+
+
+def test_every_down_revision_exists(script):
+    revisions = {revision.revision for revision in script.walk_revisions()}
+    for revision in script.walk_revisions():
+        for down in revision._all_down_revisions:
+            assert down in revisions, f"{revision.revision} -> {down}"
+
+
+def test_baseline_is_ancestor_of_head(script):
+    ancestors = {revision.revision for revision in script.iterate_revisions(SCHEMA_REVISION, "base")}
+    assert LEGACY_BASELINE_REVISION in ancestors
+
+
+def test_each_execute_is_single_statement(capsys):
+    """asyncpg는 prepared statement 하나에 여러 명령을 허용하지 않음 (DO 블록 제외)"""
+    from alembic import command
+
+    config = Config(os.path.join(PROJECT_ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(PROJECT_ROOT, "alembic"))
+    command.upgrade(config, f"{LEGACY_BASELINE_REVISION}:{SCHEMA_REVISION}", sql=True)
+    output = capsys.readouterr().out
+
+    for statement in output.split(";\n\n"):
+        if "$$" in statement:
+            continue
+        body = statement.strip().rstrip(";")
+        assert ";" not in body, body[:200]
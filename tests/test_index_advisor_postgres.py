@@ -0,0 +1,156 @@
+"""
+인덱스 어드바이저 통합 테스트 (PostgreSQL + hypopg 필요)
+
+TEST_DATABASE_URL(postgresql+asyncpg://...)이 없거나 hypopg 확장을 설치할 수 없으면 건너뜁니다.
+지정한 데이터베이스의 public 스키마를 지우므로 반드시 테스트 전용 빈 데이터베이스를 사용하세요.
+
+- 인덱스 없는 등호 조건 쿼리를 애플리케이션 쿼리 통계(app/db/query_metrics.py)로 기록한 뒤
+  추천 인덱스와 hypopg 비용 감소 추정이 나오는지 확인
+- app/db/indexes.py 인덱스 중 스캔 없는 인덱스는 unused, 없는 인덱스는 missing으로 표시되는지 확인
+- hypopg_create_index에 넘기는 DDL이 바인드 파라미터라 작은따옴표가 든 이름도 문자열을 깨지 않는지 확인
+"""
+
+import asyncio
+import os
+
+import pytest
+
+DSN = os.getenv("TEST_DATABASE_URL", "")
+
+pytestmark = pytest.mark.skipif(
+    not DSN.startswith("postgresql"), reason="TEST_DATABASE_URL (PostgreSQL) 미설정"
+)
+
+EVENTS_TABLE = "advisor_events"
+EVENTS_QUERY = f"SELECT {EVENTS_TABLE}.id FROM {EVENTS_TABLE} WHERE {EVENTS_TABLE}.account_id = :account_id"
+DROPPED_INDEX = "ix_users_role"
+QUOTED_COLUMN = "account'ref"  # 예전 f-string 방식에서는 hypopg_create_index('...') 문자열을 끝내 버리는 이름
+
+
+async def _prepare_schema():
+    """빈 스키마 + 모델 테이블/인덱스 + 인덱스 없는 이벤트 테이블 - hypopg가 없으면 False"""
+    from sqlalchemy import text
+    from sqlalchemy.exc import DBAPIError
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    import app.models  # noqa: F401 - 모든 모델 등록
+    from app.db.indexes import create_performance_indexes
+    from app.models.base import Base
+
+    engine = create_async_engine(DSN)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP SCHEMA public CASCADE"))
+            await conn.execute(text("CREATE SCHEMA public"))
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS hypopg"))
+        except DBAPIError:
+            return False
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await create_performance_indexes(engine)
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP INDEX {DROPPED_INDEX}"))
+            await conn.execute(text(
+                f"CREATE TABLE {EVENTS_TABLE} "
+                f"(id serial PRIMARY KEY, account_id integer NOT NULL, \"{QUOTED_COLUMN}\" integer, payload text)"
+            ))
+            await conn.execute(text(
+                f"INSERT INTO {EVENTS_TABLE} (account_id, \"{QUOTED_COLUMN}\", payload) "
+                "SELECT n % 5000, n % 5000, md5(n::text) FROM generate_series(1, 50000) AS n"
+            ))
+            await conn.execute(text(f"ANALYZE {EVENTS_TABLE}"))
+        return True
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def advisor_db():
+    """(엔진, 세션 팩토리) - 애플리케이션 쿼리 통계에 이벤트 조회가 기록된 상태"""
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from app.db import query_metrics
+
+    if not asyncio.run(_prepare_schema()):
+        pytest.skip("hypopg 확장을 설치할 수 없음")
+
+    async def record_statements():
+        # 테스트마다 asyncio.run으로 이벤트 루프가 바뀌므로 연결을 풀에 남기지 않음
+        engine = create_async_engine(DSN, poolclass=NullPool)
+        query_metrics.install_query_instrumentation(engine.sync_engine)
+        query_metrics.reset_query_metrics()
+        async with engine.connect() as conn:
+            for account_id in range(20):
+                await conn.execute(text(EVENTS_QUERY), {"account_id": account_id})
+        return engine
+
+    engine = asyncio.run(record_statements())
+    yield engine, async_sessionmaker(engine, expire_on_commit=False)
+    query_metrics.reset_query_metrics()
+    asyncio.run(engine.dispose())
+
+
+def _analyze(session_factory):
+    from app.db.index_advisor import IndexAdvisor
+
+    async def run():
+        async with session_factory() as db:
+            return await IndexAdvisor(min_table_rows=0).analyze(db)
+
+    return asyncio.run(run())
+
+
+def test_recommends_missing_index_with_hypopg_estimate(advisor_db):
+    _, session_factory = advisor_db
+    report = _analyze(session_factory)
+
+    assert report["extensions"]["hypopg"] is True
+    recommendation = next(
+        rec for rec in report["recommendations"]
+        if rec["table"] == EVENTS_TABLE and rec["columns"] == ["account_id"]
+    )
+    assert recommendation["calls"] == 20
+    assert recommendation["cost_after"] < recommendation["cost_before"]
+    assert recommendation["estimated_improvement_pct"] >= 50
+    assert recommendation["estimated_benefit"] > 0
+
+
+def test_reports_unused_and_missing_indexes(advisor_db):
+    from app.db.indexes import all_indexes
+
+    _, session_factory = advisor_db
+    unused = {entry["index"]: entry for entry in _analyze(session_factory)["unused_indexes"]}
+
+    assert unused[DROPPED_INDEX] == {"index": DROPPED_INDEX, "status": "missing"}
+    for index in all_indexes:
+        if index.name != DROPPED_INDEX:
+            assert unused[index.name]["status"] == "unused"
+            assert unused[index.name]["table"] == index.table.name
+
+
+def test_hypothetical_index_ddl_is_bound_not_interpolated(advisor_db):
+    from app.db.index_advisor import IndexAdvisor
+
+    _, session_factory = advisor_db
+    recommendation = {
+        "table": EVENTS_TABLE,
+        "columns": [QUOTED_COLUMN],
+        "statements": [{
+            "query": f'SELECT {EVENTS_TABLE}.id FROM {EVENTS_TABLE} WHERE {EVENTS_TABLE}."{QUOTED_COLUMN}" = $1',
+            "calls": 1,
+        }],
+    }
+
+    async def run():
+        async with session_factory() as db:
+            conn = await db.connection()
+            await IndexAdvisor()._estimate_benefit(conn, recommendation)
+            await db.rollback()
+
+    asyncio.run(run())
+    assert recommendation["cost_after"] < recommendation["cost_before"]
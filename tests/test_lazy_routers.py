@@ -0,0 +1,67 @@
+"""
+라우터 지연 등록 회귀 테스트
+
+import app.main 시점에는 엔드포인트 모듈을 로드하지 않고, prefix로 첫 요청이 올 때 등록해야 합니다.
+/openapi.json은 남은 라우터를 모두 등록해 부팅 시 전체 등록(기존 동작)과 같은 경로 목록을 내야 합니다.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from starlette.testclient import TestClient
+
+from app.core.lazy_routers import LazyRouterMiddleware, LazyRouterRegistry
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def lazy_app(monkeypatch):
+    """가짜 엔드포인트 모듈 두 개 (/api/company, /api/company-settings)를 지연 등록한 앱"""
+    for name, path in (("fake_company", "/logo"), ("fake_company_settings", "/current")):
+        module = type(sys)(name)
+        module.router = APIRouter()
+        module.router.add_api_route(path, lambda: {"ok": True})
+        monkeypatch.setitem(sys.modules, name, module)
+
+    app = FastAPI()
+    registry = LazyRouterRegistry(app)
+    registry.add("fake_company", "/api/company", ["회사"])
+    registry.add("fake_company_settings", "/api/company-settings", ["회사설정"])
+    app.add_middleware(LazyRouterMiddleware, registry=registry)
+    return app, registry
+
+
+def test_boot_does_not_import_endpoint_modules():
+    """새 인터프리터에서 import app.main - 엔드포인트 모듈/psutil이 로드되지 않아야 함"""
+    probe = (
+        "import sys, app.main\n"
+        "loaded = [m for m in ('app.api.endpoints.campaigns', 'app.api.endpoints.admin', 'psutil') if m in sys.modules]\n"
+        "print('LOADED', ','.join(loaded))\n"
+    )
+    env = dict(os.environ, LAZY_ROUTERS="true")
+    proc = subprocess.run([sys.executable, "-c", probe], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert "LOADED \n" in proc.stdout
+
+
+def test_mounts_only_matching_prefix(lazy_app):
+    app, registry = lazy_app
+    client = TestClient(app)
+
+    assert client.get("/api/company-settings/current").status_code == 200
+    # /api/company-settings 요청이 /api/company 라우터를 등록하지 않아야 함
+    assert registry.mounted == ["fake_company_settings"]
+    assert client.get("/api/company/logo").status_code == 200
+    assert registry.pending == []
+
+
+def test_openapi_mounts_all(lazy_app):
+    app, registry = lazy_app
+    paths = TestClient(app).get("/openapi.json").json()["paths"]
+
+    assert set(paths) == {"/api/company/logo", "/api/company-settings/current"}
+    assert registry.pending == []
@@ -0,0 +1,187 @@
+"""
+배포된 스키마에 대한 alembic upgrade 통합 테스트 (PostgreSQL 필요)
+
+TEST_DATABASE_URL(postgresql+asyncpg://...)이 없으면 건너뜁니다. 지정한 데이터베이스의 테이블을 모두 지우므로
+반드시 테스트 전용 빈 데이터베이스를 사용하세요.
+
+create_all로 만든 스키마에서 2026-10 리비전이 추가하는 컬럼을 지우고 alembic_version을 없애
+현재 배포 스키마(체인이 끊겨 있어 해당 리비전이 한 번도 실행되지 않은 상태)를 재현한 뒤,
+python -m app.db.migrate와 같은 경로(_run_alembic_upgrade)로 head까지 올려 컬럼과 백필 값을 확인합니다.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+
+import pytest
+
+DSN = os.getenv("TEST_DATABASE_URL", "")
+
+pytestmark = pytest.mark.skipif(
+    not DSN.startswith("postgresql"), reason="TEST_DATABASE_URL (PostgreSQL) 미설정"
+)
+
+# 배포 스키마에 아직 없는 컬럼 (테이블 -> 컬럼)
+LEGACY_MISSING_COLUMNS = {
+    "campaigns": [
+        "active_post_count", "invoiced_post_count", "paid_post_count",
+        "cancelled_post_count", "campaign_refund_count", "post_refund_count",
+    ],
+    "company_logos": ["content_hash", "asset_ext", "variant_widths"],
+}
+
+
+async def _prepare_legacy_schema():
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import app.models  # noqa: F401 - 모든 모델 등록
+    from app.models.base import Base
+    from app.models.campaign import Campaign
+    from app.models.campaign_refund import CampaignRefund, RefundType
+    from app.models.company_logo import CompanyLogo
+    from app.models.post import Post
+    from app.models.post_refund import PostRefund
+    from app.models.user import User, UserRole
+
+    engine = create_async_engine(DSN)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+        await conn.run_sync(Base.metadata.create_all)
+
+    now = datetime.utcnow()
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        user = User(name="owner", email="owner@example.com", hashed_password="x", role=UserRole.AGENCY_ADMIN, company="A")
+        db.add(user)
+        await db.flush()
+        with_posts = Campaign(name="with posts", company="A", creator_id=user.id, budget=1000, start_date=now, end_date=now)
+        without_posts = Campaign(name="without posts", company="A", creator_id=user.id, budget=500, start_date=now, end_date=now)
+        db.add_all([with_posts, without_posts])
+        await db.flush()
+        invoiced = Post(campaign_id=with_posts.id, title="invoiced", budget=100, invoice_issued=True)
+        paid = Post(campaign_id=with_posts.id, title="paid", budget=50, payment_completed=True, is_cancelled=True)
+        deleted = Post(campaign_id=with_posts.id, title="deleted", budget=999, is_active=False)
+        db.add_all([invoiced, paid, deleted])
+        await db.flush()
+        db.add_all([
+            CampaignRefund(campaign_id=with_posts.id, refund_type=RefundType.PARTIAL, refund_amount=10,
+                           original_amount=1000, requested_by=user.id),
+            PostRefund(post_id=paid.id, campaign_id=with_posts.id, refund_type=RefundType.FULL, refund_amount=50,
+                       original_budget=50, requested_by=user.id),
+            PostRefund(post_id=invoiced.id, campaign_id=with_posts.id, refund_type=RefundType.PARTIAL, refund_amount=20,
+                       original_budget=100, requested_by=user.id),
+            # 해시 컬럼 도입 전에 업로드된 로고
+            CompanyLogo(company_id="A", logo_url="/uploads/logos/legacy.png", updated_by=user.id),
+        ])
+        await db.commit()
+        ids = {"with_posts": with_posts.id, "without_posts": without_posts.id, "user": user.id}
+
+    async with engine.begin() as conn:
+        for table, columns in LEGACY_MISSING_COLUMNS.items():
+            for column in columns:
+                await conn.execute(text(f"ALTER TABLE {table} DROP COLUMN {column}"))
+        await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    await engine.dispose()
+    return ids
+
+
+async def _fetch(sql, **params):
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(DSN)
+    async with engine.connect() as conn:
+        rows = (await conn.execute(text(sql), params)).mappings().all()
+    await engine.dispose()
+    return rows
+
+
+@pytest.fixture(scope="module")
+def migrated(monkeypatch_module):
+    from app.core.config import Settings
+    from app.db import migrate
+
+    ids = asyncio.run(_prepare_legacy_schema())
+    monkeypatch_module.setattr(Settings, "get_database_url", property(lambda self: DSN))
+    # 이벤트 루프 밖에서 실행 (env.py가 asyncio.run 사용) - 배포 시와 같은 stamp + upgrade 경로
+    migrate._run_alembic_upgrade([])
+    return ids
+
+
+@pytest.fixture(scope="module")
+def monkeypatch_module():
+    patcher = pytest.MonkeyPatch()
+    yield patcher
+    patcher.undo()
+
+
+def test_upgrade_reaches_schema_revision(migrated):
+    from app.db.migrate import SCHEMA_REVISION
+
+    rows = asyncio.run(_fetch("SELECT version_num FROM alembic_version"))
+    assert [row["version_num"] for row in rows] == [SCHEMA_REVISION]
+
+
+def test_post_aggregates_are_added_and_backfilled(migrated):
+    rows = asyncio.run(_fetch(
+        "SELECT id, budget, active_post_count, invoiced_post_count, paid_post_count FROM campaigns"
+    ))
+    by_id = {row["id"]: row for row in rows}
+
+    with_posts = by_id[migrated["with_posts"]]
+    assert (with_posts["active_post_count"], with_posts["invoiced_post_count"], with_posts["paid_post_count"]) == (2, 1, 1)
+    assert with_posts["budget"] == pytest.approx(150)
+
+    # 활성 포스트가 없는 캠페인은 캠페인 예산 유지
+    without_posts = by_id[migrated["without_posts"]]
+    assert without_posts["active_post_count"] == 0
+    assert without_posts["budget"] == pytest.approx(500)
+
+
+def test_refund_aggregates_are_added_and_backfilled(migrated):
+    rows = asyncio.run(_fetch(
+        "SELECT id, cancelled_post_count, campaign_refund_count, post_refund_count FROM campaigns"
+    ))
+    by_id = {row["id"]: row for row in rows}
+
+    with_posts = by_id[migrated["with_posts"]]
+    assert (with_posts["cancelled_post_count"], with_posts["campaign_refund_count"], with_posts["post_refund_count"]) == (1, 1, 2)
+    without_posts = by_id[migrated["without_posts"]]
+    assert (without_posts["cancelled_post_count"], without_posts["campaign_refund_count"], without_posts["post_refund_count"]) == (0, 0, 0)
+
+
+def test_refund_summary_reads_migrated_columns(migrated):
+    """get_refund_summary가 읽는 ORM 컬럼이 모두 존재 (Campaign 전체 로드가 실패하지 않음)"""
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    from app.models.campaign import Campaign
+
+    async def load():
+        engine = create_async_engine(DSN)
+        async with async_sessionmaker(engine)() as db:
+            campaign = (await db.execute(select(Campaign).where(Campaign.id == migrated["with_posts"]))).scalar_one()
+            counts = (campaign.campaign_refund_count, campaign.post_refund_count)
+        await engine.dispose()
+        return counts
+
+    assert asyncio.run(load()) == (1, 2)
+
+
+def test_company_logo_columns_are_added(migrated):
+    """기존 로고 행은 해시 없이 남고 logo_url로 응답 (헤더 로고 조회가 실패하지 않음)"""
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    from app.services.company_logo import CompanyLogoCache
+
+    async def load():
+        engine = create_async_engine(DSN)
+        async with async_sessionmaker(engine)() as db:
+            payload = await CompanyLogoCache(ttl=0).get(db, "A")
+        await engine.dispose()
+        return payload
+
+    payload = asyncio.run(load())
+    assert payload["logoUrl"] == "/uploads/logos/legacy.png"
+    assert payload["version"] is None and payload["variants"] == {}
@@ -0,0 +1,77 @@
+"""
+VulnerabilityScanner 사전 필터 / 스트리밍 본문 검사 회귀 테스트
+
+사전 필터(_find_threats)는 모든 확인 정규식을 그대로 돌리는 기존 방식과 같은 결과를 내야 합니다.
+리터럴이 겹치는 입력(예: "tableval(" 안의 "table"/"eval")에서 후보 패턴이 빠지던 문제를 확인합니다.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from app.security.vulnerability_scanner import STREAM_OVERLAP_CHARS, VulnerabilityScanner
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    return VulnerabilityScanner()
+
+
+def scan_unfiltered(scanner, text):
+    """사전 필터 없이 모든 패턴 검사 (기존 동작)"""
+    return {
+        (threat_type, pattern)
+        for threat_type, pattern, compiled in scanner._compiled_patterns
+        if compiled.search(text)
+    }
+
+
+def scan_filtered(scanner, text):
+    return {(threat_type, pattern) for threat_type, pattern, _ in scanner._find_threats(text)}
+
+
+@pytest.mark.parametrize("text", [
+    "x tableval(1)",
+    "updateval()adminsp_",
+    " selectable xp_cmdshell",
+    "1=1=2",
+    "tokeneval(x)",
+    "document.cookieval(1)",
+    "<scriptable>alert(1)</script>",
+    "정상적인 캠페인 설명입니다",
+])
+def test_overlapping_triggers_match_unfiltered_scan(scanner, text):
+    assert scan_filtered(scanner, text) == scan_unfiltered(scanner, text)
+
+
+def test_known_overlap_misses_are_detected(scanner):
+    assert ("xss", r"eval\s*\([^)]*\)") in scan_filtered(scanner, "x tableval(1)")
+    assert ("xss", r"eval\s*\([^)]*\)") in scan_filtered(scanner, "updateval()adminsp_")
+
+
+def test_random_trigger_concatenations_match_unfiltered_scan(scanner):
+    triggers = sorted(scanner._patterns_by_trigger)
+    fillers = ["", " ", "(", ")", "1", "'", "a"]
+    rng = random.Random(20261018)
+    for left, right in itertools.permutations(triggers, 2):
+        text = f"{rng.choice(fillers)}{left}{right[1:] if rng.random() < 0.3 else right}(x){rng.choice(fillers)}"
+        assert scan_filtered(scanner, text) == scan_unfiltered(scanner, text), text
+    for _ in range(2000):
+        text = "".join(rng.choice(triggers + fillers) for _ in range(rng.randint(1, 6)))
+        assert scan_filtered(scanner, text) == scan_unfiltered(scanner, text), text
+
+
+def test_streaming_text_finds_patterns_spanning_beyond_overlap(scanner):
+    """청크 경계를 STREAM_OVERLAP_CHARS보다 길게 걸친 .* 패턴도 마지막 청크에서 찾아야 함"""
+    filler = "가" * (STREAM_OVERLAP_CHARS * 2)
+    chunks = [f" select {filler}".encode(), f"{filler} from users".encode()]
+
+    inspector = scanner.body_inspector("text/plain")
+    for index, chunk in enumerate(chunks):
+        inspector.feed(chunk, more_body=index < len(chunks) - 1)
+
+    whole = {(threat["type"], threat["pattern"]) for threat in scanner._scan_text(b"".join(chunks).decode())}
+    streamed = [(threat["type"], threat["pattern"]) for threat in inspector.threats]
+    assert set(streamed) == whole
+    assert len(streamed) == len(set(streamed))  # 패턴별 한 번만 보고